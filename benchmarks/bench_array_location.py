@@ -0,0 +1,71 @@
+"""
+Startup, rendering and search time of a large location kept as a matrix
+of fields, in chunks and in NumPy arrays
+
+Run from the repository root (needs numpy):
+    python benchmarks/bench_array_location.py [size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.array_storage import ArrayFields  # noqa: E402
+from location.field import Field  # noqa: E402
+from location.location import Location  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_grid(size: int):
+    """
+    Get grid of roads with a starting gate in the middle
+    and a gate to level 2 in the bottom right corner
+
+    :param size: Width and height of the grid
+    :type size: int
+    :return: Matrix of template indexes
+    :rtype: List[List[int]]
+    """
+    numbers = [[2] * size for _ in range(size)]
+    numbers[size // 2][size // 2] = 1
+    numbers[size - 1][size - 1] = 4
+    return numbers
+
+
+def timed(function):
+    """
+    :return: Result of the function and seconds it took
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    templates = load_field_templates(GAME)
+    grid = synthetic_grid(size)
+    builders = {
+        'matrix': lambda: Location(
+            [[Field.from_template(templates[num]) for num in row]
+             for row in grid]),
+        'chunked': lambda: Location(ChunkedFields(grid, templates)),
+        'numpy': lambda: Location(ArrayFields(grid, templates))
+    }
+    print(f'{size}x{size} location')
+    for name, build in builders.items():
+        location, startup = timed(build)
+        location.fog().reveal_rect(0, 0, size + 1, size + 1)
+        _, render = timed(location.format_map)
+        _, search = timed(lambda: location.storage().find_go_to(2))
+        print(f'{name:>8}: startup {startup * 1000:9.1f} ms, '
+              f'render {render * 1000:9.1f} ms, '
+              f'search {search * 1000:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Memory and save size of small locations with boarder made of separate
+Field objects compared with the shared boarder field
+
+Run from the repository root:
+    python benchmarks/bench_boarder.py [size] [locations]
+"""
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.field import Field  # noqa: E402
+from location.location import Location  # noqa: E402
+from location.storage import BOARDER, FieldMatrix  # noqa: E402
+from utils.stream import write_game_json  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+class Saved:
+    """
+    Object with the methods of Game used by write_game_json
+    """
+
+    def __init__(self, locations):
+        self._locations = locations
+
+    def game(self):
+        return GAME
+
+    def level(self):
+        return 1
+
+    def player(self):
+        return Field()
+
+    def locations(self):
+        return self._locations
+
+
+def inner_fields(size: int, templates):
+    """
+    Get matrix of roads with a starting gate in the corner
+
+    :return: Matrix of fields without boarder
+    :rtype: List[List[Field]]
+    """
+    fields = [[Field.from_template(templates[2]) for _ in range(size)]
+              for _ in range(size)]
+    fields[0][0] = Field.from_template(templates[1])
+    return fields
+
+
+def allocated_boarder(size: int, templates) -> Location:
+    """
+    Get location keeping a separate Field object for every boarder cell
+    """
+    fields = inner_fields(size, templates)
+    width = size + 2
+    matrix = [[Field.from_template(BOARDER) for _ in range(width)]]
+    for row in fields:
+        matrix.append([Field.from_template(BOARDER)] + row +
+                      [Field.from_template(BOARDER)])
+    matrix.append([Field.from_template(BOARDER) for _ in range(width)])
+    return Location(FieldMatrix(matrix))
+
+
+def shared_boarder(size: int, templates) -> Location:
+    """
+    Get location with the shared boarder field
+    """
+    return Location(inner_fields(size, templates))
+
+
+def measure(name: str, build, size: int, count: int, templates):
+    start = time.perf_counter()
+    locations = [build(size, templates) for _ in range(count)]
+    built = time.perf_counter() - start
+    del locations
+    tracemalloc.start()
+    locations = [build(size, templates) for _ in range(count)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    handle = io.BytesIO()
+    start = time.perf_counter()
+    write_game_json(Saved(locations), handle)
+    saved = time.perf_counter() - start
+    print(f'{name}: build {built * 1000:8.2f} ms, '
+          f'memory {memory / 2 ** 20:7.2f} MiB, '
+          f'save {len(handle.getvalue()) / 2 ** 20:6.2f} MiB '
+          f'in {saved * 1000:8.2f} ms')
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    templates = load_field_templates(GAME)
+    print(f'{count} locations {size}x{size}')
+    measure('allocated', allocated_boarder, size, count, templates)
+    measure('shared   ', shared_boarder, size, count, templates)
+
+
+if __name__ == '__main__':
+    main()
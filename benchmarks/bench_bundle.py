@@ -0,0 +1,56 @@
+"""
+Cold start of a game - configuration loaded from loose files
+compared with configuration loaded from the compiled bundle
+
+Run from the repository root:
+    python benchmarks/bench_bundle.py [game]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.bundle import BUNDLE_FILENAME, compile_game  # noqa: E402
+from utils.cache import configuration_cache  # noqa: E402
+from utils.io import warm_configuration_cache  # noqa: E402
+
+REPEAT = 200
+
+
+def cold_start(game: str) -> float:
+    """
+    Measure average time of loading whole configuration with empty cache
+
+    :param game: Name of the game
+    :type game: str
+    :return: Time in milliseconds
+    :rtype: float
+    """
+    elapsed = 0
+    for _ in range(REPEAT):
+        configuration_cache.clear()
+        start = time.perf_counter()
+        warm_configuration_cache(game)
+        elapsed += time.perf_counter() - start
+    return elapsed / REPEAT * 1000
+
+
+def main():
+    game = sys.argv[1] if len(sys.argv) > 1 else 'Dungeons and Dragons'
+    bundle_path = f'configuration/{game}/{BUNDLE_FILENAME}'
+    compiled = os.path.exists(bundle_path)
+    if compiled:
+        os.rename(bundle_path, bundle_path + '.bak')
+    try:
+        print(f'loose files: {cold_start(game):6.2f} ms')
+        compile_game(game)
+        print(f'     bundle: {cold_start(game):6.2f} ms')
+    finally:
+        os.remove(bundle_path)
+        if compiled:
+            os.rename(bundle_path + '.bak', bundle_path)
+
+
+if __name__ == '__main__':
+    main()
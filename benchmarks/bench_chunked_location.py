@@ -0,0 +1,85 @@
+"""
+Startup time and memory of a large location loaded as a matrix
+of fields compared with a location loaded lazily in chunks
+
+Run from the repository root:
+    python benchmarks/bench_chunked_location.py [size]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities.player import Player  # noqa: E402
+from location.field import Field  # noqa: E402
+from location.location import Location  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.binary_grid import BinaryGrid, pack_grid  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+STEPS = 200
+
+
+def synthetic_grid(size: int) -> BinaryGrid:
+    """
+    Get grid of roads with a starting gate in the middle
+
+    :param size: Width and height of the grid
+    :type size: int
+    :return: Grid of template indexes
+    :rtype: BinaryGrid
+    """
+    numbers = [[2] * size for _ in range(size)]
+    numbers[size // 2][size // 2] = 1
+    return BinaryGrid(pack_grid(numbers))
+
+
+def measure(build):
+    """
+    Measure time and memory of building location and walking east
+
+    :param build: Function that builds the location
+    :type build: Callable
+    :return: Startup seconds, startup bytes, bytes after the walk
+    :rtype: Tuple[float, int, int]
+    """
+    player = Player(health=100)
+    tracemalloc.start()
+    start = time.perf_counter()
+    location = build()
+    elapsed = time.perf_counter() - start
+    startup, _ = tracemalloc.get_traced_memory()
+    x, y = location.coordinates()
+    for step in range(STEPS):
+        location.set_coordinates((x + step, y))
+        location.current_field().set_seen()
+    walked, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, startup, walked
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    templates = load_field_templates(GAME)
+    grid = synthetic_grid(size)
+
+    def matrix():
+        return Location([[Field.from_template(templates[num]) for num in row]
+                         for row in grid])
+
+    def chunked():
+        return Location(ChunkedFields(grid, templates))
+
+    print(f'{size}x{size} location, {STEPS} steps explored')
+    for name, build in (('matrix', matrix), ('chunked', chunked)):
+        elapsed, startup, walked = measure(build)
+        print(f'{name:>8}: startup {elapsed * 1000:9.1f} ms '
+              f'{startup / 2**20:8.1f} MiB, '
+              f'after walk {walked / 2**20:8.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
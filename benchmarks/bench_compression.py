@@ -0,0 +1,79 @@
+"""
+Size and write/read time of the saves of the game compressed
+with every codec, in json and binary save format
+
+Run from the repository root:
+    python benchmarks/bench_compression.py [game]
+"""
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+from utils.compression import CODECS, SaveCompression  # noqa: E402
+from utils.io import load_save, read_save, stream_save  # noqa: E402
+from utils.save_worker import write_atomically  # noqa: E402
+
+REPEAT = 5
+LEVELS = {'zlib': (1, 6, 9), 'lzma': (0, 6, 9), 'bz2': (1, 9)}
+
+
+def measure(function) -> float:
+    """
+    Measure average time of calling function
+
+    :param function: Function without arguments
+    :type function: Callable
+    :return: Time in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def compare(game: Game, directory: str):
+    """
+    Print size and times of every codec for one save
+
+    :param game: Loaded save
+    :type game: Game
+    :param directory: Directory for the written files
+    :type directory: str
+    """
+    settings = [(None, None)] + [(codec, level) for codec in CODECS
+                                 for level in LEVELS[codec]]
+    for extension in ('.json', '.sav'):
+        filepath = f'{directory}/save{extension}'
+        for codec, level in settings:
+            compression = SaveCompression(codec, level)
+
+            def write():
+                write_atomically(filepath, compression.wrap(
+                    partial(stream_save, game, filepath)), 'never')
+            write_time = measure(write)
+            read_time = measure(partial(read_save, filepath))
+            name = f'{codec} {level}' if codec else 'none'
+            print(f'  {extension:>5} {name:>7}: '
+                  f'{os.path.getsize(filepath):8d} B  '
+                  f'write {write_time:7.2f} ms  read {read_time:7.2f} ms')
+
+
+def main():
+    game = sys.argv[1] if len(sys.argv) > 1 else 'Dungeons and Dragons'
+    folder = f'saves/{game}'
+    with tempfile.TemporaryDirectory() as directory:
+        for name in sorted(os.listdir(folder)):
+            if not name.endswith('.json') or name == 'index.json':
+                continue
+            print(f'{name}:')
+            compare(load_save(game, name, Game), directory)
+
+
+if __name__ == '__main__':
+    main()
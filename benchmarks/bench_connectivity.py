@@ -0,0 +1,78 @@
+"""
+Time of answering whether fields can be reached from the player by
+searching the fields for every question compared with labels of areas
+computed once
+
+Run from the repository root:
+    python benchmarks/bench_connectivity.py [size] [queries]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.connectivity import Connectivity  # noqa: E402
+from location.fog import Fog  # noqa: E402
+from location.pathfinding import PathFinder  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_grid(size: int):
+    """
+    Get grid of roads crossed by walls with a few openings,
+    starting gate in the middle
+
+    :param size: Width and height of the grid
+    :type size: int
+    :return: Matrix of template indexes
+    :rtype: List[List[int]]
+    """
+    generator = random.Random(0)
+    numbers = [[2] * size for _ in range(size)]
+    for y in range(0, size, 10):
+        numbers[y] = [0 if generator.random() < 0.998 else 2
+                      for _ in range(size)]
+    numbers[size // 2 + 1][size // 2] = 1
+    return numbers
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    templates = load_field_templates(GAME)
+    storage = ChunkedFields(synthetic_grid(size), templates)
+    fog = Fog(storage.width(), storage.height())
+    fog.reveal_rect(0, 0, storage.width(), storage.height())
+    player = storage.find_go_to(1)
+    generator = random.Random(1)
+    cells = [(generator.randrange(1, size + 1),
+              generator.randrange(1, size + 1)) for _ in range(queries)]
+    print(f'{size}x{size} location, {queries} questions')
+
+    pathfinder = PathFinder(storage, fog)
+    start = time.perf_counter()
+    for cell in cells:
+        pathfinder.invalidate()
+        pathfinder.path(player, [cell])
+    search = time.perf_counter() - start
+    print(f'search:       {search * 1000:9.2f} ms')
+
+    start = time.perf_counter()
+    connectivity = Connectivity.from_storage(storage)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    reachable = connectivity.reachable(player, cells)
+    lookup = time.perf_counter() - start
+    print(f'labels build: {built * 1000:9.2f} ms '
+          f'({connectivity.count()} areas)')
+    print(f'labels:       {lookup * 1000:9.2f} ms '
+          f'({len(reachable)} reachable)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Time of getting location methods available in a round by checking
+neighbouring fields compared with the table of exits
+
+Run from the repository root:
+    python benchmarks/bench_exits.py [size] [rounds]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.location import Location  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_grid(size: int):
+    """
+    Get grid of roads with some walls and a starting gate in the middle
+
+    :param size: Width and height of the grid
+    :type size: int
+    :return: Matrix of template indexes
+    :rtype: List[List[int]]
+    """
+    generator = random.Random(0)
+    numbers = [[generator.choice((2, 2, 2, 0)) for _ in range(size)]
+               for _ in range(size)]
+    numbers[size // 2][size // 2] = 1
+    return numbers
+
+
+def neighbour_methods(location: Location):
+    """
+    Get location methods checking the neighbouring fields
+    """
+    x, y = location.coordinates()
+    dictionary = {'map': location.print_map,
+                  'location info': location.description}
+    if location.field(x, y - 1).enterable():
+        dictionary['go north'] = location.go_north
+    if location.field(x, y + 1).enterable():
+        dictionary['go south'] = location.go_south
+    if location.field(x + 1, y).enterable():
+        dictionary['go east'] = location.go_east
+    if location.field(x - 1, y).enterable():
+        dictionary['go west'] = location.go_west
+    dictionary['wait'] = location.wait
+    return dictionary
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    location = Location(ChunkedFields(synthetic_grid(size),
+                                      load_field_templates(GAME)))
+    generator = random.Random(1)
+    x, y = location.coordinates()
+    cells = [(min(max(x + generator.randint(-20, 20), 1), size),
+              min(max(y + generator.randint(-20, 20), 1), size))
+             for _ in range(rounds)]
+    print(f'{size}x{size} location, {rounds} rounds')
+
+    start = time.perf_counter()
+    for cell in cells:
+        location.set_coordinates(cell)
+        neighbour_methods(location)
+    fields = time.perf_counter() - start
+    print(f'neighbours:  {fields * 1000:9.2f} ms')
+
+    start = time.perf_counter()
+    location.exits()
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    for cell in cells:
+        location.set_coordinates(cell)
+        location.available_methods()
+    table = time.perf_counter() - start
+    print(f'table build: {built * 1000:9.2f} ms')
+    print(f'table:       {table * 1000:9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
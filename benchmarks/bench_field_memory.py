@@ -0,0 +1,77 @@
+"""
+Memory used by fields of a synthetic large map
+
+Compares fields created with Field.from_dict for every cell
+with fields sharing templates loaded from fields.json
+
+Run from the repository root:
+    python benchmarks/bench_field_memory.py [size]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.field import Field  # noqa: E402
+from utils.io import load_field_templates, load_from_json  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_map(size: int, fields_count: int):
+    """
+    Get matrix of field indexes that uses every field of the game
+
+    :param size: Width and height of the map
+    :type size: int
+    :param fields_count: Number of fields in fields.json
+    :type fields_count: int
+    :return: Matrix of indexes
+    :rtype: List[List[int]]
+    """
+    return [[(x * 7 + y * 3) % fields_count for x in range(size)]
+            for y in range(size)]
+
+
+def measure(build) -> int:
+    """
+    Measure memory allocated by build and still held by its result
+
+    :param build: Function that builds the map
+    :type build: Callable
+    :return: Number of bytes
+    :rtype: int
+    """
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    fields = load_from_json(f'configuration/{GAME}/fields.json')
+    templates = load_field_templates(GAME)
+    numbers = synthetic_map(size, len(fields))
+
+    def from_dicts():
+        return [[Field.from_dict(fields[num]) for num in row]
+                for row in numbers]
+
+    def from_templates():
+        return [[Field.from_template(templates[num]) for num in row]
+                for row in numbers]
+
+    print(f'{size}x{size} map, {len(fields)} kinds of fields')
+    for name, build in (('from_dict', from_dicts),
+                        ('from_template', from_templates)):
+        used = measure(build)
+        print(f'{name:>14}: {used / 2**20:8.1f} MiB '
+              f'({used / size**2:6.1f} B per cell)')
+
+
+if __name__ == '__main__':
+    main()
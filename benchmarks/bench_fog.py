@@ -0,0 +1,67 @@
+"""
+Time of revealing a large part of a location field by field and
+in the fog, and size of saved seen flags
+
+Run from the repository root:
+    python benchmarks/bench_fog.py [size] [radius]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.location import Location  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def timed(function):
+    """
+    :return: Result of the function and seconds it took
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def reveal_fields(location: Location, radius: int):
+    """
+    Mark fields around the player as seen one Field at a time
+    """
+    x0, y0 = location.coordinates()
+    for y in range(y0 - radius, y0 + radius + 1):
+        for x in range(x0 - radius, x0 + radius + 1):
+            if (x - x0) ** 2 + (y - y0) ** 2 <= radius ** 2 and \
+                    0 <= x < location.row() and 0 <= y < location.column():
+                location.field(x, y).set_seen()
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    radius = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    templates = load_field_templates(GAME)
+    grid = [[2] * size for _ in range(size)]
+    grid[size // 2][size // 2] = 1
+
+    location = Location(ChunkedFields(grid, templates))
+    _, fields = timed(lambda: reveal_fields(location, radius))
+    location = Location(ChunkedFields(grid, templates))
+    _, fog = timed(lambda: location.reveal_radius(radius))
+    print(f'{size}x{size} location, radius {radius}, '
+          f'{location.fog().count()} fields revealed')
+    print(f'reveal by fields: {fields * 1000:9.2f} ms')
+    print(f'reveal in fog:    {fog * 1000:9.2f} ms')
+
+    changes = [[x, y, {'seen': True}] for x, y in location.fog().cells()]
+    _, encode = timed(lambda: location.fog().encode(text=True))
+    print(f'seen as changes:  {len(json.dumps(changes)):9d} bytes')
+    print(f'fog, base64:      {len(location.fog().encode(text=True)):9d} '
+          f'bytes, encoded in {encode * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
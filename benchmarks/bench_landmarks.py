@@ -0,0 +1,66 @@
+"""
+Time of building the landmark index of a large location compared with
+searching the fields for a gate every time it is needed
+
+Run from the repository root:
+    python benchmarks/bench_landmarks.py [size] [lookups]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.landmarks import LandmarkIndex  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_grid(size: int):
+    """
+    Get grid of roads with some lairs and hideouts, a starting gate
+    in the middle and a gate to level 2 in the bottom right corner
+
+    :param size: Width and height of the grid
+    :type size: int
+    :return: Matrix of template indexes
+    :rtype: List[List[int]]
+    """
+    generator = random.Random(0)
+    numbers = [[generator.choice((2, 2, 2, 2, 2, 2, 2, 2, 3, 7))
+                for _ in range(size)] for _ in range(size)]
+    numbers[size // 2][size // 2] = 1
+    numbers[size - 1][size - 1] = 4
+    return numbers
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    templates = load_field_templates(GAME)
+    storage = ChunkedFields(synthetic_grid(size), templates)
+    print(f'{size}x{size} location, {lookups} lookups of the gate')
+
+    start = time.perf_counter()
+    for _ in range(lookups):
+        storage.find_go_to(2)
+    search = time.perf_counter() - start
+    print(f'search:      {search * 1000:9.2f} ms')
+
+    start = time.perf_counter()
+    index = LandmarkIndex(storage)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(lookups):
+        index.gate(2)
+    lookup = time.perf_counter() - start
+    print(f'index build: {built * 1000:9.2f} ms '
+          f'({len(index.enemies())} enemies, {len(index.items())} items)')
+    print(f'index:       {lookup * 1000:9.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
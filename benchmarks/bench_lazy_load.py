@@ -0,0 +1,69 @@
+"""
+Time of loading a full save and getting the current location
+depending on the number of locations discovered by the player
+
+Run from the repository root:
+    python benchmarks/bench_lazy_load.py [size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities.player import Player  # noqa: E402
+from game import Game  # noqa: E402
+from location.field import Field  # noqa: E402
+from location.location import Location  # noqa: E402
+from utils.io import load_field_templates, load_save, write_save  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+SAVE = 'bench_lazy_load'
+
+
+def synthetic_location(size: int, level: int) -> Location:
+    """
+    Get location of roads with a gate in the middle
+
+    :param size: Width and height of the location
+    :type size: int
+    :param level: The number of location
+    :type level: int
+    :return: Location
+    :rtype: Location
+    """
+    templates = load_field_templates(GAME)
+    fields = [[Field.from_template(templates[2]) for _ in range(size)]
+              for _ in range(size)]
+    fields[size // 2][size // 2] = Field.from_template(templates[1])
+    fields[size // 2][size // 2].set_go_to(level)
+    return Location(fields, False, level=level)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    print(f'{size}x{size} locations, time to the first round')
+    try:
+        for count in (1, 2, 4, 8):
+            locations = [synthetic_location(size, level)
+                         for level in range(1, count + 1)]
+            game = Game(GAME, Player(), locations, count)
+            for extension in ('.sav', '.json'):
+                write_save(GAME, f'{SAVE}{extension}', game)
+                start = time.perf_counter()
+                loaded = load_save(GAME, f'{SAVE}{extension}', Game)
+                loaded.location()
+                first_round = time.perf_counter() - start
+                loaded.locations()
+                everything = time.perf_counter() - start
+                print(f'{count} location(s) {extension:>5}: '
+                      f'first round {first_round * 1000:8.1f} ms, '
+                      f'all loaded {everything * 1000:8.1f} ms')
+    finally:
+        for extension in ('.sav', '.json'):
+            if os.path.exists(f'saves/{GAME}/{SAVE}{extension}'):
+                os.remove(f'saves/{GAME}/{SAVE}{extension}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Memory of a long campaign keeping every level in memory compared with
+keeping only a few of them and saving others to snapshots, and time
+of walking back through a gate to an evicted level
+
+Run from the repository root:
+    python benchmarks/bench_levels.py [levels] [size] [max_loaded]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities.player import Player  # noqa: E402
+import game as game_module  # noqa: E402
+from game import Game  # noqa: E402
+from location.field import Field  # noqa: E402
+from location.location import Location  # noqa: E402
+
+
+def level_location(size: int, level: int) -> Location:
+    """
+    Get location with a gate back and a gate forward
+
+    :return: New location
+    :rtype: Location
+    """
+    fields = [[Field('Road') for _ in range(size)] for _ in range(size)]
+    fields[0][0] = Field('Gate', go_to=level)
+    fields[0][1] = Field('Gate', go_to=level + 1)
+    return Location(fields, level=level)
+
+
+def play(levels: int, size: int, max_loaded: int = None):
+    """
+    Open every level one after another and walk back to the first one
+    """
+    game_module.load_location_from_configuration = \
+        lambda game, filename, level: level_location(size, level)
+    tracemalloc.start()
+    game = Game('test', Player(), [level_location(size, 1)], 1)
+    game.levels().set_max_loaded(max_loaded)
+    for level in range(2, levels + 1):
+        game.add_location(f'lvl{level}')
+        game.set_level(level)
+        game.location()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for level in range(levels, 0, -1):
+        game.location_at(level)
+    back = time.perf_counter() - start
+    game.levels().close()
+    return memory, back
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    max_loaded = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    print(f'{levels} levels {size}x{size}')
+    for name, limit in (('all loaded', None),
+                        (f'{max_loaded} loaded', max_loaded)):
+        memory, back = play(levels, size, limit)
+        print(f'{name:12}: memory {memory / 2 ** 20:8.2f} MiB, '
+              f'walking back {back * 1000:9.2f} ms '
+              f'({back * 1000 / levels:7.2f} ms per level)')
+
+
+if __name__ == '__main__':
+    main()
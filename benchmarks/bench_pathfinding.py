@@ -0,0 +1,73 @@
+"""
+Time of finding the way to the gate of a large location searching
+the fields for every query compared with reusing the kept search
+
+Run from the repository root:
+    python benchmarks/bench_pathfinding.py [size] [queries]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.fog import Fog  # noqa: E402
+from location.pathfinding import PathFinder  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_grid(size: int):
+    """
+    Get grid of roads with some walls, a starting gate in the middle
+    and a gate to level 2 in the bottom right corner
+
+    :param size: Width and height of the grid
+    :type size: int
+    :return: Matrix of template indexes
+    :rtype: List[List[int]]
+    """
+    generator = random.Random(0)
+    numbers = [[generator.choice((2, 2, 2, 2, 2, 2, 2, 2, 0))
+                for _ in range(size)] for _ in range(size)]
+    numbers[size // 2][size // 2] = 1
+    numbers[size - 1][size - 1] = 4
+    return numbers
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    templates = load_field_templates(GAME)
+    storage = ChunkedFields(synthetic_grid(size), templates)
+    fog = Fog(storage.width(), storage.height())
+    fog.reveal_rect(0, 0, storage.width(), storage.height())
+    pathfinder = PathFinder(storage, fog)
+    goal = storage.find_go_to(2)
+    generator = random.Random(1)
+    starts = [(generator.randrange(1, size + 1),
+               generator.randrange(1, size + 1)) for _ in range(queries)]
+    print(f'{size}x{size} location, {queries} paths to the gate')
+
+    start = time.perf_counter()
+    for cell in starts:
+        pathfinder.invalidate()
+        pathfinder.path(cell, [goal])
+    search = time.perf_counter() - start
+    print(f'search every time: {search * 1000:9.2f} ms')
+
+    pathfinder.invalidate()
+    searches = pathfinder.searches()
+    start = time.perf_counter()
+    found = [pathfinder.path(cell, [goal]) for cell in starts]
+    kept = time.perf_counter() - start
+    print(f'kept search:       {kept * 1000:9.2f} ms '
+          f'({pathfinder.searches() - searches} search, '
+          f'{sum(path is not None for path in found)} paths found)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Time of opening gates with and without preloading every location
+of the game on a thread pool
+
+Run from the repository root:
+    python benchmarks/bench_preload.py [game] [workers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.io import (  # noqa: E402
+    build_location,
+    load_location_from_configuration,
+    preload_game,
+    warm_configuration_cache
+)
+from utils.preload import close_worlds  # noqa: E402
+
+
+def main():
+    game = sys.argv[1] if len(sys.argv) > 1 else 'Dungeons and Dragons'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    warm_configuration_cache(game)
+
+    start = time.perf_counter()
+    world = preload_game(game, workers)
+    world.wait()
+    preloaded = time.perf_counter() - start
+    for line in world.report():
+        print(line)
+    print(f'preload, wall time:       {preloaded * 1000:8.2f} ms')
+
+    start = time.perf_counter()
+    for filename, level in world.levels().items():
+        build_location(game, filename, level)
+    sequential = time.perf_counter() - start
+    print(f'sequential build:         {sequential * 1000:8.2f} ms')
+
+    start = time.perf_counter()
+    for filename, level in world.levels().items():
+        load_location_from_configuration(game, filename, level)
+    opening = time.perf_counter() - start
+    print(f'gate openings, preloaded: {opening * 1000:8.2f} ms')
+    close_worlds()
+
+
+if __name__ == '__main__':
+    main()
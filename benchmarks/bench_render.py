@@ -0,0 +1,103 @@
+"""
+Renders per second of a large location - drawing every field
+with string concatenation compared with the cached rows of MapRenderer
+and with a window around the player
+
+Run from the repository root:
+    python benchmarks/bench_render.py [size] [seconds]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location.location import Location  # noqa: E402
+from location.storage import ChunkedFields  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def concatenated_map(location: Location) -> str:
+    """
+    Get map the way it was drawn before MapRenderer -
+    every icon added to the output one by one
+    """
+    p_x, p_y = location.coordinates()
+    output = ''
+    for y in range(location.column()):
+        for x in range(location.row()):
+            if (x, y) == (p_x, p_y):
+                output += ' P '
+            else:
+                output += location.field(x, y).field_type()
+        output += '\n'
+    return output
+
+
+def renders_per_second(render, seconds: float) -> float:
+    """
+    :return: Number of calls of render per second
+    """
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds or count < 1:
+        render()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    templates = load_field_templates(GAME)
+    grid = [[2] * size for _ in range(size)]
+    grid[size // 2][size // 2] = 1
+
+    def revealed_location():
+        location = Location(ChunkedFields(grid, templates))
+        location.fog().reveal_rect(0, 0, size + 1, size + 1)
+        return location
+    print(f'{size}x{size} location')
+
+    location = revealed_location()
+    rate = renders_per_second(lambda: concatenated_map(location), seconds)
+    print(f'concatenation:          {rate:10.2f} renders/s')
+
+    location = revealed_location()
+    start = time.perf_counter()
+    str(location)
+    first = time.perf_counter() - start
+    print(f'cached rows, first:     {first * 1000:10.2f} ms')
+
+    rate = renders_per_second(lambda: str(location), seconds)
+    print(f'cached rows:            {rate:10.2f} renders/s')
+
+    def move_and_render():
+        x, y = location.coordinates()
+        location.set_coordinates((x % size + 1, y))
+        return str(location)
+    rate = renders_per_second(move_and_render, seconds)
+    print(f'cached rows, moving:    {rate:10.2f} renders/s')
+
+    def change_and_render():
+        x, y = location.coordinates()
+        field = location.field(x, y)
+        field.set_danger(field.danger() + 1)
+        return str(location)
+    rate = renders_per_second(change_and_render, seconds)
+    print(f'one changed row:        {rate:10.2f} renders/s')
+
+    location = revealed_location()
+
+    def move_and_render_window():
+        x, y = location.coordinates()
+        location.set_coordinates((x % size + 1, y))
+        location.field(*location.coordinates()).set_seen()
+        return location.format_map((80, 24), (40, 12))
+    rate = renders_per_second(move_and_render_window, seconds)
+    print(f'80x24 viewport, minimap:{rate:10.2f} renders/s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Size and write/read time of saves in json format
+compared with the binary save format
+
+Run from the repository root:
+    python benchmarks/bench_save_format.py [game]
+"""
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import binary_save  # noqa: E402
+
+REPEAT = 20
+
+
+def measure(function) -> float:
+    """
+    Measure average time of calling function
+
+    :param function: Function without arguments
+    :type function: Callable
+    :return: Time in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def compare(name: str, dictionary):
+    """
+    Print size and times of both formats for one save
+
+    :param name: Name of the save
+    :type name: str
+    :param dictionary: Contents of the save
+    :type dictionary: Dict
+    """
+    json_data = json.dumps(dictionary, indent=4).encode('utf-8')
+    handle = io.BytesIO()
+    binary_save.dump(dictionary, handle)
+    binary_data = handle.getvalue()
+
+    json_write = measure(lambda: json.dump(dictionary, io.StringIO(),
+                                           indent=4))
+    binary_write = measure(lambda: binary_save.dump(dictionary, io.BytesIO()))
+    json_read = measure(lambda: json.loads(json_data))
+    binary_read = measure(lambda: binary_save.load(io.BytesIO(binary_data)))
+    print(f'{name}:')
+    print(f'  size   json {len(json_data):9d} B  '
+          f'binary {len(binary_data):9d} B  '
+          f'({len(binary_data) / len(json_data):.1%})')
+    print(f'  write  json {json_write:9.2f} ms binary {binary_write:9.2f} ms')
+    print(f'  read   json {json_read:9.2f} ms binary {binary_read:9.2f} ms')
+
+
+def main():
+    game = sys.argv[1] if len(sys.argv) > 1 else 'Dungeons and Dragons'
+    folder_path = f'saves/{game}'
+    for name in sorted(os.listdir(folder_path)):
+        if name.endswith('.json'):
+            with open(f'{folder_path}/{name}') as handle:
+                compare(name, json.load(handle))
+    location = [[{'name': 'Road', 'description': 'Simple road',
+                  'danger': 0, 'enemy': None, 'item': None,
+                  'enterable': True, 'seen': False, 'go_to': 0}
+                 for _ in range(300)] for _ in range(300)]
+    compare('generated 300x300', {'locations': [{'location': location}]})
+
+
+if __name__ == '__main__':
+    main()
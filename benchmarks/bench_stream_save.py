@@ -0,0 +1,86 @@
+"""
+Peak memory and time of writing a full save by building the whole
+dictionary compared with streaming it one row of fields at a time
+
+Run from the repository root:
+    python benchmarks/bench_stream_save.py [size]
+"""
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entities.player import Player  # noqa: E402
+from game import Game  # noqa: E402
+from location.field import Field  # noqa: E402
+from location.location import Location  # noqa: E402
+from utils import binary_save  # noqa: E402
+from utils.io import load_field_templates  # noqa: E402
+from utils.stream import write_game_binary, write_game_json  # noqa: E402
+
+GAME = 'Dungeons and Dragons'
+
+
+def synthetic_game(size: int) -> Game:
+    """
+    Get game with one location of roads and a starting gate in the middle
+
+    :param size: Width and height of the location
+    :type size: int
+    :return: Game with the location
+    :rtype: Game
+    """
+    templates = load_field_templates(GAME)
+    fields = [[Field.from_template(templates[2]) for _ in range(size)]
+              for _ in range(size)]
+    fields[size // 2][size // 2] = Field.from_template(templates[1])
+    return Game(GAME, Player(), [Location(fields, False)], 1)
+
+
+def measure(write):
+    """
+    Measure time and peak memory of writing the save
+
+    :param write: Function writing the save to the given handle
+    :type write: Callable
+    :return: Seconds and peak bytes
+    :rtype: Tuple[float, int]
+    """
+    handle = io.BytesIO()
+    tracemalloc.start()
+    start = time.perf_counter()
+    write(handle)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak - len(handle.getvalue())
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    game = synthetic_game(size)
+
+    def json_tree(handle):
+        handle.write(json.dumps(game.as_dict(), indent=4).encode('utf-8'))
+
+    def binary_tree(handle):
+        binary_save.dump(game.as_dict(), handle)
+
+    print(f'{size}x{size} location, peak memory excludes the written file')
+    for name, write in (('json as_dict', json_tree),
+                        ('json stream', lambda handle:
+                            write_game_json(game, handle)),
+                        ('binary as_dict', binary_tree),
+                        ('binary stream', lambda handle:
+                            write_game_binary(game, handle))):
+        elapsed, peak = measure(write)
+        print(f'{name:>15}: {elapsed * 1000:9.1f} ms '
+              f'peak {peak / 2**20:8.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -56,7 +56,8 @@ class Enemy:
                  strength: int = 10,
                  random_strength: int = 10,
                  shouts: List[str] = None,
-                 description: str = ''
+                 description: str = '',
+                 _validated: bool = False
                  ):
         """
         Initialize Enemy
@@ -80,7 +81,20 @@ class Enemy:
         :type shouts: List[str], optional
         :param description: Description of the enemy, defaults to ''
         :type description: str, optional
-        """
+        :param _validated: Whether values were already validated -
+                            setters' checks are skipped, defaults to False
+        :type _validated: bool, optional
+        """
+        if _validated:
+            self._name = name
+            self._base_health = base_health
+            self._health = health
+            self._regeneration = regeneration
+            self._strength = strength
+            self._random_strength = random_strength
+            self.set_shouts(shouts)
+            self._description = description
+            return
         self.set_name(name)
         self.set_base_health(base_health)
         self.set_health(health)
@@ -109,12 +123,16 @@ class Enemy:
         }
 
     @staticmethod
-    def from_dict(dictionary: Dict) -> 'Enemy':
+    def from_dict(dictionary: Dict, trusted: bool = False) -> 'Enemy':
         """
         Get new Enemy instance loaded from dictionary
 
         :param dictionary: Dictionary with enemy's data
         :type dictionary: Dict
+        :param trusted: Whether dictionary comes from validated
+                        configuration - values are not checked,
+                        defaults to False
+        :type trusted: bool, optional
         :return: Loaded Enemy
         :rtype: Enemy
         """
@@ -127,7 +145,8 @@ class Enemy:
                 dictionary.get('strength', 10),
                 dictionary.get('random_strength', 10),
                 dictionary.get('shouts', 10),
-                dictionary.get('description', '')
+                dictionary.get('description', ''),
+                _validated=trusted
             )
 
     # Getters and setters
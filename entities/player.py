@@ -76,7 +76,8 @@ class Player:
                  weapon: Weapon = None,
                  armor: Armor = None,
                  equipment_size: int = 0,
-                 equipment: List[Item] = None
+                 equipment: List[Item] = None,
+                 _validated: bool = False
                  ):
         """
         Initialize Player
@@ -99,7 +100,20 @@ class Player:
         :param equipment: List of items - current player's equipment,
                             defaults to None
         :type equipment: List[Item], optional
-        """
+        :param _validated: Whether values were already validated -
+                            setters' checks are skipped, defaults to False
+        :type _validated: bool, optional
+        """
+        if _validated:
+            self._name = name
+            self._base_health = base_health
+            self._health = health
+            self._strength = strength
+            self._weapon = weapon
+            self._armor = armor
+            self._equipment_size = equipment_size
+            self._equipment = equipment if equipment else []
+            return
         self.set_name(name)
         self.set_base_health(base_health)
         self.set_health(health)
@@ -131,12 +145,16 @@ class Player:
         return dictionary
 
     @staticmethod
-    def from_dict(dictionary) -> "Player":
+    def from_dict(dictionary, trusted: bool = False) -> "Player":
         """
         Get new Player instance loaded from dictionary
 
         :param dictionary: Dictionary with Player's data
         :type dictionary: Dict
+        :param trusted: Whether dictionary comes from validated
+                        configuration - values are not checked,
+                        defaults to False
+        :type trusted: bool, optional
         :return: Loaded Player
         :rtype: Player
         """
@@ -149,7 +167,8 @@ class Player:
             Armor.from_dict(dictionary.get('armor', None)),
             dictionary.get('equipment_size', 0),
             [Item.item_from_dict(item)
-             for item in dictionary.get('equipment', [])]
+             for item in dictionary.get('equipment', [])],
+            _validated=trusted
         )
 
     # Getters and Setters
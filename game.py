@@ -1,13 +1,26 @@
 from utils.io import (
     load_location_from_configuration,
     load_configuration_from_json,
-    write_save_as_json,
-    load_save_from_json
+    location_delta,
+    location_from_delta,
+    field_delta,
+    apply_field_delta,
+    append_journal,
+    start_journal,
+    DELTA_VERSION,
+    write_save,
+    load_save
 )
 from entities.player import Player
 from entities.equipment import Key
 from location.location import Location
+from utils.journal import SaveJournal
+from utils.validation import trusted
+from utils.stream import SavedLocation
+from utils.levels import LevelCache, LevelSnapshot, max_loaded_levels
+from utils.save_worker import wait_for_saves
 from utils.player_input import (
+    choose_destination,
     choose_item_from_dict,
     choose_string,
     player_input
@@ -15,7 +28,8 @@ from utils.player_input import (
 from utils.format import print_formatted_list
 
 
-from typing import List, Dict
+from typing import Iterator, List, Dict, Tuple, Union
+from os import path
 import functools
 
 
@@ -31,18 +45,31 @@ class Game:
     :param player: Holds information about player, defaults to None
     :type player: Player, optional
 
-    :param locations: List of locations discovered by player, defaults to None
-    :type locations: List[Location], optional
+    :param locations: List of locations discovered by player, locations
+                    not needed yet may be saved locations or dictionaries
+                    returned by location delta, defaults to None
+    :type locations: List[Union[Location, SavedLocation, Dict]], optional
 
     :param level: The number of location where the player is now, defaults to 1
     :type level: int, optional
+
+    :param links: Levels entered from other level than the previous one,
+                    level as key and level it was entered from as value,
+                    defaults to None
+    :type links: Dict[int, int], optional
+
+    Only max_loaded_levels() locations are kept in memory, the least
+    recently used ones are saved to snapshots and loaded back
+    when the player returns
     """
 
     def __init__(self,
                  game: str = 'Dungeons and Dragons',
                  player: Player = None,
-                 locations: List[Location] = None,
-                 level: int = 1):
+                 locations: List[
+                     Union[Location, SavedLocation, Dict]] = None,
+                 level: int = 1,
+                 links: Dict[int, int] = None):
         """
         Initialize Game
         """
@@ -50,7 +77,12 @@ class Game:
         self.set_player(player)
         self.set_locations(locations)
         self.set_level(level)
+        self.set_links(links)
         self._exit = False
+        self._journal = None
+        self._journal_seq = 0
+        self._changes = []
+        self._before = None
 
     def as_dict(self) -> Dict:
         """
@@ -59,19 +91,25 @@ class Game:
         :return: Dictionary with game's data
         :rtype: Dict
         """
-        return {
+        dictionary = {
             'game': self._game,
             'player': self._player.as_dict(),
-            'locations': [location.as_dict() for location in self._locations],
+            'locations': [self._location_dict(number)
+                          for number in range(len(self._locations))],
             'level': self._level
         }
+        if self._links:
+            dictionary['links'] = self.links_list()
+        return dictionary
 
     @staticmethod
     def from_dict(dictionary: Dict) -> 'Game':
         """
-        Get new Game instance loaded from dictionary
+        Get new Game instance loaded from dictionary,
+        locations are created when they are needed
 
-        :param dictionary: Dictionary with game's data
+        :param dictionary: Dictionary with game's data, locations may be
+                            already loaded
         :type dictionary: Dict
         :return: Game loaded from dictionary
         :rtype: Game
@@ -79,9 +117,54 @@ class Game:
         return Game(
             dictionary['game'],
             Player.from_dict(dictionary['player']),
-            [Location.from_dict(location)
+            [location if isinstance(location, (Location, SavedLocation))
+             else {'location': location}
              for location in dictionary['locations']],
-            dictionary['level']
+            dictionary['level'],
+            Game.links_from_list(dictionary.get('links', []))
+        )
+
+    def as_delta(self) -> Dict:
+        """
+        Get Game as a dictionary, locations contain only
+        the fields that differ from the configuration
+
+        :return: Dictionary with game's data and changes of locations
+        :rtype: Dict
+        """
+        dictionary = {
+            'delta': DELTA_VERSION,
+            'game': self._game,
+            'level': self._level,
+            'player': self._player.as_dict(),
+            'locations': [self._location_delta(number)
+                          for number in range(len(self._locations))]
+        }
+        if self._links:
+            dictionary['links'] = self.links_list()
+        if self._journal:
+            dictionary['journal'] = self._journal_seq
+        return dictionary
+
+    @staticmethod
+    def from_delta(dictionary: Dict) -> 'Game':
+        """
+        Get new Game instance - locations are loaded from
+        the configuration and changed according to the delta
+        when they are needed
+
+        :param dictionary: Dictionary returned by as delta method
+        :type dictionary: Dict
+        :return: Game loaded from dictionary
+        :rtype: Game
+        """
+        game = dictionary['game']
+        return Game(
+            game,
+            Player.from_dict(dictionary['player']),
+            list(dictionary['locations']),
+            dictionary['level'],
+            Game.links_from_list(dictionary.get('links', []))
         )
 
     # Getters and setters
@@ -123,27 +206,56 @@ class Game:
         if player:
             self._player = player
         else:
-            self._player = load_configuration_from_json(
-                self._game, 'player', Player)
+            self._player = Player.from_dict(
+                load_configuration_from_json(self._game, 'player', None),
+                trusted(self._game))
 
     def locations(self) -> List[Location]:
         """
-        Get locations
+        Get locations, all of them are loaded - levels above the limit
+        are evicted the next time a location is needed
 
-        :return: List of locations discovered by player
+        :return: Copy of the list of locations discovered by player,
+                locations are added with add location method
         :rtype: List[Location]
         """
-        return self._locations
+        for index in range(len(self._locations)):
+            self._load_location(index, False)
+        return list(self._locations)
 
-    def set_locations(self, locations: List[Location]):
+    def stored_locations(self) -> Iterator[Union[Location, SavedLocation]]:
+        """
+        Get locations one by one for saving them - saved locations
+        are not created, locations kept as dictionaries or snapshots
+        are created only until the next one is needed and stay stored
+        as they were, so levels above the limit are not loaded
+
+        :return: Iterator over locations discovered by player
+        :rtype: Iterator[Union[Location, SavedLocation]]
+        """
+        for location in list(self._locations):
+            if isinstance(location, (Location, SavedLocation)):
+                yield location
+            else:
+                yield self._stored_location(location)
+
+    def set_locations(self,
+                      locations: List[Union[Location, SavedLocation, Dict]]):
         """
         Set locations
 
-        :param locations: List of locations discovered by player
-        :type locations: List[Location]
+        :param locations: List of locations discovered by player,
+                        locations not needed yet may be saved locations
+                        or dictionaries returned by location delta
+        :type locations: List[Union[Location, SavedLocation, Dict]]
         """
+        self._levels = LevelCache(max_loaded_levels())
+        self._indexes = {}
         if locations:
             self._locations = locations
+            for index, location in enumerate(locations):
+                level = self._location_level(location)
+                self._indexes[level if level else index + 1] = index
         else:
             self._locations = []
             self.add_location('lvl1')
@@ -166,6 +278,105 @@ class Game:
         """
         self._level = level
 
+    def links(self) -> Dict[int, int]:
+        """
+        Get links
+
+        :return: Levels entered from other level than the previous one,
+                level as key and level it was entered from as value
+        :rtype: Dict[int, int]
+        """
+        return self._links
+
+    def set_links(self, links: Dict[int, int]):
+        """
+        Set links
+
+        :param links: Levels entered from other level than the previous
+                        one, level as key and level it was entered from
+                        as value
+        :type links: Dict[int, int]
+        """
+        self._links = dict(links) if links else {}
+
+    def links_list(self) -> List[List[int]]:
+        """
+        Get links as a list that can be saved
+
+        :return: List of pairs - level and level it was entered from
+        :rtype: List[List[int]]
+        """
+        return [[level, previous]
+                for level, previous in sorted(self._links.items())]
+
+    @staticmethod
+    def links_from_list(links: List[List[int]]) -> Dict[int, int]:
+        """
+        Get links from the list returned by links list method
+
+        :param links: List of pairs - level and level it was entered from
+        :type links: List[List[int]]
+        :return: Level as key and level it was entered from as value
+        :rtype: Dict[int, int]
+        """
+        return {level: previous for level, previous in links}
+
+    def previous_level(self, level: int = None) -> int:
+        """
+        Get level the gate back from the level leads to
+
+        :param level: The number of location, defaults to current level
+        :type level: int, optional
+        :return: Level the location was first entered from,
+                0 for the first level
+        :rtype: int
+        """
+        if level is None:
+            level = self._level
+        return self._links.get(level, level - 1)
+
+    def levels(self) -> LevelCache:
+        """
+        Get levels
+
+        :return: Cache deciding which locations are kept in memory
+        :rtype: LevelCache
+        """
+        return self._levels
+
+    def journal(self) -> SaveJournal:
+        """
+        Get journal
+
+        :return: Journal of the save slot changes are appended to or None
+        :rtype: SaveJournal
+        """
+        return self._journal
+
+    def set_journal(self, journal: SaveJournal, seq: int = 0):
+        """
+        Set journal, changes not yet written are dropped -
+        they are part of the snapshot
+
+        :param journal: Journal of the save slot
+        :type journal: SaveJournal
+        :param seq: Sequence number of the last change applied to the game,
+                    defaults to 0
+        :type seq: int, optional
+        """
+        self._journal = journal
+        self._journal_seq = seq
+        self._changes = []
+
+    def journal_seq(self) -> int:
+        """
+        Get journal seq
+
+        :return: Sequence number of the last change applied to the game
+        :rtype: int
+        """
+        return self._journal_seq
+
     def end(self) -> bool:
         """
         Indicates whether to end the game or start another round
@@ -188,7 +399,81 @@ class Game:
         :return: Current location
         :rtype: Location
         """
-        return self._locations[self._level-1]
+        return self.location_at(self._level)
+
+    def location_at(self, level: int) -> Location:
+        """
+        Get location with given number, it is created from
+        its dictionary or snapshot when it is needed - locations
+        not used for the longest time above the limit are evicted
+
+        :param level: The number of location
+        :type level: int
+        :return: Location with given number
+        :rtype: Location
+        """
+        return self._load_location(self._indexes[level], True)
+
+    def _left_location(self, level: int) -> Location:
+        """
+        :return: Location with given number for reading it - it is not
+                marked as used and evicted one is created without
+                replacing its snapshot, it may be the one player just left
+        :rtype: Location
+        """
+        location = self._locations[self._indexes[level]]
+        if isinstance(location, Location):
+            return location
+        if isinstance(location, SavedLocation):
+            return location.load()
+        return self._stored_location(location)
+
+    def has_level(self, level: int) -> bool:
+        """
+        Check if location with given number was discovered by player
+
+        :param level: The number of location
+        :type level: int
+        :rtype: bool
+        """
+        return level in self._indexes
+
+    def _load_location(self, index: int, evict: bool) -> Location:
+        """
+        :return: Location with given index in the order of discovery,
+                other locations are evicted only if evict is True
+        :rtype: Location
+        """
+        location = self._locations[index]
+        if isinstance(location, SavedLocation):
+            location = location.load()
+            self._locations[index] = location
+        elif isinstance(location, LevelSnapshot):
+            location = self._levels.reload(self._game, location)
+            self._locations[index] = location
+        elif isinstance(location, dict):
+            location = location_from_delta(self._game, location)
+            self._locations[index] = location
+        self._levels.used(index, self._locations, self._game, evict)
+        return location
+
+    def location_count(self) -> int:
+        """
+        Get number of locations discovered by player
+        without loading them
+
+        :rtype: int
+        """
+        return len(self._locations)
+
+    def loaded_locations(self) -> int:
+        """
+        Get number of locations already created from their dictionaries
+
+        :rtype: int
+        """
+        return sum(isinstance(location, Location)
+                   for location in self._locations)
 
     def __eq__(self, other) -> bool:
         """
@@ -201,24 +486,241 @@ class Game:
         """
         return isinstance(other, Game) and self.as_dict() == other.as_dict()
 
-    def add_location(self, filename: str):
+    def add_location(self, filename: str, level: int = None):
         """
-        Load location from configuration directory based on filename
+        Load location from configuration directory based on filename,
+        the new level remembers the current level if player
+        did not come from the previous one
 
         :param filename: Name of loaded location
         :type filename: str
+        :param level: The number of location, defaults to the level
+                    after the highest discovered one
+        :type level: int, optional
         """
+        if level is None:
+            level = max(self._indexes, default=0) + 1
         location = load_location_from_configuration(
-            self._game, filename, len(self._locations) + 1)
+            self._game, filename, level)
+        self._append_location(location, level)
+        if level > 1 and self._level != level - 1:
+            self._links[level] = self._level
+
+    def _append_location(self,
+                         location: Union[Location, SavedLocation, Dict],
+                         level: int = None):
+        """
+        Add location discovered by player, it is found by its level
+        and not by the order of discovery - gates may skip levels
+        """
+        if level is None:
+            level = self._location_level(location)
+        if not level:
+            level = len(self._locations) + 1
+        self._indexes[level] = len(self._locations)
         self._locations.append(location)
 
     def save(self):
         """
-        Save game state
+        Save game state, only changes relative to the configuration
+        are written
+
+        Saving again to the same slot appends changes made since
+        the previous save to the slot's journal, a big journal is folded
+        into the snapshot
+
+        Only the snapshot of the state is taken here,
+        files are written in the background
         """
         print('Enter Save Name:')
         filename = player_input(choose_string)
-        write_save_as_json(self._game, filename, self)
+        slot = path.splitext(filename)[0]
+        if self._journal and self._journal.slot() == slot:
+            self._journal_seq = append_journal(
+                self._game, self._journal, self._changes, Game, True)
+            self._changes = []
+        elif self.journaled():
+            self._journal = start_journal(self._game, filename, self, True)
+        else:
+            self._journal = None
+            write_save(self._game, filename, self, True, True)
+
+    def journaled(self) -> bool:
+        """
+        Whether changes can be journaled - every location
+        was loaded from the configuration
+
+        :rtype: bool
+        """
+        return all(self._location_source(location)
+                   for location in self._locations)
+
+    @staticmethod
+    def _location_source(
+            location: Union[Location, SavedLocation, Dict]) -> str:
+        """
+        :return: Configuration the location was loaded from or None
+        :rtype: str
+        """
+        if isinstance(location, (Location, SavedLocation, LevelSnapshot)):
+            return location.source()
+        if 'location' in location:
+            return location['location'].get('source')
+        return location.get('source')
+
+    @staticmethod
+    def _location_level(
+            location: Union[Location, SavedLocation, Dict]) -> int:
+        """
+        :return: Number of the location or None if it was not saved
+        :rtype: int
+        """
+        if isinstance(location, Location):
+            return location.level()
+        if isinstance(location, SavedLocation):
+            return location.header().get('level')
+        if isinstance(location, LevelSnapshot):
+            return location.level()
+        if 'location' in location:
+            return location['location'].get('level')
+        return location.get('level')
+
+    def _stored_location(self,
+                         location: Union[LevelSnapshot, Dict]) -> Location:
+        """
+        :return: Location created from its snapshot or delta without
+                replacing it, the level cache is not changed
+        :rtype: Location
+        """
+        if isinstance(location, LevelSnapshot):
+            return location_from_delta(self._game, location.delta())
+        return location_from_delta(self._game, location)
+
+    def _location_dict(self, number: int) -> Dict:
+        """
+        :return: Dictionary of the location with given index,
+                locations not needed yet stay stored as they were
+        :rtype: Dict
+        """
+        location = self._locations[number]
+        if isinstance(location, (Location, SavedLocation)):
+            return location.as_dict()
+        if isinstance(location, dict) and 'location' in location:
+            dictionary = location['location']
+            return dict(dictionary,
+                        coordinates=tuple(dictionary['coordinates']))
+        return self._stored_location(location).as_dict()
+
+    def _location_delta(self, number: int) -> Dict:
+        """
+        :return: Delta of the location with given index, locations
+                not needed yet stay stored as they were
+        :rtype: Dict
+        """
+        location = self._locations[number]
+        if isinstance(location, dict):
+            return location
+        if isinstance(location, LevelSnapshot):
+            return location.delta()
+        if isinstance(location, SavedLocation):
+            location = location.load()
+        return location_delta(self._game, location)
+
+    def round_state(self) -> Tuple:
+        """
+        Get state needed to find changes made during a round
+
+        :return: Level, number of locations, player's coordinates,
+                state of the current field, player's data and links
+        :rtype: Tuple
+        """
+        location = self.location()
+        x, y = location.coordinates()
+        return (self._level, len(self._locations), (x, y),
+                field_delta(self._game, location, x, y),
+                self._player.as_dict(), dict(self._links))
+
+    def record_changes(self, before: Tuple):
+        """
+        Remember changes made since the round state was taken,
+        they are written to the journal on the next save
+
+        :param before: Value returned by round state method
+        :type before: Tuple
+        """
+        level, count, coordinates, field, player, links = before
+        changes = []
+        for number in range(count, len(self._locations)):
+            changes.append({
+                'op': 'location',
+                'location': self._location_delta(number)})
+        for linked in sorted(set(self._links) - set(links)):
+            changes.append({'op': 'link', 'level': linked,
+                            'from': self._links[linked]})
+        location = self._left_location(level)
+        difference = field_delta(self._game, location, *coordinates)
+        if difference != field:
+            changes.append(self._field_change(level, coordinates, difference))
+        if location.coordinates() != coordinates:
+            changes.append({
+                'op': 'move',
+                'level': level,
+                'coordinates': location.coordinates()})
+            x, y = location.coordinates()
+            difference = field_delta(self._game, location, x, y)
+            changes.append(self._field_change(level, (x, y), difference))
+        if self._level != level:
+            changes.append({'op': 'level', 'level': self._level})
+        if self._player.as_dict() != player:
+            changes.append({'op': 'player', 'player': self._player.as_dict()})
+        self._changes.extend(changes)
+
+    def checkpoint(self):
+        """
+        Remember changes made so far during the round, used by methods
+        making many moves in one round so every move is journaled
+        """
+        if self._before:
+            self.record_changes(self._before)
+            self._before = self.round_state()
+
+    @staticmethod
+    def _field_change(level: int,
+                      coordinates: Tuple[int, int],
+                      difference: Dict) -> Dict:
+        """
+        :return: Change of the field's state
+        :rtype: Dict
+        """
+        x, y = coordinates
+        return {'op': 'field', 'level': level, 'x': x, 'y': y,
+                'state': difference}
+
+    def apply_journal(self, entries: List[Dict]):
+        """
+        Apply changes read from the journal
+
+        :param entries: List of changes with sequence numbers
+        :type entries: List[Dict]
+        """
+        for entry in entries:
+            op = entry['op']
+            if op == 'location':
+                self._append_location(entry['location'])
+            elif op == 'link':
+                self._links[entry['level']] = entry['from']
+            elif op == 'field':
+                apply_field_delta(
+                    self._game, self.location_at(entry['level']),
+                    entry['x'], entry['y'], entry['state'])
+            elif op == 'move':
+                self.location_at(entry['level']).set_coordinates(
+                    entry['coordinates'])
+            elif op == 'level':
+                self.set_level(entry['level'])
+            elif op == 'player':
+                self.set_player(Player.from_dict(entry['player']))
+            self._journal_seq = entry['seq']
 
     def round(self):
         """
@@ -231,6 +733,7 @@ class Game:
         player = self.player()
         location = self.location()
         field = location.current_field()
+        self._before = self.round_state() if self._journal else None
 
         player_methods = player.available_methods()
         print('\n')
@@ -255,25 +758,60 @@ class Game:
             choose_item_from_dict, game_methods))()
         if isinstance(result, Key):
             field.open_with_key(result, self)
+        if self._before:
+            self.record_changes(self._before)
+            self._before = None
 
     @staticmethod
     def load(game: str, filename: str) -> 'Game':
         """
-        Load Game from saves directory
+        Load Game from saves directory, json and binary saves
+        are both supported
 
-        :return: Name of the save
+        :param game: Name of the game
+        :type game: str
+        :param filename: Name of the save, optionally with extension
+        :type filename: str
+        :raises SaveError: Indicates that a save written in the background
+                            failed
+        :return: Loaded game
         :rtype: Game
         """
-        return load_save_from_json(game, filename, Game)
+        wait_for_saves()
+        return load_save(game, filename, Game)
 
     def available_methods(self) -> Dict:
         """
         Get the methods available now to the user
 
-        :return: Dictionary with save and exit functions
+        :return: Dictionary with travel, save and exit functions
         :rtype: Dict
         """
         return {
+            'travel to': self.travel_to,
             'save': self.save,
             'exit': self.exit
         }
+
+    def travel_to(self):
+        """
+        Move player to a gate, an item or coordinates chosen by the user
+        taking the shortest way over fields that were seen
+
+        Every field on the way is entered, travel stops after a fight
+        """
+        location = self.location()
+        print('Where do you want to go?')
+        print('(gate, gate <level>, win, item or coordinates x y)')
+        destinations = player_input(functools.partial(
+            choose_destination, location))
+        path = location.path_to(destinations)
+        if path is None and not location.connectivity().reachable(
+                location.coordinates(), destinations):
+            print('There is no way there')
+        elif path is None:
+            print("You don't know the way there")
+        elif not path:
+            print('You are already there')
+        else:
+            location.travel(self._player, path, self.checkpoint)
@@ -0,0 +1,530 @@
+from location.field import Field, FieldTemplate
+from location.fog import Fog
+from location.storage import BOARDER, BOARDER_FIELD, FieldStorage, Landmark
+
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# go_to of fields with a go_to that is not a level, like 'WIN'
+OTHER_GO_TO = -1
+
+# Icons of the map by code computed in _codes
+ICONS = (' X ', ' G ', ' M ', ' i ', ' + ', ' o ', ' - ', '   ')
+
+
+class ArrayFields(FieldStorage):
+    """
+    ArrayFields - template index, enterable, gate, enemy and item
+    flags and danger of every field are kept in NumPy arrays,
+    seen flags are kept in the fog of the location
+
+    Field objects are created only when a field is requested and
+    are kept afterwards, values of such fields are copied back to
+    the arrays before map-wide operations. Rows of fields that were
+    not requested are temporary copies
+
+    Requires numpy - an optional dependency
+
+    Contains attributes:
+
+    :param grid: Matrix of template indexes without boarders
+    :type grid: List[List[int]]
+
+    :param templates: List of templates
+    :type templates: List[FieldTemplate]
+    """
+
+    def __init__(self, grid: List[List[int]], templates: List[FieldTemplate]):
+        """
+        Initialize ArrayFields
+
+        :param grid: Matrix of template indexes without boarders
+        :type grid: List[List[int]]
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        :raises ImportError: Indicates that numpy is not installed
+        """
+        if np is None:
+            raise ImportError('ArrayFields requires numpy')
+        templates = list(templates) + [BOARDER]
+        rows = [np.asarray(row, dtype=np.int32) for row in grid]
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        ids = np.full((height + 2, width + 2), len(templates) - 1,
+                      dtype=np.int32)
+        if height and width:
+            ids[1:-1, 1:-1] = np.stack(rows)
+        self._set_arrays(ids, templates)
+
+    @staticmethod
+    def from_matrix(location: List[List[Field]]) -> 'ArrayFields':
+        """
+        Get ArrayFields with fields of the matrix, fields are copied -
+        given Field objects are not kept
+
+        :param location: Matrix of fields with boarders
+        :type location: List[List[Field]]
+        :return: Storage with the same fields
+        :rtype: ArrayFields
+        """
+        if np is None:
+            raise ImportError('ArrayFields requires numpy')
+        indexes = {}
+        templates = []
+        grid = []
+        states = []
+        for y, row in enumerate(location):
+            grid.append([])
+            for x, field in enumerate(row):
+                template = field.template()
+                if id(template) not in indexes:
+                    indexes[id(template)] = len(templates)
+                    templates.append(template)
+                grid[y].append(indexes[id(template)])
+                state = field.state()
+                if state:
+                    states.append((x, y, state))
+        storage = ArrayFields.__new__(ArrayFields)
+        storage._set_arrays(np.array(grid, dtype=np.int32), templates)
+        for x, y, state in states:
+            storage.field(x, y).set_state(state)
+        return storage
+
+    # Getters and Setters
+
+    def width(self) -> int:
+        """
+        Get width
+
+        :return: Number of fields in a row
+        :rtype: int
+        """
+        return self._ids.shape[1]
+
+    def height(self) -> int:
+        """
+        Get height
+
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._ids.shape[0]
+
+    def ids(self) -> 'np.ndarray':
+        """
+        Get template indexes of all fields, boarder has the last index
+
+        :return: Read-only array of shape (height, width)
+        :rtype: np.ndarray
+        """
+        return self._read_only(self._ids)
+
+    def virtual_boarder(self) -> bool:
+        """
+        Whether every boarder field is made from the BOARDER template
+
+        :rtype: bool
+        """
+        ids = self._ids
+        boarder = [index for index, template in enumerate(self._templates)
+                   if template is BOARDER]
+        if not boarder:
+            return False
+        edges = np.concatenate((ids[0], ids[-1], ids[:, 0], ids[:, -1]))
+        return bool(np.all(edges == boarder[0]))
+
+    def enterable_mask(self) -> 'np.ndarray':
+        """
+        Get whether fields can be entered
+
+        :return: Read-only array of shape (height, width)
+        :rtype: np.ndarray
+        """
+        self._sync()
+        return self._read_only(self._enterable)
+
+    def gate_mask(self) -> 'np.ndarray':
+        """
+        Get whether fields lead to a different location
+
+        :return: Array of shape (height, width)
+        :rtype: np.ndarray
+        """
+        self._sync()
+        return self._go_to != 0
+
+    def danger_values(self) -> 'np.ndarray':
+        """
+        Get danger of fields
+
+        :return: Read-only array of shape (height, width)
+        :rtype: np.ndarray
+        """
+        self._sync()
+        return self._read_only(self._danger)
+
+    def created_fields(self) -> int:
+        """
+        Get number of Field objects created so far
+
+        :return: Number of fields kept by the storage
+        :rtype: int
+        """
+        return len(self._fields)
+
+    # Custom Methods
+
+    def bind(self, fog: Fog):
+        """
+        Bind fields created so far to the storage and the fog,
+        fields created later are bound when they are requested
+
+        :param fog: Fog of the location
+        :type fog: Fog
+        """
+        super().bind(fog)
+        for (x, y), field in self._fields.items():
+            field.bind(self, fog, x, y)
+
+    def field(self, x: int, y: int) -> Field:
+        """
+        Get field with given coordinates, create it if needed
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :raises IndexError: Indicates that coordinates are out of range
+        :return: Field with given coordinates
+        :rtype: Field
+        """
+        field = self._fields.get((x, y))
+        if field is None:
+            if not (0 <= x < self.width() and 0 <= y < self.height()):
+                raise IndexError('Field out of range')
+            field = self._new_field(x, y)
+            if field is not BOARDER_FIELD:
+                self._fields[(x, y)] = field
+                if self._fog is not None:
+                    field.bind(self, self._fog, x, y)
+        return field
+
+    def enterable(self, x: int, y: int) -> bool:
+        """
+        Whether player can enter the field, does not create the field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Enterable, False outside the location
+        :rtype: bool
+        """
+        if not (0 <= x < self.width() and 0 <= y < self.height()):
+            return False
+        field = self._fields.get((x, y))
+        if field is not None:
+            return field.enterable()
+        return bool(self._enterable[y, x])
+
+    def enterable_row(self, y: int) -> int:
+        """
+        Get enterable flags of fields in given row without creating fields
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: Number with bit x set if field x can be entered,
+                0 outside the location
+        :rtype: int
+        """
+        if not 0 <= y < self.height():
+            return 0
+        value = int.from_bytes(np.packbits(
+            self._enterable[y], bitorder='little').tobytes(), 'little')
+        for (x, field_y), field in self._fields.items():
+            if field_y == y:
+                bit = 1 << x
+                value = value | bit if field.enterable() else value & ~bit
+        return value
+
+    def rows(self) -> Iterator[List[Field]]:
+        """
+        Get all rows of fields, fields that were not requested
+        are temporary copies
+
+        :return: Iterator over rows
+        :rtype: Iterator[List[Field]]
+        """
+        for y in range(self.height()):
+            yield self.row_fields(y)
+
+    def row_fields(self, y: int) -> List[Field]:
+        """
+        Get fields in given row, fields that were not requested
+        are temporary copies
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: List of fields
+        :rtype: List[Field]
+        """
+        row = []
+        for x in range(self.width()):
+            field = self._fields.get((x, y))
+            row.append(field if field is not None else self._new_field(x, y))
+        return row
+
+    def field_types(self, y: int, fog: Fog = None) -> List[str]:
+        """
+        Get icons of fields in given row
+
+        :param y: Coordinate - y
+        :type y: int
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: List of icons
+        :rtype: List[str]
+        """
+        return self._types(slice(y, y + 1), fog)[0]
+
+    def map_types(self, fog: Fog = None) -> List[List[str]]:
+        """
+        Get icons of all fields computed at once
+
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: Matrix of icons
+        :rtype: List[List[str]]
+        """
+        return self._types(slice(None), fog)
+
+    def window_types(self,
+                     y: int,
+                     x0: int,
+                     x1: int,
+                     fog: Fog = None) -> List[str]:
+        """
+        Get icons of fields x0 to x1 of given row
+
+        :param y: Coordinate - y
+        :type y: int
+        :param x0: First column
+        :type x0: int
+        :param x1: Column after the last one
+        :type x1: int
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: List of icons
+        :rtype: List[str]
+        """
+        x0 = max(x0, 0)
+        x1 = min(x1, self.width())
+        if fog is None:
+            return self.field_types(y)[x0:x1]
+        if x0 >= x1:
+            return []
+        self._sync()
+        bits = fog.span(y, x0, x1).to_bytes((x1 - x0 + 7) // 8, 'little')
+        seen = np.unpackbits(np.frombuffer(bits, dtype=np.uint8),
+                             count=x1 - x0, bitorder='little').astype(bool)
+        return self._icons(slice(y, y + 1), slice(x0, x1), seen[None, :])[0]
+
+    def seen_fog(self) -> Fog:
+        """
+        Get fog with seen flags of the fields
+
+        :return: New fog
+        :rtype: Fog
+        """
+        seen = self._template_seen[self._ids]
+        for (x, y), field in self._fields.items():
+            seen[y, x] = field.seen()
+        bits = np.packbits(seen, axis=1, bitorder='little')
+        return Fog(self.width(), self.height(), bits.tobytes())
+
+    def find_go_to(self, go_to: int) -> Tuple[int, int]:
+        """
+        Find first field with given go_to value
+
+        :param go_to: Searched go_to value
+        :type go_to: int
+        :return: Coordinates (x, y) or None if not found
+        :rtype: Tuple[int, int]
+        """
+        if go_to_code(go_to) == OTHER_GO_TO:
+            return super().find_go_to(go_to)
+        self._sync()
+        found = np.flatnonzero(self._go_to == go_to)
+        if not len(found):
+            return None
+        y, x = divmod(int(found[0]), self.width())
+        return x, y
+
+    def landmarks(self) -> Iterator[Tuple[int, int, Landmark]]:
+        """
+        Get fields that are gates or have an enemy or an item,
+        found in the arrays at once
+
+        :return: Iterator over coordinates (x, y) and landmark of a field
+        :rtype: Iterator[Tuple[int, int, Landmark]]
+        """
+        self._sync()
+        ys, xs = np.nonzero((self._go_to != 0) | self._enemy | self._item)
+        for x, y, go_to, enemy, item in zip(
+                xs.tolist(), ys.tolist(), self._go_to[ys, xs].tolist(),
+                self._enemy[ys, xs].tolist(), self._item[ys, xs].tolist()):
+            if go_to == OTHER_GO_TO:
+                field = self._fields.get((x, y))
+                go_to = field.go_to() if field is not None else \
+                    self._templates[self._ids[y, x]].value('go_to')
+            yield x, y, (go_to, enemy, item)
+
+    def changes(self,
+                grid: List[List[int]],
+                templates: List[FieldTemplate]
+                ) -> Iterator[Tuple[int, int, Dict]]:
+        """
+        Get fields that differ from the configuration, only fields
+        that were requested could be changed
+
+        :param grid: Matrix of template indexes without boarders,
+                    the one this storage was created from
+        :type grid: List[List[int]]
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        :return: Iterator over coordinates (x, y) and difference of fields
+                ordered by rows
+        :rtype: Iterator[Tuple[int, int, Dict]]
+        """
+        width = self.width()
+        height = self.height()
+        for x, y in sorted(self._fields, key=lambda cell: cell[::-1]):
+            if 0 < x < width - 1 and 0 < y < height - 1:
+                difference = self._fields[(x, y)].difference(
+                    templates[grid[y - 1][x - 1]])
+                if difference:
+                    yield x, y, difference
+
+    def _new_field(self, x: int, y: int) -> Field:
+        """
+        Create field from its template, boarder is the shared BOARDER_FIELD
+
+        :return: New field
+        :rtype: Field
+        """
+        template = self._templates[self._ids[y, x]]
+        if template is BOARDER:
+            return BOARDER_FIELD
+        return Field.from_template(template)
+
+    def _sync(self):
+        """
+        Copy values of created fields back to the arrays
+        """
+        for (x, y), field in self._fields.items():
+            self._enterable[y, x] = field.enterable()
+            self._go_to[y, x] = go_to_code(field.go_to())
+            self._danger[y, x] = field.danger()
+            self._enemy[y, x] = field.has_enemy()
+            self._item[y, x] = field.has_item()
+
+    def _set_arrays(self, ids: 'np.ndarray', templates: List[FieldTemplate]):
+        """
+        Compute arrays of values from template indexes
+
+        :param ids: Template indexes of all fields with boarders
+        :type ids: np.ndarray
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        """
+        columns = list(zip(*[
+            (template.value('enterable'), template.value('seen'),
+             go_to_code(template.value('go_to')), template.value('danger'),
+             template.value('enemy') is not None,
+             template.value('item') is not None)
+            for template in templates]))
+        self._templates = templates
+        self._ids = ids
+        self._template_seen = np.array(columns[1], dtype=bool)
+        self._enterable = np.array(columns[0], dtype=bool)[ids]
+        self._go_to = np.array(columns[2], dtype=np.int32)[ids]
+        self._danger = np.array(columns[3], dtype=np.int32)[ids]
+        self._enemy = np.array(columns[4], dtype=bool)[ids]
+        self._item = np.array(columns[5], dtype=bool)[ids]
+        self._fields = {}
+
+    def _types(self, rows: slice, fog: Fog = None) -> List[List[str]]:
+        """
+        Get icons of the rows, same rules as Field.field_type
+
+        :param rows: Rows of the map
+        :type rows: slice
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: Matrix of icons
+        :rtype: List[List[str]]
+        """
+        if fog is None:
+            fog = self.seen_fog()
+        self._sync()
+        bits = np.frombuffer(fog.to_bytes(), dtype=np.uint8).reshape(
+            self.height(), -1)[rows]
+        seen = np.unpackbits(bits, axis=1, count=self.width(),
+                             bitorder='little').astype(bool)
+        return self._icons(rows, slice(None), seen)
+
+    def _icons(self,
+               rows: slice,
+               columns: slice,
+               seen: 'np.ndarray') -> List[List[str]]:
+        """
+        Get icons of the part of the map, same rules as Field.field_type
+
+        :param rows: Rows of the map
+        :type rows: slice
+        :param columns: Columns of the map
+        :type columns: slice
+        :param seen: Seen flags of the part of the map
+        :type seen: np.ndarray
+        :return: Matrix of icons
+        :rtype: List[List[str]]
+        """
+        danger = self._danger[rows, columns]
+        codes = np.select(
+            [~seen, ~self._enterable[rows, columns],
+             self._go_to[rows, columns] != 0, self._enemy[rows, columns],
+             self._item[rows, columns], danger > 0, danger == 0],
+            [7, 0, 1, 2, 3, 4, 5], 6)
+        return np.array(ICONS, dtype=object)[codes].tolist()
+
+    @staticmethod
+    def _read_only(array: 'np.ndarray') -> 'np.ndarray':
+        """
+        :return: View of the array that cannot be written
+        :rtype: np.ndarray
+        """
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+
+def go_to_code(go_to) -> int:
+    """
+    Get value of go_to kept in the array
+
+    :param go_to: go_to of a field
+    :return: Level or OTHER_GO_TO for go_to like 'WIN'
+    :rtype: int
+    """
+    if isinstance(go_to, int) and go_to >= 0:
+        return go_to
+    return OTHER_GO_TO
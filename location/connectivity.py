@@ -0,0 +1,311 @@
+from location.storage import FieldStorage
+
+from array import array
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, Set, Tuple
+
+
+# Steps to the neighbouring fields - north, south, east and west
+STEPS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+
+class Connectivity:
+    """
+    Connectivity - labels of areas of fields connected by fields
+    player can enter, fields with the same label can be reached
+    from one another
+
+    Labels are computed once from rows of enterable flags - runs of
+    enterable fields are joined with overlapping runs of the previous
+    row. Connectivity created from a storage may listen to it - field
+    that becomes enterable joins the areas around it, field that is
+    blocked searches only the area it was part of to find out
+    if it was split
+
+    Contains attributes:
+
+    :param width: Number of fields in a row
+    :type width: int
+
+    :param height: Number of rows
+    :type height: int
+
+    :param source: Function returning enterable flags of a row as bits
+    :type source: Callable[[int], int]
+    """
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 source: Callable[[int], int]):
+        """
+        Initialize Connectivity and label all fields
+
+        :param width: Number of fields in a row
+        :type width: int
+        :param height: Number of rows
+        :type height: int
+        :param source: Function returning number with bit x set
+                        if field x of the row can be entered
+        :type source: Callable[[int], int]
+        """
+        self._width = width
+        self._height = height
+        self._source = source
+        self._labels = array('l', [0]) * (width * height)
+        self._parent = [0]
+        self._label_rows()
+
+    @staticmethod
+    def from_storage(storage: FieldStorage,
+                     listen: bool = False) -> 'Connectivity':
+        """
+        Get labels of fields of the storage
+
+        :param storage: Fields of the location
+        :type storage: FieldStorage
+        :param listen: Whether to update labels after changes of fields,
+                        defaults to False
+        :type listen: bool, optional
+        :return: New connectivity
+        :rtype: Connectivity
+        """
+        connectivity = Connectivity(storage.width(), storage.height(),
+                                    storage.enterable_row)
+        if listen:
+            storage.add_listener(connectivity.update)
+        return connectivity
+
+    @staticmethod
+    def from_rows(rows: List[int], width: int) -> 'Connectivity':
+        """
+        Get labels of fields with given enterable flags
+
+        :param rows: Number with bit x set if field x can be entered
+                    for every row
+        :type rows: List[int]
+        :param width: Number of fields in a row
+        :type width: int
+        :return: New connectivity
+        :rtype: Connectivity
+        """
+        return Connectivity(width, len(rows), rows.__getitem__)
+
+    # Getters and Setters
+
+    def label(self, x: int, y: int) -> int:
+        """
+        Get label of the area the field belongs to
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Label, 0 if field cannot be entered or is outside
+                the location
+        :rtype: int
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return 0
+        label = self._labels[y * self._width + x]
+        return self._find(label) if label else 0
+
+    def count(self) -> int:
+        """
+        Get number of separate areas
+
+        :return: Number of labels in use
+        :rtype: int
+        """
+        return len({self._find(label) for label in set(self._labels)
+                    if label})
+
+    # Custom Methods
+
+    def connected(self,
+                  first: Tuple[int, int],
+                  second: Tuple[int, int]) -> bool:
+        """
+        Whether player can walk from one field to another
+
+        :param first: Coordinates (x, y) of the first field
+        :type first: Tuple[int, int]
+        :param second: Coordinates (x, y) of the second field
+        :type second: Tuple[int, int]
+        :rtype: bool
+        """
+        label = self.label(*first)
+        return label != 0 and label == self.label(*second)
+
+    def reachable(self,
+                  start: Tuple[int, int],
+                  cells: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Get fields player can walk to from the start
+
+        :param start: Coordinates (x, y) of the first field
+        :type start: Tuple[int, int]
+        :param cells: Coordinates (x, y) of checked fields
+        :type cells: Iterable[Tuple[int, int]]
+        :return: Coordinates of reachable fields in the same order
+        :rtype: List[Tuple[int, int]]
+        """
+        label = self.label(*start)
+        if not label:
+            return []
+        return [cell for cell in cells if self.label(*cell) == label]
+
+    def update(self, x: int, y: int):
+        """
+        Update labels if the field can be entered now and could not
+        before or the other way round, called by the storage
+        after a change of the field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return
+        index = y * self._width + x
+        enterable = bool(self._source(y) >> x & 1)
+        if enterable == bool(self._labels[index]):
+            return
+        neighbours = [cell for cell in self._neighbours(x, y)
+                      if self._labels[cell[1] * self._width + cell[0]]]
+        if enterable:
+            roots = {self.label(*cell) for cell in neighbours}
+            root = roots.pop() if roots else self._new_label()
+            for other in roots:
+                self._parent[other] = root
+            self._labels[index] = root
+        else:
+            self._labels[index] = 0
+            self._split(neighbours)
+
+    def _label_rows(self):
+        """
+        Label all fields joining runs of enterable fields
+        with overlapping runs of the previous row
+        """
+        parent = self._parent
+        rows = []
+        previous = []
+        for y in range(self._height):
+            runs = []
+            index = 0
+            for x0, x1 in bit_runs(self._source(y)):
+                label = 0
+                while index < len(previous) and previous[index][1] <= x0:
+                    index += 1
+                check = index
+                while check < len(previous) and previous[check][0] < x1:
+                    other = self._find(previous[check][2])
+                    if not label:
+                        label = other
+                    elif other != label:
+                        parent[other] = label
+                    check += 1
+                if not label:
+                    label = self._new_label()
+                runs.append((x0, x1, label))
+            rows.append(runs)
+            previous = runs
+        labels = self._labels
+        for y, runs in enumerate(rows):
+            start = y * self._width
+            for x0, x1, label in runs:
+                labels[start + x0:start + x1] = \
+                    array('l', [self._find(label)]) * (x1 - x0)
+
+    def _split(self, neighbours: List[Tuple[int, int]]):
+        """
+        Give new labels to parts of the area that are no longer connected
+        after a field between the neighbours was blocked
+
+        :param neighbours: Enterable fields next to the blocked field
+        :type neighbours: List[Tuple[int, int]]
+        """
+        pending = neighbours
+        while len(pending) > 1:
+            visited = self._flood(pending[0], set(pending[1:]))
+            if visited is None:
+                return
+            label = self._new_label()
+            for x, y in visited:
+                self._labels[y * self._width + x] = label
+            pending = [cell for cell in pending[1:] if cell not in visited]
+
+    def _flood(self,
+               start: Tuple[int, int],
+               targets: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """
+        Search enterable fields breadth first until all targets are found
+
+        :return: All fields connected with the start or None
+                if every target was found
+        :rtype: Set[Tuple[int, int]]
+        """
+        visited = {start}
+        queue = deque([start])
+        targets = targets - visited
+        while queue:
+            x, y = queue.popleft()
+            for cell in self._neighbours(x, y):
+                if cell not in visited and \
+                        self._labels[cell[1] * self._width + cell[0]]:
+                    visited.add(cell)
+                    queue.append(cell)
+                    targets.discard(cell)
+                    if not targets:
+                        return None
+        return visited
+
+    def _neighbours(self, x: int, y: int) -> Iterator[Tuple[int, int]]:
+        """
+        :return: Coordinates of neighbouring fields inside the location
+        :rtype: Iterator[Tuple[int, int]]
+        """
+        for dx, dy in STEPS:
+            if 0 <= x + dx < self._width and 0 <= y + dy < self._height:
+                yield x + dx, y + dy
+
+    def _new_label(self) -> int:
+        """
+        :return: Label not used before
+        :rtype: int
+        """
+        self._parent.append(len(self._parent))
+        return len(self._parent) - 1
+
+    def _find(self, label: int) -> int:
+        """
+        :return: Label the given label was joined with
+        :rtype: int
+        """
+        parent = self._parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+
+def bit_runs(value: int) -> Iterator[Tuple[int, int]]:
+    """
+    Get runs of set bits of the number
+
+    :param value: Number
+    :type value: int
+    :return: Iterator over first bit and bit after the last one of a run
+    :rtype: Iterator[Tuple[int, int]]
+    """
+    x = 0
+    while value:
+        zeros = (value & -value).bit_length() - 1
+        value >>= zeros
+        x += zeros
+        ones = (~value & (value + 1)).bit_length() - 1
+        yield x, x + ones
+        value >>= ones
+        x += ones
@@ -0,0 +1,118 @@
+from location.storage import FieldStorage
+
+
+# Bits of directions player can go from a field
+NORTH = 1
+SOUTH = 2
+EAST = 4
+WEST = 8
+
+# Turns binary digits of a number into bytes with values 0 and 1
+_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+class ExitTable:
+    """
+    ExitTable - directions player can go from every field of a location,
+    one byte per field kept in a single bytearray
+
+    Table is computed once from rows of enterable flags and listens to
+    the storage of the location - a field that becomes enterable
+    or blocked updates bits of its four neighbours
+
+    Contains attributes:
+
+    :param storage: Fields of the location
+    :type storage: FieldStorage
+
+    :param listen: Whether to listen to the storage, defaults to False
+    :type listen: bool, optional
+    """
+
+    def __init__(self, storage: FieldStorage, listen: bool = False):
+        """
+        Initialize ExitTable
+
+        :param storage: Fields of the location
+        :type storage: FieldStorage
+        :param listen: Whether to update the table after changes
+                        of fields, defaults to False
+        :type listen: bool, optional
+        """
+        self._storage = storage
+        self._width = storage.width()
+        self._height = storage.height()
+        self._exits = bytearray(self._width * self._height)
+        self._fill()
+        if listen:
+            storage.add_listener(self.update)
+
+    # Getters and Setters
+
+    def exits(self, x: int, y: int) -> int:
+        """
+        Get directions player can go from the field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Sum of NORTH, SOUTH, EAST and WEST bits
+        :rtype: int
+        """
+        return self._exits[y * self._width + x]
+
+    # Custom Methods
+
+    def update(self, x: int, y: int):
+        """
+        Set exits of the neighbours leading to the field,
+        called by the storage after its change
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        """
+        enterable = self._storage.enterable(x, y)
+        for n_x, n_y, direction in ((x, y + 1, NORTH), (x, y - 1, SOUTH),
+                                    (x - 1, y, EAST), (x + 1, y, WEST)):
+            if 0 <= n_x < self._width and 0 <= n_y < self._height:
+                index = n_y * self._width + n_x
+                if enterable:
+                    self._exits[index] |= direction
+                else:
+                    self._exits[index] &= ~direction
+
+    def _fill(self):
+        """
+        Compute exits of all fields from enterable flags of the rows
+        """
+        width = self._width
+        mask = (1 << width) - 1
+        above = 0
+        row = self._storage.enterable_row(0)
+        for y in range(self._height):
+            below = self._storage.enterable_row(y + 1)
+            value = (spread(above, width) * NORTH |
+                     spread(below, width) * SOUTH |
+                     spread(row >> 1, width) * EAST |
+                     spread(row << 1 & mask, width) * WEST)
+            self._exits[y * width:(y + 1) * width] = \
+                value.to_bytes(width, 'little')
+            above, row = row, below
+
+
+def spread(value: int, width: int) -> int:
+    """
+    Move bit x of the number to bit 8 * x - the lowest bit of byte x
+
+    :param value: Number lower than 2 ** width
+    :type value: int
+    :param width: Number of bits
+    :type width: int
+    :return: Number with a bit in every eighth position
+    :rtype: int
+    """
+    digits = format(value, f'0{width}b').encode('ascii')
+    return int.from_bytes(digits.translate(_DIGITS), 'big')
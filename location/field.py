@@ -6,6 +6,7 @@ from utils.player_input import choose_item_from_dict, player_input
 from utils.format import print_formatted_list, print_break
 
 
+from types import MappingProxyType
 from typing import Dict
 import functools
 
@@ -20,10 +21,205 @@ class GameOverError(Exception):
     pass
 
 
+class BoarderError(Exception):
+    """
+    Indicates that the boarder field shared by all locations was changed
+
+    :param Exception: Boarder cannot be changed
+    :type Exception: Exception
+    """
+    pass
+
+
+class FieldTemplate:
+    """
+    FieldTemplate - immutable static data shared by all fields of one kind
+
+    Contains attributes:
+
+    :param name: Name of the field, defaults to ''
+    :type name: str, optional
+
+    :param description: Description of the field, defaults to ''
+    :type description: str, optional
+
+    :param danger: Value of regeneration/damage that is delt to player
+                    on entrance, defaults to 0
+    :type danger: int, optional
+
+    :param enemy: Enemy's data as a dictionary, defaults to None
+    :type enemy: Dict, optional
+
+    :param item: Item's data as a dictionary, defaults to None
+    :type item: Dict, optional
+
+    :param enterable: Whether player can enter this field, defaults to True
+    :type enterable: bool, optional
+
+    :param seen: Whether field is initially shown on map, defaults to False
+    :type seen: bool, optional
+
+    :param go_to: Value of next location player can go from this field,
+                defaults to 0
+    :type go_to: int, optional
+
+    :param trusted: Whether template comes from validated configuration -
+                    its enemy and item are created without checks,
+                    defaults to False
+    :type trusted: bool, optional
+    """
+
+    __slots__ = ('_values', '_trusted')
+
+    def __init__(self,
+                 name: str = '',
+                 desc: str = '',
+                 danger: int = 0,
+                 enemy: Dict = None,
+                 item: Dict = None,
+                 enterable: bool = True,
+                 seen: bool = False,
+                 go_to: int = 0,
+                 trusted: bool = False):
+        """
+        Initialize FieldTemplate
+
+        :param name: Name of the field, defaults to ''
+        :type name: str, optional
+        :param desc: Description of the field, defaults to ''
+        :type desc: str, optional
+        :param danger: Value of regeneration/damage that is delt to player
+                        on entrance, defaults to 0
+        :type danger: int, optional
+        :param enemy: Enemy's data as a dictionary, defaults to None
+        :type enemy: Dict, optional
+        :param item: Item's data as a dictionary, defaults to None
+        :type item: Dict, optional
+        :param enterable: Whether player can enter this field, defaults to True
+        :type enterable: bool, optional
+        :param seen: Whether field is initially shown on map, defaults to False
+        :type seen: bool, optional
+        :param go_to: Value of next location player can go from this field,
+                    defaults to 0
+        :type go_to: int, optional
+        :param trusted: Whether template comes from validated configuration,
+                        defaults to False
+        :type trusted: bool, optional
+        """
+        object.__setattr__(self, '_trusted', trusted)
+        object.__setattr__(self, '_values', MappingProxyType({
+            'name': name if name else '',
+            'description': desc if desc else '',
+            'danger': danger,
+            'enemy': enemy if enemy else None,
+            'item': item if item else None,
+            'enterable': enterable,
+            'seen': seen,
+            'go_to': go_to
+        }))
+
+    def __setattr__(self, name, value):
+        """
+        :raises AttributeError: Templates are shared and cannot be modified
+        """
+        raise AttributeError('FieldTemplate is immutable')
+
+    def as_dict(self) -> Dict:
+        """
+        Get FieldTemplate as a dictionary in the format used by Field
+
+        :return: Dictionary with template's data
+        :rtype: Dict
+        """
+        dictionary = {
+            key: self._values[key]
+            for key in ('name', 'description', 'danger',
+                        'enterable', 'seen', 'go_to')
+        }
+        if self._values['enemy']:
+            dictionary['enemy'] = dict(self._values['enemy'])
+        if self._values['item']:
+            dictionary['item'] = dict(self._values['item'])
+        return dictionary
+
+    @staticmethod
+    def from_dict(dictionary: Dict, trusted: bool = False) -> 'FieldTemplate':
+        """
+        Get new FieldTemplate instance loaded from dictionary
+
+        :param dictionary: Dictionary with Field's data
+        :type dictionary: Dict
+        :param trusted: Whether dictionary comes from validated
+                        configuration, defaults to False
+        :type trusted: bool, optional
+        :return: Loaded FieldTemplate
+        :rtype: FieldTemplate
+        """
+        return FieldTemplate(
+            dictionary.get('name', ''),
+            dictionary.get('description', ''),
+            dictionary.get('danger', 0),
+            dictionary.get('enemy', None),
+            dictionary.get('item', None),
+            dictionary.get('enterable', True),
+            dictionary.get('seen', False),
+            dictionary.get('go_to', 0),
+            trusted
+        )
+
+    def trusted(self) -> bool:
+        """
+        Whether template comes from validated configuration
+
+        :rtype: bool
+        """
+        return self._trusted
+
+    def value(self, key: str):
+        """
+        Get static value with given key
+
+        :param key: Key from the Field's dictionary
+        :type key: str
+        :return: Value of the template
+        :rtype: Any
+        """
+        return self._values[key]
+
+    def __eq__(self, other) -> bool:
+        """
+        :param other: Checked object
+        :type other: Any
+        :return: Indicates whether self and other are equal
+        :rtype: bool
+        """
+        return (isinstance(other, FieldTemplate) and
+                self._values == other._values)
+
+    def __hash__(self) -> int:
+        """
+        :return: Identity based hash - templates are shared objects
+        :rtype: int
+        """
+        return id(self)
+
+
+# Marks that field's enemy or item were not yet created from the template
+_FROM_TEMPLATE = object()
+
+
 class Field:
     """
     Field
 
+    Static data is kept in a FieldTemplate shared between fields,
+    field stores only its own state - seen flag, enemy, item
+    and values changed with setters
+
+    Seen flag of a field taken from a location is kept
+    in the location's fog, other changes of its icon are reported
+    to the fog as well, so the cached map is redrawn
+
     Contains attributes:
 
     :param name: Name of the field, defaults to ''
@@ -54,6 +250,9 @@ class Field:
     :type go_to: int, optional
         """
 
+    __slots__ = ('_template', '_overlay', '_seen', '_enemy', '_item',
+                 '_fog', '_storage', '_cell')
+
     def __init__(self,
                  name: str = '',
                  desc: str = '',
@@ -86,14 +285,22 @@ class Field:
                     defaults to 0
         :type go_to: int, optional
         """
-        self.set_name(name)
-        self.set_description(desc)
-        self.set_danger(danger)
-        self.set_enemy(enemy)
-        self.set_item(item)
-        self.set_enterable(enterable)
-        self.set_seen(seen)
-        self.set_go_to(go_to)
+        self._template = FieldTemplate(
+            name,
+            desc,
+            danger,
+            enemy.as_dict() if enemy else None,
+            item.as_dict() if item else None,
+            enterable,
+            seen,
+            go_to)
+        self._fog = None
+        self._storage = None
+        self._cell = None
+        self._overlay = None
+        self._seen = seen
+        self._enemy = enemy
+        self._item = item
 
     def as_dict(self) -> Dict:
         """
@@ -103,39 +310,232 @@ class Field:
         :rtype: Dict
         """
         dictionary = {
-            'name': self._name,
-            'description': self._description,
-            'danger': self._danger,
-            'enterable': self._enterable,
-            'seen': self._seen,
-            'go_to': self._go_to
+            'name': self.name(),
+            'description': self.description(),
+            'danger': self.danger(),
+            'enterable': self.enterable(),
+            'seen': self.seen(),
+            'go_to': self.go_to()
         }
-        if self._enemy:
-            dictionary['enemy'] = self._enemy.as_dict()
-        if self._item:
-            dictionary['item'] = self._item.as_dict()
+        enemy = self._enemy_as_dict()
+        if enemy:
+            dictionary['enemy'] = enemy
+        item = self._item_as_dict()
+        if item:
+            dictionary['item'] = item
         return dictionary
 
     @staticmethod
-    def from_dict(dictionary: Dict) -> 'Field':
+    def from_dict(dictionary: Dict, templates: Dict = None) -> 'Field':
         """
         Get new Field instance loaded from dictionary
 
         :param dictionary: Dictionary with Field's data
         :type dictionary: Dict
+        :param templates: Templates shared between loaded fields,
+                        filled while loading, defaults to None
+        :type templates: Dict, optional
         :return: Loaded Field
         :rtype: Field
         """
-        return Field(
+        if templates is None:
+            return Field.from_template(FieldTemplate.from_dict(dictionary))
+        static = (
             dictionary.get('name', ''),
             dictionary.get('description', ''),
             dictionary.get('danger', 0),
-            Enemy.from_dict(dictionary.get('enemy', None)),
-            Item.item_from_dict(dictionary.get('item', None)),
             dictionary.get('enterable', True),
             dictionary.get('seen', False),
             dictionary.get('go_to', 0)
         )
+        template = templates.get(static)
+        if not template:
+            template = FieldTemplate(
+                static[0],
+                static[1],
+                static[2],
+                enterable=static[3],
+                seen=static[4],
+                go_to=static[5])
+            templates[static] = template
+        field = Field.from_template(template)
+        field._enemy = Enemy.from_dict(dictionary.get('enemy', None))
+        field._item = Item.item_from_dict(dictionary.get('item', None))
+        return field
+
+    @staticmethod
+    def from_template(template: FieldTemplate,
+                      state: Dict = None) -> 'Field':
+        """
+        Get new Field instance sharing given template
+
+        :param template: Static data of the field
+        :type template: FieldTemplate
+        :param state: Field's own state as returned by state method,
+                    defaults to None
+        :type state: Dict, optional
+        :return: Field with given template
+        :rtype: Field
+        """
+        field = Field.__new__(Field)
+        field._fog = None
+        field._storage = None
+        field._cell = None
+        field.set_template(template, state)
+        return field
+
+    def template(self) -> FieldTemplate:
+        """
+        Get template
+
+        :return: Static data shared with other fields
+        :rtype: FieldTemplate
+        """
+        return self._template
+
+    def set_template(self, template: FieldTemplate, state: Dict = None):
+        """
+        Set template and replace whole state of the field
+
+        :param template: Static data of the field
+        :type template: FieldTemplate
+        :param state: Field's own state as returned by state method,
+                    defaults to None
+        :type state: Dict, optional
+        """
+        self._template = template
+        self._overlay = None
+        self.set_seen(template.value('seen'))
+        self._enemy = _FROM_TEMPLATE
+        self._item = _FROM_TEMPLATE
+        self._changed()
+        if state:
+            self.set_state(state)
+
+    def state(self) -> Dict:
+        """
+        Get field's own state - values that differ from the template
+
+        :return: Dictionary with changed values of Field's dictionary,
+                killed enemy or taken item have None value
+        :rtype: Dict
+        """
+        state = dict(self._overlay) if self._overlay else {}
+        seen = self.seen()
+        if seen != self._template.value('seen'):
+            state['seen'] = seen
+        if self._enemy is not _FROM_TEMPLATE:
+            enemy = self._enemy.as_dict() if self._enemy else None
+            if enemy != self._template.value('enemy'):
+                state['enemy'] = enemy
+        if self._item is not _FROM_TEMPLATE:
+            item = self._item.as_dict() if self._item else None
+            if item != self._template.value('item'):
+                state['item'] = item
+        return state
+
+    def set_state(self, state: Dict):
+        """
+        Apply field's own state on top of the template
+
+        :param state: Dictionary returned by state method
+        :type state: Dict
+        """
+        for key, value in state.items():
+            if key == 'seen':
+                self.set_seen(value)
+            elif key == 'enemy':
+                self.set_enemy(Enemy.from_dict(value))
+            elif key == 'item':
+                self.set_item(Item.item_from_dict(value))
+            else:
+                self._set_static(key, value)
+
+    def difference(self, template: FieldTemplate) -> Dict:
+        """
+        Get values that differ from given template,
+        the result can be applied with set_state
+
+        :param template: Template the field is compared with
+        :type template: FieldTemplate
+        :return: Dictionary with changed values of Field's dictionary,
+                killed enemy or taken item have None value
+        :rtype: Dict
+        """
+        if self._template is template:
+            return self.state()
+        dictionary = self.as_dict()
+        base = template.as_dict()
+        difference = {key: value for key, value in dictionary.items()
+                      if base.get(key) != value}
+        for key in ('enemy', 'item'):
+            if key in base and key not in dictionary:
+                difference[key] = None
+        return difference
+
+    def has_own_state(self) -> bool:
+        """
+        Whether field may differ from its template in anything other than
+        the seen flag, does not compute the state
+
+        :return: False if field looks exactly like its template
+        :rtype: bool
+        """
+        return bool(self._overlay) or self._enemy is not _FROM_TEMPLATE or \
+            self._item is not _FROM_TEMPLATE
+
+    def _static(self, key: str):
+        """
+        Get static value, changed by setter or taken from the template
+
+        :param key: Key from the Field's dictionary
+        :type key: str
+        :return: Current value
+        :rtype: Any
+        """
+        overlay = self._overlay
+        if overlay is not None and key in overlay:
+            return overlay[key]
+        return self._template.value(key)
+
+    def _set_static(self, key: str, value):
+        """
+        Set static value - copy it to field's overlay
+        unless it is equal to the template's value
+
+        :param key: Key from the Field's dictionary
+        :type key: str
+        :param value: New value
+        :type value: Any
+        """
+        if value == self._template.value(key):
+            if self._overlay:
+                self._overlay.pop(key, None)
+        else:
+            if self._overlay is None:
+                self._overlay = {}
+            self._overlay[key] = value
+        self._changed()
+
+    def _enemy_as_dict(self) -> Dict:
+        """
+        :return: Enemy's data without creating Enemy from the template
+        :rtype: Dict
+        """
+        if self._enemy is _FROM_TEMPLATE:
+            enemy = self._template.value('enemy')
+            return dict(enemy) if enemy else None
+        return self._enemy.as_dict() if self._enemy else None
+
+    def _item_as_dict(self) -> Dict:
+        """
+        :return: Item's data without creating Item from the template
+        :rtype: Dict
+        """
+        if self._item is _FROM_TEMPLATE:
+            item = self._template.value('item')
+            return dict(item) if item else None
+        return self._item.as_dict() if self._item else None
 
     # Getters and Setters
 
@@ -146,7 +546,7 @@ class Field:
         :return: Name of the field
         :rtype: str
         """
-        return self._name
+        return self._static('name')
 
     def set_name(self, name: str):
         """
@@ -155,7 +555,7 @@ class Field:
         :param name: Name of the field
         :type name: str
         """
-        self._name = name if name else ''
+        self._set_static('name', name if name else '')
 
     def description(self) -> str:
         """
@@ -164,7 +564,7 @@ class Field:
         :return: Description of the field
         :rtype: str
         """
-        return self._description
+        return self._static('description')
 
     def set_description(self, desc: str):
         """
@@ -173,7 +573,7 @@ class Field:
         :param desc: Description of the field
         :type desc: str
         """
-        self._description = desc if desc else ''
+        self._set_static('description', desc if desc else '')
 
     def danger(self) -> int:
         """
@@ -182,7 +582,7 @@ class Field:
         :return: Value of danger
         :rtype: int
         """
-        return self._danger
+        return self._static('danger')
 
     def set_danger(self, danger: int):
         """
@@ -191,7 +591,7 @@ class Field:
         :param danger: Value of danger
         :type danger: int
         """
-        self._danger = danger
+        self._set_static('danger', danger)
 
     def enemy(self) -> "Enemy":
         """
@@ -200,6 +600,9 @@ class Field:
         :return: Monster from this field
         :rtype: Enemy
         """
+        if self._enemy is _FROM_TEMPLATE:
+            self._enemy = Enemy.from_dict(self._template.value('enemy'),
+                                          self._template.trusted())
         return self._enemy
 
     def set_enemy(self, enemy: "Enemy"):
@@ -210,6 +613,18 @@ class Field:
         :type enemy: Enemy
         """
         self._enemy = enemy
+        self._changed()
+
+    def has_enemy(self) -> bool:
+        """
+        Whether enemy lives on this field, does not create the enemy
+
+        :return: Whether field has an enemy
+        :rtype: bool
+        """
+        if self._enemy is _FROM_TEMPLATE:
+            return self._template.value('enemy') is not None
+        return self._enemy is not None
 
     def item(self) -> "Item":
         """
@@ -218,6 +633,8 @@ class Field:
         :return: Pickup
         :rtype: Item
         """
+        if self._item is _FROM_TEMPLATE:
+            self._item = Item.item_from_dict(self._template.value('item'))
         return self._item
 
     def set_item(self, item: "Item"):
@@ -228,6 +645,18 @@ class Field:
         :type item: Item
         """
         self._item = item
+        self._changed()
+
+    def has_item(self) -> bool:
+        """
+        Whether pickup lies on this field, does not create the item
+
+        :return: Whether field has an item
+        :rtype: bool
+        """
+        if self._item is _FROM_TEMPLATE:
+            return self._template.value('item') is not None
+        return self._item is not None
 
     def enterable(self) -> bool:
         """
@@ -236,7 +665,7 @@ class Field:
         :return: Enterable
         :rtype: bool
         """
-        return self._enterable
+        return self._static('enterable')
 
     def set_enterable(self, enterable: bool):
         """
@@ -245,7 +674,7 @@ class Field:
         :param enterable: If player can enter this field
         :type enterable: bool
         """
-        self._enterable = enterable
+        self._set_static('enterable', enterable)
 
     def seen(self) -> bool:
         """
@@ -254,6 +683,8 @@ class Field:
         :return: Whether player has been on this field
         :rtype: bool
         """
+        if self._fog is not None:
+            return self._fog.seen(*self._cell)
         return self._seen
 
     def set_seen(self, seen: bool = True):
@@ -264,6 +695,53 @@ class Field:
         :type seen: bool, optional
         """
         self._seen = seen
+        if self._fog is not None:
+            self._fog.set_seen(*self._cell, seen)
+
+    def _changed(self):
+        """
+        Tell the storage of the location that the field changed
+        """
+        if self._storage is not None:
+            self._storage.changed(*self._cell)
+
+    def fog(self) -> "Fog":
+        """
+        Get fog keeping the seen flag
+
+        :return: Fog of the location the field was taken from or None
+        :rtype: Fog
+        """
+        return self._fog
+
+    def storage(self) -> "FieldStorage":
+        """
+        Get storage told about changes of the field
+
+        :return: Storage of the location the field belongs to or None
+        :rtype: FieldStorage
+        """
+        return self._storage
+
+    def bind(self, storage: "FieldStorage", fog: "Fog", x: int, y: int):
+        """
+        Keep the seen flag in the fog of a location and tell its storage
+        about other changes, field that was seen stays seen
+
+        :param storage: Storage of the location
+        :type storage: FieldStorage
+        :param fog: Fog of the location
+        :type fog: Fog
+        :param x: Coordinate of the field - x
+        :type x: int
+        :param y: Coordinate of the field - y
+        :type y: int
+        """
+        if self._seen and not fog.seen(x, y):
+            fog.set_seen(x, y)
+        self._fog = fog
+        self._storage = storage
+        self._cell = (x, y)
 
     def gate(self) -> bool:
         """
@@ -273,7 +751,7 @@ class Field:
         :return: If go_to value is different than 0
         :rtype: bool
         """
-        return self._go_to != 0
+        return self.go_to() != 0
 
     def go_to(self) -> int:
         """
@@ -282,7 +760,7 @@ class Field:
         :return: Value of next location player can go from this field
         :rtype: int
         """
-        return self._go_to
+        return self._static('go_to')
 
     def set_go_to(self, go_to: int):
         """
@@ -291,7 +769,7 @@ class Field:
         :param go_to: Value of next location player can go from this field
         :type go_to: int
         """
-        self._go_to = go_to
+        self._set_static('go_to', go_to)
 
     def field_type(self) -> str:
         """
@@ -300,23 +778,32 @@ class Field:
         :return: Icon that will indicate fields position on the map
         :rtype: str
         """
-        if not self._seen:
+        if not self.seen():
             return '   '
+        return self.visible_type()
+
+    def visible_type(self) -> str:
+        """
+        Get type of the field as if it was seen
+
+        :return: Icon that will indicate fields position on the map
+        :rtype: str
+        """
+        danger = self.danger()
+        if not self.enterable():
+            return ' X '
+        elif self.gate():
+            return ' G '
+        elif self.has_enemy():
+            return ' M '
+        elif self.has_item():
+            return ' i '
+        elif danger > 0:
+            return ' + '
+        elif danger == 0:
+            return ' o '
         else:
-            if not self._enterable:
-                return ' X '
-            elif self.gate():
-                return ' G '
-            elif self._enemy:
-                return ' M '
-            elif self._item:
-                return ' i '
-            elif self._danger > 0:
-                return ' + '
-            elif self._danger == 0:
-                return ' o '
-            else:
-                return ' - '
+            return ' - '
 
     def open(self, player: Player, game):
         """
@@ -325,7 +812,9 @@ class Field:
         Searches player's inventory for matching key
         and if the key is found loads a new location
 
-        Teleports player to a new location
+        Teleports player to a new location - gate of the current level
+        leads back to the level it was entered from, other gates lead
+        to the level of their go_to
 
         :param player: Player instance
         :type player: Player
@@ -333,26 +822,26 @@ class Field:
         :type game: Game
         """
         print('\n')
-        if self._go_to == game.level():
-            if self._go_to == 1:
+        if self.go_to() == game.level():
+            if game.previous_level() < 1:
                 print('No earlier locations available!')
             else:
                 print('You are now leaving previous location!')
-                game.set_level(game.level()-1)
+                game.set_level(game.previous_level())
                 game.location().description()
-        elif self._go_to <= len(game.locations()):
+        elif game.has_level(self.go_to()):
             print('Location already open - no need for keys ;P')
-            game.set_level(game.level()+1)
+            game.set_level(self.go_to())
             game.location().description()
         else:
-            key = player.search_for_key(self._go_to)
+            key = player.search_for_key(self.go_to())
             if key:
                 print('You have opened a new location!')
                 print('\n')
                 print('You enter a place you do not know.')
                 print('I wonder what might be around the corner?')
-                game.add_location(key.location_filename())
-                game.set_level(game.level()+1)
+                game.add_location(key.location_filename(), key.level())
+                game.set_level(key.level())
                 game.location().description()
             else:
                 print('None of the available keys match!')
@@ -372,29 +861,29 @@ class Field:
         :type game: Game
         """
         print('\n')
-        if self._go_to == game.level():
-            if self._go_to == 1:
+        if self.go_to() == game.level():
+            if game.previous_level() < 1:
                 print('No earlier locations available!')
             else:
                 msg = 'You are now leaving previous location'
                 msg += ' - no need for keys ;P'
                 print(msg)
-                game.set_level(game.level()-1)
+                game.set_level(game.previous_level())
                 game.location().description()
-        elif self._go_to <= len(game.locations()) and self._go_to != 0:
+        elif game.has_level(self.go_to()) and self.go_to() != 0:
             print('Location already open - no need for keys ;P')
-            game.set_level(game.level()+1)
+            game.set_level(self.go_to())
             game.location().description()
         else:
-            if key.level() == self._go_to:
+            if key.level() == self.go_to():
                 print('You have opened a new location!')
                 print('\n')
                 print('You enter a place you do not know.')
                 print('I wonder what might be around the corner?')
-                game.add_location(key.location_filename())
-                game.set_level(game.level()+1)
+                game.add_location(key.location_filename(), key.level())
+                game.set_level(key.level())
                 game.location().description()
-            elif self._go_to == 0:
+            elif self.go_to() == 0:
                 print('You cannot use keys on a normal field!')
             else:
                 print("That key doesn't match ;P")
@@ -409,9 +898,9 @@ class Field:
         :param player: Player instance
         :type player: Player
         """
-        if self._item:
-            if player.pickup_item(self._item):
-                self._item = None
+        if self.has_item():
+            if player.pickup_item(self.item()):
+                self.set_item(None)
 
     def drop(self, player: Player):
         """
@@ -420,9 +909,9 @@ class Field:
         :param player: Player instance
         :type player: Player
         """
-        if not self._item:
+        if not self.has_item():
             item = player.drop_item()
-            self._item = item
+            self.set_item(item)
 
     def fight(self, player: Player):
         """
@@ -432,7 +921,7 @@ class Field:
         :type player: Player
         :raises GameOverError: Indicates that player's health is equal to 0
         """
-        enemy = self._enemy
+        enemy = self.enemy()
         print('\n')
         print("Let's begin the fight!!!")
         print('')
@@ -468,11 +957,11 @@ class Field:
         :rtype: bool
         """
 
-        if player.inflict_damage(self._enemy):
+        if player.inflict_damage(self.enemy()):
             return True
         else:
             print('You Won. Enemy has died !!!')
-            self._enemy = None
+            self.set_enemy(None)
             return False
 
     def hide(self, player: Player) -> bool:
@@ -499,17 +988,18 @@ class Field:
                                 of the game - you won
         :raises GameOverError: Indicates that player has no health
         """
-        if self._go_to == 'WIN':
+        if self.go_to() == 'WIN':
             raise GameOverError('\nYou Won!\n\nCongratulations :O')
-        if self._danger < 0:
-            if not player.take_damage(-self._danger):
+        danger = self.danger()
+        if danger < 0:
+            if not player.take_damage(-danger):
                 msg = 'Game Over: (\nYou died from hunger.\n'
                 msg += 'The field you were standing on had no water '
                 raise GameOverError(msg)
-        elif self._danger != 0:
-            player.regenerate(self._danger)
+        elif danger != 0:
+            player.regenerate(danger)
 
-        if self._enemy:
+        if self.has_enemy():
             self.fight(player)
 
     def __str__(self) -> str:
@@ -541,14 +1031,118 @@ class Field:
         """
         dictionary = {}
         eq_size = len(player.equipment())
-        if self._enemy:
-            dictionary['enemy info'] = self._enemy.print_info
-        if self._item:
-            dictionary['item info'] = self._item.print_info
-        if eq_size != 0 and not self._item:
+        if self.has_enemy():
+            dictionary['enemy info'] = self.enemy().print_info
+        if self.has_item():
+            dictionary['item info'] = self.item().print_info
+        if eq_size != 0 and not self.has_item():
             dictionary['drop item'] = functools.partial(self.drop, player)
-        if eq_size != player.equipment_size and self._item and not self._enemy:
+        if (eq_size != player.equipment_size and self.has_item()
+                and not self.has_enemy()):
             dictionary['pickup item'] = functools.partial(self.pickup, player)
-        if self._go_to != 0:
+        if self.go_to() != 0:
             dictionary['open'] = functools.partial(self.open, player, game)
         return dictionary
+
+
+class BoarderField(Field):
+    """
+    BoarderField - field that cannot be changed, a single instance
+    is shared by every boarder cell of every location
+
+    Boarder is never bound to the fog of a location,
+    its seen flag is always the one of its template
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def from_template(template: FieldTemplate,
+                      state: Dict = None) -> 'BoarderField':
+        """
+        Get new BoarderField instance with given template
+
+        :param template: Static data of the field
+        :type template: FieldTemplate
+        :param state: Not supported, boarder has no state of its own,
+                    defaults to None
+        :type state: Dict, optional
+        :raises BoarderError: Indicates that state was given
+        :return: Boarder field
+        :rtype: BoarderField
+        """
+        if state:
+            raise BoarderError('Boarder cannot have its own state')
+        field = BoarderField.__new__(BoarderField)
+        field._template = template
+        field._overlay = None
+        field._seen = template.value('seen')
+        field._enemy = _FROM_TEMPLATE
+        field._item = _FROM_TEMPLATE
+        field._fog = None
+        field._storage = None
+        field._cell = None
+        return field
+
+    def enemy(self) -> "Enemy":
+        """
+        Get enemy, new instance is created on every call
+
+        :return: Enemy of the template or None
+        :rtype: Enemy
+        """
+        return Enemy.from_dict(self._template.value('enemy'))
+
+    def item(self) -> "Item":
+        """
+        Get item, new instance is created on every call
+
+        :return: Item of the template or None
+        :rtype: Item
+        """
+        return Item.item_from_dict(self._template.value('item'))
+
+    def set_template(self, template: FieldTemplate, state: Dict = None):
+        """
+        :raises BoarderError: Boarder cannot be changed
+        """
+        raise BoarderError('Boarder cannot be changed')
+
+    def set_state(self, state: Dict):
+        """
+        :raises BoarderError: Boarder cannot be changed
+        """
+        raise BoarderError('Boarder cannot be changed')
+
+    def set_enemy(self, enemy: "Enemy"):
+        """
+        :raises BoarderError: Boarder cannot be changed
+        """
+        raise BoarderError('Boarder cannot be changed')
+
+    def set_item(self, item: "Item"):
+        """
+        :raises BoarderError: Boarder cannot be changed
+        """
+        raise BoarderError('Boarder cannot be changed')
+
+    def set_seen(self, seen: bool = True):
+        """
+        Seeing the boarder again changes nothing
+
+        :raises BoarderError: Indicates that seen flag would change
+        """
+        if seen != self._seen:
+            raise BoarderError('Boarder cannot be changed')
+
+    def bind(self, storage: "FieldStorage", fog: "Fog", x: int, y: int):
+        """
+        Boarder is not bound to any location, it does not change
+        """
+        pass
+
+    def _set_static(self, key: str, value):
+        """
+        :raises BoarderError: Boarder cannot be changed
+        """
+        raise BoarderError('Boarder cannot be changed')
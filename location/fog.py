@@ -0,0 +1,442 @@
+from base64 import b64decode, b64encode
+from typing import Callable, Iterator, List, Tuple, Union
+
+
+class FogError(Exception):
+    """
+    Indicates that saved fog does not fit the location
+
+    :param Exception: Fog cannot be loaded
+    :type Exception: Exception
+    """
+    pass
+
+
+class Fog:
+    """
+    Fog - fog of war of a location, whether each field was seen
+    is kept as one bit of a packed bitset
+
+    Every row starts at a new byte, bit x % 8 of byte x // 8
+    of the row belongs to the field x
+
+    Rows can be computed by a source function the first time they
+    are needed, so large locations do not visit every field at startup
+
+    Listeners added with add_listener are told about every changed row
+
+    Contains attributes:
+
+    :param width: Number of fields in a row
+    :type width: int
+
+    :param height: Number of rows
+    :type height: int
+
+    :param data: Packed bits returned by to_bytes, defaults to None
+    :type data: bytes, optional
+
+    :param source: Function returning seen flags of row y as a number
+                with bit x set if field x was seen, defaults to None
+    :type source: Callable[[int], int], optional
+    """
+
+    __slots__ = ('_width', '_height', '_stride', '_bits', '_source',
+                 '_ready', '_listeners')
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 data: bytes = None,
+                 source: Callable[[int], int] = None):
+        """
+        Initialize Fog, all fields are not seen unless
+        data or source is given
+
+        :param width: Number of fields in a row
+        :type width: int
+        :param height: Number of rows
+        :type height: int
+        :param data: Packed bits returned by to_bytes, defaults to None
+        :type data: bytes, optional
+        :param source: Function returning seen flags of a row,
+                        defaults to None
+        :type source: Callable[[int], int], optional
+        :raises FogError: Indicates that data has a wrong size
+        """
+        self._width = width
+        self._height = height
+        self._stride = (width + 7) // 8
+        self._bits = bytearray(self._stride * height)
+        self._source = source
+        self._ready = bytearray(height) if source else None
+        self._listeners = ()
+        if data is not None:
+            self.set_bytes(data)
+
+    @staticmethod
+    def from_rows(rows: Iterator[List[bool]],
+                  width: int,
+                  height: int) -> 'Fog':
+        """
+        Get fog with seen flags of the rows
+
+        :param rows: Rows of seen flags
+        :type rows: Iterator[List[bool]]
+        :param width: Number of fields in a row
+        :type width: int
+        :param height: Number of rows
+        :type height: int
+        :return: New fog
+        :rtype: Fog
+        """
+        fog = Fog(width, height)
+        for y, row in enumerate(rows):
+            value = 0
+            for x, seen in enumerate(row):
+                if seen:
+                    value |= 1 << x
+            fog._set_row(y, value)
+        return fog
+
+    # Getters and Setters
+
+    def width(self) -> int:
+        """
+        Get width
+
+        :return: Number of fields in a row
+        :rtype: int
+        """
+        return self._width
+
+    def height(self) -> int:
+        """
+        Get height
+
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._height
+
+    def seen(self, x: int, y: int) -> bool:
+        """
+        Whether field was seen
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Whether field is shown on the map
+        :rtype: bool
+        """
+        if self._ready is not None and not self._ready[y]:
+            self._prepare(y)
+        return bool(self._bits[y * self._stride + (x >> 3)] & (1 << (x & 7)))
+
+    def set_seen(self, x: int, y: int, seen: bool = True):
+        """
+        Set whether field was seen, listeners are told only
+        if the flag changed
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :param seen: Whether field is shown on the map, defaults to True
+        :type seen: bool, optional
+        """
+        if self._ready is not None and not self._ready[y]:
+            self._prepare(y)
+        index = y * self._stride + (x >> 3)
+        old = self._bits[index]
+        if seen:
+            self._bits[index] = old | 1 << (x & 7)
+        else:
+            self._bits[index] = old & ~(1 << (x & 7)) & 0xFF
+        if self._bits[index] != old:
+            for listener in self._listeners:
+                listener(y)
+
+    def row(self, y: int) -> int:
+        """
+        Get seen flags of the row
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: Number with bit x set if field x was seen
+        :rtype: int
+        """
+        if self._ready is not None and not self._ready[y]:
+            self._prepare(y)
+        start = y * self._stride
+        return int.from_bytes(self._bits[start:start + self._stride],
+                              'little')
+
+    def span(self, y: int, x0: int, x1: int) -> int:
+        """
+        Get seen flags of fields x0 to x1 of the row
+        without reading the whole row
+
+        :param y: Coordinate - y
+        :type y: int
+        :param x0: First column
+        :type x0: int
+        :param x1: Column after the last one
+        :type x1: int
+        :return: Number with bit x set if field x0 + x was seen
+        :rtype: int
+        """
+        if x1 <= x0:
+            return 0
+        if self._ready is not None and not self._ready[y]:
+            self._prepare(y)
+        start = y * self._stride
+        value = int.from_bytes(
+            self._bits[start + (x0 >> 3):start + ((x1 + 7) >> 3)], 'little')
+        return value >> (x0 & 7) & ((1 << (x1 - x0)) - 1)
+
+    def set_bytes(self, data: bytes):
+        """
+        Replace all seen flags
+
+        :param data: Packed bits returned by to_bytes
+        :type data: bytes
+        :raises FogError: Indicates that data has a wrong size
+        """
+        if len(data) != len(self._bits):
+            raise FogError(f'Fog of {len(data)} bytes does not fit '
+                           f'{self._width}x{self._height} location')
+        self._bits[:] = data
+        self._source = None
+        self._ready = None
+        for listener in self._listeners:
+            listener(None)
+
+    def listeners(self) -> Tuple[Callable[[int], None], ...]:
+        """
+        Get listeners
+
+        :return: Functions called after a change
+        :rtype: Tuple[Callable[[int], None], ...]
+        """
+        return self._listeners
+
+    def add_listener(self, listener: Callable[[int], None]):
+        """
+        Add function called with the changed row,
+        row is None if all rows changed
+
+        :param listener: Function called after a change
+        :type listener: Callable[[int], None]
+        """
+        self._listeners += (listener,)
+
+    # Custom Methods
+
+    def reveal_span(self, y: int, x0: int, x1: int):
+        """
+        Mark fields x0 to x1 of the row as seen
+
+        :param y: Coordinate - y
+        :type y: int
+        :param x0: First column
+        :type x0: int
+        :param x1: Last column, inclusive
+        :type x1: int
+        """
+        x0 = max(x0, 0)
+        x1 = min(x1, self._width - 1)
+        if x0 > x1 or not 0 <= y < self._height:
+            return
+        if self._ready is not None and not self._ready[y]:
+            self._prepare(y)
+        start = y * self._stride
+        first, last = x0 >> 3, x1 >> 3
+        low = (0xFF << (x0 & 7)) & 0xFF
+        high = 0xFF >> (7 - (x1 & 7))
+        if first == last:
+            self._bits[start + first] |= low & high
+        else:
+            self._bits[start + first] |= low
+            self._bits[start + first + 1:start + last] = \
+                b'\xff' * (last - first - 1)
+            self._bits[start + last] |= high
+        for listener in self._listeners:
+            listener(y)
+
+    def reveal_row(self, y: int):
+        """
+        Mark whole row as seen
+
+        :param y: Coordinate - y
+        :type y: int
+        """
+        self.reveal_span(y, 0, self._width - 1)
+
+    def reveal_rect(self, x0: int, y0: int, x1: int, y1: int):
+        """
+        Mark fields in the rectangle as seen
+
+        :param x0: First column
+        :type x0: int
+        :param y0: First row
+        :type y0: int
+        :param x1: Last column, inclusive
+        :type x1: int
+        :param y1: Last row, inclusive
+        :type y1: int
+        """
+        for y in range(max(y0, 0), min(y1 + 1, self._height)):
+            self.reveal_span(y, x0, x1)
+
+    def reveal_radius(self, x: int, y: int, radius: int):
+        """
+        Mark fields not further than radius from the field as seen
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :param radius: Distance in fields
+        :type radius: int
+        """
+        for dy in range(-radius, radius + 1):
+            dx = int((radius * radius - dy * dy) ** 0.5)
+            self.reveal_span(y + dy, x - dx, x + dx)
+
+    def reveal_room(self,
+                    x: int,
+                    y: int,
+                    enterable: Callable[[int, int], bool]) -> int:
+        """
+        Mark enterable fields connected with the field and fields
+        around them as seen - the room with its walls
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :param enterable: Function telling whether field (x, y)
+                        can be entered
+        :type enterable: Callable[[int, int], bool]
+        :return: Number of enterable fields of the room
+        :rtype: int
+        """
+        visited = {(x, y)}
+        stack = [(x, y)]
+        while stack:
+            x, y = stack.pop()
+            self.reveal_span(y - 1, x - 1, x + 1)
+            self.reveal_span(y, x - 1, x + 1)
+            self.reveal_span(y + 1, x - 1, x + 1)
+            for step in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if step not in visited and \
+                        0 <= step[0] < self._width and \
+                        0 <= step[1] < self._height and enterable(*step):
+                    visited.add(step)
+                    stack.append(step)
+        return len(visited)
+
+    def count(self) -> int:
+        """
+        Get number of seen fields
+
+        :rtype: int
+        """
+        self._prepare_all()
+        return int.from_bytes(self._bits, 'little').bit_count()
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        """
+        Get coordinates of seen fields ordered by rows
+
+        :return: Iterator over coordinates (x, y)
+        :rtype: Iterator[Tuple[int, int]]
+        """
+        for y in range(self._height):
+            row = self.row(y)
+            while row:
+                low = row & -row
+                yield low.bit_length() - 1, y
+                row ^= low
+
+    def to_bytes(self) -> bytes:
+        """
+        Get packed bits
+
+        :return: Rows of bits, each starting at a new byte
+        :rtype: bytes
+        """
+        self._prepare_all()
+        return bytes(self._bits)
+
+    def encode(self, text: bool = False) -> Union[bytes, str]:
+        """
+        Get packed bits for a save
+
+        :param text: Whether to encode bits as base64 for json,
+                    defaults to False
+        :type text: bool, optional
+        :return: Packed bits or their base64
+        :rtype: Union[bytes, str]
+        """
+        data = self.to_bytes()
+        return b64encode(data).decode('ascii') if text else data
+
+    def load(self, value: Union[bytes, str]):
+        """
+        Replace all seen flags with the ones from a save
+
+        :param value: Value returned by encode method
+        :type value: Union[bytes, str]
+        :raises FogError: Indicates that fog does not fit the location
+        """
+        if isinstance(value, str):
+            value = b64decode(value)
+        self.set_bytes(value)
+
+    def copy(self) -> 'Fog':
+        """
+        :return: Fog with the same seen flags
+        :rtype: Fog
+        """
+        return Fog(self._width, self._height, self.to_bytes())
+
+    def __eq__(self, other) -> bool:
+        """
+        :param other: Checked object
+        :type other: Any
+        :return: Indicates whether self and other are equal
+        :rtype: bool
+        """
+        return (isinstance(other, Fog) and
+                self._width == other._width and
+                self.to_bytes() == other.to_bytes())
+
+    def _set_row(self, y: int, value: int):
+        """
+        Replace seen flags of the row
+        """
+        start = y * self._stride
+        self._bits[start:start + self._stride] = \
+            value.to_bytes(self._stride, 'little')
+
+    def _prepare(self, y: int):
+        """
+        Compute the row with the source
+        """
+        self._ready[y] = 1
+        self._set_row(y, self._source(y))
+
+    def _prepare_all(self):
+        """
+        Compute all rows that were not needed yet
+        """
+        if self._ready is None:
+            return
+        for y in range(self._height):
+            if not self._ready[y]:
+                self._prepare(y)
+        self._source = None
+        self._ready = None
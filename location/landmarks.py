@@ -0,0 +1,179 @@
+from location.storage import FieldStorage, Landmark, field_landmark
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple, Union
+
+
+class LandmarkIndex:
+    """
+    LandmarkIndex - positions of gates by their go_to value,
+    of enemies, of items and of fields winning the game
+
+    Index is built once from the storage and listens to it - fields
+    of the location report their changes there, so picked up or dropped
+    items and killed enemies are updated in place
+
+    Contains attributes:
+
+    :param storage: Fields of the location
+    :type storage: FieldStorage
+
+    :param listen: Whether to listen to the storage, defaults to False
+    :type listen: bool, optional
+    """
+
+    def __init__(self, storage: FieldStorage, listen: bool = False):
+        """
+        Initialize LandmarkIndex
+
+        :param storage: Fields of the location
+        :type storage: FieldStorage
+        :param listen: Whether to update the index after changes
+                        of fields, defaults to False
+        :type listen: bool, optional
+        """
+        self._storage = storage
+        self._cells = {(x, y): landmark
+                       for x, y, landmark in storage.landmarks()}
+        self._gates = {}
+        for (x, y), (go_to, _, _) in self._cells.items():
+            if go_to != 0:
+                self._gates.setdefault(go_to, []).append((y, x))
+        for cells in self._gates.values():
+            cells.sort()
+        self._enemies = {cell for cell, landmark in self._cells.items()
+                         if landmark[1]}
+        self._items = {cell for cell, landmark in self._cells.items()
+                       if landmark[2]}
+        if listen:
+            storage.add_listener(self.update)
+
+    # Getters and Setters
+
+    def landmark(self, x: int, y: int) -> Landmark:
+        """
+        Get landmark of the field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: go_to, whether field has an enemy and an item,
+                None if field is not a landmark
+        :rtype: Landmark
+        """
+        return self._cells.get((x, y))
+
+    def gate(self, go_to: Union[int, str]) -> Tuple[int, int]:
+        """
+        Get first field with given go_to value, ordered by rows
+
+        :param go_to: Searched go_to value
+        :type go_to: Union[int, str]
+        :return: Coordinates (x, y) or None if not found
+        :rtype: Tuple[int, int]
+        """
+        cells = self._gates.get(go_to)
+        if not cells:
+            return None
+        y, x = cells[0]
+        return x, y
+
+    def gates(self, go_to: Union[int, str] = None) -> List[Tuple[int, int]]:
+        """
+        Get fields with given go_to value ordered by rows
+
+        :param go_to: Searched go_to value, defaults to all gates
+        :type go_to: Union[int, str], optional
+        :return: List of coordinates (x, y)
+        :rtype: List[Tuple[int, int]]
+        """
+        if go_to is None:
+            cells = sorted(cell for cells in self._gates.values()
+                           for cell in cells)
+        else:
+            cells = self._gates.get(go_to, [])
+        return [(x, y) for y, x in cells]
+
+    def gate_values(self) -> Dict[Union[int, str], int]:
+        """
+        Get go_to values of gates
+
+        :return: Dictionary with number of gates by go_to value
+        :rtype: Dict[Union[int, str], int]
+        """
+        return {go_to: len(cells) for go_to, cells in self._gates.items()}
+
+    def wins(self) -> List[Tuple[int, int]]:
+        """
+        Get fields winning the game
+
+        :return: List of coordinates (x, y) ordered by rows
+        :rtype: List[Tuple[int, int]]
+        """
+        return self.gates('WIN')
+
+    def enemies(self) -> List[Tuple[int, int]]:
+        """
+        Get fields with enemies
+
+        :return: List of coordinates (x, y) ordered by rows
+        :rtype: List[Tuple[int, int]]
+        """
+        return sorted(self._enemies, key=lambda cell: cell[::-1])
+
+    def items(self) -> List[Tuple[int, int]]:
+        """
+        Get fields with items
+
+        :return: List of coordinates (x, y) ordered by rows
+        :rtype: List[Tuple[int, int]]
+        """
+        return sorted(self._items, key=lambda cell: cell[::-1])
+
+    # Custom Methods
+
+    def update(self, x: int, y: int):
+        """
+        Read the field again, called by the storage after its change
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        """
+        landmark = field_landmark(self._storage.field(x, y))
+        if landmark == self._cells.get((x, y)):
+            return
+        self._remove(x, y)
+        if landmark:
+            self._add(x, y, landmark)
+
+    def _add(self, x: int, y: int, landmark: Landmark):
+        """
+        Add landmark of the field
+        """
+        go_to, enemy, item = landmark
+        self._cells[(x, y)] = landmark
+        if go_to != 0:
+            insort(self._gates.setdefault(go_to, []), (y, x))
+        if enemy:
+            self._enemies.add((x, y))
+        if item:
+            self._items.add((x, y))
+
+    def _remove(self, x: int, y: int):
+        """
+        Remove landmark of the field if it had one
+        """
+        landmark = self._cells.pop((x, y), None)
+        if landmark is None:
+            return
+        go_to = landmark[0]
+        if go_to != 0:
+            cells = self._gates[go_to]
+            del cells[bisect_left(cells, (y, x))]
+            if not cells:
+                del self._gates[go_to]
+        self._enemies.discard((x, y))
+        self._items.discard((x, y))
@@ -1,7 +1,14 @@
-from location.field import Field
+from location.field import Field, FieldTemplate
+from location.connectivity import Connectivity
+from location.exits import EAST, NORTH, SOUTH, WEST, ExitTable
+from location.fog import Fog
+from location.landmarks import LandmarkIndex
+from location.pathfinding import PathFinder
+from location.renderer import MapRenderer, map_view
+from location.storage import FieldMatrix, FieldStorage, is_boarder
 from entities.player import Player
 
-from typing import List, Dict, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 
 class EmptyLocationError(Exception):
@@ -48,40 +55,74 @@ class Location:
     """
     Location
 
+    Seen flags of fields are kept in the location's fog - a packed bitset,
+    fields taken from the location read and write their flag there
+
+    Positions of gates, enemies and items are kept in a LandmarkIndex
+    built the first time it is needed, paths over seen fields are found
+    by a PathFinder, areas connected by enterable fields are labeled
+    by Connectivity and directions player can go from every field
+    are kept in an ExitTable
+
+    Map is drawn by a MapRenderer that keeps drawn rows
+    until their fields change, on large maps only a window around
+    the player and a minimap can be shown - see set_map_view
+
     Contains attributes:
 
-    :param location: Matrix of fields
-    :type location: List[List[Field]]
+    :param location: Matrix of fields or storage with fields
+    :type location: List[List[Field]] or FieldStorage
 
     :param coordinates: Player's coordinates, defaults to None
     :type coordinates: Tuple[int, int], optional
 
     :param level: Location level, defaults to 1
     :type level: int, optional
+
+    :param source: Name of the configuration file location was loaded from,
+                    defaults to None
+    :type source: str, optional
+
+    :param checked: Whether to check the shape of the matrix,
+                    defaults to True
+    :type checked: bool, optional
     """
 
     def __init__(self,
                  location: List[List[Field]],
                  set_boarders: bool = True,
                  coordinates: Tuple[int, int] = None,
-                 level: int = 1):
+                 level: int = 1,
+                 source: str = None,
+                 checked: bool = True):
         """
         Initialize Location
 
-        :param location: Matrix of fields
-        :type location: List[List[Field]]
+        :param location: Matrix of fields or storage with fields
+                        that already has boarders
+        :type location: List[List[Field]] or FieldStorage
         :param set_boarders: Whether location needs boarders, defaults to True
         :type set_boarders: bool, optional
         :param coordinates: Player's coordinates, defaults to None
         :type coordinates: Tuple[int, int], optional
         :param level: Location level, defaults to 1
         :type level: int, optional
-        """
-        if set_boarders:
-            self.set_location(location)
+        :param source: Name of the configuration file location was
+                        loaded from, defaults to None
+        :type source: str, optional
+        :param checked: Whether to check the shape of the matrix, validated
+                        configuration is loaded without checks,
+                        defaults to True
+        :type checked: bool, optional
+        """
+        if isinstance(location, FieldStorage):
+            self.set_storage(location)
+        elif set_boarders:
+            self.set_location(location, checked)
         else:
             self.set_location_already_with_boarders(location)
         self.set_level(level)
+        self.set_source(source)
         if coordinates:
             self.set_coordinates(coordinates)
         else:
@@ -89,17 +130,83 @@ class Location:
 
     def as_dict(self) -> Dict:
         """
-        Get Location as a dictionary
+        Get Location as a dictionary, boarder made of BOARDER fields
+        is not saved
 
         :return: Dictionary with location's data
         :rtype: Dict
         """
-        return {
-            'location': [[field.as_dict() for field in row]
-                         for row in self._location],
+        fog = self._fog
+        if self._fields.virtual_boarder():
+            fields = [[dict(field.as_dict(), seen=fog.seen(x + 1, y + 1))
+                       for x, field in enumerate(row)]
+                      for y, row in enumerate(self._fields.inner_rows())]
+        else:
+            fields = [[dict(field.as_dict(), seen=fog.seen(x, y))
+                       for x, field in enumerate(row)]
+                      for y, row in enumerate(self._fields.rows())]
+        dictionary = {
+            'location': fields,
             'coordinates': self._coordinates,
             'level': self._level
         }
+        if self._fields.virtual_boarder():
+            dictionary['boarders'] = False
+        if self._source:
+            dictionary['source'] = self._source
+        return dictionary
+
+    def delta(self,
+              grid: List[List[int]],
+              templates: List[FieldTemplate]) -> Dict:
+        """
+        Get Location as a dictionary with only the fields that differ
+        from the configuration it was loaded from
+
+        :param grid: Matrix of template indexes without boarders
+        :type grid: List[List[int]]
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        :return: Dictionary with location's source, size, coordinates,
+                level, changed fields without seen flags and fog
+                encoded as base64
+        :rtype: Dict
+        """
+        changes = []
+        for x, y, difference in self._fields.changes(grid, templates):
+            difference.pop('seen', None)
+            if difference:
+                changes.append([x, y, difference])
+        return {
+            'source': self._source,
+            'size': [self.row(), self.column()],
+            'coordinates': self._coordinates,
+            'level': self._level,
+            'changes': changes,
+            'fog': self._fog.encode(text=True)
+        }
+
+    def apply_delta(self, delta: Dict):
+        """
+        Apply changed fields and player's coordinates from the delta
+
+        :param delta: Dictionary returned by delta method
+        :type delta: Dict
+        :raises InvalidCoordinatesError: Indicates that delta does not fit
+                                        the location
+        """
+        if list(delta.get('size', [self.row(), self.column()])) != \
+                [self.row(), self.column()]:
+            raise InvalidCoordinatesError('Delta does not fit the location')
+        for x, y, difference in delta.get('changes', []):
+            if not (0 < x < self.row() - 1 and 0 < y < self.column() - 1):
+                raise InvalidCoordinatesError(
+                    'Delta does not fit the location')
+            self.field(x, y).set_state(difference)
+        if 'fog' in delta:
+            self._fog.load(delta['fog'])
+        if delta.get('coordinates'):
+            self.set_coordinates(delta['coordinates'])
 
     @staticmethod
     def from_dict(dictionary: Dict) -> 'Location':
@@ -111,12 +218,51 @@ class Location:
         :return: Loaded Location
         :rtype: Location
         """
-        return Location(
-            [[Field().from_dict(field) for field in row]
-             for row in dictionary['location']],
-            False,
+        return Location.from_rows(dictionary['location'], dictionary)
+
+    @staticmethod
+    def from_rows(rows: Iterable[List[Dict]], dictionary: Dict) -> 'Location':
+        """
+        Get new Location instance from rows of fields' dictionaries
+        that may be read one by one
+
+        :param rows: Rows of dictionaries with Field's data
+        :type rows: Iterable[List[Dict]]
+        :param dictionary: Dictionary with Location's data other than fields
+        :type dictionary: Dict
+        :return: Loaded Location
+        :rtype: Location
+        """
+        templates = {}
+        return Location.from_fields(
+            [[Field.from_dict(field, templates) for field in row]
+             for row in rows],
+            dictionary)
+
+    @staticmethod
+    def from_fields(fields: List[List[Field]],
+                    dictionary: Dict) -> 'Location':
+        """
+        Get new Location instance from saved matrix of fields
+
+        :param fields: Matrix of fields, without boarders if 'boarders'
+                    of the dictionary is False
+        :type fields: List[List[Field]]
+        :param dictionary: Dictionary with Location's data other than fields,
+                        may contain fog returned by Fog.encode
+        :type dictionary: Dict
+        :return: Loaded Location
+        :rtype: Location
+        """
+        location = Location(
+            fields,
+            dictionary.get('boarders', True) is False,
             dictionary.get('coordinates', None),
-            dictionary.get('level', 1))
+            dictionary.get('level', 1),
+            dictionary.get('source', None))
+        if 'fog' in dictionary:
+            location.fog().load(dictionary['fog'])
+        return location
 
     # Getters and Setters
 
@@ -127,25 +273,150 @@ class Location:
         :return: Matrix of fields
         :rtype: List[List[Field]]
         """
-        return self._location
+        return self._fields.matrix()
 
-    def set_location(self, location: List[List[Field]]):
+    def set_location(self, location: List[List[Field]], checked: bool = True):
         """
-        Set location and add boarders around it
+        Set location surrounded by the shared boarder
 
         :param location: Matrix of fields
         :type location: List[List[Field]]
+        :param checked: Whether to check the shape of the matrix,
+                        defaults to True
+        :type checked: bool, optional
         """
-        self._location = self.create_boarder(location)
+        if checked:
+            self.check_rectangle(location)
+        self.set_storage(FieldMatrix(location, True))
 
     def set_location_already_with_boarders(self, location: List[List[Field]]):
         """
-        Set location without adding boarders
+        Set location without adding boarders, boarder made of BOARDER
+        fields is replaced with the shared one
 
         :param location: Matrix of fields
         :type location: List[List[Field]]
         """
-        self._location = location if location else [[]]
+        if self.standard_boarder(location):
+            self.set_storage(FieldMatrix(
+                [row[1:-1] for row in location[1:-1]], True))
+        else:
+            self.set_storage(FieldMatrix(location if location else [[]]))
+
+    def storage(self) -> FieldStorage:
+        """
+        Get storage of fields
+
+        :return: Object that keeps location's fields
+        :rtype: FieldStorage
+        """
+        return self._fields
+
+    def set_storage(self, storage: FieldStorage):
+        """
+        Set storage of fields that already has boarders,
+        fog is created from seen flags of its fields and the fields
+        are bound to the storage and the fog
+
+        :param storage: Object that keeps location's fields
+        :type storage: FieldStorage
+        """
+        self._fields = storage
+        self._fog = storage.seen_fog()
+        storage.bind(self._fog)
+        self._renderer = MapRenderer(storage, self._fog)
+        self._landmarks = None
+        self._pathfinder = None
+        self._connectivity = None
+        self._exits = None
+        self._methods = {}
+
+    def fog(self) -> Fog:
+        """
+        Get fog
+
+        :return: Seen flags of all fields
+        :rtype: Fog
+        """
+        return self._fog
+
+    def landmarks(self) -> LandmarkIndex:
+        """
+        Get landmarks, index is built on the first call and then
+        updated after changes of fields
+
+        :return: Positions of gates, enemies and items
+        :rtype: LandmarkIndex
+        """
+        if self._landmarks is None:
+            self._landmarks = LandmarkIndex(self._fields, True)
+        return self._landmarks
+
+    def pathfinder(self) -> PathFinder:
+        """
+        Get pathfinder, it is created on the first call
+
+        :return: Object finding paths over seen fields
+        :rtype: PathFinder
+        """
+        if self._pathfinder is None:
+            self._pathfinder = PathFinder(
+                self._fields, self._fog, self.connectivity())
+        return self._pathfinder
+
+    def connectivity(self) -> Connectivity:
+        """
+        Get connectivity, labels are computed on the first call and then
+        updated after changes of fields
+
+        :return: Labels of areas connected by enterable fields
+        :rtype: Connectivity
+        """
+        if self._connectivity is None:
+            self._connectivity = Connectivity.from_storage(
+                self._fields, True)
+        return self._connectivity
+
+    def exits(self) -> ExitTable:
+        """
+        Get exits, table is computed on the first call and then
+        updated after changes of fields
+
+        :return: Directions player can go from every field
+        :rtype: ExitTable
+        """
+        if self._exits is None:
+            self._exits = ExitTable(self._fields, True)
+        return self._exits
+
+    def renderer(self) -> MapRenderer:
+        """
+        Get renderer
+
+        :return: Object drawing the map of the location
+        :rtype: MapRenderer
+        """
+        return self._renderer
+
+    def source(self) -> str:
+        """
+        Get source
+
+        :return: Name of the configuration file location was loaded from
+                or None
+        :rtype: str
+        """
+        return self._source
+
+    def set_source(self, source: str):
+        """
+        Set source
+
+        :param source: Name of the configuration file location
+                        was loaded from
+        :type source: str
+        """
+        self._source = source
 
     def level(self) -> int:
         """
@@ -172,7 +443,7 @@ class Location:
         :return: (x, y)
         :rtype: Tuple[int, int]
         """
-        self._coordinates
+        return self._coordinates
 
     def set_coordinates(self, coordinates: Tuple[int, int]):
         """
@@ -208,52 +479,39 @@ class Location:
         :return: Starting coordinates - (x, y)
         :rtype: Tuple[int, int]
         """
-        for y, row in enumerate(self._location):
-            for x, field in enumerate(row):
-                if field.go_to() == level:
-                    return x, y
-        raise StartingPointNotFoundException()
-
-    def get_boarder_field(self) -> Field:
-        """
-        Get boarder field
+        coordinates = self.landmarks().gate(level)
+        if coordinates is None:
+            raise StartingPointNotFoundException()
+        return coordinates
 
-        :return: Boarder field
-        :rtype: Field
-        """
-        return Field(
-            'Boarder',
-            'No one is able to go through me!',
-            enterable=False,
-            seen=True
-        )
-
-    def boarder_row(self, row_len: int) -> List[Field]:
+    @staticmethod
+    def standard_boarder(location: List[List[Field]]) -> bool:
         """
-        Get boarder row with given length
+        Whether matrix is a rectangle with boarder made of BOARDER fields
 
-        :param row_len: Length of the row
-        :type row_len: int
-        :return: List of boarder fields
-        :rtype: List[Field]
+        :param location: Matrix of fields with boarder
+        :type location: List[List[Field]]
+        :rtype: bool
         """
-        row = []
-        for _ in range(row_len + 2):
-            row.append(self.get_boarder_field())
-        return row
+        if len(location) < 3 or len(location[0]) < 3:
+            return False
+        width = len(location[0])
+        if any(len(row) != width for row in location):
+            return False
+        edges = location[0] + location[-1] + \
+            [row[0] for row in location] + [row[-1] for row in location]
+        return all(is_boarder(field) for field in edges)
 
-    def create_boarder(self, location: List[List[Field]]) -> List[List[Field]]:
+    @staticmethod
+    def check_rectangle(location: List[List]):
         """
-        Generate boarder around location fields
+        Check whether matrix can be a location
 
-        :param location: Matrix of fields without boarder
-        :type location: List[List[Field]]
-        :raises EmptyLocationError: Indicates that given List of fields
-                                    was empty
-        :raises DeformedLocationError: Indicates that given List of fields
+        :param location: Matrix of fields or indexes without boarder
+        :type location: List[List]
+        :raises EmptyLocationError: Indicates that given matrix was empty
+        :raises DeformedLocationError: Indicates that given matrix
                                         wasn't a rectangle
-        :return: [description]
-        :rtype: List[List[Field]]
         """
         column_len = len(location)
         if column_len != 0:
@@ -265,18 +523,6 @@ class Location:
             if len(row) != row_len:
                 raise DeformedLocationError("Given Matrix wasn't a rectangle")
 
-        new_location = [self.boarder_row(row_len)]
-
-        for y, row in enumerate(location):
-            new_location.append([])
-            new_location[y+1].append(self.get_boarder_field())
-            for f in row:
-                new_location[y+1].append(f)
-            new_location[y+1].append(self.get_boarder_field())
-
-        new_location.append(self.boarder_row(row_len))
-        return new_location
-
     def field(self, x: int, y: int) -> Field:
         """
         Get fields with given coordinates
@@ -285,10 +531,11 @@ class Location:
         :type x: int
         :param y: Coordinate - y
         :type y: int
-        :return: Field with given coordinates
+        :return: Field with given coordinates, its seen flag
+                is kept in the fog
         :rtype: Field
         """
-        return self._location[y][x]
+        return self._fields.field(x, y)
 
     def current_field(self) -> Field:
         """
@@ -298,7 +545,7 @@ class Location:
         :rtype: Field
         """
         x, y = self._coordinates
-        return self._location[y][x]
+        return self.field(x, y)
 
     def column(self) -> int:
         """
@@ -307,7 +554,7 @@ class Location:
         :return: Coulum count
         :rtype: int
         """
-        return len(self._location)
+        return self._fields.height()
 
     def row(self) -> int:
         """
@@ -316,29 +563,170 @@ class Location:
         :return: Row count
         :rtype: int
         """
-        if len(self._location) != 0:
-            return len(self._location[0])
-        else:
-            return 0
+        return self._fields.width()
 
-    def format_map(self) -> str:
+    def format_map(self,
+                   viewport: Tuple[int, int] = None,
+                   minimap: Tuple[int, int] = None) -> str:
         """
         Format map based on fields
 
+        :param viewport: Size of the part of the map around the player -
+                        (width, height), defaults to size set with
+                        set_map_view or whole map
+        :type viewport: Tuple[int, int], optional
+        :param minimap: Maximal size of the minimap of whole location
+                        shown below the map - (width, height), defaults to
+                        size set with set_map_view or no minimap
+        :type minimap: Tuple[int, int], optional
         :return: Formatted map
         :rtype: str
         """
-        p_x, p_y = self._coordinates
-        output = ''
-        for y, row in enumerate(self._location):
-            for x, field in enumerate(row):
-                if p_x != x or p_y != y:
-                    output += field.field_type()
-                else:
-                    output += ' P '
-            output += '\n'
+        default_viewport, default_minimap = map_view()
+        viewport = viewport or default_viewport
+        minimap = minimap or default_minimap
+        if viewport:
+            output = self._renderer.render_window(
+                self._coordinates, *viewport)
+        else:
+            output = self._renderer.render(self._coordinates)
+        if minimap:
+            output += '\n' + self._renderer.render_minimap(
+                self._coordinates, *minimap)
         return output
 
+    def reveal_radius(self, radius: int, x: int = None, y: int = None):
+        """
+        Mark fields not further than radius as seen
+
+        :param radius: Distance in fields
+        :type radius: int
+        :param x: Coordinate - x, defaults to player's coordinate
+        :type x: int, optional
+        :param y: Coordinate - y, defaults to player's coordinate
+        :type y: int, optional
+        """
+        p_x, p_y = self._coordinates
+        self._fog.reveal_radius(p_x if x is None else x,
+                                p_y if y is None else y, radius)
+
+    def reveal_row(self, y: int = None):
+        """
+        Mark whole row as seen
+
+        :param y: Coordinate - y, defaults to player's row
+        :type y: int, optional
+        """
+        self._fog.reveal_row(self._coordinates[1] if y is None else y)
+
+    def reveal_room(self, x: int = None, y: int = None) -> int:
+        """
+        Mark enterable fields connected with the field and the walls
+        around them as seen
+
+        :param x: Coordinate - x, defaults to player's coordinate
+        :type x: int, optional
+        :param y: Coordinate - y, defaults to player's coordinate
+        :type y: int, optional
+        :return: Number of enterable fields of the room
+        :rtype: int
+        """
+        p_x, p_y = self._coordinates
+        return self._fog.reveal_room(
+            p_x if x is None else x, p_y if y is None else y,
+            lambda x, y: self._fields.field(x, y).enterable())
+
+    def destinations(self, target: str) -> List[Tuple[int, int]]:
+        """
+        Get fields described by the player
+
+        :param target: 'gate', 'gate <level>', 'win', 'item'
+                        or coordinates 'x y'
+        :type target: str
+        :raises ValueError: Indicates that target is not understood
+                            or coordinates are out of range
+        :return: List of coordinates (x, y)
+        :rtype: List[Tuple[int, int]]
+        """
+        words = target.lower().replace(',', ' ').split()
+        if words == ['gate']:
+            return self.landmarks().gates()
+        if len(words) == 2 and words[0] == 'gate' and words[1].isdigit():
+            return self.landmarks().gates(int(words[1]))
+        if words == ['win']:
+            return self.landmarks().wins()
+        if words == ['item']:
+            return self.landmarks().items()
+        if len(words) == 2 and all(word.isdigit() for word in words):
+            x, y = int(words[0]), int(words[1])
+            if not (0 <= x < self.row() and 0 <= y < self.column()):
+                raise ValueError('These coordinates are outside the map!')
+            return [(x, y)]
+        raise ValueError(
+            'Enter gate, gate <level>, win, item or coordinates x y')
+
+    def reachable(self, x: int, y: int) -> bool:
+        """
+        Whether player can walk to the field, fields that were not seen
+        are taken into account
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :rtype: bool
+        """
+        return self.connectivity().connected(self._coordinates, (x, y))
+
+    def path_to(self,
+                destinations: Iterable[Tuple[int, int]]
+                ) -> List[Tuple[int, int]]:
+        """
+        Get shortest path from the player to the nearest destination
+        over fields that were seen
+
+        :param destinations: Coordinates (x, y) of fields
+        :type destinations: Iterable[Tuple[int, int]]
+        :return: Coordinates of fields to enter, empty if player stands
+                on a destination, None if there is no known way
+        :rtype: List[Tuple[int, int]]
+        """
+        return self.pathfinder().path(self._coordinates, destinations)
+
+    def travel(self,
+               player: Player,
+               path: List[Tuple[int, int]],
+               step_done: Callable[[], None] = None) -> int:
+        """
+        Walk the path entering every field on the way, stop after a field
+        with an enemy or if the way is blocked, map is printed once
+
+        :param player: Player
+        :type player: Player
+        :param path: Coordinates of fields returned by path_to method
+        :type path: List[Tuple[int, int]]
+        :param step_done: Function called after every step,
+                        defaults to None
+        :type step_done: Callable[[], None], optional
+        :return: Number of steps made
+        :rtype: int
+        """
+        steps = 0
+        for x, y in path:
+            p_x, p_y = self._coordinates
+            if abs(x - p_x) + abs(y - p_y) != 1 or \
+                    not self.field(x, y).enterable():
+                break
+            fight = self.field(x, y).has_enemy()
+            self.go(player, south=y - p_y, east=x - p_x, describe=False)
+            steps += 1
+            if step_done:
+                step_done()
+            if fight:
+                break
+        self.description()
+        return steps
+
     def is_enterable(self, south: int = 0, east: int = 0) -> bool:
         """
         Whether location distant from player is enterable
@@ -355,7 +743,11 @@ class Location:
         y = y+east
         return self.field(x, y).enterable()
 
-    def go(self, player: Player, south: int = 0, east: int = 0):
+    def go(self,
+           player: Player,
+           south: int = 0,
+           east: int = 0,
+           describe: bool = True):
         """
         Method that allows player to move
 
@@ -365,6 +757,9 @@ class Location:
         :type south: int, optional
         :param east: Distance east, defaults to 0
         :type east: int, optional
+        :param describe: Whether to print the map and the description,
+                        defaults to True
+        :type describe: bool, optional
         """
         x, y = self._coordinates
         x = x + east
@@ -372,7 +767,8 @@ class Location:
         if self.field(x, y).enterable():
             self._coordinates = (x, y)
             self.current_field().set_seen()
-            self.description()
+            if describe:
+                self.description()
             self.current_field().entrance(player)
 
     def go_north(self, player: Player):
@@ -481,20 +877,26 @@ class Location:
 
     def available_methods(self) -> Dict:
         """
-        Get location methods available to player during this round
+        Get location methods available to player during this round,
+        the dictionary is copied from the one cached for all fields
+        with the same exits
 
         :return: Dictionary with methods
         :rtype: Dict
         """
-        x, y = self._coordinates
-        dictionary = {'map': self.print_map, 'location info': self.description}
-        if self.field(x, y - 1).enterable():
-            dictionary['go north'] = self.go_north
-        if self.field(x, y + 1).enterable():
-            dictionary['go south'] = self.go_south
-        if self.field(x + 1, y).enterable():
-            dictionary['go east'] = self.go_east
-        if self.field(x - 1, y).enterable():
-            dictionary['go west'] = self.go_west
-        dictionary['wait'] = self.wait
-        return dictionary
+        exits = self.exits().exits(*self._coordinates)
+        dictionary = self._methods.get(exits)
+        if dictionary is None:
+            dictionary = {'map': self.print_map,
+                          'location info': self.description}
+            if exits & NORTH:
+                dictionary['go north'] = self.go_north
+            if exits & SOUTH:
+                dictionary['go south'] = self.go_south
+            if exits & EAST:
+                dictionary['go east'] = self.go_east
+            if exits & WEST:
+                dictionary['go west'] = self.go_west
+            dictionary['wait'] = self.wait
+            self._methods[exits] = dictionary
+        return dict(dictionary)
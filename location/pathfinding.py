@@ -0,0 +1,177 @@
+from location.connectivity import Connectivity
+from location.fog import Fog
+from location.storage import FieldStorage
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+# Steps to the neighbouring fields - north, south, east and west
+STEPS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+
+class PathFinder:
+    """
+    PathFinder - shortest paths over fields player has seen and can enter
+
+    Fields are searched breadth first starting from the destinations,
+    the resulting tree leads to the nearest destination from every
+    field connected with them. Trees are kept until the fog or
+    the storage of the location tells about a change - a field that
+    was revealed or changed by the player. Destinations in a different
+    area than the start are skipped without searching if labels
+    of areas are given
+
+    Contains attributes:
+
+    :param storage: Fields of the location
+    :type storage: FieldStorage
+
+    :param fog: Fog of the location
+    :type fog: Fog
+
+    :param connectivity: Labels of areas of the location, defaults to None
+    :type connectivity: Connectivity, optional
+    """
+
+    def __init__(self,
+                 storage: FieldStorage,
+                 fog: Fog,
+                 connectivity: Connectivity = None):
+        """
+        Initialize PathFinder and start listening to the fog
+        and the storage
+
+        :param storage: Fields of the location
+        :type storage: FieldStorage
+        :param fog: Fog of the location
+        :type fog: Fog
+        :param connectivity: Labels of areas of the location,
+                            defaults to None
+        :type connectivity: Connectivity, optional
+        """
+        self._storage = storage
+        self._fog = fog
+        self._connectivity = connectivity
+        self._trees = {}
+        self._searches = 0
+        fog.add_listener(self.invalidate)
+        storage.add_listener(self.changed)
+
+    # Getters and Setters
+
+    def searches(self) -> int:
+        """
+        Get number of searches done so far - paths taken
+        from kept trees are not counted
+
+        :return: Number of searches
+        :rtype: int
+        """
+        return self._searches
+
+    # Custom Methods
+
+    def invalidate(self, y: int = None):
+        """
+        Forget all paths, called by the fog after a change
+
+        :param y: Coordinate - y of the change, defaults to None
+        :type y: int, optional
+        """
+        self._trees.clear()
+
+    def changed(self, x: int, y: int):
+        """
+        Forget all paths, called by the storage after a change of a field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        """
+        self._trees.clear()
+
+    def passable(self, x: int, y: int) -> bool:
+        """
+        Whether path can lead through the field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Whether field was seen and can be entered
+        :rtype: bool
+        """
+        return self._storage.enterable(x, y) and self._fog.seen(x, y)
+
+    def path(self,
+             start: Tuple[int, int],
+             destinations: Iterable[Tuple[int, int]]
+             ) -> List[Tuple[int, int]]:
+        """
+        Get shortest path to the nearest destination
+
+        :param start: Coordinates (x, y) of the first field
+        :type start: Tuple[int, int]
+        :param destinations: Coordinates (x, y) of fields
+                            path may lead to
+        :type destinations: Iterable[Tuple[int, int]]
+        :return: Coordinates of fields to enter one after another ending
+                with the destination, empty if start is a destination,
+                None if no destination can be reached
+        :rtype: List[Tuple[int, int]]
+        """
+        if self._connectivity is not None:
+            destinations = self._connectivity.reachable(start, destinations)
+            if not destinations:
+                return None
+        goals = frozenset(cell for cell in destinations
+                          if self.passable(*cell))
+        tree = self._trees.get(goals)
+        if tree is None:
+            tree = self._search(goals)
+            self._trees[goals] = tree
+        if start not in tree:
+            return None
+        path = []
+        cell = tree[start]
+        while cell is not None:
+            path.append(cell)
+            cell = tree[cell]
+        return path
+
+    def _search(self,
+                goals: FrozenSet[Tuple[int, int]]
+                ) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """
+        Search fields breadth first starting from all destinations
+
+        :param goals: Passable destinations
+        :type goals: FrozenSet[Tuple[int, int]]
+        :return: Dictionary with the next field of the path for every
+                reached field, None for destinations
+        :rtype: Dict[Tuple[int, int], Tuple[int, int]]
+        """
+        self._searches += 1
+        enterable_row = self._storage.enterable_row
+        fog_row = self._fog.row
+        height = self._fog.height()
+        rows = {}
+        tree = dict.fromkeys(goals)
+        queue = deque(sorted(goals, key=lambda cell: cell[::-1]))
+        while queue:
+            cell = queue.popleft()
+            x, y = cell
+            for dx, dy in STEPS:
+                step_x, step_y = x + dx, y + dy
+                row = rows.get(step_y)
+                if row is None:
+                    row = rows[step_y] = enterable_row(step_y) & fog_row(
+                        step_y) if 0 <= step_y < height else 0
+                if step_x >= 0 and row >> step_x & 1:
+                    step = (step_x, step_y)
+                    if step not in tree:
+                        tree[step] = cell
+                        queue.append(step)
+        return tree
@@ -0,0 +1,327 @@
+from location.fog import Fog
+from location.storage import FieldStorage
+
+from typing import List, Tuple
+
+
+# Icon of the field player is standing on
+PLAYER = ' P '
+
+# Width of every icon of the map
+ICON_WIDTH = 3
+
+# Characters of the minimap - nothing, part or all of the area was seen
+# and area with the player
+MINIMAP_UNSEEN = ' '
+MINIMAP_PARTLY_SEEN = '.'
+MINIMAP_SEEN = '#'
+MINIMAP_PLAYER = 'P'
+
+# Size of the part of the map around the player and of the minimap
+# shown by Location.format_map, None means whole map and no minimap
+_viewport = None
+_minimap = None
+
+
+class MapRenderer:
+    """
+    MapRenderer - draws the map of a location keeping every drawn row,
+    only rows changed since the last drawing are drawn again
+
+    Renderer listens to the fog and the storage of the location - revealed
+    fields and changes of fields mark their rows as changed.
+    Player's icon is put on top of the cached map, so moving does not
+    redraw anything
+
+    Window around the player is cut from cached rows, rows that changed
+    are drawn only in the window and kept until the window moves sideways,
+    so its cost depends on the size of the window and not of the location
+
+    Contains attributes:
+
+    :param storage: Fields of the location
+    :type storage: FieldStorage
+
+    :param fog: Fog of the location
+    :type fog: Fog
+    """
+
+    def __init__(self, storage: FieldStorage, fog: Fog):
+        """
+        Initialize MapRenderer and start listening to the fog
+        and the storage
+
+        :param storage: Fields of the location
+        :type storage: FieldStorage
+        :param fog: Fog of the location
+        :type fog: Fog
+        """
+        self._storage = storage
+        self._fog = fog
+        self._rows = [None] * storage.height()
+        self._changed = set(range(storage.height()))
+        self._map = None
+        self._drawn_rows = 0
+        self._window = None
+        self._minimap = None
+        self._minimap_changed = set()
+        fog.add_listener(self.invalidate)
+        storage.add_listener(self.changed)
+
+    # Getters and Setters
+
+    def drawn_rows(self) -> int:
+        """
+        Get number of rows drawn so far
+
+        :return: Number of rows computed from fields
+        :rtype: int
+        """
+        return self._drawn_rows
+
+    # Custom Methods
+
+    def invalidate(self, y: int = None):
+        """
+        Mark row as changed, called by the fog
+
+        :param y: Coordinate - y, defaults to all rows
+        :type y: int, optional
+        """
+        if y is None:
+            self._changed = set(range(len(self._rows)))
+            self._window = None
+            self._minimap = None
+        elif 0 <= y < len(self._rows):
+            self._changed.add(y)
+            self._minimap_changed.add(y)
+            if self._window is not None:
+                self._window[2].pop(y, None)
+        self._map = None
+
+    def changed(self, x: int, y: int):
+        """
+        Mark row of the field as changed, called by the storage -
+        whole row is drawn again
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        """
+        self.invalidate(y)
+
+    def render(self, coordinates: Tuple[int, int]) -> str:
+        """
+        Get map with player's icon
+
+        :param coordinates: Player's coordinates - (x, y)
+        :type coordinates: Tuple[int, int]
+        :return: Formatted map, one line per row
+        :rtype: str
+        """
+        text = self.map()
+        x, y = coordinates
+        start = (y * (self._storage.width() * ICON_WIDTH + 1) +
+                 x * ICON_WIDTH)
+        return text[:start] + PLAYER + text[start + ICON_WIDTH:]
+
+    def render_window(self,
+                      coordinates: Tuple[int, int],
+                      width: int,
+                      height: int) -> str:
+        """
+        Get part of the map centered on the player, window is moved
+        inside the map near its edges
+
+        :param coordinates: Player's coordinates - (x, y)
+        :type coordinates: Tuple[int, int]
+        :param width: Number of fields in a row of the window
+        :type width: int
+        :param height: Number of rows of the window
+        :type height: int
+        :return: Formatted part of the map, one line per row
+        :rtype: str
+        """
+        x0, y0, x1, y1 = self.window(coordinates, width, height)
+        if self._window is None or self._window[:2] != (x0, x1):
+            self._window = (x0, x1, {})
+        cached = self._window[2]
+        p_x, p_y = coordinates
+        lines = []
+        for y in range(y0, y1):
+            line = cached.get(y)
+            if line is None:
+                row = self._rows[y]
+                if row is not None and y not in self._changed:
+                    line = row[x0 * ICON_WIDTH:x1 * ICON_WIDTH]
+                else:
+                    line = ''.join(self._storage.window_types(
+                        y, x0, x1, self._fog))
+                cached[y] = line
+            if y == p_y:
+                start = (p_x - x0) * ICON_WIDTH
+                line = line[:start] + PLAYER + line[start + ICON_WIDTH:]
+            lines.append(line + '\n')
+        return ''.join(lines)
+
+    def window(self,
+               coordinates: Tuple[int, int],
+               width: int,
+               height: int) -> Tuple[int, int, int, int]:
+        """
+        Get part of the map centered on the coordinates
+        that does not cross the edges of the map
+
+        :param coordinates: Coordinates of the center - (x, y)
+        :type coordinates: Tuple[int, int]
+        :param width: Number of fields in a row of the window
+        :type width: int
+        :param height: Number of rows of the window
+        :type height: int
+        :return: First column, first row, column and row after the last
+        :rtype: Tuple[int, int, int, int]
+        """
+        x, y = coordinates
+        width = min(width, self._storage.width())
+        height = min(height, self._storage.height())
+        x0 = min(max(x - width // 2, 0), self._storage.width() - width)
+        y0 = min(max(y - height // 2, 0), self._storage.height() - height)
+        return x0, y0, x0 + width, y0 + height
+
+    def render_minimap(self,
+                       coordinates: Tuple[int, int],
+                       width: int,
+                       height: int) -> str:
+        """
+        Get whole map scaled down to fit in the size, every character
+        is an area of the map - empty if nothing there was seen,
+        MINIMAP_PARTLY_SEEN or MINIMAP_SEEN if part or all of it was seen
+
+        Minimap is kept and only lines with changed rows are computed again
+
+        :param coordinates: Player's coordinates - (x, y)
+        :type coordinates: Tuple[int, int]
+        :param width: Maximal number of characters in a line
+        :type width: int
+        :param height: Maximal number of lines
+        :type height: int
+        :return: Formatted minimap, one line per row of areas
+        :rtype: str
+        """
+        area_width = -(-self._storage.width() // max(width, 1))
+        area_height = -(-self._storage.height() // max(height, 1))
+        key = (area_width, area_height)
+        if self._minimap is None or self._minimap[0] != key:
+            lines = [self._minimap_line(y, area_width, area_height)
+                     for y in range(0, self._storage.height(), area_height)]
+            self._minimap = (key, lines)
+        else:
+            lines = self._minimap[1]
+            for line in {y // area_height for y in self._minimap_changed}:
+                lines[line] = self._minimap_line(
+                    line * area_height, area_width, area_height)
+        self._minimap_changed = set()
+        p_x, p_y = coordinates
+        lines = list(lines)
+        line = lines[p_y // area_height]
+        column = p_x // area_width
+        lines[p_y // area_height] = \
+            line[:column] + MINIMAP_PLAYER + line[column + 1:]
+        return ''.join(line + '\n' for line in lines)
+
+    def map(self) -> str:
+        """
+        Get map without player's icon, changed rows are drawn again
+
+        :return: Formatted map, one line per row
+        :rtype: str
+        """
+        if self._map is None:
+            self._draw()
+            self._map = ''.join(self._rows)
+        return self._map
+
+    def _draw(self):
+        """
+        Draw changed rows, whole map is drawn at once
+        if every row changed
+        """
+        changed = self._changed
+        if not changed:
+            return
+        if len(changed) == len(self._rows):
+            types = self._storage.map_types(self._fog)
+            self._rows = [self._line(row) for row in types]
+        else:
+            for y in changed:
+                self._rows[y] = self._line(
+                    self._storage.field_types(y, self._fog))
+        self._drawn_rows += len(changed)
+        self._changed = set()
+
+    def _minimap_line(self, y0: int, area_width: int, area_height: int) -> str:
+        """
+        Get line of the minimap with rows y0 to y0 + area_height
+
+        :return: Character of every area
+        :rtype: str
+        """
+        width = self._storage.width()
+        y1 = min(y0 + area_height, self._storage.height())
+        rows = [self._fog.row(y) for y in range(y0, y1)]
+        any_seen = 0
+        all_seen = (1 << width) - 1
+        for row in rows:
+            any_seen |= row
+            all_seen &= row
+        line = []
+        for x in range(0, width, area_width):
+            mask = (1 << min(area_width, width - x)) - 1
+            if all_seen >> x & mask == mask:
+                line.append(MINIMAP_SEEN)
+            elif any_seen >> x & mask:
+                line.append(MINIMAP_PARTLY_SEEN)
+            else:
+                line.append(MINIMAP_UNSEEN)
+        return ''.join(line)
+
+    @staticmethod
+    def _line(types: List[str]) -> str:
+        """
+        :return: Icons of the row joined into one line
+        :rtype: str
+        """
+        return ''.join(types) + '\n'
+
+
+def map_view() -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Get size of the map shown by Location.format_map
+
+    :return: Size of the window around the player and of the minimap
+            as (width, height), None means whole map and no minimap
+    :rtype: Tuple[Tuple[int, int], Tuple[int, int]]
+    """
+    return _viewport, _minimap
+
+
+def set_map_view(viewport: Tuple[int, int] = None,
+                 minimap: Tuple[int, int] = None):
+    """
+    Set size of the map shown by Location.format_map
+
+    :param viewport: Number of fields in a row and rows of the window
+                    around the player, defaults to whole map
+    :type viewport: Tuple[int, int], optional
+    :param minimap: Maximal number of characters in a line and lines
+                    of the minimap, defaults to no minimap
+    :type minimap: Tuple[int, int], optional
+    :raises ValueError: Indicates that size is not positive
+    """
+    global _viewport, _minimap
+    for size in (viewport, minimap):
+        if size is not None and min(size) <= 0:
+            raise ValueError(f'Size of the map must be positive, got {size}')
+    _viewport = tuple(viewport) if viewport else None
+    _minimap = tuple(minimap) if minimap else None
@@ -0,0 +1,1162 @@
+from location.field import BoarderField, Field, FieldTemplate
+from location.fog import Fog
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+
+# go_to, whether field has an enemy and whether it has an item
+Landmark = Tuple[Union[int, str], bool, bool]
+
+BOARDER = FieldTemplate(
+    'Boarder',
+    'No one is able to go through me!',
+    enterable=False,
+    seen=True
+)
+
+# Boarder field shared by every location, boarders are not kept
+# in storages and saves
+BOARDER_FIELD = BoarderField.from_template(BOARDER)
+
+# Dictionary of a boarder field without its seen flag
+_BOARDER_DICT = {key: value for key, value in BOARDER_FIELD.as_dict().items()
+                 if key != 'seen'}
+
+
+def is_boarder(field: Field) -> bool:
+    """
+    Whether field is the same as a boarder field, seen flag is ignored
+
+    :param field: Checked field
+    :type field: Field
+    :rtype: bool
+    """
+    if field is BOARDER_FIELD:
+        return True
+    dictionary = field.as_dict()
+    dictionary.pop('seen', None)
+    return dictionary == _BOARDER_DICT
+
+
+class FieldStorage:
+    """
+    FieldStorage - base class for the ways Location keeps its fields
+
+    Coordinates include the boarder - (0, 0) is the top left boarder field
+
+    Fields kept by a storage bound to a fog are bound to the storage
+    and the fog, listeners added with add_listener are told about
+    every change of such fields except changes of seen flags
+    """
+
+    _fog = None
+    _listeners = ()
+
+    def width(self) -> int:
+        """
+        Get width
+
+        :return: Number of fields in a row
+        :rtype: int
+        """
+        raise NotImplementedError()
+
+    def height(self) -> int:
+        """
+        Get height
+
+        :return: Number of rows
+        :rtype: int
+        """
+        raise NotImplementedError()
+
+    def fog(self) -> Fog:
+        """
+        Get fog
+
+        :return: Fog the fields are bound to or None
+        :rtype: Fog
+        """
+        return self._fog
+
+    def bind(self, fog: Fog):
+        """
+        Bind fields kept by the storage to the storage and the fog,
+        fields created later are bound when they are created
+
+        :param fog: Fog of the location
+        :type fog: Fog
+        """
+        self._fog = fog
+
+    def listeners(self) -> Tuple[Callable[[int, int], None], ...]:
+        """
+        Get listeners
+
+        :return: Functions called after a change of a field
+        :rtype: Tuple[Callable[[int, int], None], ...]
+        """
+        return self._listeners
+
+    def add_listener(self, listener: Callable[[int, int], None]):
+        """
+        Add function called with coordinates (x, y) of a changed field
+
+        :param listener: Function called after a change of a field
+        :type listener: Callable[[int, int], None]
+        """
+        self._listeners += (listener,)
+
+    def changed(self, x: int, y: int):
+        """
+        Tell the listeners that a field changed, called by bound fields
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        """
+        for listener in self._listeners:
+            listener(x, y)
+
+    def field(self, x: int, y: int) -> Field:
+        """
+        Get field with given coordinates
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Field with given coordinates
+        :rtype: Field
+        """
+        raise NotImplementedError()
+
+    def rows(self) -> Iterator[List[Field]]:
+        """
+        Get all rows of fields
+
+        :return: Iterator over rows
+        :rtype: Iterator[List[Field]]
+        """
+        raise NotImplementedError()
+
+    def enterable(self, x: int, y: int) -> bool:
+        """
+        Whether player can enter the field
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Enterable, False outside the location
+        :rtype: bool
+        """
+        if not (0 <= x < self.width() and 0 <= y < self.height()):
+            return False
+        return self.field(x, y).enterable()
+
+    def enterable_row(self, y: int) -> int:
+        """
+        Get enterable flags of fields in given row
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: Number with bit x set if field x can be entered,
+                0 outside the location
+        :rtype: int
+        """
+        if not 0 <= y < self.height():
+            return 0
+        value = 0
+        for x, field in enumerate(self.row_fields(y)):
+            if field.enterable():
+                value |= 1 << x
+        return value
+
+    def field_types(self, y: int, fog: Fog = None) -> List[str]:
+        """
+        Get icons of fields in given row
+
+        :param y: Coordinate - y
+        :type y: int
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: List of icons
+        :rtype: List[str]
+        """
+        if fog is None:
+            return [field.field_type() for field in self.row_fields(y)]
+        return hide_unseen([field.visible_type()
+                            for field in self.row_fields(y)], fog.row(y))
+
+    def window_types(self,
+                     y: int,
+                     x0: int,
+                     x1: int,
+                     fog: Fog = None) -> List[str]:
+        """
+        Get icons of fields x0 to x1 of given row without
+        visiting the rest of the row
+
+        :param y: Coordinate - y
+        :type y: int
+        :param x0: First column
+        :type x0: int
+        :param x1: Column after the last one
+        :type x1: int
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: List of icons
+        :rtype: List[str]
+        """
+        x0 = max(x0, 0)
+        x1 = min(x1, self.width())
+        fields = [self.field(x, y) for x in range(x0, x1)]
+        if fog is None:
+            return [field.field_type() for field in fields]
+        return hide_unseen([field.visible_type() for field in fields],
+                           fog.span(y, x0, x1))
+
+    def row_fields(self, y: int) -> List[Field]:
+        """
+        Get fields in given row
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: List of fields
+        :rtype: List[Field]
+        """
+        return [self.field(x, y) for x in range(self.width())]
+
+    def map_types(self, fog: Fog = None) -> List[List[str]]:
+        """
+        Get icons of all fields
+
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: Matrix of icons
+        :rtype: List[List[str]]
+        """
+        return [self.field_types(y, fog) for y in range(self.height())]
+
+    def seen_fog(self) -> Fog:
+        """
+        Get fog with seen flags of the fields
+
+        :return: New fog
+        :rtype: Fog
+        """
+        return Fog.from_rows(
+            ([field.seen() for field in row] for row in self.rows()),
+            self.width(), self.height())
+
+    def find_go_to(self, go_to: int) -> Tuple[int, int]:
+        """
+        Find first field with given go_to value
+
+        :param go_to: Searched go_to value
+        :type go_to: int
+        :return: Coordinates (x, y) or None if not found
+        :rtype: Tuple[int, int]
+        """
+        for y, row in enumerate(self.rows()):
+            for x, field in enumerate(row):
+                if field.go_to() == go_to:
+                    return x, y
+        return None
+
+    def landmarks(self) -> Iterator[Tuple[int, int, Landmark]]:
+        """
+        Get fields that are gates or have an enemy or an item
+
+        :return: Iterator over coordinates (x, y) and landmark of a field
+        :rtype: Iterator[Tuple[int, int, Landmark]]
+        """
+        for y, row in enumerate(self.rows()):
+            for x, field in enumerate(row):
+                landmark = field_landmark(field)
+                if landmark:
+                    yield x, y, landmark
+
+    def changes(self,
+                grid: List[List[int]],
+                templates: List[FieldTemplate]
+                ) -> Iterator[Tuple[int, int, Dict]]:
+        """
+        Get fields that differ from the configuration they were loaded from
+
+        :param grid: Matrix of template indexes without boarders
+        :type grid: List[List[int]]
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        :return: Iterator over coordinates (x, y) and difference of fields
+        :rtype: Iterator[Tuple[int, int, Dict]]
+        """
+        for y in range(1, self.height() - 1):
+            row = self.row_fields(y)
+            ids = grid[y - 1]
+            for x in range(1, self.width() - 1):
+                difference = row[x].difference(templates[ids[x - 1]])
+                if difference:
+                    yield x, y, difference
+
+    def matrix(self) -> List[List[Field]]:
+        """
+        Get fields as a matrix
+
+        :return: Matrix of fields
+        :rtype: List[List[Field]]
+        """
+        return list(self.rows())
+
+    def virtual_boarder(self) -> bool:
+        """
+        Whether every boarder field is the shared BOARDER_FIELD,
+        such boarder is not saved
+
+        :rtype: bool
+        """
+        return True
+
+    def inner_rows(self) -> Iterator[List[Field]]:
+        """
+        Get rows of fields inside the boarder
+
+        :return: Iterator over rows without the first and the last field,
+                the first and the last row are skipped
+        :rtype: Iterator[List[Field]]
+        """
+        for y in range(1, self.height() - 1):
+            yield self.row_fields(y)[1:-1]
+
+
+class FieldMatrix(FieldStorage):
+    """
+    FieldMatrix - every field is kept in memory in a matrix
+
+    With virtual boarder only fields inside the boarder are kept,
+    every boarder cell is the shared BOARDER_FIELD
+
+    Contains attributes:
+
+    :param location: Matrix of fields with boarders or without them
+                    if boarder is virtual
+    :type location: List[List[Field]]
+
+    :param virtual_boarder: Whether the matrix has no boarder,
+                            defaults to False
+    :type virtual_boarder: bool, optional
+    """
+
+    def __init__(self,
+                 location: List[List[Field]],
+                 virtual_boarder: bool = False):
+        """
+        Initialize FieldMatrix
+
+        :param location: Matrix of fields with boarders or without them
+                        if boarder is virtual, matrix is not copied
+        :type location: List[List[Field]]
+        :param virtual_boarder: Whether the matrix has no boarder,
+                                defaults to False
+        :type virtual_boarder: bool, optional
+        """
+        self._location = location
+        self._virtual = virtual_boarder
+        self._width = len(location[0]) if len(location) else 0
+        self._height = len(location)
+        if virtual_boarder:
+            self._width += 2
+            self._height += 2
+
+    def width(self) -> int:
+        """
+        Get width
+
+        :return: Number of fields in a row
+        :rtype: int
+        """
+        return self._width
+
+    def height(self) -> int:
+        """
+        Get height
+
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._height
+
+    def bind(self, fog: Fog):
+        """
+        Bind every field of the matrix to the storage and the fog
+
+        :param fog: Fog of the location
+        :type fog: Fog
+        """
+        super().bind(fog)
+        offset = 1 if self._virtual else 0
+        for y, row in enumerate(self._location, offset):
+            for x, field in enumerate(row, offset):
+                field.bind(self, fog, x, y)
+
+    def field(self, x: int, y: int) -> Field:
+        """
+        Get field with given coordinates
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :raises IndexError: Indicates that coordinates are outside
+                            the location with virtual boarder
+        :return: Field with given coordinates
+        :rtype: Field
+        """
+        if not self._virtual:
+            return self._location[y][x]
+        if 0 < x < self._width - 1 and 0 < y < self._height - 1:
+            return self._location[y - 1][x - 1]
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return BOARDER_FIELD
+        raise IndexError('Coordinates are outside the location')
+
+    def rows(self) -> Iterator[List[Field]]:
+        """
+        Get all rows of fields
+
+        :return: Iterator over rows
+        :rtype: Iterator[List[Field]]
+        """
+        if not self._virtual:
+            return iter(self._location)
+        return (self.row_fields(y) for y in range(self._height))
+
+    def row_fields(self, y: int) -> List[Field]:
+        """
+        Get fields in given row
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: List of fields
+        :rtype: List[Field]
+        """
+        if not self._virtual:
+            return self._location[y]
+        if y == 0 or y == self._height - 1:
+            return [BOARDER_FIELD] * self._width
+        return [BOARDER_FIELD] + self._location[y - 1] + [BOARDER_FIELD]
+
+    def matrix(self) -> List[List[Field]]:
+        """
+        Get fields as a matrix
+
+        :return: Matrix of fields
+        :rtype: List[List[Field]]
+        """
+        if not self._virtual:
+            return self._location
+        return list(self.rows())
+
+    def virtual_boarder(self) -> bool:
+        """
+        Whether boarder is not kept in the matrix
+
+        :rtype: bool
+        """
+        return self._virtual
+
+    def inner_rows(self) -> Iterator[List[Field]]:
+        """
+        Get rows of fields inside the boarder
+
+        :return: Iterator over rows without the first and the last field,
+                the first and the last row are skipped
+        :rtype: Iterator[List[Field]]
+        """
+        if not self._virtual:
+            return super().inner_rows()
+        return iter(self._location)
+
+
+class SpillStore:
+    """
+    SpillStore - keeps state of fields from chunks evicted from memory
+
+    Only fields which state differs from their template are stored
+    """
+
+    def __init__(self):
+        """
+        Initialize SpillStore
+        """
+        self._chunks = {}
+
+    def save(self, key: Tuple[int, int], states: Dict):
+        """
+        Save state of the chunk's fields
+
+        :param key: Chunk coordinates
+        :type key: Tuple[int, int]
+        :param states: Dictionary with field coordinates in the chunk
+                        as key and field's state as value
+        :type states: Dict
+        """
+        if states:
+            self._chunks[key] = states
+        else:
+            self._chunks.pop(key, None)
+
+    def load(self, key: Tuple[int, int]) -> Dict:
+        """
+        Take state of the chunk's fields out of the store
+
+        :param key: Chunk coordinates
+        :type key: Tuple[int, int]
+        :return: Dictionary with states of fields
+        :rtype: Dict
+        """
+        return self._chunks.pop(key, {})
+
+    def peek(self, key: Tuple[int, int]) -> Dict:
+        """
+        Get state of the chunk's fields and leave it in the store
+
+        :param key: Chunk coordinates
+        :type key: Tuple[int, int]
+        :return: Dictionary with states of fields
+        :rtype: Dict
+        """
+        return self._chunks.get(key, {})
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Dict]]:
+        """
+        Get state of all stored chunks
+
+        :return: Iterator over chunk coordinates and states of fields
+        :rtype: Iterator[Tuple[Tuple[int, int], Dict]]
+        """
+        return iter(list(self._chunks.items()))
+
+    def __len__(self) -> int:
+        """
+        :return: Number of stored chunks
+        :rtype: int
+        """
+        return len(self._chunks)
+
+
+class ChunkedFields(FieldStorage):
+    """
+    ChunkedFields - fields are created from templates in square chunks
+    when they are first needed
+
+    Only a bounded number of chunks is kept in memory, state of
+    the least recently used chunk is moved to the spill store
+    Boarder is not stored - it is a single shared field
+
+    Contains attributes:
+
+    :param grid: Matrix of template indexes without boarders
+    :type grid: List[List[int]]
+
+    :param templates: List of templates
+    :type templates: List[FieldTemplate]
+
+    :param chunk_size: Width and height of a chunk, defaults to 64
+    :type chunk_size: int, optional
+
+    :param max_chunks: Number of chunks kept in memory, defaults to 64
+    :type max_chunks: int, optional
+
+    :param spill: Store for state of evicted chunks, defaults to None
+    :type spill: SpillStore, optional
+    """
+
+    def __init__(self,
+                 grid: List[List[int]],
+                 templates: List[FieldTemplate],
+                 chunk_size: int = 64,
+                 max_chunks: int = 64,
+                 spill: SpillStore = None):
+        """
+        Initialize ChunkedFields
+
+        :param grid: Matrix of template indexes without boarders
+        :type grid: List[List[int]]
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        :param chunk_size: Width and height of a chunk, defaults to 64
+        :type chunk_size: int, optional
+        :param max_chunks: Number of chunks kept in memory, defaults to 64
+        :type max_chunks: int, optional
+        :param spill: Store for state of evicted chunks, defaults to None
+        :type spill: SpillStore, optional
+        :raises ValueError: Indicates that chunk size is not positive or
+                            that fields of a single round might not fit
+                            in memory
+        """
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be positive')
+        if max_chunks < 4:
+            raise ValueError('At least 4 chunks must fit in memory')
+        self._grid = grid
+        self._templates = templates
+        self._grid_width = len(grid[0]) if len(grid) else 0
+        self._grid_height = len(grid)
+        self._chunk_size = chunk_size
+        self._max_chunks = max_chunks
+        self._spill = spill if spill is not None else SpillStore()
+        self._chunks = OrderedDict()
+        self._boarder = BOARDER_FIELD
+        self._template_types = {}
+        self._seen_templates = set()
+
+    def width(self) -> int:
+        """
+        Get width
+
+        :return: Number of fields in a row
+        :rtype: int
+        """
+        return self._grid_width + 2
+
+    def height(self) -> int:
+        """
+        Get height
+
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._grid_height + 2
+
+    def loaded_chunks(self) -> int:
+        """
+        Get number of chunks kept in memory
+
+        :return: Number of chunks
+        :rtype: int
+        """
+        return len(self._chunks)
+
+    def spill(self) -> SpillStore:
+        """
+        Get spill store
+
+        :return: Store with state of evicted chunks
+        :rtype: SpillStore
+        """
+        return self._spill
+
+    def bind(self, fog: Fog):
+        """
+        Bind fields of loaded chunks to the storage and the fog,
+        fields of chunks loaded later are bound when they are created
+
+        :param fog: Fog of the location
+        :type fog: Fog
+        """
+        super().bind(fog)
+        for (cx, cy), chunk in self._chunks.items():
+            self._bind_chunk(cx, cy, chunk)
+
+    def field(self, x: int, y: int) -> Field:
+        """
+        Get field with given coordinates, load its chunk if needed
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :raises IndexError: Indicates that coordinates are out of range
+        :return: Field with given coordinates
+        :rtype: Field
+        """
+        if not (1 <= x <= self._grid_width and 1 <= y <= self._grid_height):
+            if 0 <= x <= self._grid_width + 1 and \
+                    0 <= y <= self._grid_height + 1:
+                return self._boarder
+            raise IndexError('Field out of range')
+        size = self._chunk_size
+        x -= 1
+        y -= 1
+        chunk = self._chunk(x // size, y // size)
+        return chunk[y % size][x % size]
+
+    def enterable(self, x: int, y: int) -> bool:
+        """
+        Whether player can enter the field, does not load chunks
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :return: Enterable, False outside the location
+        :rtype: bool
+        """
+        if not (1 <= x <= self._grid_width and 1 <= y <= self._grid_height):
+            return False
+        size = self._chunk_size
+        x -= 1
+        y -= 1
+        key = (x // size, y // size)
+        chunk = self._chunks.get(key)
+        if chunk:
+            return chunk[y % size][x % size].enterable()
+        state = self._spill.peek(key).get((x % size, y % size))
+        if state and 'enterable' in state:
+            return state['enterable']
+        return self._templates[self._grid[y][x]].value('enterable')
+
+    def enterable_row(self, y: int) -> int:
+        """
+        Get enterable flags of fields in given row without loading chunks
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: Number with bit x set if field x can be entered,
+                0 outside the location
+        :rtype: int
+        """
+        if not 1 <= y <= self._grid_height:
+            return 0
+        bits = ['1' if template.value('enterable') else '0'
+                for template in self._templates]
+        value = int(''.join([bits[index] for index
+                             in reversed(self._grid[y - 1])]) + '0', 2)
+        size = self._chunk_size
+        for cx, start, local_y, states in self._row_chunks(y - 1):
+            chunk = self._chunks.get((cx, (y - 1) // size))
+            if chunk:
+                fields = enumerate(chunk[local_y])
+            else:
+                fields = ((x, state) for (x, state_y), state in states.items()
+                          if state_y == local_y and 'enterable' in state)
+            for x, field in fields:
+                bit = 1 << (start + x + 1)
+                enterable = field['enterable'] if isinstance(field, dict) \
+                    else field.enterable()
+                value = value | bit if enterable else value & ~bit
+        return value
+
+    def rows(self) -> Iterator[List[Field]]:
+        """
+        Get all rows of fields without loading chunks,
+        fields of chunks that are not loaded are temporary copies
+
+        :return: Iterator over rows
+        :rtype: Iterator[List[Field]]
+        """
+        for y in range(self.height()):
+            yield self.row_fields(y)
+
+    def row_fields(self, y: int) -> List[Field]:
+        """
+        Get fields in given row without loading chunks,
+        fields of chunks that are not loaded are temporary copies
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: List of fields
+        :rtype: List[Field]
+        """
+        if y == 0 or y == self._grid_height + 1:
+            return [self._boarder] * self.width()
+        row = [self._boarder]
+        for cx, start, local_y, states in self._row_chunks(y - 1):
+            chunk = self._chunks.get((cx, (y - 1) // self._chunk_size))
+            if chunk:
+                row.extend(chunk[local_y])
+                continue
+            ids = self._grid[y - 1]
+            for x in range(start, start + self._chunk_width(cx)):
+                template = self._templates[ids[x]]
+                state = states.get((x - start, local_y), None)
+                row.append(Field.from_template(template, state))
+        row.append(self._boarder)
+        return row
+
+    def field_types(self, y: int, fog: Fog = None) -> List[str]:
+        """
+        Get icons of fields in given row without loading chunks
+
+        :param y: Coordinate - y
+        :type y: int
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: List of icons
+        :rtype: List[str]
+        """
+        if fog is None:
+            return super().field_types(y)
+        return self.window_types(y, 0, self.width(), fog)
+
+    def window_types(self,
+                     y: int,
+                     x0: int,
+                     x1: int,
+                     fog: Fog = None) -> List[str]:
+        """
+        Get icons of fields x0 to x1 of given row without loading chunks,
+        only chunks crossing the columns are visited
+
+        :param y: Coordinate - y
+        :type y: int
+        :param x0: First column
+        :type x0: int
+        :param x1: Column after the last one
+        :type x1: int
+        :param fog: Fog telling which fields were seen,
+                    defaults to seen flags of fields
+        :type fog: Fog, optional
+        :return: List of icons
+        :rtype: List[str]
+        """
+        if fog is None:
+            return super().window_types(y, x0, x1)
+        x0 = max(x0, 0)
+        x1 = min(x1, self.width())
+        if x0 >= x1:
+            return []
+        seen = fog.span(y, x0, x1)
+        if not seen:
+            return ['   '] * (x1 - x0)
+        boarder = self._boarder.visible_type()
+        if y == 0 or y == self._grid_height + 1:
+            return hide_unseen([boarder] * (x1 - x0), seen)
+        types = [self._template_type(index)
+                 for index in range(len(self._templates))]
+        ids = self._grid[y - 1]
+        size = self._chunk_size
+        local_y = (y - 1) % size
+        cy = (y - 1) // size
+        first = max(x0 - 1, 0)
+        last = min(x1 - 1, self._grid_width)
+        row = [boarder] if x0 == 0 else []
+        for cx in range(first // size, (last + size - 1) // size):
+            start = cx * size
+            a = max(start, first)
+            b = min(start + size, last)
+            chunk = self._chunks.get((cx, cy))
+            if chunk:
+                fields = chunk[local_y]
+                for x in range(a, b):
+                    field = fields[x - start]
+                    row.append(field.visible_type()
+                               if field.has_own_state() else types[ids[x]])
+                continue
+            states = self._spill.peek((cx, cy))
+            if not states:
+                row.extend([types[index] for index in ids[a:b]])
+                continue
+            for x in range(a, b):
+                state = states.get((x - start, local_y), None)
+                if state:
+                    field = Field.from_template(self._templates[ids[x]], state)
+                    row.append(field.visible_type())
+                else:
+                    row.append(types[ids[x]])
+        if x1 == self.width():
+            row.append(boarder)
+        return hide_unseen(row, seen)
+
+    def seen_fog(self) -> Fog:
+        """
+        Get fog with seen flags of the fields, rows are computed
+        from template indexes when they are first needed
+
+        :return: New fog
+        :rtype: Fog
+        """
+        self._seen_templates = {
+            index for index, template in enumerate(self._templates)
+            if template.value('seen')}
+        fog = Fog(self.width(), self.height(), source=self._seen_row)
+        size = self._chunk_size
+        for (cx, cy), chunk in self._chunks.items():
+            for y, row in enumerate(chunk):
+                for x, field in enumerate(row):
+                    if field.seen():
+                        fog.set_seen(cx * size + x + 1, cy * size + y + 1)
+        return fog
+
+    def find_go_to(self, go_to: int) -> Tuple[int, int]:
+        """
+        Find first field with given go_to value in the template indexes,
+        does not load chunks
+
+        :param go_to: Searched go_to value
+        :type go_to: int
+        :return: Coordinates (x, y) or None if not found
+        :rtype: Tuple[int, int]
+        """
+        if BOARDER.value('go_to') == go_to:
+            return 0, 0
+        indexes = [index for index, template in enumerate(self._templates)
+                   if template.value('go_to') == go_to]
+        for y in range(self._grid_height):
+            row = list(self._grid[y])
+            found = [row.index(index) for index in indexes if index in row]
+            if found:
+                return min(found) + 1, y + 1
+        return None
+
+    def landmarks(self) -> Iterator[Tuple[int, int, Landmark]]:
+        """
+        Get fields that are gates or have an enemy or an item, template
+        indexes are searched row by row, only changed fields of loaded
+        and spilled chunks are created
+
+        :return: Iterator over coordinates (x, y) and landmark of a field
+        :rtype: Iterator[Tuple[int, int, Landmark]]
+        """
+        marked = {}
+        for index, template in enumerate(self._templates):
+            landmark = field_landmark(Field.from_template(template))
+            if landmark:
+                marked[index] = landmark
+        found = {}
+        for y in range(self._grid_height):
+            row = self._grid[y]
+            present = marked.keys() & set(row)
+            if present:
+                found.update(((x + 1, y + 1), marked[index])
+                             for x, index in enumerate(row)
+                             if index in present)
+        size = self._chunk_size
+        changed = []
+        for (cx, cy), chunk in self._chunks.items():
+            for y, row in enumerate(chunk):
+                for x, field in enumerate(row):
+                    if field.has_own_state():
+                        changed.append((cx * size + x + 1,
+                                        cy * size + y + 1, field))
+        for (cx, cy), states in self._spill.items():
+            for (x, y), state in states.items():
+                x += cx * size + 1
+                y += cy * size + 1
+                template = self._templates[self._grid[y - 1][x - 1]]
+                changed.append((x, y, Field.from_template(template, state)))
+        for x, y, field in changed:
+            landmark = field_landmark(field)
+            if landmark:
+                found[(x, y)] = landmark
+            else:
+                found.pop((x, y), None)
+        for (x, y), landmark in found.items():
+            yield x, y, landmark
+
+    def changes(self,
+                grid: List[List[int]],
+                templates: List[FieldTemplate]
+                ) -> Iterator[Tuple[int, int, Dict]]:
+        """
+        Get fields that differ from the configuration, only loaded and
+        spilled chunks are visited - fields of other chunks were not changed
+
+        :param grid: Matrix of template indexes without boarders,
+                    the one this storage was created from
+        :type grid: List[List[int]]
+        :param templates: List of templates
+        :type templates: List[FieldTemplate]
+        :return: Iterator over coordinates (x, y) and difference of fields
+        :rtype: Iterator[Tuple[int, int, Dict]]
+        """
+        size = self._chunk_size
+        for (cx, cy), chunk in self._chunks.items():
+            for y, row in enumerate(chunk):
+                for x, field in enumerate(row):
+                    state = field.state()
+                    if state:
+                        yield cx * size + x + 1, cy * size + y + 1, state
+        for (cx, cy), states in self._spill.items():
+            for (x, y), state in states.items():
+                yield cx * size + x + 1, cy * size + y + 1, state
+
+    def _chunk(self, cx: int, cy: int) -> List[List[Field]]:
+        """
+        Get chunk, load it and evict the least recently used one if needed
+
+        :param cx: Chunk coordinate - x
+        :type cx: int
+        :param cy: Chunk coordinate - y
+        :type cy: int
+        :return: Matrix of chunk's fields
+        :rtype: List[List[Field]]
+        """
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        chunk = self._load_chunk(cx, cy)
+        self._chunks[key] = chunk
+        while len(self._chunks) > self._max_chunks:
+            old_key, old_chunk = self._chunks.popitem(last=False)
+            self._spill_chunk(old_key, old_chunk)
+        return chunk
+
+    def _load_chunk(self, cx: int, cy: int) -> List[List[Field]]:
+        """
+        Create fields of the chunk from templates and spilled state
+
+        :param cx: Chunk coordinate - x
+        :type cx: int
+        :param cy: Chunk coordinate - y
+        :type cy: int
+        :return: Matrix of chunk's fields
+        :rtype: List[List[Field]]
+        """
+        size = self._chunk_size
+        start_x = cx * size
+        start_y = cy * size
+        end_x = min(start_x + size, self._grid_width)
+        end_y = min(start_y + size, self._grid_height)
+        chunk = []
+        for y in range(start_y, end_y):
+            ids = self._grid[y]
+            chunk.append([Field.from_template(self._templates[ids[x]])
+                          for x in range(start_x, end_x)])
+        for (x, y), state in self._spill.load((cx, cy)).items():
+            chunk[y][x].set_state(state)
+        if self._fog is not None:
+            self._bind_chunk(cx, cy, chunk)
+        return chunk
+
+    def _bind_chunk(self, cx: int, cy: int, chunk: List[List[Field]]):
+        """
+        Bind fields of the chunk to the storage and the fog
+
+        :param cx: Chunk coordinate - x
+        :type cx: int
+        :param cy: Chunk coordinate - y
+        :type cy: int
+        :param chunk: Matrix of chunk's fields
+        :type chunk: List[List[Field]]
+        """
+        size = self._chunk_size
+        for y, row in enumerate(chunk, cy * size + 1):
+            for x, field in enumerate(row, cx * size + 1):
+                field.bind(self, self._fog, x, y)
+
+    def _spill_chunk(self, key: Tuple[int, int], chunk: List[List[Field]]):
+        """
+        Move state of the chunk's fields to the spill store
+
+        :param key: Chunk coordinates
+        :type key: Tuple[int, int]
+        :param chunk: Matrix of chunk's fields
+        :type chunk: List[List[Field]]
+        """
+        states = {}
+        for y, row in enumerate(chunk):
+            for x, field in enumerate(row):
+                state = field.state()
+                if state:
+                    states[(x, y)] = state
+        self._spill.save(key, states)
+
+    def _row_chunks(self, y: int):
+        """
+        Get chunks crossing given row of the grid
+
+        :param y: Coordinate in the grid - y
+        :type y: int
+        :return: Tuples with chunk coordinate x, first x in the grid,
+                y in the chunk and spilled state of the chunk
+        """
+        size = self._chunk_size
+        cy = y // size
+        for cx in range((self._grid_width + size - 1) // size):
+            yield cx, cx * size, y % size, self._spill.peek((cx, cy))
+
+    def _seen_row(self, y: int) -> int:
+        """
+        Get seen flags of the row from templates and spilled state
+
+        :param y: Coordinate - y
+        :type y: int
+        :return: Number with bit x set if field x was seen
+        :rtype: int
+        """
+        width = self.width()
+        if y == 0 or y == self._grid_height + 1:
+            return (1 << width) - 1 if BOARDER.value('seen') else 0
+        value = (1 | 1 << (width - 1)) if BOARDER.value('seen') else 0
+        if self._seen_templates:
+            for x, index in enumerate(self._grid[y - 1]):
+                if index in self._seen_templates:
+                    value |= 1 << (x + 1)
+        for cx, start, local_y, states in self._row_chunks(y - 1):
+            for (x, state_y), state in states.items():
+                if state_y == local_y and 'seen' in state:
+                    bit = 1 << (start + x + 1)
+                    value = value | bit if state['seen'] else value & ~bit
+        return value
+
+    def _chunk_width(self, cx: int) -> int:
+        """
+        :param cx: Chunk coordinate - x
+        :type cx: int
+        :return: Number of fields in a row of the chunk
+        :rtype: int
+        """
+        size = self._chunk_size
+        return min(size, self._grid_width - cx * size)
+
+    def _template_type(self, index: int) -> str:
+        """
+        Get icon of a seen field that was not changed
+
+        :param index: Template index
+        :type index: int
+        :return: Icon of a field created from the template
+        :rtype: str
+        """
+        if index not in self._template_types:
+            field = Field.from_template(self._templates[index])
+            self._template_types[index] = field.visible_type()
+        return self._template_types[index]
+
+
+def field_landmark(field: Field) -> Landmark:
+    """
+    Get what makes the field a landmark
+
+    :param field: Checked field
+    :type field: Field
+    :return: go_to, whether field has an enemy and whether it has an item,
+            None if field is not a gate and has neither
+    :rtype: Landmark
+    """
+    go_to = field.go_to()
+    enemy = field.has_enemy()
+    item = field.has_item()
+    if go_to == 0 and not enemy and not item:
+        return None
+    return go_to, enemy, item
+
+
+def hide_unseen(icons: List[str], seen: int) -> List[str]:
+    """
+    Replace icons of fields that were not seen with empty ones
+
+    :param icons: Icons of a row
+    :type icons: List[str]
+    :param seen: Number with bit x set if field x was seen
+    :type seen: int
+    :return: Icons shown on the map
+    :rtype: List[str]
+    """
+    if seen == (1 << len(icons)) - 1:
+        return icons
+    if not seen:
+        return ['   '] * len(icons)
+    bits = f'{seen:0{len(icons)}b}'[::-1]
+    return [icon if bit == '1' else '   ' for icon, bit in zip(icons, bits)]
@@ -1,5 +1,22 @@
 from location.field import GameOverError
+from location.renderer import set_map_view
+from utils.binary_grid import convert_tsv_to_grid
+from utils.bundle import compile_game
+from utils.compression import CODECS, save_compression
+from utils.preload import close_worlds
 from utils.format import print_break
+from utils.io import (
+    ensure_validated,
+    location_filenames,
+    LOCATION_BACKENDS,
+    preload_game,
+    set_location_backend,
+    validate_configuration,
+    warm_configuration_cache
+)
+from utils.levels import set_max_loaded_levels
+from utils.save_worker import SaveError, wait_for_saves
+from utils.validation import ConfigurationError
 
 from setup import (
     GREETINGS,
@@ -13,22 +30,41 @@ from utils.player_input import (
     player_input
 )
 
+from typing import List, Tuple
+import argparse
 import functools
+import os
+import time
 
 
-def main():
+def main(preload: bool = False, workers: int = None):
     """
     Main function
 
     Starts the program
 
     Then loops through the rounds of the game
+
+    :param preload: Whether all locations of the game are built
+                    before the game starts, defaults to False
+    :type preload: bool, optional
+    :param workers: Number of threads building locations,
+                    defaults to number of locations
+    :type workers: int, optional
     """
     print(GREETINGS)
     games = get_games_list()
     print('Which number do you want to choose?')
     game_name = player_input(functools.partial(choose_num_from_list, games))
     print(f'So, you have chosen {game_name}, fantastic!')
+    try:
+        ensure_validated(game_name)
+    except ConfigurationError as e:
+        print(e)
+        return
+    warm_configuration_cache(game_name)
+    if preload:
+        preload_levels(game_name, workers)
     functions = {
         'new game': new_game,
         'load from save': load_game
@@ -51,7 +87,145 @@ def main():
     except Exception as e:
         print("Check your game's configuration !!!")
         print(e)
+    finally:
+        close_worlds()
+        try:
+            wait_for_saves()
+        except SaveError as e:
+            print(f'{e}: {e.__cause__}')
+
+
+def preload_levels(game: str, workers: int = None):
+    """
+    Build all locations of the game on a thread pool
+    and print time of building each of them
+
+    :param game: Name of the game
+    :type game: str
+    :param workers: Number of threads, defaults to number of locations
+    :type workers: int, optional
+    """
+    start = time.perf_counter()
+    world = preload_game(game, workers)
+    world.wait()
+    elapsed = (time.perf_counter() - start) * 1000
+    for line in world.report():
+        print(line)
+    print(f'Preloaded {len(world.levels())} location(s) in {elapsed:.1f} ms')
+
+
+def compile_games(games: List[str]):
+    """
+    Pack configuration of given games into bundles and validate them,
+    validated games are loaded without runtime checks
+
+    :param games: Names of games, all games if empty
+    :type games: List[str]
+    """
+    for game in games or sorted(os.listdir('./configuration')):
+        start = time.perf_counter()
+        filepath = compile_game(game)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f'{game}: {filepath} ({elapsed:.1f} ms)')
+        try:
+            validate_configuration(game)
+        except ConfigurationError as e:
+            print(e)
+
+
+def convert_levels(game: str, levels: List[str]):
+    """
+    Convert txt location files of the game to binary grids
+
+    :param game: Name of the game
+    :type game: str
+    :param levels: Names of location files, all locations if empty
+    :type levels: List[str]
+    """
+    for level in levels or location_filenames(game):
+        filepath = convert_tsv_to_grid(f'configuration/{game}/{level}.txt')
+        print(f'{level}: {filepath}')
+
+
+def map_size(value: str) -> Tuple[int, int]:
+    """
+    Parse size of the map given as WIDTHxHEIGHT
+
+    :param value: Size, for example 40x20
+    :type value: str
+    :raises argparse.ArgumentTypeError: Indicates that size is invalid
+    :return: (width, height)
+    :rtype: Tuple[int, int]
+    """
+    try:
+        width, height = (int(number) for number in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'Size must look like 40x20, got {value}')
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError('Size must be positive')
+    return width, height
+
+
+def parse_arguments(arguments: List[str] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments
+
+    :param arguments: Arguments, defaults to sys.argv
+    :type arguments: List[str], optional
+    :return: Parsed arguments
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description='Text Adventure Game')
+    parser.add_argument(
+        '--compress', choices=CODECS,
+        help='compress saves with given codec')
+    parser.add_argument(
+        '--compress-level', type=int,
+        help='compression level, defaults to default level of the codec')
+    parser.add_argument(
+        '--grid', choices=LOCATION_BACKENDS, default='objects',
+        help='storage of locations, numpy needs numpy installed')
+    parser.add_argument(
+        '--viewport', type=map_size, metavar='WIDTHxHEIGHT',
+        help='show only fields around the player instead of whole map')
+    parser.add_argument(
+        '--minimap', type=map_size, metavar='WIDTHxHEIGHT',
+        help='show minimap of whole location below the map')
+    parser.add_argument(
+        '--max-levels', type=int, metavar='N',
+        help='keep only N levels in memory, others are saved to snapshots')
+    parser.add_argument(
+        '--preload', action='store_true',
+        help='build all locations of the game before it starts')
+    parser.add_argument(
+        '--workers', type=int,
+        help='number of threads preloading locations')
+    commands = parser.add_subparsers(dest='command')
+    compile_parser = commands.add_parser(
+        'compile', help='pack configuration of games into bundles')
+    compile_parser.add_argument(
+        'games', nargs='*', help='names of games, defaults to all games')
+    convert_parser = commands.add_parser(
+        'convert', help='convert txt locations of a game to binary grids')
+    convert_parser.add_argument('game', help='name of the game')
+    convert_parser.add_argument(
+        'levels', nargs='*',
+        help='names of location files, defaults to all locations')
+    return parser.parse_args(arguments)
 
 
 if __name__ == "__main__":
-    main()
+    arguments = parse_arguments()
+    if arguments.command == 'compile':
+        compile_games(arguments.games)
+    elif arguments.command == 'convert':
+        convert_levels(arguments.game, arguments.levels)
+    else:
+        set_location_backend(arguments.grid)
+        set_map_view(arguments.viewport, arguments.minimap)
+        set_max_loaded_levels(arguments.max_levels)
+        if arguments.compress:
+            save_compression.set_codec(
+                arguments.compress, arguments.compress_level)
+        main(arguments.preload, arguments.workers)
@@ -3,7 +3,8 @@ from game import Game
 
 from utils.io import (
     load_configuration_from_json,
-    load_configuration_from_string
+    load_configuration_from_string,
+    save_catalog
 )
 from utils.player_input import (
     choose_num_from_list,
@@ -14,27 +15,31 @@ from utils.player_input import (
 from typing import List
 import functools
 import os
+import time
 
 GREETINGS = """\t\tWelcome Gamer!
 I see you have stumbled upon my Text Adventure Games ;D
 Choose a game from the list below:"""
 
 
-def get_saves_list(filepath: str) -> List[str]:
+def get_saves_list(game_name: str) -> List[str]:
     """
-    Get list of previous saves
+    Get list of previous saves in all supported formats, newest first,
+    metadata is taken from the catalog of saves
 
-    :param filepath: Path to the directory
-    :type filepath: str
-    :return: List of file names
+    :param game_name: Name of the game
+    :type game_name: str
+    :return: List of file names with extensions
     :rtype: List[str]
     """
-
-    names = [".".join(f.split(".")[:-1])
-             for f in os.listdir(filepath)]
-    for num, name in enumerate(names):
-        print(f'{num+1}. {name}')
-    return names
+    entries = save_catalog(game_name).entries()
+    for num, entry in enumerate(entries):
+        save = os.path.splitext(entry['filename'])[0]
+        saved = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['time']))
+        print(f"{num+1}. {save} ({entry['format']}) - {entry['player']}, "
+              f"level {entry['level']}, health {entry['health']}, "
+              f"{saved}, {entry['size'] / 1024:.1f} KiB")
+    return [entry['filename'] for entry in entries]
 
 
 def get_games_list() -> List[str]:
@@ -83,7 +88,7 @@ def load_game(game_name: str) -> Game:
     path = f'./saves/{game_name}'
     files = []
     if os.path.exists(path):
-        files = get_saves_list(path)
+        files = get_saves_list(game_name)
     if len(files) == 0:
         print('Wow! Such Empty!')
         print("Let's start a new game instead!")
@@ -71,6 +71,13 @@ def test_from_dict():
     })
 
 
+def test_from_dict_trusted():
+    dictionary = {'name': 'Goblin', 'base_health': 200, 'health': 150}
+    assert Enemy.from_dict(dictionary, True) == Enemy.from_dict(dictionary)
+    assert Enemy.from_dict({}, True) is None
+    assert Enemy.from_dict({'health': -1}, True).health() == -1
+
+
 def test_take_damage():
     enemy = Enemy(health=1000, base_health=1000)
     assert enemy.health() == 1000
@@ -0,0 +1,120 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from location.array_storage import ArrayFields  # noqa: E402
+from location.location import Location  # noqa: E402
+from location.field import Field, FieldTemplate  # noqa: E402
+from entities.enemy import Enemy  # noqa: E402
+from entities.equipment import Key  # noqa: E402
+from entities.player import Player  # noqa: E402
+
+
+TEMPLATES = [
+    FieldTemplate('Road', 'Simple Road'),
+    FieldTemplate('Gate', 'Gate', seen=True, go_to=1),
+    FieldTemplate('Wall', 'Wall', enterable=False, seen=True),
+    FieldTemplate('Lair', 'Lair', enemy=Enemy().as_dict()),
+    FieldTemplate('Hideout', 'Hideout', item=Key().as_dict()),
+    FieldTemplate('Swamp', 'Swamp', danger=-5, seen=True),
+    FieldTemplate('Spring', 'Spring', danger=5, seen=True)
+]
+
+GRID = [
+    [2, 0, 0, 0, 3, 0, 0],
+    [0, 0, 1, 0, 0, 0, 2],
+    [0, 4, 0, 5, 0, 2, 0],
+    [0, 0, 0, 2, 0, 6, 0],
+    [3, 0, 0, 0, 0, 0, 4]
+]
+
+
+def matrix_location():
+    return Location([[Field.from_template(TEMPLATES[num]) for num in row]
+                     for row in GRID])
+
+
+def array_location():
+    return Location(ArrayFields(GRID, TEMPLATES))
+
+
+def test_create():
+    location = array_location()
+    expected = matrix_location()
+    assert location.row() == expected.row() == 9
+    assert location.column() == expected.column() == 7
+    assert location.coordinates() == expected.coordinates() == (3, 2)
+    assert location.storage().created_fields() == 0
+    assert location.current_field() == expected.current_field()
+    assert location.storage().created_fields() == 1
+    assert location.field(0, 0).enterable() is False
+    with pytest.raises(IndexError):
+        _ = location.field(9, 0)
+    storage = ArrayFields(
+        [[0, 7]], TEMPLATES + [FieldTemplate('Exit', 'Exit', go_to='WIN')])
+    assert storage.find_go_to('WIN') == (2, 1)
+    assert storage.field(2, 1).go_to() == 'WIN'
+
+
+def test_same_as_matrix():
+    location = array_location()
+    expected = matrix_location()
+    assert str(location) == str(expected)
+    assert location.as_dict() == expected.as_dict()
+    assert location.available_methods().keys() == \
+        expected.available_methods().keys()
+    for y in range(location.column()):
+        assert location.storage().field_types(y) == \
+            expected.storage().field_types(y)
+        assert location.storage().window_types(y, 2, 6, location.fog()) == \
+            expected.storage().field_types(y, expected.fog())[2:6]
+    assert location.storage().find_go_to(1) == (3, 2)
+    assert location.storage().find_go_to(9) is None
+
+
+def test_changed_fields():
+    location = array_location()
+    expected = matrix_location()
+    player = Player(equipment_size=10)
+    for field_location in (location, expected):
+        field_location.field(5, 1).enemy().take_damage(10)
+        field_location.field(2, 3).pickup(player)
+        field_location.field(4, 2).set_seen()
+        field_location.field(7, 4).set_go_to(2)
+    assert str(location) == str(expected)
+    assert location.as_dict() == expected.as_dict()
+    assert location.storage().find_go_to(2) == (7, 4)
+    assert location.storage().gate_mask()[4, 7]
+    delta = location.delta(GRID, TEMPLATES)
+    assert len(delta['changes']) == 3
+    loaded = array_location()
+    loaded.apply_delta(delta)
+    assert loaded.as_dict() == expected.as_dict()
+
+
+def test_reveal():
+    location = array_location()
+    expected = matrix_location()
+    location.field(2, 2)
+    location.reveal_radius(1, 2, 2)
+    expected.reveal_radius(1, 2, 2)
+    assert location.storage().created_fields() == 1
+    assert location.field(2, 2).seen() is True
+    assert location.field(3, 2).seen() is True
+    assert str(location) == str(expected)
+    assert location.as_dict() == expected.as_dict()
+    assert location.fog() == expected.fog()
+
+
+def test_from_matrix():
+    field1 = Field('Road')
+    field2 = Field('Road')
+    field2.set_seen()
+    field3 = Field('Wilderness', danger=-10)
+    expected = Location([[field1, field2, field3]], coordinates=(1, 1))
+    location = Location(ArrayFields.from_matrix(expected.location()),
+                        coordinates=(1, 1))
+    assert str(location) == \
+        " X  X  X  X  X \n X  P  o     X \n X  X  X  X  X \n"
+    assert location == expected
+    assert location.field(3, 1) == field3
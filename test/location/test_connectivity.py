@@ -0,0 +1,101 @@
+from location.connectivity import Connectivity, bit_runs
+from location.location import Location
+from location.field import Field, FieldTemplate
+from location.storage import ChunkedFields
+
+import pytest
+
+
+TEMPLATES = [
+    FieldTemplate('Road'),
+    FieldTemplate('Gate', go_to=1),
+    FieldTemplate('Wall', enterable=False),
+    FieldTemplate('Exit', go_to='WIN')
+]
+
+GRID = [
+    [0, 0, 2, 0, 0],
+    [1, 0, 2, 0, 3],
+    [2, 2, 2, 0, 0],
+    [0, 2, 0, 0, 2]
+]
+
+
+def matrix_location():
+    return Location([[Field.from_template(TEMPLATES[index])
+                      for index in row] for row in GRID])
+
+
+def test_bit_runs():
+    assert list(bit_runs(0)) == []
+    assert list(bit_runs(0b1101110)) == [(1, 4), (5, 7)]
+    assert list(bit_runs(1 << 70)) == [(70, 71)]
+
+
+def test_labels():
+    location = matrix_location()
+    connectivity = location.connectivity()
+    assert location.coordinates() == (1, 2)
+    assert connectivity.count() == 3
+    assert location.reachable(2, 1)
+    assert not location.reachable(5, 2)
+    assert not location.reachable(3, 1)
+    assert connectivity.connected((4, 1), (3, 4))
+    assert not connectivity.connected((1, 4), (3, 4))
+    assert connectivity.label(0, 0) == connectivity.label(9, 9) == 0
+    assert connectivity.reachable((5, 2), [(1, 1), (4, 4), (3, 1)]) == \
+        [(4, 4)]
+
+
+def test_updates():
+    location = matrix_location()
+    connectivity = location.connectivity()
+    location.field(3, 2).set_enterable(True)
+    assert location.reachable(5, 2)
+    assert connectivity.count() == 2
+    location.field(4, 2).set_enterable(False)
+    assert not location.reachable(5, 2)
+    assert location.reachable(3, 2)
+    assert connectivity.count() == 3
+    location.field(5, 1).set_enterable(False)
+    assert not connectivity.connected((4, 1), (5, 2))
+    assert connectivity.count() == 4
+    location.field(2, 4).set_enterable(True)
+    assert connectivity.connected((1, 4), (5, 2))
+    assert connectivity.count() == 3
+    expected = Connectivity.from_storage(location.storage())
+    for y in range(location.column()):
+        for x in range(location.row()):
+            assert (connectivity.label(x, y) == 0) == \
+                (expected.label(x, y) == 0)
+            assert connectivity.connected((x, y), (1, 2)) == \
+                expected.connected((x, y), (1, 2))
+
+
+def test_from_rows():
+    connectivity = Connectivity.from_rows([0b0111, 0b0100, 0b1101], 4)
+    assert connectivity.count() == 2
+    assert connectivity.connected((0, 0), (3, 2))
+    assert not connectivity.connected((0, 0), (0, 2))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3])
+def test_chunked_storage(chunk_size):
+    location = Location(ChunkedFields(GRID, TEMPLATES, chunk_size))
+    expected = matrix_location()
+    for changed in (location, expected):
+        changed.field(3, 2).set_enterable(True)
+    for y in range(location.column()):
+        for x in range(location.row()):
+            assert location.reachable(x, y) == expected.reachable(x, y)
+    assert location.connectivity().count() == 2
+
+
+def test_numpy_storage():
+    array_storage = pytest.importorskip('location.array_storage')
+    pytest.importorskip('numpy')
+    location = Location(array_storage.ArrayFields(GRID, TEMPLATES))
+    assert location.connectivity().count() == 3
+    assert location.storage().created_fields() == 0
+    location.field(3, 2).set_enterable(True)
+    assert location.reachable(5, 2)
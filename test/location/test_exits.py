@@ -0,0 +1,111 @@
+from location.exits import EAST, NORTH, SOUTH, WEST, ExitTable, spread
+from location.location import Location
+from location.field import Field, FieldTemplate
+from location.storage import ChunkedFields
+
+import pytest
+
+
+TEMPLATES = [
+    FieldTemplate('Road'),
+    FieldTemplate('Gate', go_to=1),
+    FieldTemplate('Wall', enterable=False)
+]
+
+GRID = [
+    [0, 0, 2, 0],
+    [1, 0, 2, 0],
+    [2, 0, 0, 2]
+]
+
+
+def matrix_location():
+    return Location([[Field.from_template(TEMPLATES[index])
+                      for index in row] for row in GRID])
+
+
+def expected_exits(location, x, y):
+    exits = 0
+    for dx, dy, direction in ((0, -1, NORTH), (0, 1, SOUTH),
+                              (1, 0, EAST), (-1, 0, WEST)):
+        if 0 <= x + dx < location.row() and 0 <= y + dy < location.column() \
+                and location.field(x + dx, y + dy).enterable():
+            exits |= direction
+    return exits
+
+
+def check_table(location):
+    table = location.exits()
+    for y in range(location.column()):
+        for x in range(location.row()):
+            assert table.exits(x, y) == expected_exits(location, x, y)
+
+
+def test_spread():
+    assert spread(0, 4) == 0
+    assert spread(0b101, 3) == 0x10001
+    assert spread(1 << 40, 41) == 1 << 320
+
+
+def test_exits():
+    location = matrix_location()
+    table = location.exits()
+    assert location.coordinates() == (1, 2)
+    assert table.exits(1, 2) == NORTH | EAST
+    assert table.exits(2, 2) == NORTH | SOUTH | WEST
+    assert table.exits(0, 0) == 0
+    check_table(location)
+    assert list(location.available_methods()) == [
+        'map', 'location info', 'go north', 'go east', 'wait']
+    del location.available_methods()['go north']
+    assert 'go north' in location.available_methods()
+
+
+def test_updates():
+    location = matrix_location()
+    location.exits()
+    location.field(3, 2).set_enterable(True)
+    location.field(2, 2).set_enterable(False)
+    check_table(location)
+    assert list(location.available_methods()) == [
+        'map', 'location info', 'go north', 'wait']
+    location.go_north(None)
+    assert 'go east' in location.available_methods()
+    location.field(2, 1).set_enterable(False)
+    assert 'go east' not in location.available_methods()
+
+
+def test_matrix_changes():
+    location = Location([[Field('Road') for _ in range(3)]
+                         for _ in range(3)], coordinates=(2, 2))
+    assert 'go north' in location.available_methods()
+    connectivity = location.connectivity()
+    location.location()[1][2].set_enterable(False)
+    assert 'go north' not in location.available_methods()
+    check_table(location)
+    location.location()[2][1].set_enterable(False)
+    location.location()[2][3].set_enterable(False)
+    location.location()[3][2].set_enterable(False)
+    assert list(location.available_methods()) == [
+        'map', 'location info', 'wait']
+    assert connectivity.count() == 5
+    assert not location.reachable(1, 1)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3])
+def test_chunked_storage(chunk_size):
+    location = Location(ChunkedFields(GRID, TEMPLATES, chunk_size))
+    location.field(4, 3).set_enterable(True)
+    check_table(location)
+
+
+def test_numpy_storage():
+    array_storage = pytest.importorskip('location.array_storage')
+    pytest.importorskip('numpy')
+    location = Location(array_storage.ArrayFields(GRID, TEMPLATES))
+    location.exits()
+    assert location.storage().created_fields() == 0
+    location.field(4, 3).set_enterable(True)
+    check_table(location)
+    assert ExitTable(location.storage()).exits(4, 2) == \
+        location.exits().exits(4, 2)
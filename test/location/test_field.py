@@ -1,4 +1,4 @@
-from location.field import Field, GameOverError
+from location.field import Field, FieldTemplate, GameOverError
 from entities.enemy import Enemy
 from entities.player import Player
 from entities.equipment import Item, Key
@@ -127,3 +127,58 @@ def test_entrance():
     assert player.health() == 100
     field.entrance(player)
     assert player.health() == 90
+
+
+def test_template():
+    template = FieldTemplate('Road', 'Simple Road', enemy=Enemy().as_dict())
+    with pytest.raises(AttributeError):
+        template.name = 'Wilderness'
+    field1 = Field.from_template(template)
+    field2 = Field.from_template(template)
+    assert field1.template() is field2.template()
+    assert field1.as_dict() == template.as_dict()
+    assert field1.has_enemy()
+    assert field1.enemy() is not field2.enemy()
+    field1.set_seen()
+    field1.enemy().take_damage(10)
+    assert field2.seen() is False
+    assert field2.enemy().health() == 100
+
+
+def test_state():
+    template = FieldTemplate('Road', 'Simple Road', item=Key().as_dict())
+    field = Field.from_template(template)
+    assert field.state() == {}
+    field.set_seen()
+    field.set_name('Old Road')
+    field.pickup(Player(equipment_size=1))
+    assert field.state() == {'seen': True, 'name': 'Old Road', 'item': None}
+    field.set_name('Road')
+    assert field.state() == {'seen': True, 'item': None}
+    new_field = Field.from_template(template, field.state())
+    assert new_field == field
+    assert new_field.has_item() is False
+
+
+def test_from_dict_shared_templates():
+    templates = {}
+    dictionary = Field('Road', 'Simple Road', enemy=Enemy()).as_dict()
+    field1 = Field.from_dict(dictionary, templates)
+    field2 = Field.from_dict(dictionary, templates)
+    assert len(templates) == 1
+    assert field1.template() is field2.template()
+    assert field1 == field2
+    assert field1.enemy() is not field2.enemy()
+
+
+def test_difference():
+    template = FieldTemplate('Road', 'Simple Road', item=Key().as_dict())
+    field = Field.from_template(template)
+    assert field.difference(template) == {}
+    field.set_seen()
+    assert field.difference(template) == {'seen': True}
+    copy = Field.from_dict(field.as_dict(), {})
+    assert copy.difference(template) == {'seen': True}
+    copy.pickup(Player(equipment_size=1))
+    assert copy.difference(template) == {'seen': True, 'item': None}
+    assert Field.from_template(template, copy.difference(template)) == copy
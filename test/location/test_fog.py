@@ -0,0 +1,59 @@
+from location.fog import Fog, FogError
+
+import pytest
+
+
+def test_reveal_span():
+    fog = Fog(20, 3)
+    fog.reveal_span(1, 3, 17)
+    assert fog.row(1) == sum(1 << x for x in range(3, 18))
+    assert fog.row(0) == fog.row(2) == 0
+    fog.reveal_span(0, -5, 2)
+    fog.reveal_span(5, 0, 3)
+    assert fog.row(0) == 0b111
+    assert fog.count() == 18
+    assert fog.seen(3, 1) and not fog.seen(2, 1)
+    fog.set_seen(3, 1, False)
+    assert list(fog.cells())[:4] == [(0, 0), (1, 0), (2, 0), (4, 1)]
+
+
+def test_reveal_radius_and_room():
+    fog = Fog(9, 9)
+    fog.reveal_radius(4, 4, 2)
+    assert fog.row(2) == fog.row(6) == 0b10000
+    assert fog.row(4) == 0b1111100
+    assert fog.count() == 13
+    walls = {(3, y) for y in range(9)}
+    fog = Fog(9, 9)
+    assert fog.reveal_room(1, 1, lambda x, y: (x, y) not in walls) == 27
+    assert fog.row(4) == 0b1111
+    assert fog.count() == 36
+
+
+def test_encode_and_load():
+    fog = Fog(10, 2)
+    fog.reveal_rect(2, 0, 9, 1)
+    data = fog.encode()
+    assert len(data) == 4
+    loaded = Fog(10, 2)
+    loaded.load(fog.encode(text=True))
+    assert loaded == fog
+    assert Fog(10, 2, data) == fog
+    with pytest.raises(FogError):
+        Fog(10, 3).load(data)
+
+
+def test_lazy_source():
+    computed = []
+
+    def source(y):
+        computed.append(y)
+        return 1 << y
+
+    fog = Fog(4, 4, source=source)
+    assert fog.seen(2, 2) is True
+    fog.reveal_span(3, 0, 0)
+    assert computed == [2, 3]
+    assert fog.row(3) == 0b1001
+    assert fog.count() == 5
+    assert computed == [2, 3, 0, 1]
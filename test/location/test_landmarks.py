@@ -0,0 +1,88 @@
+from location.landmarks import LandmarkIndex
+from location.location import Location
+from location.field import Field, FieldTemplate
+from location.storage import ChunkedFields, FieldMatrix
+from entities.enemy import Enemy
+from entities.equipment import Key
+from entities.player import Player
+
+import pytest
+
+
+TEMPLATES = [
+    FieldTemplate('Road'),
+    FieldTemplate('Gate', go_to=1),
+    FieldTemplate('Lair', enemy=Enemy().as_dict()),
+    FieldTemplate('Hideout', item=Key().as_dict()),
+    FieldTemplate('Exit', go_to='WIN'),
+    FieldTemplate('Gate', go_to=2)
+]
+
+GRID = [
+    [0, 2, 0, 3, 0],
+    [5, 0, 1, 0, 2],
+    [0, 3, 0, 0, 4],
+    [5, 0, 0, 0, 0]
+]
+
+
+def test_index():
+    location = Location([[Field.from_template(TEMPLATES[index])
+                          for index in row] for row in GRID])
+    landmarks = location.landmarks()
+    assert location.coordinates() == landmarks.gate(1) == (3, 2)
+    assert landmarks.gates(2) == [(1, 2), (1, 4)]
+    assert landmarks.gates() == [(1, 2), (3, 2), (5, 3), (1, 4)]
+    assert landmarks.gate_values() == {1: 1, 2: 2, 'WIN': 1}
+    assert landmarks.wins() == [(5, 3)]
+    assert landmarks.enemies() == [(2, 1), (5, 2)]
+    assert landmarks.items() == [(4, 1), (2, 3)]
+    assert landmarks.landmark(2, 1) == (0, True, False)
+    assert landmarks.landmark(1, 1) is None
+    assert landmarks.gate(3) is None
+
+
+def test_update():
+    location = Location(ChunkedFields(GRID, TEMPLATES, chunk_size=2))
+    landmarks = location.landmarks()
+    location.field(4, 1).pickup(Player(equipment_size=10))
+    location.field(2, 1).set_enemy(None)
+    location.field(1, 1).set_item(Key())
+    location.field(1, 2).set_go_to(0)
+    location.field(3, 3).set_go_to(2)
+    assert landmarks.items() == [(1, 1), (2, 3)]
+    assert landmarks.enemies() == [(5, 2)]
+    assert landmarks.gates(2) == [(3, 3), (1, 4)]
+    assert landmarks.landmark(1, 2) is None
+    location.field(1, 2).set_go_to(2)
+    assert landmarks.gate(2) == (1, 2)
+    assert landmarks.gates(2) == [(1, 2), (3, 3), (1, 4)]
+
+
+def test_spilled_chunks():
+    storage = ChunkedFields(GRID, TEMPLATES, chunk_size=2, max_chunks=4)
+    location = Location(storage)
+    location.field(4, 1).set_item(None)
+    location.field(1, 1).set_enemy(Enemy())
+    for y in range(1, 5):
+        for x in range(1, 6):
+            location.field(x, y)
+    assert len(storage.spill()) > 0
+    index = LandmarkIndex(storage)
+    expected = LandmarkIndex(FieldMatrix(storage.matrix()))
+    assert index.gates() == expected.gates()
+    assert index.enemies() == expected.enemies() == [(1, 1), (2, 1), (5, 2)]
+    assert index.items() == expected.items() == [(2, 3)]
+
+
+def test_numpy_storage():
+    array_storage = pytest.importorskip('location.array_storage')
+    pytest.importorskip('numpy')
+    location = Location(array_storage.ArrayFields(GRID, TEMPLATES))
+    expected = Location([[Field.from_template(TEMPLATES[index])
+                          for index in row] for row in GRID])
+    for index in (location.landmarks(), expected.landmarks()):
+        assert index.gates() == [(1, 2), (3, 2), (5, 3), (1, 4)]
+        assert index.wins() == [(5, 3)]
+    location.field(5, 2).set_enemy(None)
+    assert location.landmarks().enemies() == [(2, 1)]
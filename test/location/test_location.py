@@ -5,7 +5,8 @@ from location.location import (
     StartingPointNotFoundException,
     InvalidCoordinatesError
 )
-from location.field import Field
+from location.field import BoarderError, Field
+from location.storage import BOARDER_FIELD
 import pytest
 
 
@@ -82,3 +83,32 @@ def test_from_dict():
     })
 
     assert new_location == location
+
+
+def test_shared_boarder():
+    first = Location([[Field('Road'), Field('Road')]], coordinates=(1, 1))
+    second = Location([[Field('Road')]], coordinates=(1, 1))
+    assert first.field(0, 0) is second.field(2, 2) is BOARDER_FIELD
+    assert first.field(3, 1) is BOARDER_FIELD
+    with pytest.raises(BoarderError):
+        first.field(0, 1).set_enterable(True)
+    with pytest.raises(IndexError):
+        first.field(4, 1)
+    dictionary = first.as_dict()
+    assert dictionary['boarders'] is False
+    assert len(dictionary['location']) == 1
+    assert len(dictionary['location'][0]) == 2
+    assert Location.from_dict(dictionary) == first
+
+
+def test_from_dict_with_boarders():
+    location = Location([[Field('Road')]], coordinates=(1, 1))
+    boarder = dict(BOARDER_FIELD.as_dict(), seen=False)
+    road = Field('Road').as_dict()
+    loaded = Location.from_dict({
+        'location': [[boarder] * 3, [boarder, road, boarder], [boarder] * 3],
+        'coordinates': (1, 1),
+        'level': 1
+    })
+    assert loaded.field(0, 0) is BOARDER_FIELD
+    assert loaded == location
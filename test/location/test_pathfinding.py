@@ -0,0 +1,148 @@
+from location.location import Location
+from location.field import Field, FieldTemplate
+from location.storage import ChunkedFields
+from entities.enemy import Enemy
+from entities.equipment import Key
+from entities.player import Player
+from game import Game
+from utils.journal import SaveJournal
+
+import pytest
+
+
+TEMPLATES = [
+    FieldTemplate('Road'),
+    FieldTemplate('Gate', go_to=1),
+    FieldTemplate('Wall', enterable=False),
+    FieldTemplate('Lair', enemy=Enemy().as_dict()),
+    FieldTemplate('Hideout', item=Key().as_dict()),
+    FieldTemplate('Exit', go_to='WIN')
+]
+
+GRID = [
+    [0, 0, 0, 2, 4],
+    [0, 2, 1, 2, 0],
+    [0, 2, 0, 0, 0],
+    [0, 0, 0, 2, 5]
+]
+
+PATH = [(3, 3), (4, 3), (5, 3), (5, 2), (5, 1)]
+
+
+def matrix_location():
+    return Location([[Field.from_template(TEMPLATES[index])
+                      for index in row] for row in GRID])
+
+
+def revealed(location):
+    location.fog().reveal_rect(0, 0, location.row(), location.column())
+    return location
+
+
+def test_shortest_path():
+    location = revealed(matrix_location())
+    assert location.coordinates() == (3, 2)
+    assert location.path_to(location.destinations('item')) == PATH
+    assert location.path_to(location.destinations('5, 1')) == PATH
+    assert location.path_to(location.destinations('gate')) == []
+    assert location.path_to([(4, 2), (0, 0)]) is None
+    assert location.destinations('win') == [(5, 4)]
+    assert location.path_to(location.destinations('win')) == \
+        [(3, 3), (4, 3), (5, 3), (5, 4)]
+    with pytest.raises(ValueError):
+        location.destinations('8 8')
+    with pytest.raises(ValueError):
+        location.destinations('castle')
+
+
+def test_unseen_fields():
+    location = matrix_location()
+    assert location.path_to([(5, 1)]) is None
+    revealed(location)
+    location.fog().set_seen(5, 2, False)
+    assert location.path_to([(5, 1)]) is None
+    location.fog().set_seen(5, 2)
+    assert location.path_to([(5, 1)]) == PATH
+
+
+def test_cached_paths():
+    location = revealed(matrix_location())
+    pathfinder = location.pathfinder()
+    assert location.path_to([(5, 1)]) == PATH
+    assert pathfinder.path((1, 1), [(5, 1)]) is not None
+    assert pathfinder.searches() == 1
+    location.fog().set_seen(1, 1)
+    assert location.path_to([(5, 1)]) == PATH
+    assert pathfinder.searches() == 1
+    location.field(3, 3).set_enterable(False)
+    assert location.path_to([(5, 1)]) is None
+    assert pathfinder.searches() == 1
+    location.field(3, 3).set_enterable(True)
+    assert location.path_to([(5, 1)]) == PATH
+    assert pathfinder.searches() == 2
+
+
+def test_chunked_storage():
+    storage = ChunkedFields(GRID, TEMPLATES, chunk_size=2, max_chunks=4)
+    location = revealed(Location(storage))
+    expected = revealed(matrix_location())
+    for target in ('item', 'win', '1 4'):
+        assert location.path_to(location.destinations(target)) == \
+            expected.path_to(expected.destinations(target))
+    for changed in (location, expected):
+        changed.field(3, 3).set_enterable(False)
+        changed.field(4, 2).set_enterable(True)
+    for y in range(1, 5):
+        for x in range(1, 6):
+            location.field(x, y)
+    assert len(storage.spill()) > 0
+    for y in range(-1, location.column() + 1):
+        assert storage.enterable_row(y) == \
+            expected.storage().enterable_row(y)
+    assert location.path_to([(5, 1)]) == [(4, 2), (5, 2), (5, 1)]
+
+
+def test_numpy_storage():
+    array_storage = pytest.importorskip('location.array_storage')
+    pytest.importorskip('numpy')
+    location = revealed(Location(array_storage.ArrayFields(GRID, TEMPLATES)))
+    assert location.path_to(location.destinations('item')) == PATH
+    assert location.storage().created_fields() == 0
+    location.field(4, 3).set_template(TEMPLATES[2])
+    assert location.path_to(location.destinations('item')) is None
+
+
+def test_travel(monkeypatch):
+    location = revealed(matrix_location())
+    player = Player()
+    steps = []
+    assert location.travel(player, PATH, lambda: steps.append(
+        location.coordinates())) == 5
+    assert steps == PATH
+    assert location.coordinates() == (5, 1)
+
+    location = revealed(matrix_location())
+    location.field(5, 3).set_enemy(Enemy())
+    monkeypatch.setattr(Field, 'fight', lambda field, player: None)
+    assert location.travel(player, PATH) == 3
+    assert location.coordinates() == (5, 3)
+
+
+def test_travel_command(monkeypatch):
+    game = Game('test', Player('Knight'))
+    game.set_journal(SaveJournal('test', 'travel'))
+    location = revealed(game.location())
+    assert location.coordinates() == (1, 1)
+
+    def answer(func):
+        if func.func.__name__ == 'choose_destination':
+            return location.destinations('2 2')
+        return lambda: func.args[0]['travel to']()
+
+    monkeypatch.setattr('game.player_input', answer)
+    game.round()
+    assert location.coordinates() == (2, 2)
+    moves = [change['coordinates'] for change in game._changes
+             if change['op'] == 'move']
+    assert len(moves) == 2
+    assert moves[-1] == (2, 2)
@@ -0,0 +1,138 @@
+from location.location import Location
+from location.field import Field
+from location.storage import ChunkedFields, FieldMatrix
+from location.renderer import set_map_view
+from location.field import FieldTemplate
+from entities.enemy import Enemy
+from entities.equipment import Key
+from entities.player import Player
+
+
+def create_location() -> Location:
+    return Location([
+        [Field('Road', seen=True), Field('Lair', enemy=Enemy(), seen=True),
+         Field('Hideout', item=Key(), seen=True)],
+        [Field('Road'), Field('Gate', go_to=1, seen=True), Field('Road')]
+    ])
+
+
+def test_render():
+    location = create_location()
+    assert str(location) == \
+        " X  X  X  X  X \n" \
+        " X  o  M  i  X \n" \
+        " X     P     X \n" \
+        " X  X  X  X  X \n"
+    assert location.renderer().drawn_rows() == 4
+    location.set_coordinates((1, 1))
+    assert str(location).splitlines()[1] == " X  P  M  i  X "
+    assert location.renderer().drawn_rows() == 4
+
+
+def test_changed_rows():
+    location = create_location()
+    renderer = location.renderer()
+    renderer.map()
+    location.field(3, 1).pickup(Player(equipment_size=10))
+    assert str(location).splitlines()[1] == " X  o  M  o  X "
+    assert renderer.drawn_rows() == 5
+    location.field(1, 2).set_seen()
+    location.field(3, 2).set_danger(5)
+    assert str(location).splitlines()[2] == " X  o  P     X "
+    assert renderer.drawn_rows() == 6
+    location.reveal_row(2)
+    assert str(location).splitlines()[2] == " X  o  P  +  X "
+    location.fog().load(Location.from_dict(location.as_dict()).fog().encode())
+    str(location)
+    assert renderer.drawn_rows() == 11
+
+
+def test_matrix_changes():
+    location = create_location()
+    landmarks = location.landmarks()
+    str(location)
+    location.location()[1][3].set_item(None)
+    location.location()[1][2].set_enemy(None)
+    assert str(location).splitlines()[1] == " X  o  o  o  X "
+    assert landmarks.items() == landmarks.enemies() == []
+
+
+def test_same_as_fields():
+    templates = [FieldTemplate('Road', seen=True),
+                 FieldTemplate('Gate', go_to=1),
+                 FieldTemplate('Swamp', danger=-5)]
+    grid = [[0, 2, 0, 2], [2, 1, 0, 0], [0, 0, 2, 2]]
+    location = Location(ChunkedFields(grid, templates, chunk_size=2))
+    location.reveal_radius(1)
+    location.field(4, 3).set_enterable(False)
+    location.field(4, 3).set_seen()
+    expected = ''
+    for y in range(location.column()):
+        types = [location.field(x, y).field_type()
+                 for x in range(location.row())]
+        if y == location.coordinates()[1]:
+            types[location.coordinates()[0]] = ' P '
+        expected += ''.join(types) + '\n'
+    assert str(location) == expected
+
+
+def large_location(storage) -> Location:
+    templates = [FieldTemplate('Road'), FieldTemplate('Gate', go_to=1)]
+    grid = [[0] * 12 for _ in range(8)]
+    grid[0][0] = 1
+    return Location(storage(grid, templates), coordinates=(2, 2))
+
+
+def window_of(location: Location, x0: int, y0: int, width: int,
+              height: int) -> str:
+    lines = str(location).splitlines()[y0:y0 + height]
+    return ''.join(line[x0 * 3:(x0 + width) * 3] + '\n' for line in lines)
+
+
+def test_viewport():
+    location = large_location(ChunkedFields)
+    location.reveal_radius(3)
+    location.field(3, 2).set_seen()
+    assert location.format_map((4, 3)) == window_of(location, 0, 1, 4, 3)
+    location.set_coordinates((7, 5))
+    location.field(8, 5).set_danger(3)
+    location.field(8, 5).set_seen()
+    assert location.format_map((5, 5)) == window_of(location, 5, 3, 5, 5)
+    location.set_coordinates((13, 9))
+    assert location.format_map((5, 3)) == window_of(location, 9, 7, 5, 3)
+    assert location.format_map((50, 50)) == str(location)
+
+
+def test_window_types():
+    location = large_location(ChunkedFields)
+    location.reveal_radius(4)
+    location.field(3, 3).set_enterable(False)
+    expected = location.storage().field_types(3, location.fog())
+    for storage in (location.storage(),
+                    FieldMatrix(location.location())):
+        assert storage.window_types(3, 0, 14, location.fog()) == expected
+        assert storage.window_types(3, 2, 9, location.fog()) == \
+            expected[2:9]
+
+
+def test_minimap():
+    location = large_location(ChunkedFields)
+    assert location.format_map(minimap=(7, 5)).endswith(
+        '\n'
+        '.......\n'
+        '.P    .\n'
+        '.     .\n'
+        '.     .\n'
+        '.......\n')
+    location.fog().reveal_rect(5, 3, 10, 6)
+    window = window_of(location, 1, 1, 3, 3)
+    set_map_view((3, 3), (7, 5))
+    try:
+        assert str(location) == window + '\n' + \
+            '.......\n' \
+            '.P.....\n' \
+            '. .##..\n' \
+            '. .....\n' \
+            '.......\n'
+    finally:
+        set_map_view()
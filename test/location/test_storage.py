@@ -0,0 +1,117 @@
+from location.storage import ChunkedFields, FieldMatrix, SpillStore
+from location.location import Location, InvalidCoordinatesError
+from location.field import Field, FieldTemplate
+from entities.enemy import Enemy
+from entities.equipment import Key
+from entities.player import Player
+
+import pytest
+
+
+TEMPLATES = [
+    FieldTemplate('Road', 'Simple Road'),
+    FieldTemplate('Gate', 'Gate', seen=True, go_to=1),
+    FieldTemplate('Wall', 'Wall', enterable=False, seen=True),
+    FieldTemplate('Lair', 'Lair', enemy=Enemy().as_dict()),
+    FieldTemplate('Hideout', 'Hideout', item=Key().as_dict())
+]
+
+GRID = [
+    [2, 0, 0, 0, 3, 0, 0],
+    [0, 0, 1, 0, 0, 0, 2],
+    [0, 4, 0, 0, 0, 2, 0],
+    [0, 0, 0, 2, 0, 0, 0],
+    [3, 0, 0, 0, 0, 0, 4]
+]
+
+
+def matrix_location():
+    return Location([[Field.from_template(TEMPLATES[num]) for num in row]
+                     for row in GRID])
+
+
+def chunked_location(spill=None):
+    return Location(ChunkedFields(GRID, TEMPLATES, 2, 4, spill))
+
+
+def test_create():
+    location = chunked_location()
+    expected = matrix_location()
+    assert location.row() == expected.row() == 9
+    assert location.column() == expected.column() == 7
+    assert location.storage().loaded_chunks() == 0
+    assert location.current_field() == expected.current_field()
+    assert location.storage().loaded_chunks() == 1
+    assert location.field(0, 0).enterable() is False
+    assert location.field(8, 6) is location.field(0, 0)
+    with pytest.raises(IndexError):
+        _ = location.field(9, 0)
+    with pytest.raises(ValueError):
+        _ = ChunkedFields(GRID, TEMPLATES, 2, 3)
+
+
+def test_same_as_matrix():
+    location = chunked_location()
+    expected = matrix_location()
+    assert str(location) == str(expected)
+    assert location.as_dict() == expected.as_dict()
+    assert location == expected
+    for y in range(location.column()):
+        for x in range(location.row()):
+            assert location.field(x, y) == expected.field(x, y)
+    assert location.storage().loaded_chunks() == 4
+
+
+def test_spill():
+    spill = SpillStore()
+    location = chunked_location(spill)
+    expected = matrix_location()
+    player = Player(equipment_size=10)
+    for field_location in (location, expected):
+        field_location.field(5, 1).enemy().take_damage(10)
+        field_location.field(2, 3).pickup(player)
+        field_location.field(4, 2).set_seen()
+    assert str(location) == str(expected)
+    for y in range(location.column()):
+        for x in range(location.row()):
+            _ = location.field(x, y)
+    assert location.storage().loaded_chunks() == 4
+    assert len(spill) == 3
+    assert location.as_dict() == expected.as_dict()
+    assert str(location) == str(expected)
+    assert location.field(5, 1).enemy().health() == 90
+    assert location.field(2, 3).item() is None
+    assert location.field(4, 2).seen() is True
+
+
+def test_find_go_to():
+    storage = ChunkedFields(GRID, TEMPLATES, 2, 4)
+    assert storage.find_go_to(1) == (3, 2)
+    assert storage.find_go_to(5) is None
+    assert storage.loaded_chunks() == 0
+    matrix = FieldMatrix(matrix_location().location())
+    assert matrix.find_go_to(1) == (3, 2)
+
+
+def test_delta():
+    spill = SpillStore()
+    location = chunked_location(spill)
+    expected = matrix_location()
+    player = Player(equipment_size=10)
+    for field_location in (location, expected):
+        field_location.field(5, 1).enemy().take_damage(10)
+        field_location.field(2, 3).pickup(player)
+        field_location.field(7, 5).set_seen()
+    for y in range(location.column()):
+        _ = location.field(1, y)
+    assert len(spill) > 0
+    delta = location.delta(GRID, TEMPLATES)
+    assert sorted(map(str, delta['changes'])) == \
+        sorted(map(str, expected.delta(GRID, TEMPLATES)['changes']))
+    assert len(delta['changes']) == 2
+    assert delta['fog'] == expected.delta(GRID, TEMPLATES)['fog']
+    loaded = chunked_location()
+    loaded.apply_delta(delta)
+    assert loaded.as_dict() == expected.as_dict()
+    with pytest.raises(InvalidCoordinatesError):
+        loaded.apply_delta({'size': [3, 3], 'changes': []})
@@ -2,6 +2,10 @@ from game import Game
 from entities.player import Player
 from location.location import Location
 from location.field import Field
+from utils.io import compact_journal
+from utils.save_worker import wait_for_saves
+
+import os
 
 
 def test_correct():
@@ -24,6 +28,8 @@ def test_create():
     assert len(game.locations()) == 2
     assert game.level() == 2
     assert game.location() == location2
+    game.locations().clear()
+    assert game.location_count() == 2
 
 
 def test_as_dict():
@@ -55,6 +61,26 @@ def test_from_dict():
     assert dictionary == game_from_dict.as_dict()
 
 
+def test_from_dict_lazy():
+    player = Player('Knight')
+    location1 = Location([[Field(go_to=1), Field(go_to=2)]], level=1)
+    location2 = Location([[Field(go_to=2)]], level=2)
+    game = Game.from_dict({
+        'game': 'test',
+        'player': player.as_dict(),
+        'locations': [location1.as_dict(), location2.as_dict()],
+        'level': 2
+    })
+    assert game.location_count() == 2
+    assert game.loaded_locations() == 0
+    assert game.location() == location2
+    assert game.loaded_locations() == 1
+    assert game.as_dict()['locations'][0] == location1.as_dict()
+    assert game.loaded_locations() == 1
+    assert game.location_at(1) == location1
+    assert game.loaded_locations() == 2
+
+
 def test_save(monkeypatch):
     player = Player('Knight')
     location1 = Location([[Field(go_to=1), Field(go_to=2)]], level=1)
@@ -65,6 +91,7 @@ def test_save(monkeypatch):
         return 'save_1'
     monkeypatch.setattr('game.player_input', return_str)
     game.save()
+    wait_for_saves()
 
 
 def test_load():
@@ -75,3 +102,39 @@ def test_load():
     loaded_game = Game.load('test', 'save_1')
 
     assert loaded_game == game
+
+
+def test_save_journal(monkeypatch):
+    monkeypatch.setattr('game.player_input', lambda a: 'journaled')
+    game = Game('test', Player('Knight'))
+    assert game.journaled()
+    try:
+        game.save()
+        wait_for_saves()
+        assert game.journal().slot() == 'journaled'
+        seq = game.journal_seq()
+        before = game.round_state()
+        game.location().go_east(game.player())
+        game.player().set_name('Hero')
+        game.record_changes(before)
+        game.save()
+        wait_for_saves()
+        entries = game.journal().entries()
+        assert [entry['op'] for entry in entries] == [
+            'move', 'field', 'player']
+        assert game.journal_seq() == seq + 3
+
+        loaded_game = Game.load('test', 'journaled')
+        assert loaded_game == game
+        assert loaded_game.journal_seq() == seq + 3
+
+        assert compact_journal('test', 'journaled', Game)
+        assert game.journal().entries() == []
+        loaded_game = Game.load('test', 'journaled')
+        assert loaded_game == game
+        assert loaded_game.journal_seq() == seq + 3
+    finally:
+        wait_for_saves()
+        for extension in ('.sav', '.journal'):
+            if os.path.exists(f'saves/test/journaled{extension}'):
+                os.remove(f'saves/test/journaled{extension}')
@@ -0,0 +1,71 @@
+from utils.binary_grid import (
+    BinaryGrid,
+    GridFormatError,
+    convert_tsv_to_grid,
+    pack_grid,
+    parse_grid,
+    write_grid
+)
+
+import pytest
+
+
+def test_parse_grid():
+    assert parse_grid('1\t0\n0\t0\n') == [[1, 0], [0, 0]]
+    with pytest.raises(ValueError):
+        _ = parse_grid('Intro')
+
+
+def test_pack_grid():
+    numbers = [[1, 0, 2], [0, 0, 3]]
+    grid = BinaryGrid(pack_grid(numbers))
+    assert grid.width() == 3
+    assert grid.height() == 2
+    assert grid.cell(2, 1) == 3
+    assert len(grid) == 2
+    assert list(grid[0]) == [1, 0, 2]
+    assert grid.tolist() == numbers
+    numbers = [[70000]]
+    assert BinaryGrid(pack_grid(numbers)).tolist() == numbers
+    with pytest.raises(IndexError):
+        _ = grid.cell(3, 0)
+    with pytest.raises(IndexError):
+        _ = grid.row(2)
+
+
+def test_pack_grid_invalid():
+    with pytest.raises(ValueError):
+        _ = pack_grid([])
+    with pytest.raises(ValueError):
+        _ = pack_grid([[1, 0], [0]])
+    with pytest.raises(ValueError):
+        _ = pack_grid([[-1]])
+
+
+def test_open(tmp_path):
+    path = str(tmp_path / 'lvl1.grid')
+    write_grid(path, [[1, 0], [0, 0]])
+    grid = BinaryGrid.open(path)
+    assert grid.tolist() == [[1, 0], [0, 0]]
+
+
+def test_open_invalid(tmp_path):
+    path = tmp_path / 'lvl1.grid'
+    path.write_bytes(b'')
+    with pytest.raises(GridFormatError):
+        _ = BinaryGrid.open(str(path))
+    path.write_bytes(b'1\t0\n0\t0\n1\t0\n0\t0\n')
+    with pytest.raises(GridFormatError):
+        _ = BinaryGrid.open(str(path))
+    path.write_bytes(pack_grid([[1, 0], [0, 0]])[:-1])
+    with pytest.raises(GridFormatError):
+        _ = BinaryGrid.open(str(path))
+
+
+def test_convert_tsv_to_grid(tmp_path):
+    path = convert_tsv_to_grid('configuration/test/correct.txt',
+                               str(tmp_path / 'correct.grid'))
+    assert BinaryGrid.open(path).tolist() == [[1, 0], [0, 0]]
+    with pytest.raises(ValueError):
+        _ = convert_tsv_to_grid('configuration/test/deformed.txt',
+                                str(tmp_path / 'deformed.grid'))
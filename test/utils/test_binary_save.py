@@ -0,0 +1,72 @@
+from utils.binary_save import (
+    BinaryEncoder,
+    BinarySaveError,
+    FLUSH_SIZE,
+    MAGIC,
+    dump,
+    load,
+    is_binary_save
+)
+
+import io
+import pytest
+
+
+def encode(value) -> bytes:
+    handle = io.BytesIO()
+    dump(value, handle)
+    return handle.getvalue()
+
+
+def test_round_trip():
+    value = {
+        'name': 'Knight',
+        'health': -100,
+        'big': 2**40,
+        'ratio': 0.5,
+        'seen': True,
+        'enterable': False,
+        'enemy': None,
+        'coordinates': [1, 2],
+        'equipment': [{'name': 'Key'}, {'name': 'Key'}],
+        'unicode': 'Zażółć gęślą jaźń',
+        'blob': b'\x00TAGS\xff'
+    }
+    data = encode(value)
+    assert is_binary_save(data)
+    assert load(io.BytesIO(data)) == value
+
+
+def test_tuple_is_list():
+    assert load(io.BytesIO(encode((1, 2)))) == [1, 2]
+
+
+def test_strings_are_interned():
+    description = 'Long description of the field ' * 4
+    once = len(encode([description]))
+    many = len(encode([description] * 100))
+    assert many - once < 100 * 3
+
+
+def test_bytes_in_pieces():
+    data = bytes(range(256)) * (FLUSH_SIZE // 128)
+    handle = io.BytesIO()
+    encoder = BinaryEncoder(handle)
+    encoder.begin_bytes(len(data))
+    for start in range(0, len(data), 1000):
+        encoder.write_bytes(data[start:start + 1000])
+    encoder.flush()
+    assert handle.getvalue() == encode(data)
+
+
+def test_invalid():
+    with pytest.raises(TypeError):
+        _ = encode({'value': object()})
+    with pytest.raises(TypeError):
+        _ = encode(2**70)
+    with pytest.raises(BinarySaveError):
+        _ = load(io.BytesIO(b'{"name": "Knight"}'))
+    with pytest.raises(BinarySaveError):
+        _ = load(io.BytesIO(MAGIC + b'\x63'))
+    with pytest.raises(BinarySaveError):
+        _ = load(io.BytesIO(encode({'name': 'Knight'})[:-3]))
@@ -0,0 +1,46 @@
+from utils.bundle import (
+    Bundle,
+    BundleError,
+    BUNDLE_FILENAME,
+    compile_game,
+    read_bundle
+)
+from utils.binary_grid import convert_tsv_to_grid
+
+import shutil
+import pytest
+
+
+def test_compile_game(tmp_path):
+    shutil.copytree('configuration/test', tmp_path / 'test')
+    filepath = compile_game('test', str(tmp_path))
+    assert filepath == f'{tmp_path}/test/{BUNDLE_FILENAME}'
+    bundle = read_bundle(filepath)
+    assert bundle.has('fields.json')
+    assert bundle.has('lvl1.txt')
+    assert not bundle.has('lvl2.txt')
+    assert bundle.json('player.json')['base_health'] == 100
+    assert bundle.string('introduction.txt') == 'Intro\n...\ntest'
+    assert bundle.grid('lvl1.txt').tolist() == [[1, 0], [0, 0]]
+    assert bundle.grid('empty.txt') == []
+    assert bundle.grid('deformed.txt') == [[1, 0], [0]]
+
+
+def test_from_bytes_invalid():
+    with pytest.raises(BundleError):
+        _ = Bundle.from_bytes(b'')
+    with pytest.raises(BundleError):
+        _ = Bundle.from_bytes(b'{"name": "not a bundle"}')
+    data = bytearray(Bundle().to_bytes())
+    data[4] = 99
+    with pytest.raises(BundleError):
+        _ = Bundle.from_bytes(bytes(data))
+
+
+def test_compile_game_with_grid(tmp_path):
+    shutil.copytree('configuration/test', tmp_path / 'test')
+    grid_path = convert_tsv_to_grid(str(tmp_path / 'test' / 'correct.txt'))
+    (tmp_path / 'test' / 'correct.txt').unlink()
+    bundle = read_bundle(compile_game('test', str(tmp_path)))
+    assert bundle.grid('correct.txt').tolist() == [[1, 0], [0, 0]]
+    assert grid_path.endswith('correct.grid')
@@ -0,0 +1,77 @@
+from utils.cache import ConfigurationCache
+
+import os
+import pytest
+
+
+def read(path):
+    with open(path, 'r') as handle:
+        return handle.read()
+
+
+def test_create():
+    cache = ConfigurationCache(2)
+    assert cache.max_size() == 2
+    assert cache.size() == 0
+    assert cache.hits() == 0
+    assert cache.misses() == 0
+    with pytest.raises(ValueError):
+        _ = ConfigurationCache(0)
+
+
+def test_get(tmp_path):
+    path = str(tmp_path / 'file.txt')
+    with open(path, 'w') as handle:
+        handle.write('first')
+    cache = ConfigurationCache()
+    assert cache.get(path, read) == 'first'
+    assert cache.get(path, read) == 'first'
+    assert cache.stats() == {
+        'hits': 1,
+        'misses': 1,
+        'size': 1,
+        'max_size': 128
+    }
+
+
+def test_get_modified(tmp_path):
+    path = str(tmp_path / 'file.txt')
+    with open(path, 'w') as handle:
+        handle.write('first')
+    cache = ConfigurationCache()
+    assert cache.get(path, read) == 'first'
+    with open(path, 'w') as handle:
+        handle.write('second')
+    info = os.stat(path)
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + 10**9))
+    assert cache.get(path, read) == 'second'
+    assert cache.misses() == 2
+    assert cache.size() == 1
+
+
+def test_get_not_found(tmp_path):
+    cache = ConfigurationCache()
+    with pytest.raises(FileNotFoundError):
+        _ = cache.get(str(tmp_path / 'not_found.txt'), read)
+
+
+def test_eviction(tmp_path):
+    paths = []
+    for num in range(3):
+        path = str(tmp_path / f'{num}.txt')
+        with open(path, 'w') as handle:
+            handle.write(str(num))
+        paths.append(path)
+    cache = ConfigurationCache(2)
+    cache.get(paths[0], read)
+    cache.get(paths[1], read)
+    cache.get(paths[0], read)
+    cache.get(paths[2], read)
+    assert cache.size() == 2
+    cache.get(paths[0], read)
+    assert cache.hits() == 2
+    cache.get(paths[1], read)
+    assert cache.misses() == 4
+    cache.clear()
+    assert cache.size() == 0
+    assert cache.hits() == 0
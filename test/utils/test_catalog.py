@@ -0,0 +1,70 @@
+from utils.catalog import SaveCatalog
+
+import json
+import os
+
+
+def make_catalog(directory, reads):
+    def reader(filepath):
+        reads.append(os.path.basename(filepath))
+        with open(filepath) as handle:
+            return json.load(handle)
+    return SaveCatalog(str(directory), reader, ['.json', '.sav'])
+
+
+def write(filepath, dictionary):
+    with open(filepath, 'w') as handle:
+        json.dump(dictionary, handle)
+
+
+def test_entries(tmp_path):
+    reads = []
+    catalog = make_catalog(tmp_path, reads)
+    write(tmp_path / 'a.json', {'player': 'Knight', 'level': 2})
+    write(tmp_path / 'b.json', {'player': 'Mage', 'health': 50})
+    entries = catalog.entries()
+    assert sorted(reads) == ['a.json', 'b.json']
+    assert {entry['filename'] for entry in entries} == {'a.json', 'b.json'}
+    assert entries[0]['time'] >= entries[1]['time']
+    entry = [entry for entry in entries if entry['filename'] == 'a.json'][0]
+    assert entry['player'] == 'Knight'
+    assert entry['level'] == 2
+    assert entry['size'] == os.path.getsize(tmp_path / 'a.json')
+
+    reads.clear()
+    assert catalog.entries() == entries
+    assert reads == []
+
+
+def test_repair(tmp_path):
+    reads = []
+    catalog = make_catalog(tmp_path, reads)
+    write(tmp_path / 'a.json', {'player': 'Knight'})
+    write(tmp_path / 'b.json', {'player': 'Mage'})
+    catalog.entries()
+    reads.clear()
+    write(tmp_path / 'a.json', {'player': 'Paladin', 'level': 3})
+    os.remove(tmp_path / 'b.json')
+    entries = catalog.entries()
+    assert reads == ['a.json']
+    assert [entry['player'] for entry in entries] == ['Paladin']
+    with open(catalog.path(), 'w') as handle:
+        handle.write('{"version": 1, "saves": ')
+    assert [entry['player'] for entry in catalog.entries()] == ['Paladin']
+    with open(tmp_path / 'c.sav', 'w') as handle:
+        handle.write('TAGS')
+    entries = catalog.entries()
+    assert [entry['format'] for entry in entries
+            if entry['filename'] == 'c.sav'] == ['damaged']
+
+
+def test_record(tmp_path):
+    reads = []
+    catalog = make_catalog(tmp_path, reads)
+    write(tmp_path / 'a.json', {})
+    catalog.record('a.json', {'player': 'Knight', 'format': 'json'})
+    catalog.update_slot('a', {'level': 4})
+    entries = catalog.entries()
+    assert reads == []
+    assert entries[0]['player'] == 'Knight'
+    assert entries[0]['level'] == 4
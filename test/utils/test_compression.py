@@ -0,0 +1,52 @@
+from utils.compression import (
+    CODECS,
+    SaveCompression,
+    detect_codec,
+    file_codec,
+    open_decompressed
+)
+from utils.save_worker import write_atomically
+
+import os
+import pytest
+
+
+def test_set_codec():
+    compression = SaveCompression()
+    assert compression.codec() is None
+    assert compression.wrap(b'data') == b'data'
+    compression.set_codec('lzma')
+    assert compression.level() == 6
+    compression.set_codec('bz2', 1)
+    assert compression.level() == 1
+    with pytest.raises(ValueError):
+        compression.set_codec('zip')
+    with pytest.raises(ValueError):
+        compression.set_codec('bz2', 0)
+
+
+def test_detect_codec():
+    assert detect_codec(b'TAGS\x01') is None
+    assert detect_codec(b'{"streamed": 2') is None
+    assert detect_codec(b'[]') is None
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_round_trip(codec):
+    filepath = 'saves/test/compressed.bin'
+    data = b''.join(b'{"name": "Road", "number": %d}\n' % number
+                    for number in range(10000))
+
+    def write(handle):
+        for line in data.splitlines(keepends=True):
+            handle.write(line)
+    try:
+        write_atomically(filepath, SaveCompression(codec).wrap(write))
+        assert file_codec(filepath) == codec
+        assert os.path.getsize(filepath) < len(data) // 10
+        with open_decompressed(filepath) as handle:
+            assert handle.read() == data
+        with open_decompressed(filepath) as handle:
+            assert handle.readline() == data.splitlines(keepends=True)[0]
+    finally:
+        os.remove(filepath)
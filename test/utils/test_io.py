@@ -3,8 +3,17 @@ from utils.io import (
     load_configuration_from_string,
     load_location_from_configuration,
     write_save_as_json,
-    load_save_from_json
+    load_save_from_json,
+    write_save,
+    load_save,
+    save_format,
+    save_catalog,
+    warm_configuration_cache
 )
+from utils.binary_grid import convert_tsv_to_grid
+from utils.bundle import compile_game
+from utils.cache import configuration_cache
+from utils.compression import file_codec, save_compression
 
 from entities.player import Player
 from entities.enemy import Enemy
@@ -18,6 +27,7 @@ from location.location import (
 from location.field import Field
 from game import Game
 
+import os
 import pytest
 
 
@@ -79,3 +89,129 @@ def test_load_save_from_json():
     game = Game('test', player, [location1, location2], 2)
     loaded_game = load_save_from_json('test', 'test', Game)
     assert game == loaded_game
+
+
+def test_write_save_binary():
+    player = Player('Knight')
+    field = Field('Road', 'Simple Road', -10, Enemy(), Key(), True, True, 1)
+    location = Location([[field, Field(go_to=2)]], level=1)
+    game = Game('test', player, [location], 1)
+    write_save('test', 'binary', game)
+    try:
+        assert save_format('saves/test/binary.sav') == 'binary'
+        entry = [entry for entry in save_catalog('test').entries()
+                 if entry['filename'] == 'binary.sav'][0]
+        assert entry['player'] == 'Knight'
+        assert entry['level'] == 1
+        assert entry['format'] == 'binary'
+        assert load_save('test', 'binary', Game) == game
+        assert load_save('test', 'binary.sav', Game) == game
+    finally:
+        os.remove('saves/test/binary.sav')
+
+
+def test_load_save_detects_format():
+    player = Player('Knight')
+    location = Location([[Field(go_to=1), Field(go_to=2)]], level=1)
+    game = Game('test', player, [location], 1)
+    write_save('test', 'detect.json', game)
+    os.replace('saves/test/detect.json', 'saves/test/detect.sav')
+    try:
+        assert save_format('saves/test/detect.sav') == 'json'
+        assert load_save('test', 'detect', Game) == game
+    finally:
+        os.remove('saves/test/detect.sav')
+    with pytest.raises(FileNotFoundError):
+        _ = load_save('test', 'not_found', Game)
+
+
+def test_write_save_delta():
+    game = Game('test', Player('Knight'))
+    location = game.location()
+    assert location.source() == 'lvl1'
+    location.field(2, 2).set_seen()
+    location.field(1, 2).set_name('Old Road')
+    game.set_locations(
+        game.locations() + [Location([[Field(go_to=2)]], level=2)])
+    assert game.location_at(2) == game.locations()[1]
+    delta = game.as_delta()
+    assert delta['locations'][0]['changes'] == [
+        [1, 2, {'name': 'Old Road'}]]
+    fog = location.fog().copy()
+    fog.load(delta['locations'][0]['fog'])
+    assert fog.seen(2, 2) is True
+    assert delta['locations'][1]['location'] == game.locations()[1].as_dict()
+    write_save('test', 'delta', game, delta=True)
+    try:
+        loaded_game = load_save('test', 'delta', Game)
+        assert loaded_game == game
+        assert loaded_game.location().source() == 'lvl1'
+    finally:
+        os.remove('saves/test/delta.sav')
+
+
+@pytest.mark.parametrize('filename', ['compressed.json', 'compressed.sav'])
+def test_write_save_compressed(filename):
+    player = Player('Knight')
+    location = Location([[Field(go_to=1), Field(go_to=2)]], level=1)
+    game = Game('test', player, [location], 1)
+    save_compression.set_codec('lzma', 1)
+    try:
+        write_save('test', filename, game)
+        assert file_codec(f'saves/test/{filename}') == 'lzma'
+        assert load_save('test', filename, Game) == game
+        entry = [entry for entry in save_catalog('test').entries()
+                 if entry['filename'] == filename][0]
+        assert entry['format'].endswith('+lzma')
+        assert entry['player'] == 'Knight'
+        write_save('test', filename, game, delta=True)
+        assert load_save('test', filename, Game) == game
+    finally:
+        save_compression.set_codec(None)
+        os.remove(f'saves/test/{filename}')
+    if filename.endswith('.json'):
+        save_compression.set_codec('zlib')
+        try:
+            write_save('test', filename, game)
+            assert load_save_from_json('test', 'compressed', Game) == game
+        finally:
+            save_compression.set_codec(None)
+            os.remove(f'saves/test/{filename}')
+
+
+def test_warm_configuration_cache():
+    configuration_cache.clear()
+    warm_configuration_cache('test')
+    misses = configuration_cache.misses()
+    _ = load_location_from_configuration('test', 'lvl1', 1)
+    _ = load_configuration_from_json('test', 'player', Player)
+    assert configuration_cache.misses() == misses
+    assert configuration_cache.hits() > 0
+
+
+def test_load_from_bundle():
+    filepath = compile_game('test')
+    try:
+        configuration_cache.clear()
+        location = load_location_from_configuration('test', 'correct', 1)
+        assert str(location) == (
+            " X  X  X  X \n X  P     X \n X        X \n X  X  X  X \n")
+        string = load_configuration_from_string('test', 'introduction')
+        assert string == "Intro\n...\ntest"
+        player = load_configuration_from_json('test', 'player', Player)
+        assert player.base_health() == 100
+        with pytest.raises(DeformedLocationError):
+            _ = load_location_from_configuration('test', 'deformed', 1)
+        assert configuration_cache.size() == 2
+    finally:
+        os.remove(filepath)
+
+
+def test_load_from_binary_grid():
+    filepath = convert_tsv_to_grid('configuration/test/correct.txt')
+    try:
+        location = load_location_from_configuration('test', 'correct', 1)
+        assert str(location) == (
+            " X  X  X  X \n X  P     X \n X        X \n X  X  X  X \n")
+    finally:
+        os.remove(filepath)
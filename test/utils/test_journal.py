@@ -0,0 +1,56 @@
+from utils.journal import SaveJournal, read_journal
+from utils.save_worker import FSYNC_NEVER, save_worker
+
+import os
+
+
+def test_append_and_entries():
+    journal = SaveJournal('test', 'journal')
+    with journal.lock():
+        journal.reset()
+    try:
+        assert journal.append([]) == 0
+        assert journal.append([{'op': 'level', 'level': 2},
+                               {'op': 'level', 'level': 1}]) == 2
+        assert journal.entries() == [
+            {'op': 'level', 'level': 2, 'seq': 1},
+            {'op': 'level', 'level': 1, 'seq': 2}]
+        assert journal.entries(1) == [{'op': 'level', 'level': 1, 'seq': 2}]
+        assert SaveJournal('test', 'journal').last_seq() == 2
+        assert SaveJournal('test', 'journal', 5).last_seq() == 5
+        with journal.lock():
+            journal.truncate(1)
+        assert [entry['seq'] for entry in journal.entries()] == [2]
+        assert journal.append([{'op': 'level', 'level': 3}]) == 3
+    finally:
+        with journal.lock():
+            journal.reset()
+
+
+def test_damaged_line_ends_journal():
+    filepath = 'saves/test/damaged.journal'
+    with open(filepath, 'w') as handle:
+        handle.write('{"op": "level", "level": 2, "seq": 1}\n')
+        handle.write('{"op": "level", "le')
+    try:
+        assert [entry['seq'] for entry in read_journal(filepath)] == [1]
+    finally:
+        os.remove(filepath)
+    assert list(read_journal(filepath)) == []
+
+
+def test_append_fsync(monkeypatch):
+    synced = []
+    monkeypatch.setattr('utils.journal.fsync', synced.append)
+    journal = SaveJournal('test', 'synced')
+    policy = save_worker.fsync()
+    try:
+        journal.append([{'op': 'level', 'level': 2}])
+        assert len(synced) == 1
+        save_worker.set_fsync(FSYNC_NEVER)
+        journal.append([{'op': 'level', 'level': 1}])
+        assert len(synced) == 1
+    finally:
+        save_worker.set_fsync(policy)
+        with journal.lock():
+            journal.reset()
@@ -0,0 +1,184 @@
+from utils.levels import (
+    LevelCache,
+    LevelSnapshot,
+    max_loaded_levels,
+    set_max_loaded_levels
+)
+from utils.io import load_location_from_configuration
+from utils.stream import read_game_binary, write_game_binary
+
+from entities.player import Player
+from entities.equipment import Key
+from location.location import Location
+from location.field import Field
+from game import Game
+
+import os
+import pytest
+
+
+def create_locations():
+    return [Location([[Field(go_to=1), Field(go_to=2), Field(go_to=3)]],
+                     level=1),
+            Location([[Field(go_to=2), Field()]], level=2),
+            Location([[Field(go_to=3)], [Field()]], level=3)]
+
+
+def test_snapshot():
+    cache = LevelCache()
+    location = load_location_from_configuration('test', 'lvl1', 1)
+    location.go_east(Player())
+    snapshot = cache.spill('test', 1, location)
+    assert isinstance(snapshot, LevelSnapshot)
+    assert snapshot.source() == 'lvl1'
+    assert os.path.exists(snapshot.filepath())
+    assert cache.reload('test', snapshot) == location
+    assert not os.path.exists(snapshot.filepath())
+    assert cache.evictions() == cache.reloads() == 1
+    cache.close()
+
+
+def test_eviction():
+    locations = create_locations()
+    expected = Game('test', Player('Knight'), create_locations(), 1)
+    game = Game('test', Player('Knight'), locations, 1)
+    game.levels().set_max_loaded(2)
+    for level in (1, 2, 3):
+        game.location_at(level).set_coordinates((1, 1))
+        expected.location_at(level).set_coordinates((1, 1))
+    assert isinstance(locations[0], LevelSnapshot)
+    assert game.loaded_locations() == 2
+    delta = game.as_delta()['locations'][0]
+    assert Location.from_dict(delta['location']) == expected.location_at(1)
+    assert game == expected
+    assert game.location_at(1) == expected.location_at(1)
+    assert game.levels().reloads() == 1
+    assert isinstance(locations[1], LevelSnapshot)
+    assert game.loaded_locations() == 2
+    game.levels().close()
+
+
+def test_save_keeps_snapshots():
+    locations = create_locations()
+    expected = Game('test', Player('Knight'), create_locations(), 1)
+    game = Game('test', Player('Knight'), locations, 1)
+    game.levels().set_max_loaded(1)
+    for level in (3, 2, 1):
+        game.location_at(level)
+    assert game.loaded_locations() == 1
+    assert game == expected
+    assert Game.from_delta(game.as_delta()) == expected
+    filepath = 'saves/test/snapshots.sav'
+    try:
+        with open(filepath, 'wb') as handle:
+            write_game_binary(game, handle)
+        assert Game.from_dict(read_game_binary(filepath)) == expected
+    finally:
+        os.remove(filepath)
+    assert game.loaded_locations() == 1
+    assert all(isinstance(location, LevelSnapshot)
+               for location in locations[1:])
+    assert game.levels().reloads() == 0
+    game.levels().close()
+
+
+def test_record_changes(monkeypatch):
+    monkeypatch.setattr('game.field_delta', lambda game, location, x, y: {})
+    locations = create_locations()
+    game = Game('test', Player('Knight'), locations[:2], 1)
+    game.levels().set_max_loaded(1)
+    for level in (2, 1, 2, 1):
+        before = game.round_state()
+        game.set_level(level)
+        game.location()
+        game.record_changes(before)
+        assert isinstance(locations[level - 1], Location)
+        game.location()
+    assert game.levels().evictions() == 4
+    assert game.levels().reloads() == 3
+    game.levels().close()
+
+
+def test_max_loaded():
+    with pytest.raises(ValueError):
+        LevelCache(0)
+    assert max_loaded_levels() is None
+    set_max_loaded_levels(1)
+    try:
+        game = Game('test', Player('Knight'), create_locations(), 1)
+        assert game.levels().max_loaded() == 1
+    finally:
+        set_max_loaded_levels(None)
+
+
+def test_links(monkeypatch):
+    locations = create_locations()
+    player = Player('Knight', equipment_size=10)
+    game = Game('test', player, locations[:2], 1)
+    player.set_equipment([Key(location_filename='lvl3', level=3)])
+    monkeypatch.setattr('game.load_location_from_configuration',
+                        lambda game, filename, level: locations[2])
+    game.location_at(1).field(3, 1).open(player, game)
+    assert game.level() == 3
+    assert game.links() == {3: 1}
+    game.location().field(1, 1).open(player, game)
+    assert game.level() == 1
+    game.location().field(2, 1).open(player, game)
+    assert game.level() == 2
+    game.location().field(1, 1).open(player, game)
+    assert game.level() == 1
+
+    loaded = Game.from_dict(game.as_dict())
+    assert loaded.links() == {3: 1}
+    assert loaded.previous_level(3) == 1
+    assert loaded.previous_level(2) == 1
+    assert Game.from_delta(game.as_delta()).links() == {3: 1}
+    loaded.set_links(None)
+    loaded.apply_journal([{'op': 'link', 'level': 3, 'from': 1, 'seq': 1}])
+    assert loaded.links() == {3: 1}
+
+
+def test_skip_level(monkeypatch):
+    locations = create_locations()
+    loaded_levels = []
+
+    def load(game, filename, level):
+        loaded_levels.append(level)
+        return locations[level - 1]
+
+    player = Player('Knight', equipment_size=10)
+    game = Game('test', player, locations[:1], 1)
+    player.set_equipment([Key(location_filename='lvl3', level=3)])
+    monkeypatch.setattr('game.load_location_from_configuration', load)
+    game.location().field(3, 1).open(player, game)
+    assert game.level() == 3
+    assert game.location() is locations[2]
+    assert game.location_count() == 2
+    assert game.has_level(3) and not game.has_level(2)
+    for _ in range(2):
+        game.location().field(1, 1).open(player, game)
+        assert game.level() == 1
+        game.location().field(3, 1).open(player, game)
+        assert game.level() == 3
+    game.location().field(1, 1).open_with_key(player.equipment()[0], game)
+    game.location().field(3, 1).open_with_key(player.equipment()[0], game)
+    assert game.level() == 3
+    assert loaded_levels == [3]
+    assert game.location_count() == 2
+
+    for loaded in (Game.from_dict(game.as_dict()),
+                   Game.from_delta(game.as_delta())):
+        assert loaded.location_count() == 2
+        assert loaded.location_at(3) == locations[2]
+        assert loaded.location_at(1) == locations[0]
+        assert not loaded.has_level(2)
+        assert loaded.previous_level(3) == 1
+    filepath = 'saves/test/skip.sav'
+    try:
+        with open(filepath, 'wb') as handle:
+            write_game_binary(game, handle)
+        dictionary = read_game_binary(filepath)
+        assert isinstance(dictionary['locations'][1], Location)
+        assert Game.from_dict(dictionary) == game
+    finally:
+        os.remove(filepath)
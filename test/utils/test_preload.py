@@ -0,0 +1,44 @@
+from utils.preload import LoadedWorld, close_worlds, preloaded_location
+from utils.io import (
+    build_location,
+    load_location_from_configuration,
+    preload_game
+)
+from location.field import Field
+from location.location import Location
+
+GAME = 'Dungeons and Dragons'
+
+
+def test_preload_game():
+    try:
+        world = preload_game(GAME, workers=2)
+        assert world.levels() == {'lvl1': 1, 'lvl2': 2, 'lvl3': 3}
+        times = world.wait()
+        assert sorted(times) == ['lvl1', 'lvl2', 'lvl3']
+        assert len(world.report()) == 3
+
+        location = load_location_from_configuration(GAME, 'lvl2', 2)
+        assert location == build_location(GAME, 'lvl2', 2)
+        again = preloaded_location(GAME, 'lvl2', 2)
+        assert again == location
+        assert again is not location
+        assert preloaded_location(GAME, 'lvl2', 3) is None
+        assert preloaded_location(GAME, 'lvl9', 9) is None
+    finally:
+        close_worlds()
+    assert preloaded_location(GAME, 'lvl2', 2) is None
+
+
+def test_loaded_world_failed_build():
+    def build(game, filename, level):
+        if filename == 'broken':
+            raise ValueError('broken')
+        return Location([[Field(go_to=level)]], level=level)
+
+    world = LoadedWorld(GAME, {'lvl1': 1, 'broken': 2}, build)
+    try:
+        assert world.take('lvl1', 1).level() == 1
+        assert world.take('broken', 2) is None
+    finally:
+        world.close()
@@ -0,0 +1,54 @@
+from utils.save_worker import (
+    SaveError,
+    SaveWorker,
+    write_atomically
+)
+
+from threading import Event
+import os
+import pytest
+
+
+def test_write_atomically(tmp_path):
+    filepath = str(tmp_path / 'save.sav')
+    for policy in ('never', 'file', 'always'):
+        write_atomically(filepath, policy.encode(), policy)
+        with open(filepath, 'rb') as handle:
+            assert handle.read() == policy.encode()
+    assert os.listdir(tmp_path) == ['save.sav']
+
+
+def test_coalesce():
+    worker = SaveWorker()
+    started = Event()
+    release = Event()
+    written = []
+
+    def blocking():
+        started.set()
+        release.wait()
+
+    worker.submit('other', blocking)
+    started.wait()
+    worker.submit('slot', lambda: written.append(1))
+    worker.submit('slot', lambda: written.append(2))
+    worker.submit('slot', lambda: written.append(3), replace=False)
+    assert worker.pending() == 3
+    release.set()
+    worker.wait()
+    assert written == [2, 3]
+    assert worker.pending() == 0
+
+
+def test_errors():
+    worker = SaveWorker()
+    with pytest.raises(ValueError):
+        worker.set_fsync('sometimes')
+
+    def failing():
+        raise OSError('Disk is full')
+
+    worker.submit('slot', failing)
+    with pytest.raises(SaveError):
+        worker.wait()
+    worker.wait()
@@ -0,0 +1,143 @@
+from utils.stream import (
+    SavedLocation,
+    read_game_binary,
+    read_game_header,
+    read_game_json,
+    field_dict,
+    location_header,
+    write_game_binary,
+    write_game_json
+)
+from utils.io import write_save_as_json
+
+from entities.player import Player
+from entities.enemy import Enemy
+from entities.equipment import Key
+from location.location import Location
+from location.field import Field
+from game import Game
+
+import json
+import os
+import pytest
+
+
+def create_game() -> Game:
+    field = Field('Road', 'Simple Road', -10, Enemy(), Key(), True, True, 1)
+    location1 = Location([[field, Field(go_to=2)], [Field(), Field()]],
+                         level=1)
+    location2 = Location([[Field(go_to=2)]], level=2)
+    return Game('test', Player('Knight'), [location1, location2], 2)
+
+
+def test_json_round_trip():
+    game = create_game()
+    filepath = 'saves/test/stream.json'
+    try:
+        with open(filepath, 'wb') as handle:
+            write_game_json(game, handle)
+        with open(filepath, 'r') as handle:
+            saved = json.load(handle)['locations']
+        assert [location['fog'] for location in saved] == \
+            [location.fog().encode(text=True)
+             for location in game.locations()]
+        assert 'seen' not in saved[0]['location'][0][0]
+        assert saved[0]['boarders'] is False
+        assert len(saved[0]['location']) == 2
+        dictionary = read_game_json(filepath)
+        first, current = dictionary['locations']
+        assert isinstance(first, SavedLocation)
+        assert isinstance(current, Location)
+        assert first.as_dict() == game.locations()[0].as_dict()
+        assert Game.from_dict(dictionary) == game
+        assert read_game_header(filepath)['player']['name'] == 'Knight'
+    finally:
+        os.remove(filepath)
+
+
+def test_binary_round_trip():
+    game = create_game()
+    filepath = 'saves/test/stream.sav'
+    try:
+        with open(filepath, 'wb') as handle:
+            write_game_binary(game, handle)
+        dictionary = read_game_binary(filepath)
+        first, current = dictionary['locations']
+        assert first.load() == game.locations()[0]
+        assert isinstance(current, Location)
+        assert Game.from_dict(dictionary) == game
+        header = read_game_header(filepath)
+        assert header['level'] == 2
+        assert 'locations' not in header
+    finally:
+        os.remove(filepath)
+
+
+def test_read_json_with_boarders():
+    game = create_game()
+    filepath = 'saves/test/boarders.json'
+    try:
+        with open(filepath, 'w') as handle:
+            handle.write('{"streamed": 3, "game": "test", "level": 1, '
+                         '"locations": [\n')
+            location = game.locations()[0]
+            header = location_header(location, text=True)
+            del header['boarders']
+            handle.write(json.dumps(header)[:-1] + ', "location": [\n')
+            rows = [json.dumps([field_dict(field) for field in row])
+                    for row in location.storage().rows()]
+            handle.write(',\n'.join(rows) + '\n]}\n]}\n')
+        loaded = read_game_json(filepath)['locations'][0]
+        assert loaded == location
+        assert loaded.storage().virtual_boarder()
+    finally:
+        os.remove(filepath)
+
+
+def test_read_not_streamed_json():
+    game = create_game()
+    filepath = 'saves/test/indented.json'
+    try:
+        with open(filepath, 'w') as handle:
+            json.dump(game.as_dict(), handle, indent=4)
+        assert read_game_json(filepath) is None
+        assert read_game_header(filepath) is None
+    finally:
+        os.remove(filepath)
+
+
+def test_read_truncated_json():
+    game = create_game()
+    write_save_as_json('test', 'truncated', game)
+    filepath = 'saves/test/truncated.json'
+    try:
+        with open(filepath, 'r') as handle:
+            lines = handle.readlines()
+        with open(filepath, 'w') as handle:
+            handle.writelines(lines[:3])
+        with pytest.raises(ValueError):
+            _ = read_game_json(filepath)
+    finally:
+        os.remove(filepath)
+
+
+def test_copy_saved_locations():
+    game = create_game()
+    json_path = 'saves/test/copy.json'
+    binary_path = 'saves/test/copy.sav'
+    try:
+        with open(json_path, 'wb') as handle:
+            write_game_json(game, handle)
+        loaded = Game.from_dict(read_game_json(json_path))
+        with open(binary_path, 'wb') as handle:
+            write_game_binary(loaded, handle)
+        assert isinstance(next(loaded.stored_locations()), SavedLocation)
+        loaded = Game.from_dict(read_game_binary(binary_path))
+        assert loaded == game
+        with open(json_path, 'wb') as handle:
+            write_game_json(loaded, handle)
+        assert loaded.loaded_locations() == 1
+        assert Game.from_dict(read_game_json(json_path)) == game
+    finally:
+        os.remove(json_path)
+        os.remove(binary_path)
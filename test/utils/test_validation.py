@@ -0,0 +1,125 @@
+from utils.validation import (
+    ConfigurationError,
+    VALIDATION_FILENAME,
+    check_fields,
+    check_grid,
+    check_player,
+    distrust,
+    location_levels,
+    read_stamp,
+    trusted,
+    trusted_start
+)
+from utils.io import (
+    ensure_validated,
+    load_field_templates,
+    load_location_from_configuration,
+    validate_configuration
+)
+from utils.cache import configuration_cache
+from location.location import Location
+
+import json
+import os
+import pytest
+import shutil
+
+
+FIELDS = [
+    {'name': 'Road'},
+    {'name': 'Gate', 'go_to': 1},
+    {'name': 'Gate', 'go_to': 2}
+]
+
+
+def test_check_fields():
+    assert check_fields(FIELDS) == []
+    assert check_fields([]) == ['fields.json must be a non-empty list']
+    problems = check_fields([
+        {'go_to': -1},
+        {'go_to': 'WIN'},
+        {'enemy': {'name': 'Goblin', 'health': 0}},
+        {'item': {'class': 'Potion', 'name': ''}}
+    ])
+    assert len(problems) == 3
+    assert problems[0] == 'Field 0 has invalid go_to -1'
+    assert problems[1].startswith('Enemy of field 2 is invalid')
+    assert problems[2].startswith('Item of field 3 is invalid')
+
+
+def test_check_player():
+    assert check_player({'name': 'Knight'}) == []
+    assert len(check_player({'name': 'Knight', 'health': 200})) == 1
+
+
+def test_location_levels():
+    key = {'class': 'Key', 'name': 'Key', 'level': 2,
+           'location_filename': 'lvl2'}
+    levels, problems = location_levels([{'item': key}])
+    assert levels == {'lvl1': 1, 'lvl2': 2}
+    assert problems == []
+    other = dict(key, level=3)
+    _, problems = location_levels([{'item': key}, {'item': other}])
+    assert problems == ['Keys open lvl2 as different levels']
+
+
+def test_check_grid():
+    assert check_grid('lvl1', [[0, 1], [0, 2]], FIELDS, 1) == ((2, 1), [])
+    assert check_grid('lvl2', [[0, 1], [0, 2]], FIELDS, 2) == ((2, 2), [])
+    assert check_grid('lvl1', [], FIELDS, 1) == (None, ['lvl1 is empty'])
+    start, problems = check_grid('lvl1', [[0, 1], [0]], FIELDS, 1)
+    assert start == (2, 1)
+    assert problems == ['lvl1 row 2 has 1 fields instead of 2']
+    start, problems = check_grid('lvl1', [[1, 1], [0, 7]], FIELDS, 1)
+    assert start is None
+    assert problems == [
+        'lvl1 row 2 column 2 has unknown field 7',
+        'lvl1 must have exactly one starting point for level 1, found 2']
+    fields = FIELDS + [{'name': 'Wall', 'enterable': False}]
+    assert check_grid('lvl1', [[1, 3, 2]], fields, 1) == \
+        ((1, 1), ['lvl1 has no gate that can be reached '
+                  'from the starting point'])
+    assert check_grid('lvl1', [[1, 3, 0]], fields, 1) == ((1, 1), [])
+
+
+def test_validate_configuration():
+    distrust('test')
+    starts = validate_configuration('test')
+    assert trusted('test')
+    assert read_stamp('configuration/test') == starts
+    assert trusted_start('test', 'lvl1', 1) == tuple(starts['lvl1'][1:])
+    assert trusted_start('test', 'lvl1', 2) is None
+    configuration_cache.clear()
+    assert all(template.trusted() for template in load_field_templates('test'))
+    location = load_location_from_configuration('test', 'lvl1', 1)
+
+    distrust('test')
+    configuration_cache.clear()
+    assert not any(template.trusted()
+                   for template in load_field_templates('test'))
+    assert location == load_location_from_configuration('test', 'lvl1', 1)
+    assert isinstance(location, Location)
+    ensure_validated('test')
+    assert trusted('test')
+
+
+def test_validate_invalid_configuration():
+    directory = 'configuration/invalid'
+    os.mkdir(directory)
+    try:
+        with open(f'{directory}/fields.json', 'w') as handle:
+            json.dump([{'name': 'Road'}, {'name': 'Gate', 'go_to': 1}, {
+                'item': {'class': 'Key', 'name': 'Key', 'level': 2,
+                         'location_filename': 'lvl2'}}], handle)
+        with open(f'{directory}/lvl1.txt', 'w') as handle:
+            handle.write('0\t0\n0\t3\n')
+        with pytest.raises(ConfigurationError) as error:
+            ensure_validated('invalid')
+        assert error.value.problems == [
+            'lvl1 row 2 column 2 has unknown field 3',
+            'lvl1 must have exactly one starting point for level 1, found 0',
+            'Location lvl2 does not exist']
+        assert not trusted('invalid')
+        assert not os.path.exists(f'{directory}/{VALIDATION_FILENAME}')
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,248 @@
+from array import array
+from mmap import mmap, ACCESS_READ
+from typing import List
+import os
+import struct
+import sys
+
+MAGIC = b'TAGG'
+VERSION = 1
+GRID_EXTENSION = '.grid'
+
+# magic, version, item size, width, height
+HEADER = struct.Struct('<4sHBxII')
+
+TYPECODES = {2: 'H', 4: 'I'}
+
+
+class GridFormatError(Exception):
+    """
+    Indicates that binary grid is damaged or has unsupported version
+
+    :param Exception: Grid cannot be read
+    :type Exception: Exception
+    """
+    pass
+
+
+class BinaryGrid:
+    """
+    BinaryGrid - matrix of field indexes stored as fixed-width
+    unsigned numbers, read in place from a buffer or a memory-mapped file
+
+    Behaves like a read-only List[List[int]] - rows are indexed by y
+
+    Contains attributes:
+
+    :param buffer: Buffer with the header and cells
+    :type buffer: bytes or mmap
+
+    :param offset: Position of the header in the buffer, defaults to 0
+    :type offset: int, optional
+    """
+
+    def __init__(self, buffer, offset: int = 0):
+        """
+        Initialize BinaryGrid
+
+        :param buffer: Buffer with the header and cells
+        :type buffer: bytes or mmap
+        :param offset: Position of the header in the buffer, defaults to 0
+        :type offset: int, optional
+        :raises GridFormatError: Indicates that buffer is not a binary grid
+        """
+        if len(buffer) < offset + HEADER.size:
+            raise GridFormatError('Grid is too short')
+        magic, version, itemsize, width, height = HEADER.unpack_from(
+            buffer, offset)
+        if magic != MAGIC:
+            raise GridFormatError('Buffer is not a binary grid')
+        if version != VERSION or itemsize not in TYPECODES:
+            raise GridFormatError(f'Unsupported grid version {version}')
+        start = offset + HEADER.size
+        end = start + width * height * itemsize
+        if len(buffer) < end:
+            raise GridFormatError('Grid is truncated')
+        self._buffer = buffer
+        self._width = width
+        self._height = height
+        self._cells = memoryview(buffer)[start:end].cast(TYPECODES[itemsize])
+        if sys.byteorder != 'little':
+            swapped = array(TYPECODES[itemsize], self._cells)
+            swapped.byteswap()
+            self._cells = memoryview(swapped)
+
+    @staticmethod
+    def open(path: str) -> 'BinaryGrid':
+        """
+        Open binary grid file with mmap
+
+        :param path: Path to the grid file
+        :type path: str
+        :raises FileNotFoundException: Indicates that given file doesn't exist
+        :raises GridFormatError: Indicates that file is not a binary grid
+        :return: Grid reading cells from the file
+        :rtype: BinaryGrid
+        """
+        with open(path, 'rb') as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                raise GridFormatError('Grid is too short')
+            return BinaryGrid(mmap(handle.fileno(), 0, access=ACCESS_READ))
+
+    def width(self) -> int:
+        """
+        Get width
+
+        :return: Number of cells in a row
+        :rtype: int
+        """
+        return self._width
+
+    def height(self) -> int:
+        """
+        Get height
+
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._height
+
+    def cell(self, x: int, y: int) -> int:
+        """
+        Get field index with given coordinates
+
+        :param x: Coordinate - x
+        :type x: int
+        :param y: Coordinate - y
+        :type y: int
+        :raises IndexError: Indicates that coordinates are out of range
+        :return: Field index
+        :rtype: int
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise IndexError('Cell out of range')
+        return self._cells[y * self._width + x]
+
+    def row(self, y: int) -> memoryview:
+        """
+        Get row of field indexes without copying it
+
+        :param y: Coordinate - y
+        :type y: int
+        :raises IndexError: Indicates that row is out of range
+        :return: Row of indexes
+        :rtype: memoryview
+        """
+        if not 0 <= y < self._height:
+            raise IndexError('Row out of range')
+        return self._cells[y * self._width:(y + 1) * self._width]
+
+    def tolist(self) -> List[List[int]]:
+        """
+        Get grid as a matrix
+
+        :return: Matrix of indexes
+        :rtype: List[List[int]]
+        """
+        return [self.row(y).tolist() for y in range(self._height)]
+
+    def __len__(self) -> int:
+        """
+        :return: Number of rows
+        :rtype: int
+        """
+        return self._height
+
+    def __getitem__(self, y: int) -> memoryview:
+        """
+        :param y: Coordinate - y
+        :type y: int
+        :return: Row of indexes
+        :rtype: memoryview
+        """
+        return self.row(y)
+
+
+def parse_grid(text: str) -> List[List[int]]:
+    """
+    Parse tab separated matrix of field indexes
+
+    :param text: Contents of the location file
+    :type text: str
+    :raises ValueError: Indicates that text contains something else
+                        than numbers
+    :return: Matrix of indexes
+    :rtype: List[List[int]]
+    """
+    return [[int(num) for num in row.split('\t')]
+            for row in text.splitlines()]
+
+
+def pack_grid(numbers: List[List[int]]) -> bytes:
+    """
+    Pack rectangular matrix of field indexes into binary grid format
+
+    :param numbers: Matrix of indexes
+    :type numbers: List[List[int]]
+    :raises ValueError: Indicates that matrix is empty, is not a rectangle
+                        or contains negative indexes
+    :return: Header and cells
+    :rtype: bytes
+    """
+    if len(numbers) == 0 or len(numbers[0]) == 0:
+        raise ValueError('Grid cannot be empty')
+    height = len(numbers)
+    width = len(numbers[0])
+    if min(map(min, numbers)) < 0:
+        raise ValueError('Grid cannot contain negative indexes')
+    cells = array('H' if max(map(max, numbers)) < 2**16 else 'I')
+    for row in numbers:
+        if len(row) != width:
+            raise ValueError("Grid must be a rectangle")
+        cells.extend(row)
+    if sys.byteorder != 'little':
+        cells.byteswap()
+    return HEADER.pack(MAGIC, VERSION, cells.itemsize, width, height) + \
+        cells.tobytes()
+
+
+def write_grid(path: str, numbers: List[List[int]]):
+    """
+    Write matrix of field indexes as a binary grid file
+
+    The file is replaced atomically, so grids opened with mmap
+    keep reading the old contents
+
+    :param path: Path to the grid file
+    :type path: str
+    :param numbers: Matrix of indexes
+    :type numbers: List[List[int]]
+    :raises ValueError: Indicates that matrix cannot be packed
+    """
+    data = pack_grid(numbers)
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as handle:
+        handle.write(data)
+    os.replace(temp_path, path)
+
+
+def convert_tsv_to_grid(path: str, grid_path: str = None) -> str:
+    """
+    Convert location file with tab separated indexes to binary grid
+
+    :param path: Path to the txt location file
+    :type path: str
+    :param grid_path: Path to the new grid file, defaults to path
+                    with .grid extension
+    :type grid_path: str, optional
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises ValueError: Indicates that file is not a rectangle of indexes
+    :return: Path to the grid file
+    :rtype: str
+    """
+    if grid_path is None:
+        grid_path = os.path.splitext(path)[0] + GRID_EXTENSION
+    with open(path, 'r') as handle:
+        numbers = parse_grid(handle.read())
+    write_grid(grid_path, numbers)
+    return grid_path
@@ -0,0 +1,382 @@
+from typing import Any, BinaryIO
+import struct
+
+MAGIC = b'TAGS'
+VERSION = 1
+
+NONE = 0
+FALSE = 1
+TRUE = 2
+INT = 3
+NEW_STR = 4
+STR = 5
+LIST = 6
+DICT = 7
+FLOAT = 8
+BYTES = 9
+
+DOUBLE = struct.Struct('<d')
+
+# Encoded data is written to the file in pieces of this size
+FLUSH_SIZE = 1 << 16
+
+
+class BinarySaveError(Exception):
+    """
+    Indicates that binary save is damaged or has unsupported version
+
+    :param Exception: Save cannot be read
+    :type Exception: Exception
+    """
+    pass
+
+
+class BinaryEncoder:
+    """
+    BinaryEncoder - writes json-like values in compact binary format
+
+    Every string is written once, later occurrences refer to its number,
+    so repeated descriptions and names cost a few bytes
+
+    Contains attributes:
+
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    """
+
+    def __init__(self, handle: BinaryIO):
+        """
+        Initialize BinaryEncoder and write the header
+
+        :param handle: File opened in binary mode
+        :type handle: BinaryIO
+        """
+        self._handle = handle
+        self._strings = {}
+        self._buffer = bytearray(MAGIC)
+        self._buffer.append(VERSION)
+
+    def encode(self, value: Any):
+        """
+        Encode value - None, bool, int, float, str, bytes, list, tuple
+        or dict with string keys
+
+        :param value: Value to encode
+        :type value: Any
+        :raises TypeError: Indicates that value cannot be encoded
+        """
+        buffer = self._buffer
+        if value is None:
+            buffer.append(NONE)
+        elif value is True:
+            buffer.append(TRUE)
+        elif value is False:
+            buffer.append(FALSE)
+        elif isinstance(value, str):
+            self._encode_str(value)
+        elif isinstance(value, int):
+            if not -2**63 <= value < 2**63:
+                raise TypeError(f'Number {value} does not fit in 64 bits')
+            buffer.append(INT)
+            self._encode_varint((value << 1) ^ (value >> 63))
+        elif isinstance(value, dict):
+            buffer.append(DICT)
+            self._encode_varint(len(value))
+            for key, item in value.items():
+                self._encode_str(key)
+                self.encode(item)
+        elif isinstance(value, (list, tuple)):
+            buffer.append(LIST)
+            self._encode_varint(len(value))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, float):
+            buffer.append(FLOAT)
+            buffer += DOUBLE.pack(value)
+        elif isinstance(value, (bytes, bytearray)):
+            buffer.append(BYTES)
+            self._encode_varint(len(value))
+            buffer += value
+        else:
+            raise TypeError(f'Cannot encode {type(value).__name__}')
+        if len(buffer) >= FLUSH_SIZE:
+            self.flush()
+
+    def begin_dict(self, count: int):
+        """
+        Start dict with given number of items, each item is written
+        with key method followed by its value
+
+        :param count: Number of items
+        :type count: int
+        """
+        self._buffer.append(DICT)
+        self._encode_varint(count)
+
+    def begin_list(self, count: int):
+        """
+        Start list with given number of items written one by one
+
+        :param count: Number of items
+        :type count: int
+        """
+        self._buffer.append(LIST)
+        self._encode_varint(count)
+
+    def begin_bytes(self, count: int):
+        """
+        Start bytes of given length written in pieces with write bytes
+
+        :param count: Number of bytes
+        :type count: int
+        """
+        self._buffer.append(BYTES)
+        self._encode_varint(count)
+
+    def write_bytes(self, data: bytes):
+        """
+        Write piece of bytes started with begin bytes
+
+        :param data: Next bytes
+        :type data: bytes
+        """
+        self._buffer += data
+        if len(self._buffer) >= FLUSH_SIZE:
+            self.flush()
+
+    def key(self, key: str):
+        """
+        Write key of a dict item
+
+        :param key: Key
+        :type key: str
+        """
+        self._encode_str(key)
+
+    def flush(self):
+        """
+        Write encoded data to the file
+        """
+        self._handle.write(self._buffer)
+        self._buffer = bytearray()
+
+    def _encode_str(self, value: str):
+        """
+        :param value: String to encode
+        :type value: str
+        """
+        number = self._strings.get(value)
+        if number is None:
+            self._strings[value] = len(self._strings)
+            data = value.encode('utf-8')
+            self._buffer.append(NEW_STR)
+            self._encode_varint(len(data))
+            self._buffer += data
+        else:
+            self._buffer.append(STR)
+            self._encode_varint(number)
+
+    def _encode_varint(self, value: int):
+        """
+        :param value: Non-negative number to encode in 7-bit groups
+        :type value: int
+        """
+        buffer = self._buffer
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+
+class BinaryDecoder:
+    """
+    BinaryDecoder - reads values written by BinaryEncoder
+
+    Contains attributes:
+
+    :param data: Encoded data with the header
+    :type data: bytes
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Initialize BinaryDecoder and check the header
+
+        :param data: Encoded data with the header
+        :type data: bytes
+        :raises BinarySaveError: Indicates that data is not a binary save
+        """
+        if data[:len(MAGIC)] != MAGIC:
+            raise BinarySaveError('File is not a binary save')
+        if len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+            raise BinarySaveError('Unsupported binary save version')
+        self._data = data
+        self._position = len(MAGIC) + 1
+        self._strings = []
+
+    def decode(self) -> Any:
+        """
+        Decode next value
+
+        :raises BinarySaveError: Indicates that data is damaged
+        :return: Decoded value
+        :rtype: Any
+        """
+        try:
+            return self._decode()
+        except (IndexError, UnicodeDecodeError, struct.error) as e:
+            raise BinarySaveError('Binary save is damaged') from e
+
+    def peek(self) -> int:
+        """
+        Get tag of the next value without reading it
+
+        :raises BinarySaveError: Indicates that data is damaged
+        :return: Tag of the next value
+        :rtype: int
+        """
+        try:
+            return self._data[self._position]
+        except IndexError as e:
+            raise BinarySaveError('Binary save is damaged') from e
+
+    def begin(self, tag: int) -> int:
+        """
+        Read start of a dict or list written by begin method
+        of the encoder, its items are read with decode method
+
+        :param tag: DICT or LIST
+        :type tag: int
+        :raises BinarySaveError: Indicates that there is other value
+        :return: Number of items
+        :rtype: int
+        """
+        data = self._data
+        try:
+            if data[self._position] != tag:
+                raise BinarySaveError(f'Expected tag {tag}')
+            self._position += 1
+            result = 0
+            shift = 0
+            while True:
+                byte = data[self._position]
+                self._position += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+        except IndexError as e:
+            raise BinarySaveError('Binary save is damaged') from e
+
+    def _decode(self) -> Any:
+        """
+        :return: Decoded value
+        :rtype: Any
+        """
+        data = self._data
+        strings = self._strings
+        position = self._position
+
+        def varint() -> int:
+            nonlocal position
+            byte = data[position]
+            position += 1
+            if byte < 0x80:
+                return byte
+            result = byte & 0x7F
+            shift = 7
+            while True:
+                byte = data[position]
+                position += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+
+        def value() -> Any:
+            nonlocal position
+            tag = data[position]
+            position += 1
+            if tag == STR:
+                return strings[varint()]
+            elif tag == INT:
+                number = varint()
+                return (number >> 1) ^ -(number & 1)
+            elif tag == DICT:
+                dictionary = {}
+                for _ in range(varint()):
+                    key = value()
+                    dictionary[key] = value()
+                return dictionary
+            elif tag == NONE:
+                return None
+            elif tag == TRUE:
+                return True
+            elif tag == FALSE:
+                return False
+            elif tag == NEW_STR:
+                length = varint()
+                end = position + length
+                if end > len(data):
+                    raise IndexError('String is truncated')
+                string = data[position:end].decode('utf-8')
+                position = end
+                strings.append(string)
+                return string
+            elif tag == LIST:
+                return [value() for _ in range(varint())]
+            elif tag == FLOAT:
+                number, = DOUBLE.unpack_from(data, position)
+                position += DOUBLE.size
+                return number
+            elif tag == BYTES:
+                length = varint()
+                end = position + length
+                if end > len(data):
+                    raise IndexError('Bytes are truncated')
+                blob = bytes(data[position:end])
+                position = end
+                return blob
+            raise BinarySaveError(f'Unknown tag {tag}')
+
+        result = value()
+        self._position = position
+        return result
+
+
+def dump(value: Any, handle: BinaryIO):
+    """
+    Write value to the file in binary save format
+
+    :param value: Value to encode
+    :type value: Any
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    """
+    encoder = BinaryEncoder(handle)
+    encoder.encode(value)
+    encoder.flush()
+
+
+def load(handle: BinaryIO) -> Any:
+    """
+    Read value from the file in binary save format
+
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    :raises BinarySaveError: Indicates that file is not a binary save
+    :return: Decoded value
+    :rtype: Any
+    """
+    return BinaryDecoder(handle.read()).decode()
+
+
+def is_binary_save(header: bytes) -> bool:
+    """
+    Whether file starting with given bytes is a binary save
+
+    :param header: First bytes of the file
+    :type header: bytes
+    :rtype: bool
+    """
+    return header[:len(MAGIC)] == MAGIC
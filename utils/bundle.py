@@ -0,0 +1,253 @@
+from mmap import mmap, ACCESS_READ
+from os import fstat, listdir, path, replace
+from typing import Dict, List
+import json
+import struct
+
+from utils.binary_grid import (
+    BinaryGrid,
+    GRID_EXTENSION,
+    pack_grid,
+    parse_grid
+)
+from utils.validation import VALIDATION_FILENAME
+
+MAGIC = b'TAGB'
+VERSION = 2
+BUNDLE_FILENAME = 'world.bundle'
+
+# magic, version, number of sections
+HEADER = struct.Struct('<4sHH')
+# name length, kind, offset, length
+SECTION = struct.Struct('<HBQQ')
+
+JSON = 0
+TEXT = 1
+GRID_KIND = 2
+
+
+class BundleError(Exception):
+    """
+    Indicates that bundle file is damaged or has unsupported version
+
+    :param Exception: Bundle cannot be read
+    :type Exception: Exception
+    """
+    pass
+
+
+class Bundle:
+    """
+    Bundle - whole configuration of a game packed into one file
+
+    Decoded sections are kept in the bundle and shared between callers,
+    they must be treated as read-only
+
+    Contains attributes:
+
+    :param sections: Dictionary with sections' name, kind and contents
+    :type sections: Dict
+    """
+
+    def __init__(self, sections: Dict = None):
+        """
+        Initialize Bundle
+
+        :param sections: Dictionary with sections' name as key and
+                        tuple of kind and contents as value, defaults to None
+        :type sections: Dict, optional
+        """
+        self._sections = sections if sections else {}
+        self._decoded = {}
+
+    def names(self) -> List[str]:
+        """
+        Get names of bundled files
+
+        :return: List of file names
+        :rtype: List[str]
+        """
+        return list(self._sections.keys())
+
+    def has(self, name: str) -> bool:
+        """
+        Whether file with given name was bundled
+
+        :param name: File name from the configuration directory
+        :type name: str
+        :rtype: bool
+        """
+        return name in self._sections
+
+    def json(self, name: str):
+        """
+        Get contents of bundled json file
+
+        :param name: File name from the configuration directory
+        :type name: str
+        :return: Parsed json
+        """
+        if name not in self._decoded:
+            kind, data = self._sections[name]
+            self._decoded[name] = json.loads(bytes(data))
+        return self._decoded[name]
+
+    def string(self, name: str) -> str:
+        """
+        Get contents of bundled txt file
+
+        :param name: File name from the configuration directory
+        :type name: str
+        :return: File contents
+        :rtype: str
+        """
+        kind, data = self._sections[name]
+        return bytes(data).decode('utf-8')
+
+    def grid(self, name: str) -> List[List[int]]:
+        """
+        Get matrix of field indexes from bundled location file,
+        packed grids are read in place
+
+        :param name: File name from the configuration directory
+        :type name: str
+        :raises ValueError: Indicates that file is not a matrix of numbers
+        :return: Matrix of indexes - BinaryGrid or List[List[int]]
+        :rtype: List[List[int]]
+        """
+        if name not in self._decoded:
+            kind, data = self._sections[name]
+            if kind == GRID_KIND:
+                self._decoded[name] = BinaryGrid(data)
+            else:
+                self._decoded[name] = parse_grid(
+                    bytes(data).decode('utf-8'))
+        return self._decoded[name]
+
+    def add_file(self, filepath: str):
+        """
+        Add file from the configuration directory to the bundle,
+        binary grids are bundled under the name of the txt location file
+
+        :param filepath: Path to the file
+        :type filepath: str
+        :raises GridFormatError: Indicates that binary grid is damaged
+        """
+        name = path.basename(filepath)
+        if name.endswith(GRID_EXTENSION):
+            name = name[:-len(GRID_EXTENSION)] + '.txt'
+        self._decoded.pop(name, None)
+        if filepath.endswith(GRID_EXTENSION):
+            with open(filepath, 'rb') as handle:
+                data = handle.read()
+            BinaryGrid(data)
+            self._sections[name] = (GRID_KIND, data)
+            return
+        if name.endswith('.json'):
+            with open(filepath, 'r') as handle:
+                data = json.dumps(json.load(handle)).encode('utf-8')
+            self._sections[name] = (JSON, data)
+            return
+        with open(filepath, 'r') as handle:
+            text = handle.read()
+        try:
+            self._sections[name] = (GRID_KIND, pack_grid(parse_grid(text)))
+        except ValueError:
+            self._sections[name] = (TEXT, text.encode('utf-8'))
+
+    def to_bytes(self) -> bytes:
+        """
+        Get bundle in binary format
+
+        :return: Header, table of sections and their contents
+        :rtype: bytes
+        """
+        names = [name.encode('utf-8') for name in self._sections]
+        table_size = HEADER.size + sum(
+            SECTION.size + len(name) for name in names)
+        table = [HEADER.pack(MAGIC, VERSION, len(names))]
+        contents = []
+        offset = table_size
+        for name, (kind, data) in zip(names, self._sections.values()):
+            table.append(SECTION.pack(len(name), kind, offset, len(data)))
+            table.append(name)
+            contents.append(data)
+            offset += len(data)
+        return b''.join(table + contents)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Bundle':
+        """
+        Get new Bundle instance from binary format
+
+        :param data: Bundle in binary format
+        :type data: bytes
+        :raises BundleError: Indicates that data is not a supported bundle
+        :return: Loaded Bundle
+        :rtype: Bundle
+        """
+        if len(data) < HEADER.size:
+            raise BundleError('Bundle is too short')
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise BundleError('File is not a bundle')
+        if version != VERSION:
+            raise BundleError(f'Unsupported bundle version {version}')
+        view = memoryview(data)
+        sections = {}
+        position = HEADER.size
+        for _ in range(count):
+            name_len, kind, offset, length = SECTION.unpack_from(
+                data, position)
+            position += SECTION.size
+            name = bytes(view[position:position + name_len]).decode('utf-8')
+            position += name_len
+            if offset + length > len(data):
+                raise BundleError(f'Section {name} is truncated')
+            sections[name] = (kind, view[offset:offset + length])
+        return Bundle(sections)
+
+
+def read_bundle(filepath: str) -> Bundle:
+    """
+    Reads bundle file based on path, the file is memory-mapped
+
+    :param filepath: Path to the bundle
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises BundleError: Indicates that file is not a supported bundle
+    :return: Loaded Bundle
+    :rtype: Bundle
+    """
+    with open(filepath, 'rb') as handle:
+        if fstat(handle.fileno()).st_size == 0:
+            raise BundleError('Bundle is too short')
+        return Bundle.from_bytes(
+            mmap(handle.fileno(), 0, access=ACCESS_READ))
+
+
+def compile_game(game: str, directory: str = 'configuration') -> str:
+    """
+    Pack configuration directory of the game into a bundle file
+    placed in the same directory
+
+    :param game: Name of the game
+    :type game: str
+    :param directory: Directory with configurations,
+                        defaults to 'configuration'
+    :type directory: str, optional
+    :raises FileNotFoundException: Indicates that game doesn't exist
+    :return: Path to the bundle
+    :rtype: str
+    """
+    folder_path = f'{directory}/{game}'
+    bundle = Bundle()
+    for name in sorted(listdir(folder_path)):
+        if name.endswith(('.json', '.txt', GRID_EXTENSION)) and \
+                name != VALIDATION_FILENAME:
+            bundle.add_file(f'{folder_path}/{name}')
+    filepath = f'{folder_path}/{BUNDLE_FILENAME}'
+    with open(f'{filepath}.tmp', 'wb') as handle:
+        handle.write(bundle.to_bytes())
+    replace(f'{filepath}.tmp', filepath)
+    return filepath
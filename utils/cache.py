@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from os import stat
+from threading import Lock
+from typing import Any, Callable, Dict
+
+
+class ConfigurationCache:
+    """
+    Process-wide cache of parsed configuration files
+
+    Entries are keyed by path and parser and validated against the file's
+    modification time and size, so an edited file is parsed again.
+    The least recently used entries are evicted once the cache is full.
+
+    Values are shared between all callers - they must be treated
+    as read-only.
+
+    Contains attributes:
+
+    :param max_size: Maximal number of cached files, defaults to 128
+    :type max_size: int, optional
+    """
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize ConfigurationCache
+
+        :param max_size: Maximal number of cached files, defaults to 128
+        :type max_size: int, optional
+        """
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self.set_max_size(max_size)
+
+    # Getters and Setters
+
+    def max_size(self) -> int:
+        """
+        Get max size
+
+        :return: Maximal number of cached files
+        :rtype: int
+        """
+        return self._max_size
+
+    def set_max_size(self, max_size: int):
+        """
+        Set max size and evict entries that do not fit anymore
+
+        :param max_size: Maximal number of cached files
+        :type max_size: int
+        :raises ValueError: Indicates that given size was not positive
+        """
+        if max_size <= 0:
+            raise ValueError('Cache size must be positive')
+        self._max_size = max_size
+        with self._lock:
+            self._evict()
+
+    def hits(self) -> int:
+        """
+        Get hits
+
+        :return: Number of lookups served from the cache
+        :rtype: int
+        """
+        return self._hits
+
+    def misses(self) -> int:
+        """
+        Get misses
+
+        :return: Number of lookups that had to parse the file
+        :rtype: int
+        """
+        return self._misses
+
+    def size(self) -> int:
+        """
+        Get size
+
+        :return: Number of currently cached files
+        :rtype: int
+        """
+        return len(self._entries)
+
+    # Custom Methods
+
+    def get(self, path: str, parser: Callable[[str], Any]) -> Any:
+        """
+        Get parsed contents of the file, parse it on a miss
+
+        :param path: Path to the file
+        :type path: str
+        :param parser: Function that parses file with given path
+        :type parser: Callable[[str], Any]
+        :raises FileNotFoundError: Indicates that given file doesn't exist
+        :return: Parsed contents of the file
+        :rtype: Any
+        """
+        info = stat(path)
+        signature = (info.st_mtime_ns, info.st_size)
+        key = (path, parser)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        value = parser(path)
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            self._evict()
+        return value
+
+    def invalidate(self, path: str):
+        """
+        Remove file from the cache
+
+        :param path: Path to the file
+        :type path: str
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Remove all files from the cache and reset counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        :return: Dictionary with hits, misses, size and max size
+        :rtype: Dict
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'size': self.size(),
+            'max_size': self._max_size
+        }
+
+    def _evict(self):
+        """
+        Remove least recently used entries over the max size
+        """
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+configuration_cache = ConfigurationCache()
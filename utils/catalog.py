@@ -0,0 +1,217 @@
+from os import listdir, path, stat
+from threading import Lock
+from typing import Callable, Dict, List
+import json
+import time
+
+from utils.save_worker import write_atomically
+
+CATALOG_FILENAME = 'index.json'
+CATALOG_VERSION = 1
+
+# Catalogs of all directories share one lock, they are small
+_lock = Lock()
+
+
+class SaveCatalog:
+    """
+    SaveCatalog - index of saves in a directory with their metadata,
+    kept in index.json so the saves do not have to be read to list them
+
+    Entries are checked against size and modification time of the files,
+    stale entries are read again and missing ones are removed
+
+    Contains attributes:
+
+    :param directory: Directory with saves
+    :type directory: str
+
+    :param reader: Function returning metadata of the save with given path
+    :type reader: Callable[[str], Dict]
+
+    :param extensions: Extensions of save files
+    :type extensions: List[str]
+    """
+
+    def __init__(self,
+                 directory: str,
+                 reader: Callable[[str], Dict],
+                 extensions: List[str]):
+        """
+        Initialize SaveCatalog
+
+        :param directory: Directory with saves
+        :type directory: str
+        :param reader: Function returning metadata of the save
+                        with given path
+        :type reader: Callable[[str], Dict]
+        :param extensions: Extensions of save files
+        :type extensions: List[str]
+        """
+        self._directory = directory
+        self._reader = reader
+        self._extensions = tuple(extensions)
+        self._path = f'{directory}/{CATALOG_FILENAME}'
+
+    def path(self) -> str:
+        """
+        Get path
+
+        :return: Path to the index file
+        :rtype: str
+        """
+        return self._path
+
+    def entries(self) -> List[Dict]:
+        """
+        Get metadata of all saves, newest first,
+        the index is repaired if it is stale
+
+        :return: List of dictionaries with filename, player, level,
+                health, time, size and format
+        :rtype: List[Dict]
+        """
+        with _lock:
+            catalog = self._read()
+            changed = False
+            names = [name for name in listdir(self._directory)
+                     if name.endswith(self._extensions) and
+                     name != CATALOG_FILENAME]
+            for name in set(catalog) - set(names):
+                del catalog[name]
+                changed = True
+            for name in names:
+                signature = self._signature(name)
+                entry = catalog.get(name)
+                if entry is None or entry['signature'] != signature:
+                    catalog[name] = self._read_entry(name, signature)
+                    changed = True
+            if changed:
+                self._write(catalog)
+        entries = [dict(entry, filename=name)
+                   for name, entry in catalog.items()]
+        entries.sort(key=lambda entry: entry['time'], reverse=True)
+        for entry in entries:
+            del entry['signature']
+        return entries
+
+    def record(self, filename: str, metadata: Dict):
+        """
+        Update entry of the save that was just written
+
+        :param filename: Name of the save file with extension
+        :type filename: str
+        :param metadata: Dictionary with player, level, health and format
+        :type metadata: Dict
+        """
+        with _lock:
+            catalog = self._read()
+            catalog[filename] = self._entry(
+                filename, metadata, self._signature(filename), time.time())
+            self._write(catalog)
+
+    def update_slot(self, slot: str, metadata: Dict):
+        """
+        Update entries of the slot after its journal was appended,
+        only given values are changed
+
+        :param slot: Name of the save without extension
+        :type slot: str
+        :param metadata: Dictionary with changed values
+        :type metadata: Dict
+        """
+        with _lock:
+            catalog = self._read()
+            for name, entry in catalog.items():
+                if path.splitext(name)[0] == slot:
+                    entry.update(metadata)
+                    entry['signature'] = self._signature(name)
+                    entry['size'] = self._size(name)
+                    entry['time'] = time.time()
+            self._write(catalog)
+
+    def _read_entry(self, filename: str, signature: List[int]) -> Dict:
+        """
+        :return: Entry with metadata read from the save
+        :rtype: Dict
+        """
+        filepath = f'{self._directory}/{filename}'
+        try:
+            metadata = self._reader(filepath)
+        except Exception:
+            metadata = {'format': 'damaged'}
+        modified = max(signature[0], signature[2]) / 1e9
+        return self._entry(filename, metadata, signature, modified)
+
+    def _entry(self,
+               filename: str,
+               metadata: Dict,
+               signature: List[int],
+               saved: float) -> Dict:
+        """
+        :return: Entry of the index
+        :rtype: Dict
+        """
+        return {
+            'player': metadata.get('player', None),
+            'level': metadata.get('level', None),
+            'health': metadata.get('health', None),
+            'format': metadata.get('format', None),
+            'time': saved,
+            'size': self._size(filename),
+            'signature': signature
+        }
+
+    def _signature(self, filename: str) -> List[int]:
+        """
+        :return: Modification time and size of the save and
+                modification time of its journal
+        :rtype: List[int]
+        """
+        info = stat(f'{self._directory}/{filename}')
+        journal = self._journal_path(filename)
+        journal_time = stat(journal).st_mtime_ns if path.exists(journal) \
+            else 0
+        return [info.st_mtime_ns, info.st_size, journal_time]
+
+    def _size(self, filename: str) -> int:
+        """
+        :return: Size of the save with its journal
+        :rtype: int
+        """
+        size = path.getsize(f'{self._directory}/{filename}')
+        journal = self._journal_path(filename)
+        if path.exists(journal):
+            size += path.getsize(journal)
+        return size
+
+    def _journal_path(self, filename: str) -> str:
+        """
+        :return: Path to the journal of the save
+        :rtype: str
+        """
+        return f'{self._directory}/{path.splitext(filename)[0]}.journal'
+
+    def _read(self) -> Dict:
+        """
+        :return: Entries of the index by file name, empty if the index
+                is missing or damaged
+        :rtype: Dict
+        """
+        try:
+            with open(self._path, 'r') as handle:
+                catalog = json.load(handle)
+            if catalog.get('version') != CATALOG_VERSION:
+                return {}
+            return catalog['saves']
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+
+    def _write(self, catalog: Dict):
+        """
+        :param catalog: Entries of the index by file name
+        :type catalog: Dict
+        """
+        data = json.dumps({'version': CATALOG_VERSION, 'saves': catalog},
+                          indent=4)
+        write_atomically(self._path, data.encode('utf-8'))
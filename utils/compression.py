@@ -0,0 +1,298 @@
+from io import BufferedReader, RawIOBase
+from typing import BinaryIO, Callable, Union
+import bz2
+import lzma
+import zlib
+
+# Codecs of compressed saves with their default levels
+CODECS = ('zlib', 'lzma', 'bz2')
+DEFAULT_LEVELS = {'zlib': 6, 'lzma': 6, 'bz2': 9}
+LEVELS = {'zlib': range(0, 10), 'lzma': range(0, 10), 'bz2': range(1, 10)}
+
+LZMA_MAGIC = b'\xfd7zXZ\x00'
+BZ2_MAGIC = b'BZh'
+
+# Compressed files are read in pieces of this size
+CHUNK_SIZE = 1 << 16
+
+
+class SaveCompression:
+    """
+    SaveCompression - codec and level used for new saves,
+    saves are not compressed by default
+
+    Contains attributes:
+
+    :param codec: 'zlib', 'lzma', 'bz2' or None, defaults to None
+    :type codec: str, optional
+
+    :param level: Compression level, defaults to default level of the codec
+    :type level: int, optional
+    """
+
+    def __init__(self, codec: str = None, level: int = None):
+        """
+        Initialize SaveCompression
+
+        :param codec: 'zlib', 'lzma', 'bz2' or None, defaults to None
+        :type codec: str, optional
+        :param level: Compression level,
+                    defaults to default level of the codec
+        :type level: int, optional
+        """
+        self.set_codec(codec, level)
+
+    # Getters and Setters
+
+    def codec(self) -> str:
+        """
+        Get codec
+
+        :return: Codec of new saves or None
+        :rtype: str
+        """
+        return self._codec
+
+    def level(self) -> int:
+        """
+        Get level
+
+        :return: Compression level or None
+        :rtype: int
+        """
+        return self._level
+
+    def set_codec(self, codec: str, level: int = None):
+        """
+        Set codec and level
+
+        :param codec: 'zlib', 'lzma', 'bz2' or None to save
+                    without compression
+        :type codec: str
+        :param level: Compression level,
+                    defaults to default level of the codec
+        :type level: int, optional
+        :raises ValueError: Indicates that codec or level is unknown
+        """
+        if codec is not None and codec not in CODECS:
+            raise ValueError(f'Unknown codec {codec}')
+        if codec is not None and level is None:
+            level = DEFAULT_LEVELS[codec]
+        if codec is not None and level not in LEVELS[codec]:
+            raise ValueError(f'Invalid {codec} level {level}')
+        self._codec = codec
+        self._level = level if codec else None
+
+    # Custom Methods
+
+    def wrap(self, data: Union[bytes, Callable[[BinaryIO], None]]
+             ) -> Union[bytes, Callable[[BinaryIO], None]]:
+        """
+        Get contents of the file compressed with the current codec,
+        data is compressed while it is written
+
+        :param data: Contents of the file or function writing them
+                    to the given file handle
+        :type data: Union[bytes, Callable[[BinaryIO], None]]
+        :return: Function writing compressed data or data itself
+                if saves are not compressed
+        :rtype: Union[bytes, Callable[[BinaryIO], None]]
+        """
+        if self._codec is None:
+            return data
+        codec = self._codec
+        level = self._level
+
+        def write(handle: BinaryIO):
+            compressed = compressing_writer(handle, codec, level)
+            try:
+                if callable(data):
+                    data(compressed)
+                else:
+                    compressed.write(data)
+            finally:
+                compressed.close()
+        return write
+
+
+class ZlibWriter:
+    """
+    ZlibWriter - compresses data written to it into the file,
+    closing it does not close the file
+
+    Contains attributes:
+
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+
+    :param level: Compression level
+    :type level: int
+    """
+
+    def __init__(self, handle: BinaryIO, level: int):
+        """
+        Initialize ZlibWriter
+
+        :param handle: File opened in binary mode
+        :type handle: BinaryIO
+        :param level: Compression level
+        :type level: int
+        """
+        self._handle = handle
+        self._compressor = zlib.compressobj(level)
+
+    def write(self, data: bytes) -> int:
+        """
+        Compress data into the file
+
+        :param data: Data to write
+        :type data: bytes
+        :return: Number of bytes written
+        :rtype: int
+        """
+        self._handle.write(self._compressor.compress(data))
+        return len(data)
+
+    def close(self):
+        """
+        Write the end of the compressed stream
+        """
+        if self._compressor:
+            self._handle.write(self._compressor.flush())
+            self._compressor = None
+
+
+class ZlibReader(RawIOBase):
+    """
+    ZlibReader - decompresses zlib file while it is read
+
+    Contains attributes:
+
+    :param handle: File opened in binary mode, closed with the reader
+    :type handle: BinaryIO
+    """
+
+    def __init__(self, handle: BinaryIO):
+        """
+        Initialize ZlibReader
+
+        :param handle: File opened in binary mode
+        :type handle: BinaryIO
+        """
+        super().__init__()
+        self._handle = handle
+        self._decompressor = zlib.decompressobj()
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        """
+        :rtype: bool
+        """
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Read decompressed data into the buffer
+
+        :param buffer: Writable buffer
+        :raises zlib.error: Indicates that file is damaged
+        :raises EOFError: Indicates that file is truncated
+        :return: Number of bytes read, 0 at the end of the file
+        :rtype: int
+        """
+        decompressor = self._decompressor
+        while not self._buffer and not decompressor.eof:
+            chunk = decompressor.unconsumed_tail or \
+                self._handle.read(CHUNK_SIZE)
+            if not chunk:
+                raise EOFError('Compressed save is truncated')
+            self._buffer = decompressor.decompress(chunk, CHUNK_SIZE)
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        """
+        Close the reader and the file
+        """
+        self._handle.close()
+        super().close()
+
+
+def compressing_writer(handle: BinaryIO, codec: str, level: int) -> BinaryIO:
+    """
+    Get writer compressing data into the file,
+    closing it does not close the file
+
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    :param codec: 'zlib', 'lzma' or 'bz2'
+    :type codec: str
+    :param level: Compression level
+    :type level: int
+    :return: Writer with write and close methods
+    :rtype: BinaryIO
+    """
+    if codec == 'lzma':
+        return lzma.LZMAFile(handle, 'wb', preset=level)
+    if codec == 'bz2':
+        return bz2.BZ2File(handle, 'wb', compresslevel=level)
+    return ZlibWriter(handle, level)
+
+
+def detect_codec(header: bytes) -> str:
+    """
+    Detect codec of the file by its first bytes
+
+    :param header: First bytes of the file, at least 6
+    :type header: bytes
+    :return: 'zlib', 'lzma', 'bz2' or None if file is not compressed
+    :rtype: str
+    """
+    if header.startswith(LZMA_MAGIC):
+        return 'lzma'
+    if header.startswith(BZ2_MAGIC):
+        return 'bz2'
+    if len(header) >= 2 and header[0] & 0x0F == 8 and \
+            header[0] >> 4 <= 7 and (header[0] << 8 | header[1]) % 31 == 0:
+        return 'zlib'
+    return None
+
+
+def open_decompressed(filepath: str) -> BinaryIO:
+    """
+    Open file for reading, compressed files are decompressed
+    while they are read
+
+    :param filepath: Path to the file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: File opened in binary mode
+    :rtype: BinaryIO
+    """
+    codec = file_codec(filepath)
+    if codec == 'lzma':
+        return lzma.LZMAFile(filepath)
+    if codec == 'bz2':
+        return bz2.BZ2File(filepath)
+    if codec == 'zlib':
+        return BufferedReader(ZlibReader(open(filepath, 'rb')), CHUNK_SIZE)
+    return open(filepath, 'rb')
+
+
+def file_codec(filepath: str) -> str:
+    """
+    Detect codec of the file
+
+    :param filepath: Path to the file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: 'zlib', 'lzma', 'bz2' or None if file is not compressed
+    :rtype: str
+    """
+    with open(filepath, 'rb') as handle:
+        return detect_codec(handle.read(len(LZMA_MAGIC)))
+
+
+save_compression = SaveCompression()
@@ -1,9 +1,59 @@
 import json
+from functools import partial
+from io import BytesIO, TextIOWrapper
 from os import mkdir, path
-from typing import List
+from typing import BinaryIO, Dict, List
 
-from location.field import Field
+from utils import binary_save
+
+from entities.equipment import Key
+from location.field import Field, FieldTemplate
 from location.location import Location
+from location.array_storage import ArrayFields
+from location.storage import ChunkedFields
+from utils.binary_grid import BinaryGrid, GRID_EXTENSION, parse_grid
+from utils.bundle import Bundle, BUNDLE_FILENAME, read_bundle
+from utils.cache import configuration_cache
+from utils.catalog import SaveCatalog
+from utils.compression import file_codec, open_decompressed, save_compression
+from utils.journal import JOURNAL_EXTENSION, SaveJournal, read_journal
+from utils.preload import LoadedWorld, preload_world, preloaded_location
+from utils.save_worker import save_worker, write_atomically
+from utils.validation import (
+    ConfigurationError,
+    check_fields,
+    check_grid,
+    check_player,
+    distrust,
+    location_levels,
+    read_stamp,
+    trust,
+    trusted,
+    trusted_start,
+    write_stamp
+)
+from utils.stream import (
+    read_game_binary,
+    read_game_header,
+    read_game_json,
+    write_game_binary,
+    write_game_json
+)
+
+# Locations with more fields are loaded lazily in chunks
+CHUNKED_LOCATION_SIZE = 256 * 256
+
+# Storages of locations built from the configuration, 'numpy' keeps
+# fields in NumPy arrays and needs numpy installed
+LOCATION_BACKENDS = ('objects', 'numpy')
+_location_backend = 'objects'
+
+# Save formats by file extension, new saves use the first one
+SAVE_FORMATS = {'.sav': 'binary', '.json': 'json'}
+DEFAULT_SAVE_EXTENSION = '.sav'
+
+# Version of delta saves, stored under 'delta' key of the save
+DELTA_VERSION = 1
 
 
 def load_configuration_from_json(game: str, filename: str, cls):
@@ -20,6 +70,10 @@ def load_configuration_from_json(game: str, filename: str, cls):
     :raises FileNotFoundException: Indicates that given file doesn't exist
     :return: Object of a given class
     """
+    bundle = load_bundle(game)
+    if bundle and bundle.has(f'{filename}.json'):
+        result = bundle.json(f'{filename}.json')
+        return cls.from_dict(result) if cls else result
     return load_from_json(f'configuration/{game}/{filename}.json', cls)
 
 
@@ -35,13 +89,31 @@ def load_configuration_from_string(game: str, filename: str) -> str:
     :return: Config file contents
     :rtype: str
     """
-    with open(f'configuration/{game}/{filename}.txt', 'r') as handle:
+    bundle = load_bundle(game)
+    if bundle and bundle.has(f'{filename}.txt'):
+        return bundle.string(f'{filename}.txt')
+    return configuration_cache.get(
+        f'configuration/{game}/{filename}.txt', read_string)
+
+
+def read_string(path: str) -> str:
+    """
+    Reads txt file based on path
+
+    :param path: Path to txt file
+    :type path: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: File contents
+    :rtype: str
+    """
+    with open(path, 'r') as handle:
         return handle.read()
 
 
 def load_save_from_json(save: str, filename: str, cls):
     """
-    Loads save from saves directory
+    Loads save from saves directory, compressed saves
+    are detected by their header
 
     :param save: Name of the game
     :type save: str
@@ -52,52 +124,486 @@ def load_save_from_json(save: str, filename: str, cls):
     :raises FileNotFoundException: Indicates that given file doesn't exist
     :return: Object of a given class
     """
-    return load_from_json(f'saves/{save}/{filename}.json', cls)
+    return load_save(save, f'{filename}.json', cls)
 
 
-def write_save_as_json(save: str, filename: str, obj):
+def write_save_as_json(save: str, filename: str, obj, delta: bool = False):
     """
     Save object as json in the saves directory
 
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save
+    :type filename: str
+    :param obj: Game or object with as dict method
+    :param delta: Whether to save only changes with as delta method,
+                    defaults to False
+    :type delta: bool, optional
+    """
+    write_save(save, f'{filename}.json', obj, delta)
+
+
+def write_save_as_binary(save: str,
+                         filename: str,
+                         obj,
+                         delta: bool = False):
+    """
+    Save object in binary save format in the saves directory
+
     :param save: Name of the game
     :type save: str
     :param filename: Name of the save
     :type filename: str
     :param obj: Object with as dict method
+    :param delta: Whether to save only changes with as delta method,
+                    defaults to False
+    :type delta: bool, optional
+    """
+    write_save(save, f'{filename}.sav', obj, delta)
+
+
+def save_path(save: str, filename: str) -> str:
+    """
+    Get path to the save file, create saves directory of the game if needed
+
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save, optionally with extension
+    :type filename: str
+    :return: Path to the save file with extension
+    :rtype: str
     """
     folder_path = f'saves/{save}'
     if not path.exists(folder_path):
         mkdir(folder_path)
-    filepath = folder_path + f'/{filename}.json'
-    with open(filepath, 'w') as handle:
-        json.dump(obj.as_dict(), handle, indent=4)
+    if path.splitext(filename)[1] not in SAVE_FORMATS:
+        filename += DEFAULT_SAVE_EXTENSION
+    return f'{folder_path}/{filename}'
+
+
+def encode_save(dictionary: Dict, filepath: str) -> bytes:
+    """
+    Encode save in the format chosen by the extension of filepath
+
+    :param dictionary: Contents of the save
+    :type dictionary: Dict
+    :param filepath: Path to the save file with extension
+    :type filepath: str
+    :return: Contents of the save file
+    :rtype: bytes
+    """
+    if SAVE_FORMATS[path.splitext(filepath)[1]] == 'json':
+        return json.dumps(dictionary, indent=4).encode('utf-8')
+    handle = BytesIO()
+    binary_save.dump(dictionary, handle)
+    return handle.getvalue()
+
+
+def write_save(save: str,
+               filename: str,
+               obj,
+               delta: bool = False,
+               background: bool = False):
+    """
+    Save object in the saves directory, format is chosen by
+    the extension of filename - binary if it has none
+
+    The file is replaced atomically. Full saves written right away
+    are streamed one row of fields at a time without creating
+    the dictionary. In the background only the dictionary is created
+    right away - it is encoded and written by the save worker,
+    a newer save of the slot replaces a queued one
+
+    Saves are compressed while they are written if save compression
+    has a codec set
+
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save, optionally with extension
+    :type filename: str
+    :param obj: Game or object with as dict method
+    :param delta: Whether to save only changes with as delta method,
+                    defaults to False
+    :type delta: bool, optional
+    :param background: Whether to write on the save worker,
+                        defaults to False
+    :type background: bool, optional
+    """
+    filepath = save_path(save, filename)
+    codec = save_compression.codec()
+    if delta or background:
+        dictionary = obj.as_delta() if delta else obj.as_dict()
+        metadata = save_metadata(dictionary, filepath, codec)
+
+        def write(handle: BinaryIO):
+            handle.write(encode_save(dictionary, filepath))
+    else:
+        metadata = save_metadata({'player': obj.player().as_dict(),
+                                  'level': obj.level()}, filepath, codec)
+        write = partial(stream_save, obj, filepath)
+    write = save_compression.wrap(write)
+
+    def job():
+        write_atomically(filepath, write)
+        save_catalog(save).record(path.basename(filepath), metadata)
+    if background:
+        save_worker.submit(path.splitext(filepath)[0], job)
+    else:
+        job()
+
+
+def stream_save(obj, filepath: str, handle: BinaryIO):
+    """
+    Write whole game one row of fields at a time,
+    format is chosen by the extension of filepath
+
+    :param obj: Game to save
+    :type obj: Game
+    :param filepath: Path to the save file with extension
+    :type filepath: str
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    """
+    if SAVE_FORMATS[path.splitext(filepath)[1]] == 'json':
+        write_game_json(obj, handle)
+    else:
+        write_game_binary(obj, handle)
+
+
+def load_save(save: str, filename: str, cls):
+    """
+    Loads save from saves directory in any supported format
+
+    Format is detected by the header of the file. If filename has
+    no extension the most recently written save with that name is loaded
+    Delta saves are loaded with from delta method of the class,
+    changes from the journal of the slot are applied on top of snapshots
+
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save, optionally with extension
+    :type filename: str
+    :param cls: Class with from_dict static method
+    :type cls: class
+    :raises FileNotFoundException: Indicates that given save doesn't exist
+    :raises BinarySaveError: Indicates that binary save is damaged
+    :return: Object of a given class
+    """
+    filepath = find_save(save, filename)
+    dictionary = read_save(filepath)
+    if 'delta' not in dictionary:
+        return cls.from_dict(dictionary)
+    obj = cls.from_delta(dictionary)
+    if 'journal' in dictionary:
+        slot = path.splitext(path.basename(filepath))[0]
+        journal = SaveJournal(save, slot, dictionary['journal'])
+        obj.set_journal(journal, dictionary['journal'])
+        obj.apply_journal(journal.entries(dictionary['journal']))
+    return obj
+
+
+def start_journal(save: str,
+                  filename: str,
+                  obj,
+                  background: bool = False) -> SaveJournal:
+    """
+    Write snapshot of the object as a delta save and start
+    an empty journal for the slot, later changes are appended to it
+
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save, optionally with extension
+    :type filename: str
+    :param obj: Object with as delta and set journal methods
+    :param background: Whether to write on the save worker,
+                        defaults to False
+    :type background: bool, optional
+    :return: Journal of the slot
+    :rtype: SaveJournal
+    """
+    filepath = save_path(save, filename)
+    journal = SaveJournal(save, path.splitext(path.basename(filepath))[0])
+    obj.set_journal(journal, journal.last_seq())
+    dictionary = obj.as_delta()
+    codec = save_compression.codec()
+    compress = save_compression.wrap
+
+    def job():
+        data = compress(encode_save(dictionary, filepath))
+        with journal.lock():
+            write_atomically(filepath, data)
+            journal.reset()
+        save_catalog(save).record(
+            path.basename(filepath),
+            save_metadata(dictionary, filepath, codec))
+    if background:
+        save_worker.submit(path.splitext(filepath)[0], job)
+    else:
+        job()
+    return journal
+
+
+def append_journal(save: str,
+                   journal: SaveJournal,
+                   changes: List[Dict],
+                   cls,
+                   background: bool = False) -> int:
+    """
+    Append changes to the journal, a journal that grew too big
+    is folded into the snapshot afterwards
+
+    :param save: Name of the game
+    :type save: str
+    :param journal: Journal of the slot
+    :type journal: SaveJournal
+    :param changes: List of changes
+    :type changes: List[Dict]
+    :param cls: Class used to load the slot during compaction
+    :type cls: class
+    :param background: Whether to write on the save worker,
+                        defaults to False
+    :type background: bool, optional
+    :return: Sequence number of the last change
+    :rtype: int
+    """
+    entries = journal.number(changes)
+
+    def job():
+        journal.write(entries)
+        save_catalog(save).update_slot(
+            journal.slot(), journal_metadata(entries))
+        if journal.needs_compaction():
+            compact_journal(save, journal.slot(), cls)
+    if background:
+        save_worker.submit(
+            f'saves/{save}/{journal.slot()}', job, replace=False)
+    else:
+        job()
+    return journal.last_seq()
+
+
+def compact_journal(save: str, filename: str, cls) -> bool:
+    """
+    Fold journal of the slot into its snapshot
+
+    Snapshot with replayed journal is written and entries it covers
+    are removed from the journal. Entries appended in the meantime
+    are kept. Nothing is written if the slot got a new snapshot
+    in the meantime
+
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save without extension
+    :type filename: str
+    :param cls: Class with from delta and apply journal methods
+    :type cls: class
+    :return: Whether the journal was compacted
+    :rtype: bool
+    """
+    filepath = find_save(save, filename)
+    journal = SaveJournal(save, filename)
+    generation = journal.generation()
+    obj = load_save(save, path.basename(filepath), cls)
+    with journal.lock():
+        if journal.generation() != generation:
+            return False
+        write_save(save, path.basename(filepath), obj, delta=True)
+        journal.truncate(obj.journal_seq())
+    return True
+
+
+def save_catalog(save: str) -> SaveCatalog:
+    """
+    Get catalog of saves of the game
+
+    :param save: Name of the game
+    :type save: str
+    :return: Catalog of the saves directory
+    :rtype: SaveCatalog
+    """
+    return SaveCatalog(f'saves/{save}', read_save_metadata, list(SAVE_FORMATS))
+
+
+def save_metadata(dictionary: Dict,
+                  filepath: str,
+                  codec: str = None) -> Dict:
+    """
+    Get metadata shown in the catalog of saves
+
+    :param dictionary: Contents of the save
+    :type dictionary: Dict
+    :param filepath: Path to the save file
+    :type filepath: str
+    :param codec: Codec the save is compressed with, defaults to None
+    :type codec: str, optional
+    :return: Dictionary with player's name and health, level and format
+    :rtype: Dict
+    """
+    player = dictionary.get('player', {})
+    save_type = SAVE_FORMATS[path.splitext(filepath)[1]]
+    return {
+        'player': player.get('name', None),
+        'health': player.get('health', None),
+        'level': dictionary.get('level', None),
+        'format': f'{save_type}+{codec}' if codec else save_type
+    }
+
+
+def journal_metadata(entries: List[Dict]) -> Dict:
+    """
+    Get metadata changed by journal entries
+
+    :param entries: List of journal entries
+    :type entries: List[Dict]
+    :return: Dictionary with changed player's name and health and level
+    :rtype: Dict
+    """
+    metadata = {}
+    for entry in entries:
+        if entry['op'] == 'player':
+            metadata['player'] = entry['player'].get('name', None)
+            metadata['health'] = entry['player'].get('health', None)
+        elif entry['op'] == 'level':
+            metadata['level'] = entry['level']
+    return metadata
+
+
+def read_save_metadata(filepath: str) -> Dict:
+    """
+    Read metadata of the save file and its journal
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises BinarySaveError: Indicates that binary save is damaged
+    :return: Dictionary with player's name and health, level and format
+    :rtype: Dict
+    """
+    try:
+        dictionary = read_game_header(filepath)
+    except binary_save.BinarySaveError:
+        dictionary = None
+    if not dictionary or 'player' not in dictionary or \
+            'level' not in dictionary:
+        dictionary = read_save(filepath)
+    metadata = save_metadata(dictionary, filepath, file_codec(filepath))
+    if 'journal' in dictionary:
+        slot = path.splitext(filepath)[0]
+        metadata.update(journal_metadata([
+            entry for entry in read_journal(f'{slot}{JOURNAL_EXTENSION}')
+            if entry['seq'] > dictionary['journal']]))
+    return metadata
 
 
-def load_from_json(path: str, cls=None):
+def read_save(filepath: str) -> Dict:
+    """
+    Read save file in any supported format, locations of full binary
+    and streamed json saves are loaded row by row, compressed saves
+    are decompressed while they are read
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises BinarySaveError: Indicates that binary save is damaged
+    :return: Contents of the save, locations can be Location objects
+    :rtype: Dict
+    """
+    if save_format(filepath) == 'binary':
+        return read_game_binary(filepath)
+    dictionary = read_game_json(filepath)
+    if dictionary is not None:
+        return dictionary
+    with TextIOWrapper(open_decompressed(filepath), 'utf-8') as handle:
+        return json.load(handle)
+
+
+def find_save(save: str, filename: str) -> str:
+    """
+    Get path to the save with given name
+
+    :param save: Name of the game
+    :type save: str
+    :param filename: Name of the save, optionally with extension
+    :type filename: str
+    :raises FileNotFoundError: Indicates that given save doesn't exist
+    :return: Path to the save file
+    :rtype: str
+    """
+    folder_path = f'saves/{save}'
+    if path.splitext(filename)[1] in SAVE_FORMATS:
+        candidates = [f'{folder_path}/{filename}']
+    else:
+        candidates = [f'{folder_path}/{filename}{extension}'
+                      for extension in SAVE_FORMATS]
+    candidates = [candidate for candidate in candidates
+                  if path.exists(candidate)]
+    if not candidates:
+        raise FileNotFoundError(f'Save {filename} does not exist')
+    return max(candidates, key=path.getmtime)
+
+
+def save_format(filepath: str) -> str:
+    """
+    Detect format of the save file by its header,
+    compressed saves are detected by the header of their contents
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: 'binary' or 'json'
+    :rtype: str
+    """
+    with open_decompressed(filepath) as handle:
+        header = handle.read(len(binary_save.MAGIC))
+    return 'binary' if binary_save.is_binary_save(header) else 'json'
+
+
+def load_from_json(path: str, cls=None, cache: bool = True):
     """
     Reads json file based on path
     If cls is None returns dict else returns object of a given class
 
+    Parsed files are kept in the shared configuration cache,
+    returned dict must not be modified
+
     :param path: Path to json file
     :type path: str
     :param cls: Class with from_dict static method, defaults to None
     :type cls: class, optional
+    :param cache: Whether to use the configuration cache, defaults to True
+    :type cache: bool, optional
     :raises FileNotFoundException: Indicates that given file doesn't exist
     :return: Object of a given class or dict
     """
+    if cache:
+        result = configuration_cache.get(path, read_json)
+    else:
+        result = read_json(path)
+    if cls:
+        return cls.from_dict(result)
+    else:
+        return result
+
+
+def read_json(path: str):
+    """
+    Reads json file based on path
+
+    :param path: Path to json file
+    :type path: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: Parsed json
+    """
     with open(path, 'r') as handle:
-        result = json.load(handle)
-        if cls:
-            return cls.from_dict(result)
-        else:
-            return result
+        return json.load(handle)
 
 
 def load_location_from_configuration(game: str,
                                      filename: str,
                                      level: int) -> Location:
     """
-    Loads location from the configuration files
+    Loads location from the configuration files,
+    large locations are loaded lazily in chunks
 
     :param game: Name of the game
     :type game: str
@@ -113,23 +619,274 @@ def load_location_from_configuration(game: str,
                                             starting point is missing
     :return: Loaded location
     :rtype: Location
+
+    Locations of validated games are loaded without checks, their
+    starting points are known from the validation.
+    Locations of preloaded games are taken from the preloaded world
+    """
+    location = preloaded_location(game, filename, level)
+    if location is not None:
+        return location
+    return build_location(game, filename, level)
+
+
+def build_location(game: str, filename: str, level: int) -> Location:
     """
-    path = f'configuration/{game}/fields.json'
-    fields = load_from_json(path)
+    Builds location from the configuration files
+
+    :param game: Name of the game
+    :type game: str
+    :param filename: Name of the file
+    :type filename: str
+    :param level: Level of the new location
+    :type level: int
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises DeformedLocationError: Indicates that loaded location
+                                    is not a rectangle
+    :raises EmptyLocationError: Indicates that loaded location is empty
+    :raises StartingPointNotFoundException: Indicates that in loaded location
+                                            starting point is missing
+    :return: Loaded location
+    :rtype: Location
+    """
+    templates = load_field_templates(game)
     numbers = load_location(game, filename)
+    start = trusted_start(game, filename, level)
+    if start is None:
+        Location.check_rectangle(numbers)
+    if _location_backend == 'numpy':
+        return Location(ArrayFields(numbers, templates), coordinates=start,
+                        level=level, source=filename)
+    if len(numbers) * len(numbers[0]) > CHUNKED_LOCATION_SIZE:
+        return Location(ChunkedFields(numbers, templates), coordinates=start,
+                        level=level, source=filename)
     my_map = []
     for row in numbers:
         new_row = []
         for num in row:
-            new_row.append(Field().from_dict(fields[num]))
+            new_row.append(Field.from_template(templates[num]))
         my_map.append(new_row)
-    return Location(my_map, level=level)
+    return Location(my_map, coordinates=start, level=level, source=filename,
+                    checked=start is None)
+
+
+def location_delta(game: str, location: Location) -> Dict:
+    """
+    Get changes of the location relative to the configuration it was
+    loaded from, locations without source are saved whole
+
+    :param game: Name of the game
+    :type game: str
+    :param location: Location to save
+    :type location: Location
+    :raises FileNotFoundException: Indicates that configuration
+                                    doesn't exist anymore
+    :return: Dictionary with location's delta or whole location
+            under 'location' key
+    :rtype: Dict
+    """
+    if location.source() is None:
+        return {'location': location.as_dict()}
+    return location.delta(load_location(game, location.source()),
+                          load_field_templates(game))
+
+
+def field_delta(game: str, location: Location, x: int, y: int) -> Dict:
+    """
+    Get changes of the field relative to the configuration
+
+    :param game: Name of the game
+    :type game: str
+    :param location: Location loaded from the configuration
+    :type location: Location
+    :param x: Coordinate - x
+    :type x: int
+    :param y: Coordinate - y
+    :type y: int
+    :return: Difference that can be applied with apply_field_delta
+    :rtype: Dict
+    """
+    template = configuration_template(game, location, x, y)
+    return location.field(x, y).difference(template)
+
+
+def apply_field_delta(game: str,
+                      location: Location,
+                      x: int,
+                      y: int,
+                      delta: Dict):
+    """
+    Replace state of the field with the configuration changed by delta
+
+    :param game: Name of the game
+    :type game: str
+    :param location: Location loaded from the configuration
+    :type location: Location
+    :param x: Coordinate - x
+    :type x: int
+    :param y: Coordinate - y
+    :type y: int
+    :param delta: Dictionary returned by field_delta
+    :type delta: Dict
+    """
+    template = configuration_template(game, location, x, y)
+    location.field(x, y).set_template(template, delta)
+
+
+def configuration_template(game: str,
+                           location: Location,
+                           x: int,
+                           y: int) -> FieldTemplate:
+    """
+    Get template the field was created from
+
+    :param game: Name of the game
+    :type game: str
+    :param location: Location loaded from the configuration
+    :type location: Location
+    :param x: Coordinate - x
+    :type x: int
+    :param y: Coordinate - y
+    :type y: int
+    :return: Template from the configuration
+    :rtype: FieldTemplate
+    """
+    numbers = load_location(game, location.source())
+    return load_field_templates(game)[numbers[y - 1][x - 1]]
+
+
+def location_from_delta(game: str, delta: Dict) -> Location:
+    """
+    Rebuild location from the configuration and its delta
+
+    :param game: Name of the game
+    :type game: str
+    :param delta: Dictionary returned by location_delta
+    :type delta: Dict
+    :raises FileNotFoundException: Indicates that configuration
+                                    doesn't exist anymore
+    :raises InvalidCoordinatesError: Indicates that configuration
+                                    was changed and delta does not fit it
+    :return: Loaded location
+    :rtype: Location
+    """
+    if 'location' in delta:
+        return Location.from_dict(delta['location'])
+    location = load_location_from_configuration(
+        game, delta['source'], delta.get('level', 1))
+    location.apply_delta(delta)
+    return location
+
+
+def load_field_templates(game: str) -> List[FieldTemplate]:
+    """
+    Loads templates of fields from the configuration files,
+    templates are shared by all locations of the game
+
+    :param game: Name of the game
+    :type game: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: List of templates ordered as in fields.json,
+            templates of validated games are trusted
+    :rtype: List[FieldTemplate]
+    """
+    bundle = load_bundle(game)
+    if bundle and bundle.has('fields.json'):
+        return configuration_cache.get(
+            f'configuration/{game}/{BUNDLE_FILENAME}',
+            read_trusted_bundle_field_templates if trusted(game)
+            else read_bundle_field_templates)
+    return configuration_cache.get(
+        f'configuration/{game}/fields.json',
+        read_trusted_field_templates if trusted(game)
+        else read_field_templates)
+
+
+def read_field_templates(path: str,
+                         trusted: bool = False) -> List[FieldTemplate]:
+    """
+    Reads templates of fields from json file based on path
+
+    :param path: Path to json file
+    :type path: str
+    :param trusted: Whether file passed validation, defaults to False
+    :type trusted: bool, optional
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: List of templates
+    :rtype: List[FieldTemplate]
+    """
+    return [FieldTemplate.from_dict(field, trusted)
+            for field in read_json(path)]
+
+
+def read_trusted_field_templates(path: str) -> List[FieldTemplate]:
+    """
+    Reads templates of fields from validated json file based on path
+
+    :param path: Path to json file
+    :type path: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: List of trusted templates
+    :rtype: List[FieldTemplate]
+    """
+    return read_field_templates(path, True)
+
+
+def read_bundle_field_templates(path: str,
+                                trusted: bool = False) -> List[FieldTemplate]:
+    """
+    Reads templates of fields from the bundle based on path
+
+    :param path: Path to the bundle
+    :type path: str
+    :param trusted: Whether bundle passed validation, defaults to False
+    :type trusted: bool, optional
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: List of templates
+    :rtype: List[FieldTemplate]
+    """
+    bundle = configuration_cache.get(path, read_bundle)
+    return [FieldTemplate.from_dict(field, trusted)
+            for field in bundle.json('fields.json')]
+
+
+def read_trusted_bundle_field_templates(path: str) -> List[FieldTemplate]:
+    """
+    Reads templates of fields from validated bundle based on path
+
+    :param path: Path to the bundle
+    :type path: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: List of trusted templates
+    :rtype: List[FieldTemplate]
+    """
+    return read_bundle_field_templates(path, True)
+
+
+def load_bundle(game: str) -> Bundle:
+    """
+    Loads compiled configuration of the game
+
+    :param game: Name of the game
+    :type game: str
+    :raises BundleError: Indicates that bundle is damaged
+    :return: Bundle or None if the game was not compiled
+    :rtype: Bundle
+    """
+    filepath = f'configuration/{game}/{BUNDLE_FILENAME}'
+    if not path.exists(filepath):
+        return None
+    return configuration_cache.get(filepath, read_bundle)
 
 
 def load_location(game: str, filename: str) -> List[List[int]]:
     """
     Loads location numbers from config file
 
+    Location is taken from the bundle, binary grid file
+    or txt file - whichever exists first
+    Binary grids are memory-mapped and read in place
+
     :param game: Name of the game
     :type game: str
     :param filename: Name of the file
@@ -138,10 +895,201 @@ def load_location(game: str, filename: str) -> List[List[int]]:
     :return: Matrix of indexes of fields that should be in this position
     :rtype: List[List[int]]
     """
-    path = f'configuration/{game}/{filename}.txt'
+    bundle = load_bundle(game)
+    if bundle and bundle.has(f'{filename}.txt'):
+        return bundle.grid(f'{filename}.txt')
+    grid_path = f'configuration/{game}/{filename}{GRID_EXTENSION}'
+    if path.exists(grid_path):
+        return configuration_cache.get(grid_path, BinaryGrid.open)
+    return configuration_cache.get(
+        f'configuration/{game}/{filename}.txt', read_location)
+
+
+def read_location(path: str) -> List[List[int]]:
+    """
+    Reads location numbers from txt file based on path
+
+    :param path: Path to txt file
+    :type path: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :return: Matrix of indexes of fields
+    :rtype: List[List[int]]
+    """
     with open(path, 'r') as handle:
-        numbers = []
-        for row in handle.readlines():
-            row = [int(num) for num in row.split('\t')]
-            numbers.append(row)
-        return numbers
+        return parse_grid(handle.read())
+
+
+def location_filenames(game: str) -> List[str]:
+    """
+    Get names of all location files used by the game -
+    the first location and locations opened by keys from fields.json
+
+    :param game: Name of the game
+    :type game: str
+    :raises FileNotFoundException: Indicates that fields.json doesn't exist
+    :return: List of location file names
+    :rtype: List[str]
+    """
+    fields = load_configuration_from_json(game, 'fields', None)
+    filenames = ['lvl1']
+    for field in fields:
+        item = field.get('item', None)
+        if item and item.get('class') == 'Key':
+            filename = Key.from_dict(item).location_filename()
+            if filename and filename not in filenames:
+                filenames.append(filename)
+    return filenames
+
+
+def warm_configuration_cache(game: str):
+    """
+    Parse configuration of the game ahead of time,
+    so that later loads are served from the configuration cache
+
+    :param game: Name of the game
+    :type game: str
+    """
+    if configuration_exists(game, 'player.json'):
+        load_configuration_from_json(game, 'player', None)
+    if configuration_exists(game, 'introduction.txt'):
+        load_configuration_from_string(game, 'introduction')
+    if configuration_exists(game, 'fields.json'):
+        load_field_templates(game)
+        for filename in location_filenames(game):
+            if configuration_exists(game, f'{filename}.txt'):
+                load_location(game, filename)
+
+
+def location_backend() -> str:
+    """
+    Get storage of locations built from the configuration
+
+    :return: 'objects' or 'numpy'
+    :rtype: str
+    """
+    return _location_backend
+
+
+def set_location_backend(backend: str):
+    """
+    Set storage of locations built from the configuration
+
+    :param backend: 'objects' - fields kept as objects, large locations
+                    in chunks, or 'numpy' - fields kept in NumPy arrays
+    :type backend: str
+    :raises ValueError: Indicates that backend is unknown
+    :raises ImportError: Indicates that numpy is not installed
+    """
+    global _location_backend
+    if backend not in LOCATION_BACKENDS:
+        raise ValueError(f'Unknown location backend {backend}')
+    if backend == 'numpy':
+        import numpy  # noqa: F401
+    _location_backend = backend
+
+
+def preload_game(game: str, workers: int = None) -> LoadedWorld:
+    """
+    Start building every location of the game on a thread pool,
+    gates opened later take the built locations without waiting
+
+    :param game: Name of the game
+    :type game: str
+    :param workers: Number of threads, defaults to number of locations
+    :type workers: int, optional
+    :raises FileNotFoundException: Indicates that fields.json doesn't exist
+    :return: Preloaded world, reports time of building each location
+    :rtype: LoadedWorld
+    """
+    load_field_templates(game)
+    levels, _ = location_levels(
+        load_configuration_from_json(game, 'fields', None))
+    levels = {filename: level for filename, level in levels.items()
+              if configuration_exists(game, f'{filename}.txt')}
+    return preload_world(game, levels, build_location, workers)
+
+
+def configuration_exists(game: str, filename: str) -> bool:
+    """
+    Whether configuration file exists in the bundle or
+    in the configuration directory
+
+    :param game: Name of the game
+    :type game: str
+    :param filename: Name of the config file with extension
+    :type filename: str
+    :rtype: bool
+    """
+    bundle = load_bundle(game)
+    if bundle is not None and bundle.has(filename):
+        return True
+    if filename.endswith('.txt'):
+        grid_path = f'configuration/{game}/{filename[:-4]}{GRID_EXTENSION}'
+        if path.exists(grid_path):
+            return True
+    return path.exists(f'configuration/{game}/{filename}')
+
+
+def validate_configuration(game: str) -> Dict[str, List[int]]:
+    """
+    Check whole configuration of the game - fields, player, keys
+    and location files. Games that passed are loaded without checks,
+    the result is remembered until configuration files change
+
+    :param game: Name of the game
+    :type game: str
+    :raises ConfigurationError: Indicates that configuration is invalid,
+                                contains all found problems
+    :return: Starting points by location file name - [level, x, y]
+    :rtype: Dict[str, List[int]]
+    """
+    distrust(game)
+    problems = []
+    starts = {}
+    try:
+        fields = load_configuration_from_json(game, 'fields', None)
+    except (OSError, ValueError) as e:
+        raise ConfigurationError(game, [f'fields.json cannot be read: {e}'])
+    problems += check_fields(fields)
+    if configuration_exists(game, 'player.json'):
+        problems += check_player(
+            load_configuration_from_json(game, 'player', None))
+    if not problems:
+        levels, level_problems = location_levels(fields)
+        problems += level_problems
+        for filename, level in levels.items():
+            if not configuration_exists(game, f'{filename}.txt'):
+                problems.append(f'Location {filename} does not exist')
+                continue
+            try:
+                grid = load_location(game, filename)
+            except ValueError as e:
+                problems.append(f'{filename} cannot be read: {e}')
+                continue
+            start, grid_problems = check_grid(filename, grid, fields, level)
+            problems += grid_problems
+            if start:
+                starts[filename] = [level, *start]
+    if problems:
+        raise ConfigurationError(game, problems)
+    write_stamp(f'configuration/{game}', starts)
+    trust(game, starts)
+    return starts
+
+
+def ensure_validated(game: str):
+    """
+    Validate configuration of the game unless it passed validation
+    since it last changed
+
+    :param game: Name of the game
+    :type game: str
+    :raises ConfigurationError: Indicates that configuration is invalid
+    """
+    if trusted(game):
+        return
+    starts = read_stamp(f'configuration/{game}')
+    if starts is None:
+        validate_configuration(game)
+    else:
+        trust(game, starts)
@@ -0,0 +1,242 @@
+from os import fsync, path, remove, replace
+from threading import Lock
+from typing import Dict, Iterator, List
+import json
+
+from utils.save_worker import FSYNC_NEVER, save_worker
+
+JOURNAL_EXTENSION = '.journal'
+
+# Journal is folded into the snapshot once its file is bigger
+COMPACTION_SIZE = 64 * 1024
+
+# Lock and generation shared by all journals of the same slot
+_slots = {}
+_slots_lock = Lock()
+
+
+class SaveJournal:
+    """
+    SaveJournal - append-only list of changes made to the game
+    since the snapshot of a save slot
+
+    Every entry is a single json line with increasing sequence number,
+    a line cut off by a crash is ignored
+
+    Contains attributes:
+
+    :param save: Name of the game
+    :type save: str
+
+    :param slot: Name of the save without extension
+    :type slot: str
+
+    :param seq: Sequence number already covered by the snapshot,
+                defaults to 0
+    :type seq: int, optional
+    """
+
+    def __init__(self, save: str, slot: str, seq: int = 0):
+        """
+        Initialize SaveJournal
+
+        :param save: Name of the game
+        :type save: str
+        :param slot: Name of the save without extension
+        :type slot: str
+        :param seq: Sequence number already covered by the snapshot,
+                    defaults to 0
+        :type seq: int, optional
+        """
+        self._save = save
+        self._slot = slot
+        self._path = f'saves/{save}/{slot}{JOURNAL_EXTENSION}'
+        with _slots_lock:
+            if self._path not in _slots:
+                _slots[self._path] = {'lock': Lock(), 'generation': 0}
+            self._shared = _slots[self._path]
+        with self.lock():
+            entries = self.entries()
+            self._last_seq = max([seq] + [entry['seq'] for entry in entries])
+
+    # Getters
+
+    def save(self) -> str:
+        """
+        Get save
+
+        :return: Name of the game
+        :rtype: str
+        """
+        return self._save
+
+    def slot(self) -> str:
+        """
+        Get slot
+
+        :return: Name of the save without extension
+        :rtype: str
+        """
+        return self._slot
+
+    def path(self) -> str:
+        """
+        Get path
+
+        :return: Path to the journal file
+        :rtype: str
+        """
+        return self._path
+
+    def last_seq(self) -> int:
+        """
+        Get last sequence number
+
+        :return: Sequence number of the last written entry
+        :rtype: int
+        """
+        return self._last_seq
+
+    def generation(self) -> int:
+        """
+        Get generation
+
+        :return: Number of times the slot got a new snapshot
+        :rtype: int
+        """
+        return self._shared['generation']
+
+    def lock(self) -> Lock:
+        """
+        Get lock of the slot, it has to be held while
+        the snapshot or the journal file is replaced
+
+        :return: Lock shared by journals of the slot
+        :rtype: Lock
+        """
+        return self._shared['lock']
+
+    # Custom Methods
+
+    def append(self, changes: List[Dict]) -> int:
+        """
+        Append changes at the end of the journal
+
+        :param changes: List of dictionaries with changes
+        :type changes: List[Dict]
+        :return: Sequence number of the last entry
+        :rtype: int
+        """
+        self.write(self.number(changes))
+        return self._last_seq
+
+    def number(self, changes: List[Dict]) -> List[Dict]:
+        """
+        Give changes next sequence numbers without writing them
+
+        :param changes: List of dictionaries with changes
+        :type changes: List[Dict]
+        :return: List of entries to write
+        :rtype: List[Dict]
+        """
+        with self.lock():
+            entries = []
+            for change in changes:
+                self._last_seq += 1
+                entries.append(dict(change, seq=self._last_seq))
+            return entries
+
+    def write(self, entries: List[Dict]):
+        """
+        Write numbered entries at the end of the journal, the file
+        is flushed to the disk according to the fsync policy
+        of the save worker
+
+        :param entries: List of entries returned by number method
+        :type entries: List[Dict]
+        """
+        if not entries:
+            return
+        with self.lock():
+            with open(self._path, 'a') as handle:
+                handle.write(''.join(json.dumps(entry) + '\n'
+                                     for entry in entries))
+                if save_worker.fsync() != FSYNC_NEVER:
+                    handle.flush()
+                    fsync(handle.fileno())
+
+    def entries(self, after: int = 0) -> List[Dict]:
+        """
+        Read entries of the journal
+
+        :param after: Skip entries with this or lower sequence number,
+                        defaults to 0
+        :type after: int, optional
+        :return: List of entries ordered by sequence number
+        :rtype: List[Dict]
+        """
+        return [entry for entry in read_journal(self._path)
+                if entry['seq'] > after]
+
+    def size(self) -> int:
+        """
+        Get size of the journal file
+
+        :return: Number of bytes
+        :rtype: int
+        """
+        return path.getsize(self._path) if path.exists(self._path) else 0
+
+    def needs_compaction(self) -> bool:
+        """
+        Whether the journal grew big enough to be folded into the snapshot
+
+        :rtype: bool
+        """
+        return self.size() > COMPACTION_SIZE
+
+    def reset(self):
+        """
+        Remove all entries - the slot got a new snapshot,
+        must be called with the lock held
+        """
+        if path.exists(self._path):
+            remove(self._path)
+        self._shared['generation'] += 1
+
+    def truncate(self, seq: int):
+        """
+        Remove entries already covered by the snapshot,
+        must be called with the lock held
+
+        :param seq: Sequence number covered by the snapshot
+        :type seq: int
+        """
+        entries = self.entries(seq)
+        temp_path = f'{self._path}.tmp'
+        with open(temp_path, 'w') as handle:
+            handle.write(''.join(json.dumps(entry) + '\n'
+                                 for entry in entries))
+        replace(temp_path, self._path)
+
+
+def read_journal(filepath: str) -> Iterator[Dict]:
+    """
+    Read entries of the journal file, a damaged line ends the journal
+
+    :param filepath: Path to the journal file
+    :type filepath: str
+    :return: Iterator over entries
+    :rtype: Iterator[Dict]
+    """
+    if not path.exists(filepath):
+        return
+    with open(filepath, 'r') as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                return
+            if not line.endswith('\n'):
+                return
+            yield entry
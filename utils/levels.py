@@ -0,0 +1,313 @@
+from collections import OrderedDict
+from os import path, remove
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import Dict, List
+import json
+import weakref
+import zlib
+
+from location.location import Location
+from utils.io import location_delta, location_from_delta
+
+# Maximal number of levels of a new game kept in memory,
+# None keeps all of them
+_max_loaded_levels = None
+
+# Compression level of snapshots, they are written often
+# so the fastest one is used
+SNAPSHOT_LEVEL = 1
+
+
+class LevelSnapshot:
+    """
+    LevelSnapshot - location of a level evicted from memory, saved
+    in a file as json of its delta compressed with zlib - json is
+    encoded and decoded much faster than the binary save format
+
+    Contains attributes:
+
+    :param filepath: Path to the snapshot file
+    :type filepath: str
+
+    :param source: Configuration the location was loaded from or None
+    :type source: str
+
+    :param level: Number of the location or None
+    :type level: int
+    """
+
+    def __init__(self, filepath: str, source: str = None, level: int = None):
+        """
+        Initialize LevelSnapshot
+
+        :param filepath: Path to the snapshot file
+        :type filepath: str
+        :param source: Configuration the location was loaded from,
+                        defaults to None
+        :type source: str, optional
+        :param level: Number of the location, defaults to None
+        :type level: int, optional
+        """
+        self._filepath = filepath
+        self._source = source
+        self._level = level
+
+    @staticmethod
+    def write(filepath: str, delta: Dict) -> 'LevelSnapshot':
+        """
+        Save delta of the location in the file
+
+        :param filepath: Path to the snapshot file
+        :type filepath: str
+        :param delta: Dictionary returned by location_delta
+        :type delta: Dict
+        :return: Snapshot of the location
+        :rtype: LevelSnapshot
+        """
+        data = json.dumps(delta, separators=(',', ':')).encode('utf-8')
+        with open(filepath, 'wb') as snapshot:
+            snapshot.write(zlib.compress(data, SNAPSHOT_LEVEL))
+        saved = delta['location'] if 'location' in delta else delta
+        return LevelSnapshot(filepath, saved.get('source'),
+                             saved.get('level'))
+
+    # Getters
+
+    def filepath(self) -> str:
+        """
+        Get filepath
+
+        :return: Path to the snapshot file
+        :rtype: str
+        """
+        return self._filepath
+
+    def source(self) -> str:
+        """
+        Get source
+
+        :return: Configuration the location was loaded from or None
+        :rtype: str
+        """
+        return self._source
+
+    def level(self) -> int:
+        """
+        Get level
+
+        :return: Number of the location or None
+        :rtype: int
+        """
+        return self._level
+
+    def size(self) -> int:
+        """
+        Get size of the snapshot file
+
+        :return: Number of bytes
+        :rtype: int
+        """
+        return path.getsize(self._filepath)
+
+    # Custom Methods
+
+    def delta(self) -> Dict:
+        """
+        Read delta of the location from the file
+
+        :raises ValueError: Indicates that the file is damaged
+        :return: Dictionary returned by location_delta
+        :rtype: Dict
+        """
+        with open(self._filepath, 'rb') as snapshot:
+            try:
+                return json.loads(zlib.decompress(snapshot.read()))
+            except zlib.error as e:
+                raise ValueError('Level snapshot is damaged') from e
+
+    def remove(self):
+        """
+        Remove the snapshot file
+        """
+        if path.exists(self._filepath):
+            remove(self._filepath)
+
+
+class LevelCache:
+    """
+    LevelCache - levels of a game kept in memory, the least recently
+    used ones are evicted to snapshots once there are too many
+
+    Snapshots are written to a temporary directory removed when
+    the cache is closed or garbage collected
+
+    Contains attributes:
+
+    :param max_loaded: Maximal number of levels in memory,
+                        defaults to None - levels are never evicted
+    :type max_loaded: int, optional
+    """
+
+    def __init__(self, max_loaded: int = None):
+        """
+        Initialize LevelCache
+
+        :param max_loaded: Maximal number of levels in memory,
+                            defaults to None - levels are never evicted
+        :type max_loaded: int, optional
+        """
+        self._order = OrderedDict()
+        self._directory = None
+        self._finalizer = None
+        self._evictions = 0
+        self._reloads = 0
+        self.set_max_loaded(max_loaded)
+
+    # Getters and Setters
+
+    def max_loaded(self) -> int:
+        """
+        Get max loaded
+
+        :return: Maximal number of levels in memory or None
+        :rtype: int
+        """
+        return self._max_loaded
+
+    def set_max_loaded(self, max_loaded: int):
+        """
+        Set max loaded, levels above the limit are evicted
+        the next time a level is used
+
+        :param max_loaded: Maximal number of levels in memory or None
+        :type max_loaded: int
+        :raises ValueError: Indicates that given number was not positive
+        """
+        if max_loaded is not None and max_loaded <= 0:
+            raise ValueError('Number of loaded levels must be positive')
+        self._max_loaded = max_loaded
+
+    def evictions(self) -> int:
+        """
+        Get evictions
+
+        :return: Number of levels saved to snapshots
+        :rtype: int
+        """
+        return self._evictions
+
+    def reloads(self) -> int:
+        """
+        Get reloads
+
+        :return: Number of levels loaded back from snapshots
+        :rtype: int
+        """
+        return self._reloads
+
+    # Custom Methods
+
+    def used(self,
+             index: int,
+             locations: List,
+             game: str,
+             evict: bool = True):
+        """
+        Mark level as the most recently used one and replace locations
+        of the least recently used levels above the limit with snapshots
+
+        :param index: Index of the used level in locations
+        :type index: int
+        :param locations: Locations of the game in the order of discovery,
+                        evicted ones are replaced in place
+        :type locations: List
+        :param game: Name of the game
+        :type game: str
+        :param evict: Whether to evict other levels, defaults to True
+        :type evict: bool, optional
+        """
+        self._order.pop(index, None)
+        self._order[index] = None
+        if not evict or self._max_loaded is None:
+            return
+        while len(self._order) > self._max_loaded:
+            old, _ = self._order.popitem(last=False)
+            location = locations[old]
+            if isinstance(location, Location):
+                locations[old] = self.spill(
+                    game, location.level(), location)
+
+    def spill(self,
+              game: str,
+              level: int,
+              location: Location) -> LevelSnapshot:
+        """
+        Save location to a snapshot
+
+        :param game: Name of the game
+        :type game: str
+        :param level: Number of the level
+        :type level: int
+        :param location: Evicted location
+        :type location: Location
+        :return: Snapshot of the location
+        :rtype: LevelSnapshot
+        """
+        if self._directory is None:
+            self._directory = mkdtemp(prefix='levels-')
+            self._finalizer = weakref.finalize(
+                self, rmtree, self._directory, True)
+        self._evictions += 1
+        return LevelSnapshot.write(
+            path.join(self._directory, f'{level}.snapshot'),
+            location_delta(game, location))
+
+    def reload(self, game: str, snapshot: LevelSnapshot) -> Location:
+        """
+        Load location back from its snapshot, the file is removed
+
+        :param game: Name of the game
+        :type game: str
+        :param snapshot: Snapshot of the location
+        :type snapshot: LevelSnapshot
+        :return: Loaded location
+        :rtype: Location
+        """
+        location = location_from_delta(game, snapshot.delta())
+        snapshot.remove()
+        self._reloads += 1
+        return location
+
+    def close(self):
+        """
+        Remove directory with snapshots
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+            self._directory = None
+            self._finalizer = None
+
+
+def max_loaded_levels() -> int:
+    """
+    Get maximal number of levels of a new game kept in memory
+
+    :return: Number of levels or None if levels are never evicted
+    :rtype: int
+    """
+    return _max_loaded_levels
+
+
+def set_max_loaded_levels(max_loaded: int):
+    """
+    Set maximal number of levels of a new game kept in memory
+
+    :param max_loaded: Number of levels or None - levels are never evicted
+    :type max_loaded: int
+    :raises ValueError: Indicates that given number was not positive
+    """
+    global _max_loaded_levels
+    if max_loaded is not None and max_loaded <= 0:
+        raise ValueError('Number of loaded levels must be positive')
+    _max_loaded_levels = max_loaded
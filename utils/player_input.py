@@ -39,6 +39,19 @@ def choose_item_from_dict(dictionary: Dict):
     return dictionary[key.lower()]
 
 
+def choose_destination(location) -> List:
+    """
+    Ask user where he would like to travel
+
+    :param location: Location the player is in
+    :type location: Location
+    :raises ValueError: Indicates that destination is not understood
+    :return: Coordinates of fields matching the destination
+    :rtype: List[Tuple[int, int]]
+    """
+    return location.destinations(input('> '))
+
+
 def choose_string() -> str:
     """
     Ask user to give a string
@@ -0,0 +1,244 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, List
+import time
+
+from location.location import Location
+from utils.validation import fingerprint
+
+# Worlds of games preloaded so far, by game name
+_worlds = {}
+_worlds_lock = Lock()
+
+
+class LoadedWorld:
+    """
+    LoadedWorld - locations of a game built ahead of time on a thread pool
+
+    Every location is handed out once, a fresh copy is built
+    in the background right after, so each game opening a gate
+    gets its own untouched location without waiting.
+    Locations are dropped when configuration of the game changes
+
+    Threads are used instead of processes - locations share
+    field templates of the game, which do not survive pickling
+
+    Contains attributes:
+
+    :param game: Name of the game
+    :type game: str
+
+    :param levels: Levels by location file name
+    :type levels: Dict[str, int]
+
+    :param build: Function building location from the configuration -
+                (game, filename, level) -> Location
+    :type build: Callable[[str, str, int], Location]
+
+    :param workers: Number of threads, defaults to number of locations
+    :type workers: int, optional
+    """
+
+    def __init__(self,
+                 game: str,
+                 levels: Dict[str, int],
+                 build: Callable[[str, str, int], Location],
+                 workers: int = None):
+        """
+        Initialize LoadedWorld and start building its locations
+
+        :param game: Name of the game
+        :type game: str
+        :param levels: Levels by location file name
+        :type levels: Dict[str, int]
+        :param build: Function building location from the configuration
+        :type build: Callable[[str, str, int], Location]
+        :param workers: Number of threads,
+                        defaults to number of locations
+        :type workers: int, optional
+        """
+        self._game = game
+        self._levels = dict(levels)
+        self._build = build
+        self._lock = Lock()
+        self._times = {}
+        self._fingerprint = fingerprint(f'configuration/{game}')
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or max(len(self._levels), 1),
+            thread_name_prefix=f'preload-{game}')
+        self._futures = {filename: self._submit(filename)
+                         for filename in self._levels}
+
+    # Getters and Setters
+
+    def game(self) -> str:
+        """
+        Get game
+
+        :return: Name of the game
+        :rtype: str
+        """
+        return self._game
+
+    def levels(self) -> Dict[str, int]:
+        """
+        Get levels
+
+        :return: Levels by location file name
+        :rtype: Dict[str, int]
+        """
+        return dict(self._levels)
+
+    def times(self) -> Dict[str, float]:
+        """
+        Get times
+
+        :return: Time of building each location in seconds,
+                by location file name, only finished locations
+        :rtype: Dict[str, float]
+        """
+        with self._lock:
+            return dict(self._times)
+
+    # Custom Methods
+
+    def wait(self) -> Dict[str, float]:
+        """
+        Wait until all locations are built
+
+        :raises Exception: Error raised while building a location
+        :return: Time of building each location in seconds
+        :rtype: Dict[str, float]
+        """
+        with self._lock:
+            futures = list(self._futures.values())
+        for future in futures:
+            future.result()
+        return self.times()
+
+    def take(self, filename: str, level: int) -> Location:
+        """
+        Take built location, another one is built in its place
+
+        :param filename: Name of the location file
+        :type filename: str
+        :param level: Level of the location
+        :type level: int
+        :return: Location or None if it was not preloaded as given level,
+                failed or configuration changed since preloading
+        :rtype: Location
+        """
+        if self._levels.get(filename) != level:
+            return None
+        if fingerprint(f'configuration/{self._game}') != self._fingerprint:
+            return None
+        with self._lock:
+            future = self._futures.get(filename)
+            if future is None:
+                return None
+            self._futures[filename] = self._submit(filename)
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def close(self):
+        """
+        Stop building locations, already started builds are finished
+        """
+        with self._lock:
+            self._futures = {}
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def report(self) -> List[str]:
+        """
+        Get description of building time of each location
+
+        :return: Lines like 'lvl2 (level 2): 12.3 ms'
+        :rtype: List[str]
+        """
+        times = self.times()
+        return [f'{filename} (level {level}): '
+                f'{times[filename] * 1000:.1f} ms'
+                for filename, level in self._levels.items()
+                if filename in times]
+
+    def _submit(self, filename: str) -> Future:
+        """
+        Queue building of the location
+
+        :return: Future of the location
+        :rtype: Future
+        """
+        return self._executor.submit(
+            self._timed_build, filename, self._levels[filename])
+
+    def _timed_build(self, filename: str, level: int) -> Location:
+        """
+        Build location and remember how long it took
+
+        :return: Built location
+        :rtype: Location
+        """
+        start = time.perf_counter()
+        location = self._build(self._game, filename, level)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._times[filename] = elapsed
+        return location
+
+
+def preload_world(game: str,
+                  levels: Dict[str, int],
+                  build: Callable[[str, str, int], Location],
+                  workers: int = None) -> LoadedWorld:
+    """
+    Start building all locations of the game in the background,
+    previously preloaded world of the game is replaced
+
+    :param game: Name of the game
+    :type game: str
+    :param levels: Levels by location file name
+    :type levels: Dict[str, int]
+    :param build: Function building location from the configuration
+    :type build: Callable[[str, str, int], Location]
+    :param workers: Number of threads, defaults to number of locations
+    :type workers: int, optional
+    :return: Preloaded world
+    :rtype: LoadedWorld
+    """
+    world = LoadedWorld(game, levels, build, workers)
+    with _worlds_lock:
+        previous = _worlds.get(game)
+        _worlds[game] = world
+    if previous:
+        previous.close()
+    return world
+
+
+def preloaded_location(game: str, filename: str, level: int) -> Location:
+    """
+    Take location from the preloaded world of the game
+
+    :param game: Name of the game
+    :type game: str
+    :param filename: Name of the location file
+    :type filename: str
+    :param level: Level of the location
+    :type level: int
+    :return: Location or None if the game was not preloaded
+    :rtype: Location
+    """
+    world = _worlds.get(game)
+    return world.take(filename, level) if world else None
+
+
+def close_worlds():
+    """
+    Stop building and forget all preloaded worlds
+    """
+    with _worlds_lock:
+        worlds = list(_worlds.values())
+        _worlds.clear()
+    for world in worlds:
+        world.close()
@@ -0,0 +1,191 @@
+from os import O_RDONLY, close, fsync, open as open_fd, path, replace
+from threading import Condition, Thread
+from typing import BinaryIO, Callable, Union
+
+# Policies of flushing saves to the disk
+FSYNC_NEVER = 'never'
+FSYNC_FILE = 'file'
+FSYNC_ALWAYS = 'always'
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_FILE, FSYNC_ALWAYS)
+
+
+class SaveError(Exception):
+    """
+    Indicates that saving in the background failed
+
+    :param Exception: Save was not written
+    :type Exception: Exception
+    """
+    pass
+
+
+class SaveWorker:
+    """
+    SaveWorker - writes saves on a background thread
+
+    Jobs with the same key are run in the order they were submitted.
+    A job submitted with replace supersedes jobs with the same key
+    that did not start yet - only the newest save of a slot is written
+
+    Contains attributes:
+
+    :param fsync: Policy of flushing files to the disk - 'never',
+                'file' or 'always' which also flushes the directory,
+                defaults to 'file'
+    :type fsync: str, optional
+    """
+
+    def __init__(self, fsync: str = FSYNC_FILE):
+        """
+        Initialize SaveWorker
+
+        :param fsync: Policy of flushing files to the disk,
+                    defaults to 'file'
+        :type fsync: str, optional
+        """
+        self._condition = Condition()
+        self._jobs = []
+        self._running = False
+        self._errors = []
+        self._thread = None
+        self.set_fsync(fsync)
+
+    # Getters and Setters
+
+    def fsync(self) -> str:
+        """
+        Get fsync
+
+        :return: Policy of flushing files to the disk
+        :rtype: str
+        """
+        return self._fsync
+
+    def set_fsync(self, fsync: str):
+        """
+        Set fsync
+
+        :param fsync: Policy of flushing files to the disk - 'never',
+                    'file' or 'always'
+        :type fsync: str
+        :raises ValueError: Indicates that policy is unknown
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f'Unknown fsync policy {fsync}')
+        self._fsync = fsync
+
+    def pending(self) -> int:
+        """
+        Get pending
+
+        :return: Number of jobs not finished yet
+        :rtype: int
+        """
+        with self._condition:
+            return len(self._jobs) + int(self._running)
+
+    # Custom Methods
+
+    def submit(self, key: str, job: Callable[[], None], replace: bool = True):
+        """
+        Queue job for the background thread
+
+        :param key: Jobs with the same key are run in order
+        :type key: str
+        :param job: Function without arguments doing the write
+        :type job: Callable[[], None]
+        :param replace: Whether queued jobs with the same key can be
+                        dropped, defaults to True
+        :type replace: bool, optional
+        """
+        with self._condition:
+            if replace:
+                self._jobs = [queued for queued in self._jobs
+                              if queued[0] != key]
+            self._jobs.append((key, job))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def wait(self):
+        """
+        Wait until all queued jobs are finished
+
+        :raises SaveError: Indicates that some of the jobs failed
+        """
+        with self._condition:
+            while self._jobs or self._running:
+                self._condition.wait()
+            errors, self._errors = self._errors, []
+        if errors:
+            raise SaveError(f'{len(errors)} save(s) failed') from errors[-1]
+
+    def _run(self):
+        """
+        Run queued jobs until the queue is empty
+        """
+        while True:
+            with self._condition:
+                if not self._jobs:
+                    self._thread = None
+                    self._condition.notify_all()
+                    return
+                key, job = self._jobs.pop(0)
+                self._running = True
+            try:
+                job()
+            except Exception as e:
+                with self._condition:
+                    self._errors.append(e)
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._condition.notify_all()
+
+
+def write_atomically(filepath: str,
+                     data: Union[bytes, Callable[[BinaryIO], None]],
+                     policy: str = None):
+    """
+    Write file through a temporary file replaced in one step,
+    a crash leaves either the old or the new file
+
+    :param filepath: Path to the file
+    :type filepath: str
+    :param data: Contents of the file or function writing them
+                to the given file handle
+    :type data: Union[bytes, Callable[[BinaryIO], None]]
+    :param policy: Policy of flushing the file to the disk,
+                    defaults to policy of the save worker
+    :type policy: str, optional
+    """
+    policy = policy if policy else save_worker.fsync()
+    temp_path = f'{filepath}.tmp'
+    with open(temp_path, 'wb') as handle:
+        if callable(data):
+            data(handle)
+        else:
+            handle.write(data)
+        if policy != FSYNC_NEVER:
+            handle.flush()
+            fsync(handle.fileno())
+    replace(temp_path, filepath)
+    if policy == FSYNC_ALWAYS:
+        directory = open_fd(path.dirname(filepath) or '.', O_RDONLY)
+        try:
+            fsync(directory)
+        finally:
+            close(directory)
+
+
+save_worker = SaveWorker()
+
+
+def wait_for_saves():
+    """
+    Wait until saves written in the background are on the disk
+
+    :raises SaveError: Indicates that some of the saves failed
+    """
+    save_worker.wait()
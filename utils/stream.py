@@ -0,0 +1,524 @@
+from base64 import b64decode, b64encode
+from io import TextIOWrapper
+from mmap import mmap, ACCESS_READ
+from os import fstat
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import BinaryIO, Dict, Iterator, List, Union
+import json
+
+from location.field import Field
+from location.fog import Fog
+from location.location import Location
+from utils import binary_save
+from utils.binary_save import BinaryDecoder, BinaryEncoder, BYTES, DICT, LIST
+from utils.compression import file_codec, open_decompressed
+
+# Since version 3 seen flags are saved as the fog of a location
+# instead of a key of every field, since version 4 boarders made
+# of BOARDER fields are not saved
+STREAM_VERSION = 4
+
+# Streamed json saves keep one row of fields per line, lines with
+# these endings open the list of locations and the fields of a location
+LOCATIONS_OPEN = ', "locations": ['
+FIELDS_OPEN = ', "location": ['
+
+# Values before the locations are read from this many first bytes
+HEADER_SIZE = 1 << 16
+
+
+class SavedLocation:
+    """
+    SavedLocation - location read from a save without creating its fields,
+    they are decoded when the location is needed
+
+    Contains attributes:
+
+    :param header: Location's dictionary without fields
+    :type header: Dict
+
+    :param rows: Encoded rows of fields - binary save with the list
+                of rows or json lines with one row each
+    :type rows: Union[bytes, List[str]]
+    """
+
+    def __init__(self, header: Dict, rows: Union[bytes, List[str]]):
+        """
+        Initialize SavedLocation
+
+        :param header: Location's dictionary without fields
+        :type header: Dict
+        :param rows: Encoded rows of fields
+        :type rows: Union[bytes, List[str]]
+        """
+        self._header = header
+        self._rows = rows
+
+    # Getters
+
+    def header(self) -> Dict:
+        """
+        Get header
+
+        :return: Location's dictionary without fields
+        :rtype: Dict
+        """
+        return self._header
+
+    def source(self) -> str:
+        """
+        Get source
+
+        :return: Name of the configuration the location was loaded from
+                or None
+        :rtype: str
+        """
+        return self._header.get('source')
+
+    def encoded_rows(self) -> Union[bytes, List[str]]:
+        """
+        Get encoded rows
+
+        :return: Binary save with the list of rows or json lines
+                with one row each
+        :rtype: Union[bytes, List[str]]
+        """
+        return self._rows
+
+    # Custom Methods
+
+    def saved_header(self, text: bool = False) -> Dict:
+        """
+        Get header to write to a save, the fog is converted
+        to the format of the save
+
+        :param text: Whether to encode fog as base64 for json,
+                    defaults to False
+        :type text: bool, optional
+        :return: Location's dictionary without fields
+        :rtype: Dict
+        """
+        header = dict(self._header)
+        fog = header.get('fog')
+        if text and isinstance(fog, bytes):
+            header['fog'] = b64encode(fog).decode('ascii')
+        elif not text and isinstance(fog, str):
+            header['fog'] = b64decode(fog)
+        return header
+
+    def rows(self) -> Iterator[List[Dict]]:
+        """
+        Decode rows of fields one by one
+
+        :raises BinarySaveError: Indicates that binary rows are damaged
+        :raises ValueError: Indicates that json rows are damaged
+        :return: Iterator over rows of fields' dictionaries
+        :rtype: Iterator[List[Dict]]
+        """
+        if isinstance(self._rows, bytes):
+            decoder = BinaryDecoder(self._rows)
+            for _ in range(decoder.begin(LIST)):
+                yield decoder.decode()
+        else:
+            for line in self._rows:
+                yield json.loads(line.rstrip().rstrip(','))
+
+    def load(self) -> Location:
+        """
+        Create the location
+
+        :return: Loaded location
+        :rtype: Location
+        """
+        return Location.from_rows(self.rows(), self._header)
+
+    def as_dict(self) -> Dict:
+        """
+        Get location's dictionary without creating its fields
+
+        :return: Dictionary equal to the dictionary of loaded location
+        :rtype: Dict
+        """
+        rows = list(self.rows())
+        dictionary = {'location': rows}
+        dictionary.update(self._header)
+        dictionary['coordinates'] = tuple(self._header['coordinates'])
+        if 'fog' in dictionary:
+            offset = 1 if dictionary.get('boarders', True) is False else 0
+            fog = Fog((len(rows[0]) if rows else 0) + 2 * offset,
+                      len(rows) + 2 * offset)
+            fog.load(dictionary.pop('fog'))
+            for y, row in enumerate(rows):
+                for x, field in enumerate(row):
+                    field['seen'] = fog.seen(x + offset, y + offset)
+        return dictionary
+
+
+def write_game_json(game, handle: BinaryIO):
+    """
+    Write game as json one row of fields at a time,
+    the whole dictionary of the game is never created
+
+    The result is a valid json with the same contents as
+    the game's dictionary, every row of fields is in its own line.
+    Locations are not kept in memory - rows of saved locations
+    are copied without creating their fields
+
+    :param game: Game to save
+    :type game: Game
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    """
+    header = {
+        'streamed': STREAM_VERSION,
+        'game': game.game(),
+        'level': game.level(),
+        'player': game.player().as_dict()
+    }
+    if game.links():
+        header['links'] = game.links_list()
+    handle.write(f'{json.dumps(header)[:-1]}{LOCATIONS_OPEN}\n'.encode())
+    count = game.location_count()
+    for number, location in enumerate(game.stored_locations()):
+        if isinstance(location, SavedLocation):
+            header = location.saved_header(text=True)
+        else:
+            header = location_header(location, text=True)
+        handle.write(f'{json.dumps(header)[:-1]}{FIELDS_OPEN}\n'.encode())
+        for line in _json_rows(location):
+            handle.write(line.encode())
+        handle.write(b']},\n' if number < count - 1 else b']}\n')
+    handle.write(b']}\n')
+
+
+def _json_rows(location: Union[Location, SavedLocation]) -> Iterator[str]:
+    """
+    :return: Iterator over json lines with one row each, lines of
+            saved locations from json saves are not parsed
+    :rtype: Iterator[str]
+    """
+    if isinstance(location, SavedLocation) and \
+            not isinstance(location.encoded_rows(), bytes):
+        for line in location.encoded_rows():
+            yield line if line.endswith('\n') else f'{line}\n'
+        return
+    rows = _row_dicts(location)
+    row = next(rows)
+    for next_row in rows:
+        yield f'{json.dumps(row)},\n'
+        row = next_row
+    yield f'{json.dumps(row)}\n'
+
+
+def _row_dicts(
+        location: Union[Location, SavedLocation]) -> Iterator[List[Dict]]:
+    """
+    :return: Iterator over rows of saved fields' dictionaries
+    :rtype: Iterator[List[Dict]]
+    """
+    if isinstance(location, SavedLocation):
+        return location.rows()
+    return ([field_dict(field) for field in row]
+            for row in saved_rows(location))
+
+
+def write_game_binary(game, handle: BinaryIO):
+    """
+    Write game in binary save format one row of fields at a time,
+    the whole dictionary of the game is never created
+
+    Fields of every location are encoded as a separate binary save
+    stored as bytes, locations not needed at once are read without
+    decoding them. The bytes are encoded into a temporary file
+    and copied in pieces, only one row is kept in memory. Locations
+    are not kept in memory - bytes of saved locations are copied
+    without creating their fields
+
+    :param game: Game to save
+    :type game: Game
+    :param handle: File opened in binary mode
+    :type handle: BinaryIO
+    """
+    encoder = BinaryEncoder(handle)
+    values = [('streamed', STREAM_VERSION),
+              ('game', game.game()),
+              ('level', game.level()),
+              ('player', game.player().as_dict())]
+    if game.links():
+        values.append(('links', game.links_list()))
+    encoder.begin_dict(len(values) + 1)
+    for key, value in values:
+        encoder.key(key)
+        encoder.encode(value)
+    encoder.key('locations')
+    encoder.begin_list(game.location_count())
+    for location in game.stored_locations():
+        if isinstance(location, SavedLocation):
+            header = location.saved_header()
+        else:
+            header = location_header(location)
+        encoder.begin_dict(len(header) + 1)
+        for key, value in header.items():
+            encoder.key(key)
+            encoder.encode(value)
+        encoder.key('location')
+        if isinstance(location, SavedLocation) and \
+                isinstance(location.encoded_rows(), bytes):
+            encoder.encode(location.encoded_rows())
+            continue
+        with TemporaryFile() as rows:
+            rows_encoder = BinaryEncoder(rows)
+            rows_encoder.begin_list(_row_count(location))
+            for row in _row_dicts(location):
+                rows_encoder.encode(row)
+            rows_encoder.flush()
+            encoder.begin_bytes(rows.tell())
+            rows.seek(0)
+            chunk = rows.read(binary_save.FLUSH_SIZE)
+            while chunk:
+                encoder.write_bytes(chunk)
+                chunk = rows.read(binary_save.FLUSH_SIZE)
+    encoder.flush()
+
+
+def _row_count(location: Union[Location, SavedLocation]) -> int:
+    """
+    :return: Number of saved rows of the location
+    :rtype: int
+    """
+    if isinstance(location, SavedLocation):
+        return len(location.encoded_rows())
+    if location.storage().virtual_boarder():
+        return location.column() - 2
+    return location.column()
+
+
+def location_header(location: Location, text: bool = False) -> Dict:
+    """
+    Get Location's dictionary without fields
+
+    :param location: Saved location
+    :type location: Location
+    :param text: Whether to encode fog as base64 for json,
+                defaults to False
+    :type text: bool, optional
+    :return: Dictionary with coordinates, level, source, fog and
+            boarders set to False if boarder is not saved
+    :rtype: Dict
+    """
+    header = {
+        'coordinates': location.coordinates(),
+        'level': location.level()
+    }
+    if location.source():
+        header['source'] = location.source()
+    header['fog'] = location.fog().encode(text)
+    if location.storage().virtual_boarder():
+        header['boarders'] = False
+    return header
+
+
+def saved_rows(location: Location) -> Iterator[List[Field]]:
+    """
+    Get rows of fields that are saved, without boarder made
+    of BOARDER fields
+
+    :param location: Saved location
+    :type location: Location
+    :return: Iterator over rows of fields
+    :rtype: Iterator[List[Field]]
+    """
+    storage = location.storage()
+    if storage.virtual_boarder():
+        return storage.inner_rows()
+    return storage.rows()
+
+
+def field_dict(field: Field) -> Dict:
+    """
+    Get Field's dictionary without the seen flag kept in the fog
+
+    :param field: Saved field
+    :type field: Field
+    :return: Dictionary with Field's data
+    :rtype: Dict
+    """
+    dictionary = field.as_dict()
+    del dictionary['seen']
+    return dictionary
+
+
+def read_game_json(filepath: str) -> Dict:
+    """
+    Read json save written by write_game_json, the current location
+    is built row by row while the file is read, rows of others
+    are kept without parsing them
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises ValueError: Indicates that file is damaged
+    :return: Game's dictionary with loaded current Location or None
+            if the file was not streamed
+    :rtype: Dict
+    """
+    with TextIOWrapper(open_decompressed(filepath), 'utf-8') as handle:
+        line = handle.readline().rstrip('\n')
+        if not line.startswith('{"streamed": ') or \
+                not line.endswith(LOCATIONS_OPEN):
+            return None
+        game = json.loads(line[:-len(LOCATIONS_OPEN)] + '}')
+        game['locations'] = []
+        for line in handle:
+            line = line.rstrip('\n')
+            if line == ']}':
+                return game
+            if not line.endswith(FIELDS_OPEN):
+                raise ValueError('Streamed save is damaged')
+            header = json.loads(line[:-len(FIELDS_OPEN)] + '}')
+            if header.get('level') == game['level']:
+                location = Location.from_rows(
+                    (json.loads(line.rstrip().rstrip(','))
+                     for line in _json_lines(handle)), header)
+            else:
+                location = SavedLocation(header, list(_json_lines(handle)))
+            game['locations'].append(location)
+    raise ValueError('Streamed save is truncated')
+
+
+def _json_lines(handle) -> Iterator[str]:
+    """
+    :return: Iterator over lines with rows of the location
+    :rtype: Iterator[str]
+    """
+    for line in handle:
+        if line.startswith(']}'):
+            return
+        yield line
+    raise ValueError('Streamed save is truncated')
+
+
+def read_game_binary(filepath: str) -> Dict:
+    """
+    Read binary save - the current location of full saves is built
+    row by row, fields of others are not decoded. The file is
+    memory-mapped instead of being read into memory, compressed files
+    are decompressed into a temporary file first
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises BinarySaveError: Indicates that file is damaged
+    :return: Game's dictionary, the current location of full saves
+            is a loaded Location, others are SavedLocation objects
+            or dictionaries in saves written before
+    :rtype: Dict
+    """
+    decoder = BinaryDecoder(map_save(filepath))
+    game = {}
+    for _ in range(decoder.begin(DICT)):
+        key = decoder.decode()
+        if key == 'locations' and 'delta' not in game:
+            game[key] = [_binary_location(decoder, game.get('level'))
+                         for _ in range(decoder.begin(LIST))]
+        else:
+            game[key] = decoder.decode()
+    return game
+
+
+def _binary_location(decoder: BinaryDecoder,
+                     level: int) -> Union[Location, SavedLocation, Dict]:
+    """
+    :return: Location read from the decoder - the one of the current
+            level is created, fields of others are kept encoded
+    :rtype: Union[Location, SavedLocation, Dict]
+    """
+    header = {}
+    rows = None
+    fields = None
+    current = False
+    for _ in range(decoder.begin(DICT)):
+        key = decoder.decode()
+        if key != 'location':
+            header[key] = decoder.decode()
+            current = header.get('level') == level
+        elif decoder.peek() == BYTES:
+            rows = decoder.decode()
+        elif current:
+            templates = {}
+            fields = [[Field.from_dict(field, templates)
+                       for field in decoder.decode()]
+                      for _ in range(decoder.begin(LIST))]
+        else:
+            header[key] = decoder.decode()
+    if rows is not None:
+        saved = SavedLocation(header, rows)
+        return saved.load() if current else saved
+    if fields is not None:
+        return Location.from_fields(fields, header)
+    return header
+
+
+def read_game_header(filepath: str) -> Dict:
+    """
+    Read values saved before the locations - json saves written
+    by write_game_json and binary saves, without reading locations
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises BinarySaveError: Indicates that binary file is damaged
+                            or values do not fit in its first bytes
+    :return: Game's dictionary without locations or None if the file
+            is a json save that was not streamed
+    :rtype: Dict
+    """
+    with open_decompressed(filepath) as handle:
+        data = handle.read(HEADER_SIZE)
+    if not binary_save.is_binary_save(data):
+        line = data.split(b'\n', 1)[0].decode('utf-8', 'replace')
+        if not line.startswith('{"streamed": ') or \
+                not line.endswith(LOCATIONS_OPEN):
+            return None
+        return json.loads(line[:-len(LOCATIONS_OPEN)] + '}')
+    decoder = BinaryDecoder(data)
+    game = {}
+    for _ in range(decoder.begin(DICT)):
+        key = decoder.decode()
+        if key == 'locations':
+            break
+        game[key] = decoder.decode()
+    return game
+
+
+def map_save(filepath: str) -> mmap:
+    """
+    Memory-map contents of the save, compressed saves are
+    decompressed into a temporary file
+
+    :param filepath: Path to the save file
+    :type filepath: str
+    :raises FileNotFoundException: Indicates that given file doesn't exist
+    :raises BinarySaveError: Indicates that file is empty
+    :return: Read-only memory map
+    :rtype: mmap
+    """
+    if file_codec(filepath):
+        with open_decompressed(filepath) as source, \
+                TemporaryFile() as handle:
+            copyfileobj(source, handle)
+            handle.flush()
+            return _map(handle)
+    with open(filepath, 'rb') as handle:
+        return _map(handle)
+
+
+def _map(handle: BinaryIO) -> mmap:
+    """
+    :return: Read-only memory map of the whole file
+    :rtype: mmap
+    """
+    if fstat(handle.fileno()).st_size == 0:
+        raise binary_save.BinarySaveError('File is not a binary save')
+    return mmap(handle.fileno(), 0, access=ACCESS_READ)
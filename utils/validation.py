@@ -0,0 +1,322 @@
+from os import listdir, stat
+from typing import Callable, Dict, List, Tuple
+import json
+
+from entities.enemy import Enemy
+from entities.equipment import Item, Key
+from entities.player import Player
+from location.connectivity import Connectivity
+from utils.save_worker import write_atomically
+
+VALIDATION_FILENAME = 'validated.json'
+VALIDATION_VERSION = 1
+
+# go_to of the field that ends the game
+WIN = 'WIN'
+
+# Starting points of locations of games that passed validation,
+# by game name - {filename: [level, x, y]}
+_trusted = {}
+
+
+class ConfigurationError(Exception):
+    """
+    Indicates that configuration of the game is invalid
+
+    :param Exception: Configuration has problems
+    :type Exception: Exception
+    """
+
+    def __init__(self, game: str, problems: List[str]):
+        """
+        Initialize ConfigurationError
+
+        :param game: Name of the game
+        :type game: str
+        :param problems: Descriptions of found problems
+        :type problems: List[str]
+        """
+        self.problems = problems
+        super().__init__(f'Configuration of {game} is invalid:\n' +
+                         '\n'.join(f' - {problem}' for problem in problems))
+
+
+def check_fields(fields: List[Dict]) -> List[str]:
+    """
+    Check that fields.json is a list of fields with valid enemies and items
+
+    :param fields: Parsed fields.json
+    :type fields: List[Dict]
+    :return: Descriptions of found problems
+    :rtype: List[str]
+    """
+    if not isinstance(fields, list) or not fields:
+        return ['fields.json must be a non-empty list']
+    problems = []
+    for number, field in enumerate(fields):
+        if not isinstance(field, dict):
+            problems.append(f'Field {number} is not a dictionary')
+            continue
+        go_to = field.get('go_to', 0)
+        if go_to != WIN and (not isinstance(go_to, int) or go_to < 0):
+            problems.append(f'Field {number} has invalid go_to {go_to}')
+        if not isinstance(field.get('danger', 0), int):
+            problems.append(f'Field {number} has invalid danger')
+        problems += _check(f'Enemy of field {number}',
+                           Enemy.from_dict, field.get('enemy', None))
+        problems += _check(f'Item of field {number}',
+                           Item.item_from_dict, field.get('item', None))
+    return problems
+
+
+def check_player(player: Dict) -> List[str]:
+    """
+    Check that player.json describes a valid player
+
+    :param player: Parsed player.json
+    :type player: Dict
+    :return: Descriptions of found problems
+    :rtype: List[str]
+    """
+    if not isinstance(player, dict):
+        return ['player.json must be a dictionary']
+    return _check('Player', Player.from_dict, player)
+
+
+def location_levels(fields: List[Dict]) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Get levels of location files - the first location
+    and locations opened by keys
+
+    :param fields: Parsed fields.json
+    :type fields: List[Dict]
+    :return: Levels by file name and descriptions of found problems
+    :rtype: Tuple[Dict[str, int], List[str]]
+    """
+    levels = {'lvl1': 1}
+    problems = []
+    for number, field in enumerate(fields):
+        item = field.get('item', None) if isinstance(field, dict) else None
+        if not item or item.get('class') != 'Key':
+            continue
+        try:
+            key = Key.from_dict(item)
+        except Exception as e:
+            problems.append(f'Key of field {number} is invalid: {e}')
+            continue
+        filename = key.location_filename()
+        if not filename:
+            problems.append(f'Key of field {number} has no location')
+        elif levels.setdefault(filename, key.level()) != key.level():
+            problems.append(f'Keys open {filename} as different levels')
+    return levels, problems
+
+
+def check_grid(filename: str,
+               grid: List[List[int]],
+               fields: List[Dict],
+               level: int) -> Tuple[Tuple[int, int], List[str]]:
+    """
+    Check that location grid is a non-empty rectangle of valid field ids
+    with exactly one starting point from which a gate can be reached
+
+    :param filename: Name of the location file
+    :type filename: str
+    :param grid: Matrix of field ids without boarders
+    :type grid: List[List[int]]
+    :param fields: Parsed fields.json
+    :type fields: List[Dict]
+    :param level: Level the location is opened as
+    :type level: int
+    :return: Starting coordinates (x, y) with boarders or None
+            and descriptions of found problems
+    :rtype: Tuple[Tuple[int, int], List[str]]
+    """
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    if width == 0:
+        return None, [f'{filename} is empty']
+    problems = []
+    starts = []
+    for y, row in enumerate(grid):
+        row = list(row)
+        if len(row) != width:
+            problems.append(f'{filename} row {y + 1} has {len(row)} '
+                            f'fields instead of {width}')
+        for x, number in enumerate(row):
+            if not 0 <= number < len(fields):
+                problems.append(f'{filename} row {y + 1} column {x + 1} '
+                                f'has unknown field {number}')
+            elif isinstance(fields[number], dict) and \
+                    fields[number].get('go_to', 0) == level:
+                starts.append((x + 1, y + 1))
+    if len(starts) != 1:
+        problems.append(f'{filename} must have exactly one starting point '
+                        f'for level {level}, found {len(starts)}')
+    elif not problems:
+        problems += check_reachable(filename, grid, fields, level, starts[0])
+    return (starts[0] if len(starts) == 1 else None), problems
+
+
+def check_reachable(filename: str,
+                    grid: List[List[int]],
+                    fields: List[Dict],
+                    level: int,
+                    start: Tuple[int, int]) -> List[str]:
+    """
+    Check that player can walk from the starting point to a gate
+    leading out of the location, if it has any
+
+    :param filename: Name of the location file
+    :type filename: str
+    :param grid: Rectangle of valid field ids without boarders
+    :type grid: List[List[int]]
+    :param fields: Parsed fields.json
+    :type fields: List[Dict]
+    :param level: Level the location is opened as
+    :type level: int
+    :param start: Starting coordinates (x, y) with boarders
+    :type start: Tuple[int, int]
+    :return: Descriptions of found problems
+    :rtype: List[str]
+    """
+    rows = [0]
+    exits = []
+    for y, row in enumerate(grid):
+        value = 0
+        for x, number in enumerate(row):
+            field = fields[number] if isinstance(fields[number], dict) else {}
+            if field.get('enterable', True):
+                value |= 1 << (x + 1)
+            if field.get('go_to', 0) not in (0, level):
+                exits.append((x + 1, y + 1))
+        rows.append(value)
+    rows.append(0)
+    connectivity = Connectivity.from_rows(rows, len(grid[0]) + 2)
+    if exits and not connectivity.reachable(start, exits):
+        return [f'{filename} has no gate that can be reached '
+                f'from the starting point']
+    return []
+
+
+def fingerprint(directory: str) -> List[List]:
+    """
+    Get names, sizes and modification times of configuration files
+
+    :param directory: Configuration directory of the game
+    :type directory: str
+    :raises FileNotFoundException: Indicates that directory doesn't exist
+    :return: List of [name, size, mtime_ns] ordered by name
+    :rtype: List[List]
+    """
+    result = []
+    for name in sorted(listdir(directory)):
+        if name == VALIDATION_FILENAME or name.endswith('.tmp'):
+            continue
+        info = stat(f'{directory}/{name}')
+        result.append([name, info.st_size, info.st_mtime_ns])
+    return result
+
+
+def read_stamp(directory: str) -> Dict[str, List[int]]:
+    """
+    Read starting points saved by the last validation
+    if configuration did not change since then
+
+    :param directory: Configuration directory of the game
+    :type directory: str
+    :return: Starting points by file name or None
+    :rtype: Dict[str, List[int]]
+    """
+    try:
+        with open(f'{directory}/{VALIDATION_FILENAME}', 'r') as handle:
+            stamp = json.load(handle)
+        if stamp.get('version') != VALIDATION_VERSION or \
+                stamp.get('files') != fingerprint(directory):
+            return None
+        return stamp['starts']
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def write_stamp(directory: str, starts: Dict[str, List[int]]):
+    """
+    Remember that configuration passed validation
+
+    :param directory: Configuration directory of the game
+    :type directory: str
+    :param starts: Starting points by file name - [level, x, y]
+    :type starts: Dict[str, List[int]]
+    """
+    stamp = {
+        'version': VALIDATION_VERSION,
+        'files': fingerprint(directory),
+        'starts': starts
+    }
+    data = json.dumps(stamp, indent=4).encode('utf-8')
+    write_atomically(f'{directory}/{VALIDATION_FILENAME}', data, 'never')
+
+
+def trust(game: str, starts: Dict[str, List[int]]):
+    """
+    Mark game as validated, its configuration is loaded without checks
+
+    :param game: Name of the game
+    :type game: str
+    :param starts: Starting points by file name - [level, x, y]
+    :type starts: Dict[str, List[int]]
+    """
+    _trusted[game] = starts
+
+
+def distrust(game: str):
+    """
+    Load configuration of the game with all checks again
+
+    :param game: Name of the game
+    :type game: str
+    """
+    _trusted.pop(game, None)
+
+
+def trusted(game: str) -> bool:
+    """
+    Whether configuration of the game passed validation
+
+    :param game: Name of the game
+    :type game: str
+    :rtype: bool
+    """
+    return game in _trusted
+
+
+def trusted_start(game: str, filename: str, level: int) -> Tuple[int, int]:
+    """
+    Get starting point of the location found by validation
+
+    :param game: Name of the game
+    :type game: str
+    :param filename: Name of the location file
+    :type filename: str
+    :param level: Level the location is loaded as
+    :type level: int
+    :return: Coordinates (x, y) or None if location was not validated
+            as this level
+    :rtype: Tuple[int, int]
+    """
+    start = _trusted.get(game, {}).get(filename)
+    if start is None or start[0] != level:
+        return None
+    return start[1], start[2]
+
+
+def _check(name: str, loader: Callable[[Dict], object], value) -> List[str]:
+    """
+    :return: Description of the error raised while loading value
+    :rtype: List[str]
+    """
+    try:
+        loader(value)
+    except Exception as e:
+        return [f'{name} is invalid: {type(e).__name__} {e}'.rstrip()]
+    return []